@@ -6,12 +6,21 @@
 """
 from inspect import isfunction
 import copy
+import collections
 import logging
 import pytest
 import numpy as np
 import paddle
 from paddle import to_tensor
 
+# max elements of stacked perturbed inputs in batched numeric grad
+GRAD_BATCH_ELEMENTS = 1 << 22
+# static graph cache, key -> built program with its scope, least recently used entry is dropped
+STATIC_CACHE = collections.OrderedDict()
+STATIC_CACHE_SIZE = 128
+# executor of each place
+STATIC_EXECUTOR = {}
+
 
 class APIBase(object):
     """
@@ -49,6 +58,12 @@ class APIBase(object):
         # calculate grad delta, You can rewrite these value
         self.delta = 1e-6
         self.gap = 0.001
+        # numeric grad method, forward or central difference
+        self.grad_method = "forward"
+        # max perturbed inputs stacked in one forward, 1 for element by element forward
+        self.grad_batch = 256
+        # reuse static program of the same api signature, only feed new data
+        self.static_cache = True
         self.rtol = 1e-7
         # choose layertypes [functional or classional]
         self._layertypes(func)
@@ -488,61 +503,142 @@ class APIBase(object):
         if data is None:
             for k, v in self.kwargs.items():
                 if isinstance(v, paddle.Tensor):
-                    grad = []
-                    shape = v.numpy().shape
-                    for i in range(len(v.numpy().flatten())):
-                        tmp = v.numpy().flatten()
-                        tmp[i] = tmp[i] + self.gap
-                        tmp = tmp.reshape(shape)
-                        # print(tmp)
-                        self.kwargs[k] = to_tensor(tmp.astype(self.dtype))
-                        # enable compute gradient
-                        if self.enable_backward is True:
-                            self.kwargs[k].stop_gradient = False
-                        loss_delta = self._numeric_grad()
-                        g = (loss_delta - loss) / self.gap
-                        # print("-----> {}".format(g))
-                        grad.append(g.item())
-                        # recover v to self.kwargs
-                        self.kwargs[k] = v
-                    numeric_grad[k] = np.array(grad).reshape(shape)
+                    numeric_grad[k] = self._perturb_grad(v.numpy().astype(self.dtype), loss, k)
+                    # recover v to self.kwargs
+                    self.kwargs[k] = v
         else:
             # change data to correct dtype
             data = data.astype(self.dtype)
-            grad = []
-            shape = data.shape
-            for i in range(len(data.flatten())):
-                tmp = copy.deepcopy(data.flatten())
-                tmp[i] = tmp[i] + self.gap
-                tmp = tmp.reshape(shape)
-                self.data = to_tensor(tmp.astype(self.dtype))
-                # enable compute gradient
-                if self.enable_backward is True:
-                    self.data.stop_gradient = False
-                loss_delta = self._numeric_grad()
-                g = (loss_delta - loss) / self.gap
-                grad.append(g.item())
-                # recover v to self.kwargs
-                self.data = data
-            numeric_grad["data"] = np.array(grad).reshape(shape)
+            tensor = self.data
+            numeric_grad["data"] = self._perturb_grad(data, loss)
+            # recover data
+            self.data = tensor
         paddle.enable_static()
         return numeric_grad
 
-    def _numeric_grad(self):
+    def _numeric_grad(self, batch=None):
         """
         _numeric_grad
+        Args:
+            batch (int, optional): number of perturbed inputs stacked on axis 0, None for single input
         Returns:
-            result
+            result, loss of each perturbed input if batch is not None
         """
         if self.__layertype == "func":
             res = self.func(**self.kwargs)
-            loss = paddle.mean(res).numpy()
-            return loss
         elif self.__layertype == "class":
             obj = self.func(**self.kwargs)
             res = obj(self.data)
-            loss = paddle.mean(res).numpy()
-            return loss
+        if batch is None:
+            self._grad_out_shape = list(res.shape)
+            return paddle.mean(res).numpy()
+        # api without batch support changes output shape, such as reduce all or reshape
+        if list(res.shape) != [batch] + self._grad_out_shape:
+            raise ValueError("batched output shape {} mismatch".format(res.shape))
+        return paddle.mean(res.reshape([batch, -1]), axis=1).numpy()
+
+    def _grad_tensor(self, value):
+        """
+        numpy to tensor, enable compute gradient
+        """
+        t = to_tensor(value)
+        if self.enable_backward is True:
+            t.stop_gradient = False
+        return t
+
+    def _set_grad_input(self, t, k=None, n=None):
+        """
+        set perturbed input to self.kwargs[k], self.kwargs[k][n] for tensor list, self.data if k is None
+        """
+        if k is None:
+            self.data = t
+        elif isinstance(n, int):
+            self.kwargs[k][n] = t
+        else:
+            self.kwargs[k] = t
+
+    def _finite_diff(self, losses, loss):
+        """
+        forward difference (f(x+h)-f(x))/h or central difference (f(x+h)-f(x-h))/2h
+        """
+        if self.grad_method == "central":
+            return (losses[0] - losses[1]) / self.gap / 2
+        return (losses[0] - loss) / self.gap
+
+    def _perturb_grad(self, base, loss, k=None, n=None):
+        """numeric grad of one input, element by element perturbation with step self.gap
+
+        Args:
+            base (numpy): input value
+            loss (numpy): loss of unperturbed input
+            k (str, optional): kwargs key, None for self.data
+            n (int, optional): index of tensor list self.kwargs[k]
+        Returns:
+            numpy: grad with the same shape as base
+        """
+        shape = base.shape
+        # host buffer, perturb one element in place and recover it
+        flat = np.array(base).reshape(-1)
+        steps = [self.gap, -self.gap] if self.grad_method == "central" else [self.gap]
+        grad = np.zeros(flat.size, dtype=np.result_type(loss, np.float64))
+        start = self._batch_grad(flat, shape, loss, steps, grad, k, n)
+        for i in range(start, flat.size):
+            losses = []
+            orig = flat[i]
+            for step in steps:
+                flat[i] = orig + step
+                self._set_grad_input(self._grad_tensor(flat.reshape(shape)), k, n)
+                losses.append(self._numeric_grad())
+            flat[i] = orig
+            grad[i] = self._finite_diff(losses, loss)
+        return grad.reshape(shape)
+
+    def _batch_grad(self, flat, shape, loss, steps, grad, k=None, n=None):
+        """batched numeric grad, perturbed inputs are stacked on axis 0 as shape [b] + shape,
+        one forward for self.grad_batch elements. The first batch is checked by single forward
+
+        Returns:
+            int: number of elements computed, 0 if the api does not support batched input
+        """
+        size = min(self.grad_batch, flat.size, GRAD_BATCH_ELEMENTS // flat.size)
+        if size < 2:
+            return 0
+        buf = np.empty((size, flat.size), dtype=flat.dtype)
+        rows = np.arange(size)
+        done = 0
+        try:
+            for start in range(0, flat.size, size):
+                b = min(size, flat.size - start)
+                losses = []
+                for step in steps:
+                    buf[:b] = flat
+                    buf[rows[:b], start + rows[:b]] += step
+                    self._set_grad_input(self._grad_tensor(buf[:b].reshape([b] + list(shape))), k, n)
+                    losses.append(self._numeric_grad(batch=b))
+                if start == 0 and not self._check_batch(flat, shape, steps[0], losses[0], k, n):
+                    break
+                grad[start : start + b] = self._finite_diff(losses, loss)
+                done = start + b
+        except Exception as e:
+            logging.info("[grad] batched input not supported: {}".format(e))
+        if done < flat.size:
+            logging.info("[grad] compute elements from {} by single forward".format(done))
+        return done
+
+    def _check_batch(self, flat, shape, step, batch_loss, k=None, n=None):
+        """
+        check batched loss by single forward of the first, middle and last perturbed input,
+        ops across axis 0 (such as softmax or cumsum on axis 0) mix perturbed inputs and fail the check
+        """
+        for i in sorted({0, len(batch_loss) // 2, len(batch_loss) - 1}):
+            orig = flat[i]
+            flat[i] = orig + step
+            self._set_grad_input(self._grad_tensor(flat.reshape(shape)), k, n)
+            single = self._numeric_grad()
+            flat[i] = orig
+            if not np.allclose(batch_loss[i], single, rtol=1e-5, atol=1e-8):
+                return False
+        return True
 
     def _dygraph_forward(self):
         """
@@ -582,101 +678,193 @@ class APIBase(object):
         """
         if self.__layertype == "func":
             paddle.seed(self.seed)
-            main_program = paddle.static.Program()
-            startup_program = paddle.static.Program()
-            params = copy.deepcopy(kwargs)
-            with paddle.utils.unique_name.guard():
-                with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
-                    # PS:没有单列出一个函数做值传递，因为self.kwargs只有一个，就没单列出来
-                    xyz = []
-                    for k, v in kwargs.items():
-                        if isinstance(v, (np.generic, np.ndarray)):
-                            # no_grad_Var不需要转换类型
-                            if self.no_grad_var is not None and k in self.no_grad_var:
-                                kwargs[k] = v
-                            else:
-                                kwargs[k] = v.astype(self.dtype)
-                    for k, v in params.items():
-                        if isinstance(v, (np.generic, np.ndarray)):
-                            # no_grad_Var不需要转换类型
-                            if self.no_grad_var is not None and k in self.no_grad_var:
-                                params[k] = paddle.static.data(name=k, shape=v.shape, dtype=v.dtype)
-                            else:
-                                params[k] = paddle.static.data(name=k, shape=v.shape, dtype=self.dtype)
-                            xyz.append(k)
-                            # enable compute gradient
-                            if self.enable_backward is True:
-                                params[k].stop_gradient = False
-                    output = self.func(**params)
-                    if self.enable_backward:
-                        loss = paddle.mean(output)
-                        grad_var = {}
-                        for k in xyz:
-                            grad_var[k] = paddle.static.gradients(loss, params[k])
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        # print(list(grad_var.values()))
-                        # print([output] + list(grad_var.values()))
-                        res = exe.run(
-                            main_program, feed=kwargs, fetch_list=[output] + list(grad_var.values()), return_numpy=True
-                        )
-                        # combine grad
-                        grad = dict(zip(xyz, res[1:]))
-                        return res[0], grad
+            for k, v in kwargs.items():
+                if isinstance(v, (np.generic, np.ndarray)):
+                    # no_grad_Var不需要转换类型
+                    if self.no_grad_var is not None and k in self.no_grad_var:
+                        kwargs[k] = v
                     else:
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        # print(list(grad_var.values()))
-                        # print([output] + list(grad_var.values()))
-                        res = exe.run(main_program, feed=kwargs, fetch_list=[output], return_numpy=True)
-                        return res[0]
+                        kwargs[k] = v.astype(self.dtype)
+            key = self._static_key(data, **kwargs)
+            entry = self._static_cache_get(key)
+            if entry is None:
+                main_program = paddle.static.Program()
+                startup_program = paddle.static.Program()
+                params = copy.deepcopy(kwargs)
+                with paddle.utils.unique_name.guard():
+                    with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
+                        # PS:没有单列出一个函数做值传递，因为self.kwargs只有一个，就没单列出来
+                        xyz = []
+                        for k, v in params.items():
+                            if isinstance(v, (np.generic, np.ndarray)):
+                                # no_grad_Var不需要转换类型
+                                if self.no_grad_var is not None and k in self.no_grad_var:
+                                    params[k] = paddle.static.data(name=k, shape=v.shape, dtype=v.dtype)
+                                else:
+                                    params[k] = paddle.static.data(name=k, shape=v.shape, dtype=self.dtype)
+                                xyz.append(k)
+                                # enable compute gradient
+                                if self.enable_backward is True:
+                                    params[k].stop_gradient = False
+                        output = self.func(**params)
+                        fetch_list = [output]
+                        if self.enable_backward:
+                            loss = paddle.mean(output)
+                            grad_var = {}
+                            for k in xyz:
+                                grad_var[k] = paddle.static.gradients(loss, params[k])
+                            fetch_list += list(grad_var.values())
+                entry = self._static_build(key, main_program, startup_program, fetch_list, xyz=xyz)
+            res = self._static_run(entry, feed=kwargs)
+            if self.enable_backward:
+                # combine grad
+                grad = dict(zip(entry["xyz"], res[1:]))
+                return res[0], grad
+            else:
+                return res[0]
         elif self.__layertype == "class":
-            main_program = paddle.static.Program()
-            startup_program = paddle.static.Program()
-            main_program.random_seed = self.seed
-            startup_program.random_seed = self.seed
-            params = copy.deepcopy(kwargs)
-            with paddle.utils.unique_name.guard():
-                with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
-                    # PS:没有单列出一个函数做值传递，因为self.kwargs只有一个，就没单列出来
-                    for k, v in kwargs.items():
-                        if isinstance(v, (np.generic, np.ndarray)):
-                            # no_grad_Var不需要转换类型
-                            if self.no_grad_var is not None and k in self.no_grad_var:
-                                kwargs[k] = v
-                            else:
-                                kwargs[k] = v.astype(self.dtype)
-                    for k, v in params.items():
-                        if isinstance(v, (np.generic, np.ndarray)):
-                            # no_grad_Var不需要转换类型
-                            if self.no_grad_var is not None and k in self.no_grad_var:
-                                params[k] = paddle.static.data(name=k, shape=v.shape, dtype=v.dtype)
-                            else:
-                                params[k] = paddle.static.data(name=k, shape=v.shape, dtype=self.dtype)
-                            # enable compute gradient
-                            if self.enable_backward is True:
-                                params[k].stop_gradient = False
-                    if data is not None:
-                        data = data.astype(self.dtype)
-                        self.data = paddle.static.data(name="data", shape=data.shape, dtype=self.dtype)
-                        if self.enable_backward is True:
-                            self.data.stop_gradient = False
-                    data = dict({"data": data}, **kwargs)
-                    obj = self.func(**params)
-                    output = obj(self.data)
-                    if self.enable_backward:
-                        loss = paddle.mean(output)
-                        g = paddle.static.gradients(loss, self.data)
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        res = exe.run(main_program, feed=data, fetch_list=[output, g], return_numpy=True)
-                        grad = {"data": res[1]}
-                        return res[0], grad
+            for k, v in kwargs.items():
+                if isinstance(v, (np.generic, np.ndarray)):
+                    # no_grad_Var不需要转换类型
+                    if self.no_grad_var is not None and k in self.no_grad_var:
+                        kwargs[k] = v
                     else:
-                        exe = paddle.static.Executor(self.place)
-                        exe.run(startup_program)
-                        res = exe.run(main_program, feed=data, fetch_list=[output], return_numpy=True)
-                        return res[0]
+                        kwargs[k] = v.astype(self.dtype)
+            if data is not None:
+                data = data.astype(self.dtype)
+            key = self._static_key(data, **kwargs)
+            entry = self._static_cache_get(key)
+            if entry is None:
+                main_program = paddle.static.Program()
+                startup_program = paddle.static.Program()
+                main_program.random_seed = self.seed
+                startup_program.random_seed = self.seed
+                params = copy.deepcopy(kwargs)
+                with paddle.utils.unique_name.guard():
+                    with paddle.static.program_guard(main_program=main_program, startup_program=startup_program):
+                        # PS:没有单列出一个函数做值传递，因为self.kwargs只有一个，就没单列出来
+                        for k, v in params.items():
+                            if isinstance(v, (np.generic, np.ndarray)):
+                                # no_grad_Var不需要转换类型
+                                if self.no_grad_var is not None and k in self.no_grad_var:
+                                    params[k] = paddle.static.data(name=k, shape=v.shape, dtype=v.dtype)
+                                else:
+                                    params[k] = paddle.static.data(name=k, shape=v.shape, dtype=self.dtype)
+                                # enable compute gradient
+                                if self.enable_backward is True:
+                                    params[k].stop_gradient = False
+                        if data is not None:
+                            self.data = paddle.static.data(name="data", shape=data.shape, dtype=self.dtype)
+                            if self.enable_backward is True:
+                                self.data.stop_gradient = False
+                        obj = self.func(**params)
+                        output = obj(self.data)
+                        fetch_list = [output]
+                        if self.enable_backward:
+                            loss = paddle.mean(output)
+                            g = paddle.static.gradients(loss, self.data)
+                            fetch_list.append(g)
+                entry = self._static_build(key, main_program, startup_program, fetch_list)
+            res = self._static_run(entry, feed=dict({"data": data}, **kwargs))
+            if self.enable_backward:
+                grad = {"data": res[1]}
+                return res[0], grad
+            else:
+                return res[0]
+
+    def _static_key(self, data=None, feed_list=False, **kwargs):
+        """
+        static graph cache key: api, layer type, input shapes and dtypes, attributes, no_grad_var and backward flag.
+        Attributes are part of the program, key is None (not cached) if any attribute is not a plain value
+        Args:
+            data (numpy, optional): input data of class api
+            feed_list (bool, optional): list of numpy in kwargs is fed as inputs
+        Returns:
+            tuple or None
+        """
+        if not self.static_cache:
+            return None
+        inputs = []
+        for k, v in kwargs.items():
+            if isinstance(v, (np.generic, np.ndarray)):
+                inputs.append((k, np.shape(v), np.asarray(v).dtype.str))
+            elif feed_list and isinstance(v, (list, tuple)) and isinstance(v[0], (np.generic, np.ndarray)):
+                inputs.append((k, tuple((np.shape(i), np.asarray(i).dtype.str) for i in v)))
+            elif is_static_attr(v):
+                inputs.append((k, repr(v)))
+            else:
+                return None
+        in_pir_mode = getattr(paddle.framework, "in_pir_mode", lambda: False)()
+        return (
+            self.func,
+            self.__layertype,
+            tuple(inputs),
+            None if data is None else np.shape(data),
+            np.dtype(self.dtype).str,
+            tuple(self.no_grad_var or []),
+            self.enable_backward,
+            str(self.place),
+            self.seed,
+            in_pir_mode,
+        )
+
+    def _static_cache_get(self, key):
+        """
+        get built program from static graph cache
+        """
+        if key is None or key not in STATIC_CACHE:
+            return None
+        STATIC_CACHE.move_to_end(key)
+        return STATIC_CACHE[key]
+
+    def _static_build(self, key, main_program, startup_program, fetch_list, **kwargs):
+        """
+        run startup program in a new scope, save program to static graph cache
+        Args:
+            key (tuple): static cache key, None for not cached
+            fetch_list (list): default fetch list
+            **kwargs: other info used by _static_forward, such as grad vars
+        Returns:
+            dict: cache entry
+        """
+        entry = dict(main=main_program, scope=paddle.static.Scope(), fetch_list=fetch_list, **kwargs)
+        with paddle.static.scope_guard(entry["scope"]):
+            self._static_executor().run(startup_program)
+        if key is not None:
+            STATIC_CACHE[key] = entry
+            if len(STATIC_CACHE) > STATIC_CACHE_SIZE:
+                STATIC_CACHE.popitem(last=False)
+        return entry
+
+    def _static_executor(self):
+        """
+        executor of self.place, created once
+        """
+        place = str(self.place)
+        if place not in STATIC_EXECUTOR:
+            STATIC_EXECUTOR[place] = paddle.static.Executor(self.place)
+        return STATIC_EXECUTOR[place]
+
+    def _static_run(self, entry, feed, fetch_list=None):
+        """
+        run cached program with new feed
+        """
+        with paddle.static.scope_guard(entry["scope"]):
+            return self._static_executor().run(
+                entry["main"],
+                feed=feed,
+                fetch_list=entry["fetch_list"] if fetch_list is None else fetch_list,
+                return_numpy=True,
+            )
+
+
+def is_static_attr(value):
+    """
+    plain attribute value, repr of it can be used as static cache key
+    """
+    if isinstance(value, (list, tuple)):
+        return all(is_static_attr(v) for v in value)
+    return value is None or isinstance(value, (bool, int, float, str, np.dtype))
 
 
 def compare_grad(result, expect, delta=1e-6, rtol=0.001, mode=None, no_grad_var=None):
@@ -0,0 +1,65 @@
+#!/bin/env python
+# -*- coding: utf-8 -*-
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+test_compute_grad
+"""
+
+from apibase import APIBase
+import paddle
+import pytest
+import numpy as np
+
+
+class TestComputeGrad(APIBase):
+    """
+    test
+    """
+
+    def hook(self):
+        """
+        implement
+        """
+        self.types = [np.float64]
+        self.dtype = np.float64
+        self.place = paddle.CPUPlace()
+
+
+def func_list(xs):
+    """
+    loss = mean(x0 * x1 + x2)
+    """
+    return xs[0] * xs[1] + xs[2]
+
+
+obj = TestComputeGrad(func_list)
+
+
+@pytest.mark.api_incubate_compute_grad_parameters
+def test_compute_grad_tensor_list():
+    """
+    numeric grad of a tensor list, every item is computed against unperturbed other items
+    """
+    x0 = np.random.rand(2, 3)
+    x1 = np.random.rand(2, 3)
+    x2 = np.random.rand(2, 3)
+    grad = obj.compute_grad(res=np.zeros([2, 3]), xs=[x0, x1, x2])
+    assert np.allclose(grad["xs"][0], x1 / x1.size, atol=1e-6)
+    assert np.allclose(grad["xs"][1], x0 / x0.size, atol=1e-6)
+    assert np.allclose(grad["xs"][2], np.ones([2, 3]) / x2.size, atol=1e-6)
+
+
+@pytest.mark.api_incubate_compute_grad_parameters
+def test_compute_grad_tensor_list_single_forward():
+    """
+    numeric grad of a tensor list, element by element forward
+    """
+    x0 = np.random.rand(2, 3)
+    x1 = np.random.rand(2, 3)
+    x2 = np.random.rand(2, 3)
+    obj.grad_batch = 1
+    grad = obj.compute_grad(res=np.zeros([2, 3]), xs=[x0, x1, x2])
+    obj.grad_batch = 256
+    assert np.allclose(grad["xs"][0], x1 / x1.size, atol=1e-6)
+    assert np.allclose(grad["xs"][1], x0 / x0.size, atol=1e-6)
+    assert np.allclose(grad["xs"][2], np.ones([2, 3]) / x2.size, atol=1e-6)
@@ -5,6 +5,7 @@
 conftest
 """
 import os
+import json
 import pytest
 import allure
 
@@ -21,6 +22,37 @@ def pytest_addoption(parser):
     parser.addoption("--device_place_id", type=int, default=0, help="device place id")
 
 
+def pytest_collection_modifyitems(config, items):
+    """layerE2Ecase去重执行时, 跳过已由其他文件执行的测试类"""
+    skip_file = os.environ.get("PLT_E2E_DEDUP_SKIP")
+    if not skip_file or not os.path.exists(skip_file):
+        return
+    with open(skip_file, "r") as f:
+        skip_dict = json.load(f)
+    kept, deselected = [], []
+    for item in items:
+        skip_tests = skip_dict.get(os.path.abspath(str(item.fspath)), [])
+        if item.nodeid.split("::")[1] in skip_tests:
+            deselected.append(item)
+        else:
+            kept.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = kept
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """layerE2Ecase去重执行时, 记录测试类级别的失败, 用于回填到引用相同子图的文件"""
+    outcome = yield
+    report = outcome.get_result()
+    result_file = os.environ.get("PLT_E2E_DEDUP_RESULT")
+    if result_file and report.failed:
+        record = {"file": os.path.abspath(str(item.fspath)), "test": item.nodeid.split("::")[1]}
+        with open(result_file, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
 @pytest.fixture
 def title(request):
     """title"""
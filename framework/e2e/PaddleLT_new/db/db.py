@@ -6,11 +6,11 @@
 db object
 """
 
+import os
 import json
 import traceback
 from datetime import datetime
-import yaml
-import pymysql
+from pltools.result_store import open_store
 
 # from utils.logger import logger
 
@@ -20,27 +20,17 @@ ACCURACY = "%.6g"
 class DB(object):
     """DB class"""
 
-    def __init__(self, storage="storage.yaml"):
-        self.storage = storage
-        host, port, user, password, database = self.load_storge()
-        self.db = pymysql.connect(host=host, port=port, user=user, password=password, database=database, charset="utf8")
-        self.cursor = self.db.cursor()
-        # self.now_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    def load_storge(self):
+    def __init__(self, storage="storage.yaml", backend=None):
         """
-        解析storage.yaml的内容添加到self.db
+        init
+        :param storage: yaml配置文件
+        :param backend: mysql/sqlite, 默认见pltools.result_store.open_store
         """
-        with open(self.storage, "r") as f:
-            data = yaml.safe_load(f)
-        msg_dict = data.get("Config").get("layer_benchmark").get("MYSQL")
-        # msg_dict = data.get("Config").get("layer_benchmark").get("DEV")
-        host = msg_dict.get("host")
-        port = msg_dict.get("port")
-        user = msg_dict.get("user")
-        password = msg_dict.get("password")
-        database = msg_dict.get("db_name")
-        return host, port, user, password, database
+        self.storage = storage
+        self.store = open_store(storage=self.storage, config_key="layer_benchmark", backend=backend)
+        self.db = self.store.conn
+        self.cursor = self.store.cursor
+        # self.now_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def timestamp(self):
         """
@@ -51,110 +41,61 @@ class DB(object):
     def insert(self, table, data):
         """插入数据"""
         id = -1
-        sql_table = "`" + table + "`"
-        ls = [(k, data[k]) for k in data if data[k] is not None]
-        keys = ",".join(("`" + i[0] + "`") for i in ls)
-        values = ",".join("%r" % i[1] for i in ls)
-
-        sql = "INSERT INTO {table}({keys}) VALUES ({values})".format(table=sql_table, keys=keys, values=values)
         try:
-            self.cursor.execute(sql)
-            id = self.db.insert_id()
-            self.db.commit()
+            id = self.store.insert(table=table, data=data)
         except Exception as e:
             # print(traceback.format_exc())
             print(e)
         return id
 
+    def insert_many(self, table, data_list):
+        """
+        批量插入数据, 每个事务写入多行
+        :return: 插入行数, 写入失败时抛出异常, 由调用方把job标记为error
+        """
+        try:
+            return self.store.insert_many(table=table, rows=data_list)
+        except Exception:
+            print(traceback.format_exc())
+            raise
+
     def update(self, table, data, data_condition):
         """按照data_condition 更新数据"""
-        sql_table = "`" + table + "`"
-        sql = (
-            "UPDATE %s SET " % sql_table
-            + ",".join("%s=%r" % (("`" + k + "`"), data[k]) for k in data)
-            + " WHERE "
-            + " AND ".join("%s=%r" % (("`" + k + "`"), data_condition[k]) for k in data_condition)
-        )
-
         try:
-            self.cursor.execute(sql)
-            self.db.commit()
+            self.store.update(table=table, data=data, condition_dict=data_condition)
         except Exception as e:
             print(traceback.format_exc())
             print(e)
 
     def update_by_id(self, table, data, id):
         """按照id 更新数据"""
-        sql_table = "`" + table + "`"
-        sql = (
-            "UPDATE %s SET " % sql_table
-            + ",".join("%s=%r" % (("`" + k + "`"), data[k]) for k in data)
-            + " WHERE "
-            + "%s=%r" % ("`id`", id)
-        )
+        self.update(table=table, data=data, data_condition={"id": id})
 
-        try:
-            self.cursor.execute(sql)
-            self.db.commit()
-        except Exception as e:
-            print(traceback.format_exc())
-            print(e)
-
-    def select(self, table, condition_list):
-        """按照condition_list 查询数据"""
+    def select(self, table, condition_list=None, condition_dict=None):
+        """
+        按照condition_list 查询数据
+        :param condition_list: 条件字符串list
+        :param condition_dict: 等值条件dict, 参数化查询
+        """
         results = []
-        sql_table = "`" + table + "`"
-        sql = "SELECT * FROM %s " % sql_table + " WHERE " + " AND ".join("%s" % k for k in condition_list)
-
         try:
-            self.cursor.execute(sql)
-            res = self.cursor.fetchall()
-
-            index_list = self.show_list(table=table)
-            for row in res:
-                tmp = {}
-                for i, v in enumerate(row):
-                    tmp[index_list[i]] = row[i]
-                results.append(tmp)
+            results = self.store.select(table=table, condition_list=condition_list, condition_dict=condition_dict)
         except Exception as e:
             print(traceback.format_exc())
             print(e)
         return results
 
     def select_use_date(self, table, date_str, condition_dict):
-        """按照condition_list 查询数据"""
+        """按照日期与condition_dict 查询数据"""
         results = []
-        # sql_table = "`" + table + "`"
-        # condition_list.append("DATE(update_time) = %s")
-        # sql = "SELECT * FROM %s " % sql_table + " WHERE " + " AND ".join("%s" % k for k in condition_list)
-
-        # 构建条件列表，注意日期条件的特殊处理
-        conditions = []
-        params = []
-
-        # 添加日期条件
-        conditions.append("DATE(update_time) = %s")
-        params.append(date_str)  # 确保date_str是"YYYY-MM-DD"格式的字符串
-
-        # 添加其他条件
-        for key, value in condition_dict.items():
-            # 这里假设value已经是适合数据库查询的格式（如字符串、数字等）
-            # 如果value是日期或时间，请确保它在这里被正确格式化
-            conditions.append(f"{key} = %s")
-            params.append(value)
-
-        # 构建完整的SQL查询语句
-        sql = "SELECT * FROM {} WHERE {}".format(table, " AND ".join(conditions))
         try:
-            self.cursor.execute(sql, tuple(params))
-            res = self.cursor.fetchall()
-
-            index_list = self.show_list(table=table)
-            for row in res:
-                tmp = {}
-                for i, v in enumerate(row):
-                    tmp[index_list[i]] = row[i]
-                results.append(tmp)
+            # date_str为"YYYY-MM-DD"格式的字符串
+            results = self.store.select(
+                table=table,
+                condition_list=["DATE(update_time) = {}".format(self.store.placeholder)],
+                condition_dict=condition_dict,
+                params=(date_str,),
+            )
         except Exception as e:
             print(traceback.format_exc())
             print(e)
@@ -162,24 +103,7 @@ class DB(object):
 
     def select_by_id(self, table, id):
         """按照id 查询数据"""
-        results = []
-        sql_table = "`" + table + "`"
-        sql = "SELECT * FROM %s " % sql_table + " WHERE " + "%s=%r" % ("`id`", id)
-
-        try:
-            self.cursor.execute(sql)
-            res = self.cursor.fetchall()
-
-            tmp = {}
-            index_list = self.show_list(table=table)
-            for row in res:
-                for i, v in enumerate(row):
-                    tmp[index_list[i]] = row[i]
-                results.append(tmp)
-        except Exception as e:
-            print(traceback.format_exc())
-            print(e)
-        return results
+        return self.select(table=table, condition_dict={"id": id})
 
     def insert_job(
         self,
@@ -232,26 +156,19 @@ class DB(object):
 
     def insert_case(self, jid, case_name, result, create_time):
         """向case表中录入数据"""
-        try:
-            data = {
-                "jid": jid,
-                "case_name": case_name,
-                "result": result,
-                "create_time": create_time,
-            }
-            retry = 3
-            for i in range(retry):
-                case_id = self.insert(table="layer_case", data=data)
-                if case_id == -1:
-                    print("db ping again~~~")
-                    self.db.ping(True)
-                    continue
-                else:
-                    break
-        except Exception as e:
-            # self.ci_update_job(id=job_id, status="error", update_time=time_now)
-            print(traceback.format_exc())
-            print(e)
+        self.insert_cases(jid=jid, case_dict={case_name: result}, create_time=create_time)
+
+    def insert_cases(self, jid, case_dict, create_time):
+        """
+        向case表中批量录入数据
+        :param case_dict: {case_name: result}
+        :return: 插入行数
+        """
+        data_list = [
+            {"jid": jid, "case_name": case_name, "result": result, "create_time": create_time}
+            for case_name, result in case_dict.items()
+        ]
+        return self.insert_many(table="layer_case", data_list=data_list)
 
     def update_job(self, id, status, update_time):
         """数据录入完成后更新job表中的部分字段"""
@@ -260,16 +177,16 @@ class DB(object):
 
     def select_baseline_job(self, comment, testing, plt_perf_content, base, ci, md5_id):
         """通过comment字段、ci字段、机器唯一标识码，查找baseline数据"""
-        condition_list = [
-            "comment = '{}'".format(comment),
-            "status = 'done'",
-            "testing = '{}'".format(testing),
-            "plt_perf_content = '{}'".format(plt_perf_content),
-            "base = '{}'".format(base),
-            "ci = '{}'".format(ci),
-            "md5_id = '{}'".format(md5_id),
-        ]
-        res = self.select(table="layer_job", condition_list=condition_list)
+        condition_dict = {
+            "comment": comment,
+            "status": "done",
+            "testing": testing,
+            "plt_perf_content": plt_perf_content,
+            "base": base,
+            "ci": ci,
+            "md5_id": md5_id,
+        }
+        res = self.select(table="layer_job", condition_dict=condition_dict)
         baseline_job = res[-1]
         # job_id = baseline_job["id"]
         return baseline_job
@@ -277,11 +194,8 @@ class DB(object):
     def show_list(self, table):
         """返回table中的列list"""
         results = []
-        sql_table = "`" + table + "`"
-        sql = "SHOW COLUMNS from {}".format(sql_table)
         try:
-            self.cursor.execute(sql)
-            results = [column[0] for column in self.cursor.fetchall()]
+            results = self.store.columns(table=table)
         except Exception as e:
             print(traceback.format_exc())
             print(e)
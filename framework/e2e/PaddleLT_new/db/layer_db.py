@@ -140,9 +140,14 @@ class LayerBenchmarkDB(object):
             file.write(str(latest_id))
         self.logger.get_log().info("录入最新latest数据的job_id: {}".format(latest_id))
 
-        # 插入layer_case
-        for title, perf_dict in data_dict.items():
-            db.insert_case(jid=latest_id, case_name=title, result=json.dumps(perf_dict), create_time=self.now_time)
+        # 插入layer_case, perf_dict中的 执行器-raw 为每轮原始耗时, 作为后续对比的显著性检验样本
+        case_dict = {title: json.dumps(perf_dict) for title, perf_dict in data_dict.items()}
+        try:
+            db.insert_cases(jid=latest_id, case_dict=case_dict, create_time=self.now_time)
+        except Exception:
+            # case未完整写入, job标记为error, 不会被选作baseline
+            db.update_job(id=latest_id, status="error", update_time=self.now_time)
+            raise
 
         if bool(error_list):
             db.update_job(id=latest_id, status="done", update_time=self.now_time)
@@ -167,7 +172,7 @@ class LayerBenchmarkDB(object):
         )
         baseline_id = baseline_job["id"]
         baseline_layer_type = baseline_job["layer_type"]
-        baseline_list = db.select(table="layer_case", condition_list=["jid = {}".format(baseline_id)])
+        baseline_list = db.select(table="layer_case", condition_dict={"jid": baseline_id})
         baseline_dict = {}
         for i in baseline_list:
             baseline_dict[i["case_name"]] = i
@@ -203,10 +208,10 @@ class LayerBenchmarkDB(object):
                     self.logger.get_log().error(e)
                     continue
             else:
-                condition_list = [
-                    "md5_id = '{}'".format(md5_id),
-                ]
-                res = db.select(table="layer_job", condition_list=condition_list)
+                condition_dict = {
+                    "md5_id": md5_id,
+                }
+                res = db.select(table="layer_job", condition_dict=condition_dict)
                 baseline_job = res[-2]
                 latest_job = res[-1]
 
@@ -219,8 +224,8 @@ class LayerBenchmarkDB(object):
             assert baseline_testing == latest_testing
             baseline_update_time = baseline_job["update_time"]
             latest_update_time = latest_job["update_time"]
-            baseline_list = db.select(table="layer_case", condition_list=["jid = {}".format(baseline_id)])
-            latest_list = db.select(table="layer_case", condition_list=["jid = {}".format(latest_id)])
+            baseline_list = db.select(table="layer_case", condition_dict={"jid": baseline_id})
+            latest_list = db.select(table="layer_case", condition_dict={"jid": latest_id})
             baseline_dict = {}
             for i in baseline_list:
                 file_name = i["case_name"].replace("^", "/") + ".py"
@@ -299,9 +304,14 @@ class LayerBenchmarkDB(object):
             file.write(str(basleine_id))
         self.logger.get_log().info("录入最新baseline数据的job_id: {}".format(basleine_id))
 
-        # 插入layer_case
-        for title, perf_dict in data_dict.items():
-            db.insert_case(jid=basleine_id, case_name=title, result=json.dumps(perf_dict), create_time=self.now_time)
+        # 插入layer_case, perf_dict中的 执行器-raw 为每轮原始耗时, 作为后续对比的显著性检验样本
+        case_dict = {title: json.dumps(perf_dict) for title, perf_dict in data_dict.items()}
+        try:
+            db.insert_cases(jid=basleine_id, case_dict=case_dict, create_time=self.now_time)
+        except Exception:
+            # case未完整写入, job标记为error, 不会被选作baseline
+            db.update_job(id=basleine_id, status="error", update_time=self.now_time)
+            raise
 
         if bool(error_list):
             db.update_job(id=basleine_id, status="done", update_time=self.now_time)
@@ -0,0 +1,32 @@
+#!/bin/env python3
+# -*- coding: utf-8 -*-
+# @author Zeref996
+# encoding=utf-8 vi:ts=4:sw=4:expandtab:ft=python
+"""
+把离线机器上sqlite中的benchmark结果同步到MySQL
+
+用法(在PaddleLT_new目录下执行):
+python db/sync.py --sqlite benchmark_result.db --storage apibm_config.yml
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pltools.result_store import SQLiteStore, open_store, sync_jobs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sqlite", type=str, default="benchmark_result.db", help="local sqlite file")
+    parser.add_argument("--storage", type=str, default="apibm_config.yml", help="yaml config of mysql")
+    parser.add_argument("--job_id", type=int, nargs="*", default=None, help="local job ids, default all unsynced")
+    parser.add_argument("--job_table", type=str, default="layer_job", help="job table")
+    parser.add_argument("--case_table", type=str, default="layer_case", help="case table")
+    args = parser.parse_args()
+
+    src = SQLiteStore(args.sqlite)
+    dst = open_store(storage=args.storage, config_key="layer_benchmark", backend="mysql")
+    id_map = sync_jobs(src, dst, job_table=args.job_table, case_table=args.case_table, job_ids=args.job_id)
+    print("synced {} jobs: {}".format(len(id_map), id_map))
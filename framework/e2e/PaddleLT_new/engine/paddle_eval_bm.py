@@ -7,6 +7,7 @@ eval 方法
 """
 import os
 import timeit
+import traceback
 import time
 import numpy as np
 import paddle
@@ -15,6 +16,8 @@ from generator.builder_layer import BuildLayer
 from generator.builder_data import BuildData
 from pltools.res_save import save_pickle
 from pltools.statistics import trimmean, mean, best, best_top_k, perf_by_step
+from pltools.adaptive_bm import AdaptiveBenchmark
+from pltools.mem_profile import MemoryProfiler, PaddleMemoryStats
 from pltools.logger import Logger
 
 
@@ -39,6 +42,11 @@ class LayerEvalBM(object):
         self.perf_repeat = int(os.environ.get("PLT_BM_REPEAT", "100"))
         self.perf_statis = os.environ.get("PLT_BM_STATIS", "trimmean")
         self.timeit_num = int(os.environ.get("TIMEIT_NUM", "1"))
+        self.adaptive = os.environ.get("PLT_BM_ADAPTIVE", "False") == "True"
+        self.min_repeat = int(os.environ.get("PLT_BM_MIN_REPEAT", "50"))
+        self.ci_width = float(os.environ.get("PLT_BM_CI_WIDTH", "0.02"))
+        self.memory = os.environ.get("PLT_BM_MEMORY", "False") == "True"
+        self.device_place_id = device_place_id
         self.statis_times = 100
         self.statis_round = 6
 
@@ -61,6 +69,83 @@ class LayerEvalBM(object):
             net = BuildLayer(layerfile=self.layerfile).get_layer()
         return net
 
+    def _memory(self, _perf):
+        """
+        计时之后执行一次前向并统计内存, 统计项见pltools.mem_profile
+        :return: dict, key为 mem_forward_统计项
+        """
+        profiler = MemoryProfiler(device_stats=PaddleMemoryStats(place=self.device, device_id=self.device_place_id))
+        _, forward_mem = profiler.measure(lambda: _perf(self.data))
+        return {"mem_forward_" + k: v for k, v in forward_mem.items()}
+
+    def _perf_timing(self, _perf, perf_repeat, plot_name):
+        """
+        计时并统计性能结果
+        :param _perf: 单次执行函数
+        :param perf_repeat: 性能测试轮次, 自适应模式下为最多采样轮次
+        :param plot_name: PLT_BM_PLOT开启时保存的文件名前缀
+        :return: dict, 包含耗时res, 每轮原始耗时raw; 自适应模式下额外包含采样轮次samples, 置信区间ci_low/ci_high, 变异系数cv
+        """
+
+        def _step():
+            for _ in range(self.timeit_num):
+                _perf(self.data)
+            paddle.core._cuda_synchronize(paddle.CUDAPlace(0))
+
+        if self.adaptive:
+            adaptive_bm = AdaptiveBenchmark(
+                statis=self.perf_statis, min_repeat=self.min_repeat, max_repeat=perf_repeat, ci_width=self.ci_width
+            )
+            bm_res = adaptive_bm.run(step_func=_step)
+            total_time_list = bm_res["samples"]
+        else:
+            total_time_list = []
+            # 预热
+            timeit.timeit(lambda: _perf(self.data), number=10)
+            # timeit.timeit(lambda: _perf(self.data), number=int(self.perf_repeat * self.timeit_num * 0.2))
+            for i in range(perf_repeat):
+                start_time = time.time()
+                _step()
+                end_time = time.time()
+                total_time = end_time - start_time
+                total_time_list.append(total_time)
+
+        if os.environ.get("PLT_BM_PLOT") == "True":
+            save_pickle(data=total_time_list, filename=plot_name + self.layerfile)
+            # 画图
+            perf_by_step(
+                data_list=total_time_list,
+                step_scale=[0.1, 0.5, 1],
+                filename=plot_name + self.layerfile + "_by_step",
+            )
+
+        time_res = eval(self.perf_statis)(data_list=total_time_list)
+        time_res = round(time_res * self.statis_times, self.statis_round)
+        # 保留每轮原始耗时, 入库后用于显著性检验
+        res = {"res": time_res, "raw": [round(t * self.statis_times, self.statis_round) for t in total_time_list]}
+        if self.memory:
+            # 内存测试失败只记录告警, 不影响耗时结果
+            try:
+                res.update(self._memory(_perf))
+            except Exception:
+                self.logger.get_log().warning("{} 内存测试失败: {}".format(self.layerfile, traceback.format_exc()))
+        if not self.adaptive:
+            return res
+
+        res.update(
+            {
+                "samples": len(total_time_list),
+                "ci_low": round(bm_res["ci_low"] * self.statis_times, self.statis_round),
+                "ci_high": round(bm_res["ci_high"] * self.statis_times, self.statis_round),
+                "cv": round(bm_res["cv"], 4),
+            }
+        )
+        self.logger.get_log().info(
+            f"自适应性能测试: 预热{bm_res['warmup']}轮, 采样{res['samples']}轮, 耗时{time_res}, "
+            f"置信区间[{res['ci_low']}, {res['ci_high']}], 变异系数{res['cv']}"
+        )
+        return res
+
     def _set_cinn_flags(self):
         """
         set cinn flags
@@ -85,32 +170,7 @@ class LayerEvalBM(object):
             logit = net(*input_data)
             return logit
 
-        total_time_list = []
-        # 预热
-        timeit.timeit(lambda: _perf(self.data), number=10)
-        # timeit.timeit(lambda: _perf(self.data), number=int(self.perf_repeat * self.timeit_num * 0.2))
-        for i in range(self.perf_repeat):
-            start_time = time.time()
-            for _ in range(self.timeit_num):
-                _perf(self.data)
-            paddle.core._cuda_synchronize(paddle.CUDAPlace(0))
-            end_time = time.time()
-            total_time = end_time - start_time
-            total_time_list.append(total_time)
-
-        if os.environ.get("PLT_BM_PLOT") == "True":
-            save_pickle(data=total_time_list, filename="dy_eval_perf_" + self.layerfile)
-            # 画图
-            perf_by_step(
-                data_list=total_time_list,
-                step_scale=[0.1, 0.5, 1],
-                filename="dy_eval_perf_" + self.layerfile + "_by_step",
-            )
-
-        time_res = eval(self.perf_statis)(data_list=total_time_list)
-        time_res = round(time_res * self.statis_times, self.statis_round)
-
-        return time_res
+        return self._perf_timing(_perf=_perf, perf_repeat=self.perf_repeat, plot_name="dy_eval_perf_")
 
     def dy2st_eval_perf(self):
         """dygraph eval"""
@@ -122,32 +182,7 @@ class LayerEvalBM(object):
             logit = st_net(*input_data)
             return logit
 
-        total_time_list = []
-        # 预热
-        timeit.timeit(lambda: _perf(self.data), number=10)
-        # timeit.timeit(lambda: _perf(self.data), number=int(self.perf_repeat * self.timeit_num * 0.2))
-        for i in range(self.perf_repeat):
-            start_time = time.time()
-            for _ in range(self.timeit_num):
-                _perf(self.data)
-            paddle.core._cuda_synchronize(paddle.CUDAPlace(0))
-            end_time = time.time()
-            total_time = end_time - start_time
-            total_time_list.append(total_time)
-
-        if os.environ.get("PLT_BM_PLOT") == "True":
-            save_pickle(data=total_time_list, filename="dy_eval_perf_" + self.layerfile)
-            # 画图
-            perf_by_step(
-                data_list=total_time_list,
-                step_scale=[0.1, 0.5, 1],
-                filename="dy_eval_perf_" + self.layerfile + "_by_step",
-            )
-
-        time_res = eval(self.perf_statis)(data_list=total_time_list)
-        time_res = round(time_res * self.statis_times, self.statis_round)
-
-        return time_res
+        return self._perf_timing(_perf=_perf, perf_repeat=self.perf_repeat, plot_name="dy_eval_perf_")
 
     def _dy2st_eval_cinn_perf(self, perf_repeat=10):
         net = self._net_instant()
@@ -162,32 +197,7 @@ class LayerEvalBM(object):
             logit = cinn_net(*input_data)
             return logit
 
-        total_time_list = []
-        # 预热
-        timeit.timeit(lambda: _perf(self.data), number=10)
-        # timeit.timeit(lambda: _perf(self.data), number=int(self.perf_repeat * self.timeit_num * 0.2))
-        for i in range(perf_repeat):
-            start_time = time.time()
-            for _ in range(self.timeit_num):
-                _perf(self.data)
-            paddle.core._cuda_synchronize(paddle.CUDAPlace(0))
-            end_time = time.time()
-            total_time = end_time - start_time
-            total_time_list.append(total_time)
-
-        if os.environ.get("PLT_BM_PLOT") == "True":
-            save_pickle(data=total_time_list, filename="dy_eval_perf_" + self.layerfile)
-            # 画图
-            perf_by_step(
-                data_list=total_time_list,
-                step_scale=[0.1, 0.5, 1],
-                filename="dy_eval_perf_" + self.layerfile + "_by_step",
-            )
-
-        time_res = eval(self.perf_statis)(data_list=total_time_list)
-        time_res = round(time_res * self.statis_times, self.statis_round)
-
-        return time_res
+        return self._perf_timing(_perf=_perf, perf_repeat=perf_repeat, plot_name="dy_eval_perf_")
 
     def dy2st_eval_cinn_perf(self):
         """dy2st eval"""
@@ -13,6 +13,7 @@ from generator.builder_layer import BuildLayer
 from generator.builder_data import BuildData
 
 from pltools.logger import Logger
+from pltools.export_cache import ExportCache
 
 
 class LayerExport(object):
@@ -41,6 +42,41 @@ class LayerExport(object):
 
         self.path = os.path.join(os.getcwd(), "jit_save_export", self.modelpath)
 
+        export_cache_dir = os.environ.get("PLT_EXPORT_CACHE_DIR", "None")
+        if export_cache_dir == "None":
+            self.export_cache = None
+        else:
+            self.export_cache = ExportCache(cache_dir=export_cache_dir, framework_commit=paddle.__git_commit__)
+        self.export_key = None
+
+    def _export_cache_hit(self, net, export_type, input_spec=None):
+        """
+        查询导出缓存, 命中时导出产物已拷贝到jit_save_export中, 无需再次动转静与jit.save
+        :param net: 待导出的模型实例
+        :param export_type: 导出方式, 同时也是导出文件名
+        :return: 是否命中
+        """
+        if self.export_cache is None:
+            return False
+        self.export_key = self.export_cache.key(
+            layerfile=self.layerfile,
+            export_type=export_type,
+            net=net,
+            input_spec=input_spec,
+            model_dtype=self.model_dtype,
+        )
+        if self.export_cache.restore(key=self.export_key, path=os.path.join(self.path, self.layername, export_type)):
+            Logger(export_type).get_log().info(f"命中导出缓存: {self.export_key}, 跳过jit.save")
+            return True
+        return False
+
+    def _export_cache_put(self, export_type):
+        """
+        导出产物写入缓存
+        """
+        if self.export_cache is not None:
+            self.export_cache.store(key=self.export_key, path=os.path.join(self.path, self.layername, export_type))
+
     def _net_input(self):
         """get input"""
         reset(self.seed)
@@ -76,12 +112,16 @@ class LayerExport(object):
 
     def jit_save(self):
         """jit.save(layer)"""
-        st_net = paddle.jit.to_static(self._net_instant())
+        net = self._net_instant()
+        if self._export_cache_hit(net=net, export_type="jit_save"):
+            return {"res": None}
+        st_net = paddle.jit.to_static(net)
         st_net.eval()
         st_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
         paddle.jit.save(st_net, path=os.path.join(self.path, self.layername, "jit_save"))
+        self._export_cache_put(export_type="jit_save")
         return {"res": None}
 
     def jit_save_inputspec(self):
@@ -90,12 +130,15 @@ class LayerExport(object):
         Logger("jit_save_inputspec").get_log().info(f"待测动态InputSpec为: {input_spec}")
 
         net = self._net_instant()
+        if self._export_cache_hit(net=net, export_type="jit_save_inputspec", input_spec=input_spec):
+            return {"res": None}
         st_net = paddle.jit.to_static(net, full_graph=True, input_spec=input_spec)
         st_net.eval()
         # st_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
         paddle.jit.save(st_net, path=os.path.join(self.path, self.layername, "jit_save_inputspec"))
+        self._export_cache_put(export_type="jit_save_inputspec")
         return {"res": None}
 
     def jit_save_static_inputspec(self):
@@ -104,18 +147,23 @@ class LayerExport(object):
         Logger("jit_save_static_inputspec").get_log().info(f"待测静态InputSpec为: {input_spec}")
 
         net = self._net_instant()
+        if self._export_cache_hit(net=net, export_type="jit_save_static_inputspec", input_spec=input_spec):
+            return {"res": None}
         st_net = paddle.jit.to_static(net, full_graph=True, input_spec=input_spec)
         st_net.eval()
         # st_net(*self._net_input())
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
         paddle.jit.save(st_net, path=os.path.join(self.path, self.layername, "jit_save_static_inputspec"))
+        self._export_cache_put(export_type="jit_save_static_inputspec")
         return {"res": None}
 
     def jit_save_cinn(self):
         """jit.save(layer)"""
         data = self._net_input()
         net = self._net_instant()
+        if self._export_cache_hit(net=net, export_type="jit_save_cinn"):
+            return {"res": None}
 
         build_strategy = paddle.static.BuildStrategy()
         build_strategy.build_cinn_pass = True
@@ -125,6 +173,7 @@ class LayerExport(object):
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
         paddle.jit.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn"))
+        self._export_cache_put(export_type="jit_save_cinn")
         return {"res": None}
 
     def jit_save_cinn_inputspec(self):
@@ -132,6 +181,8 @@ class LayerExport(object):
         data, input_spec = self._net_input_and_spec()
         Logger("jit_save_cinn_inputspec").get_log().info(f"待测动态InputSpec为: {input_spec}")
         net = self._net_instant()
+        if self._export_cache_hit(net=net, export_type="jit_save_cinn_inputspec", input_spec=input_spec):
+            return {"res": None}
 
         build_strategy = paddle.static.BuildStrategy()
         build_strategy.build_cinn_pass = True
@@ -141,6 +192,7 @@ class LayerExport(object):
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
         paddle.jit.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn_inputspec"))
+        self._export_cache_put(export_type="jit_save_cinn_inputspec")
         return {"res": None}
 
     def jit_save_cinn_static_inputspec(self):
@@ -148,6 +200,8 @@ class LayerExport(object):
         data, input_spec = self._net_input_and_static_spec()
         Logger("jit_save_cinn_static_inputspec").get_log().info(f"待测静态InputSpec为: {input_spec}")
         net = self._net_instant()
+        if self._export_cache_hit(net=net, export_type="jit_save_cinn_static_inputspec", input_spec=input_spec):
+            return {"res": None}
 
         build_strategy = paddle.static.BuildStrategy()
         build_strategy.build_cinn_pass = True
@@ -157,4 +211,5 @@ class LayerExport(object):
 
         # paddle.jit.save(net, path=os.path.join(self.path, self.case))
         paddle.jit.save(cinn_net, path=os.path.join(self.path, self.layername, "jit_save_cinn_static_inputspec"))
+        self._export_cache_put(export_type="jit_save_cinn_static_inputspec")
         return {"res": None}
@@ -15,6 +15,7 @@ from generator.builder_layer import BuildLayer
 from generator.builder_data import BuildData
 
 from pltools.logger import Logger
+from pltools.input_cache import INPUT_CACHE
 
 
 class LayerInfer(object):
@@ -35,10 +36,26 @@ class LayerInfer(object):
         self.testing = testing
         self.jit_save_type = self.testing.get("jit_save_type")
 
-        self.data = BuildData(layerfile=layerfile).get_single_numpy()
+        self.layer_module = BuildData(layerfile=layerfile).layer_module
+        self.data = INPUT_CACHE.numpy_inputs(self.layer_module)
 
         self.path = os.path.join(os.getcwd(), "jit_save_export", layerfile.replace(".", "/"), self.jit_save_type)
 
+    def _feed_inputs(self, predictor, place=None):
+        """
+        设置predictor输入
+        :param place: None则从缓存的numpy输入copy_from_cpu; 否则通过share_external_data共享该place上已构造的输入Tensor,
+            同一个case的多个predictor只构造一次输入Tensor
+        """
+        input_names = predictor.get_input_names()
+        if place is not None and INPUT_CACHE.enable:
+            input_tensors = INPUT_CACHE.shared_tensors(self.layer_module, place=place)
+            for i, name in enumerate(input_names):
+                predictor.get_input_handle(name).share_external_data(input_tensors[i])
+        else:
+            for i, name in enumerate(input_names):
+                predictor.get_input_handle(name).copy_from_cpu(np.ascontiguousarray(self.data[i]))
+
     def paddle_infer_gpu(self):
         """infer load (layer)"""
         reset(self.seed)
@@ -50,11 +67,7 @@ class LayerInfer(object):
         config.enable_use_gpu(1000, int(self.device_id))
 
         predictor = paddle_infer.create_predictor(config)
-        input_names = predictor.get_input_names()
-        for i, name in enumerate(input_names):
-            input_handle = predictor.get_input_handle(name)
-            input_tmp = self.data[i]
-            input_handle.copy_from_cpu(input_tmp)
+        self._feed_inputs(predictor, place=paddle.CUDAPlace(int(self.device_id)))
 
         predictor.run()
         output_names = predictor.get_output_names()
@@ -80,11 +93,7 @@ class LayerInfer(object):
         config.disable_mkldnn()
 
         predictor = paddle_infer.create_predictor(config)
-        input_names = predictor.get_input_names()
-        for i, name in enumerate(input_names):
-            input_handle = predictor.get_input_handle(name)
-            input_tmp = self.data[i]
-            input_handle.copy_from_cpu(input_tmp)
+        self._feed_inputs(predictor, place=paddle.CPUPlace())
 
         predictor.run()
         output_names = predictor.get_output_names()
@@ -112,11 +121,7 @@ class LayerInfer(object):
         config.set_mkldnn_cache_capacity(1)
 
         predictor = paddle_infer.create_predictor(config)
-        input_names = predictor.get_input_names()
-        for i, name in enumerate(input_names):
-            input_handle = predictor.get_input_handle(name)
-            input_tmp = self.data[i]
-            input_handle.copy_from_cpu(input_tmp)
+        self._feed_inputs(predictor)
 
         predictor.run()
         output_names = predictor.get_output_names()
@@ -143,11 +148,7 @@ class LayerInfer(object):
         config.enable_ort_optimization()
 
         predictor = paddle_infer.create_predictor(config)
-        input_names = predictor.get_input_names()
-        for i, name in enumerate(input_names):
-            input_handle = predictor.get_input_handle(name)
-            input_tmp = self.data[i]
-            input_handle.copy_from_cpu(input_tmp)
+        self._feed_inputs(predictor)
 
         predictor.run()
         output_names = predictor.get_output_names()
@@ -177,11 +178,7 @@ class LayerInfer(object):
         config.enable_new_ir()
 
         predictor = paddle_infer.create_predictor(config)
-        input_names = predictor.get_input_names()
-        for i, name in enumerate(input_names):
-            input_handle = predictor.get_input_handle(name)
-            input_tmp = self.data[i]
-            input_handle.copy_from_cpu(input_tmp)
+        self._feed_inputs(predictor, place=paddle.CUDAPlace(0))
 
         predictor.run()
         output_names = predictor.get_output_names()
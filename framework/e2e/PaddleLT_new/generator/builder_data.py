@@ -12,21 +12,18 @@ import numpy as np
 if "paddle" in os.environ.get("FRAMEWORK"):
     import paddle
     import diy
-    import layerApicase
-    import layercase
 
     if os.environ.get("USE_PADDLE_MODEL", "None") == "PaddleOCR":
-        import layerOCRcase
         import PaddleOCR
     elif os.environ.get("USE_PADDLE_MODEL", "None") == "PaddleNLP":
-        import layerNLPcase
         import paddlenlp
 
 if "torch" in os.environ.get("FRAMEWORK"):
     import torch
-    import torch_case
 
 import pltools.np_tool as tool
+from pltools.case_registry import load_case_module
+from pltools.input_cache import INPUT_CACHE
 
 
 class BuildData(object):
@@ -35,7 +32,7 @@ class BuildData(object):
     def __init__(self, layerfile):
         """init"""
         self.layerfile = layerfile
-        self.layer_module = eval(self.layerfile)
+        self.layer_module = load_case_module(self.layerfile)
 
     def get_single_data(self, framework="paddle"):
         """get data"""
@@ -43,7 +40,8 @@ class BuildData(object):
             # dataname = self.layerfile + ".create_numpy_inputs()"
             data = []
             # for i in eval(dataname):
-            for i in getattr(self.layer_module, "create_numpy_inputs")():
+            # numpy输入同一个case只生成一次, 各执行器基于缓存构造各自的Tensor
+            for i in INPUT_CACHE.numpy_inputs(self.layer_module):
                 if isinstance(i, (tuple, list)):  # 为了适配list输入的模型子图
                     tmp = []
                     for j in i:
@@ -98,7 +96,7 @@ class BuildData(object):
         # dataname = self.layerfile + ".create_numpy_inputs()"
         data = []
         # for i in eval(dataname):
-        for i in getattr(self.layer_module, "create_numpy_inputs")():
+        for i in INPUT_CACHE.numpy_inputs(self.layer_module):
             data.append(i)
 
         return data
@@ -132,8 +130,8 @@ class BuildData(object):
         """get single inputspec"""
         spec_list = []
         data = self.get_single_data()
-        if hasattr(eval(self.layerfile), "create_inputspec"):  # 如果子图case中包含inputspec, 则直接使用接口获取
-            spec_list = eval(self.layerfile + ".create_inputspec()")
+        if hasattr(self.layer_module, "create_inputspec"):  # 如果子图case中包含inputspec, 则直接使用接口获取
+            spec_list = getattr(self.layer_module, "create_inputspec")()
         else:
             for v in data:
                 if isinstance(v, paddle.Tensor):
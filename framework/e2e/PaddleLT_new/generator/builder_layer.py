@@ -11,21 +11,18 @@ import os
 if "paddle" in os.environ.get("FRAMEWORK"):
     import paddle
     import diy
-    import layerApicase
-    import layercase
 
     if os.environ.get("USE_PADDLE_MODEL", "None") == "PaddleOCR":
-        import layerOCRcase
         import PaddleOCR
     elif os.environ.get("USE_PADDLE_MODEL", "None") == "PaddleNLP":
-        import layerNLPcase
         import paddlenlp
 
         os.system("cd /root/.paddlenlp && rm -rf models")
 
 if "torch" in os.environ.get("FRAMEWORK"):
     import torch
-    import torch_case
+
+from pltools.case_registry import load_case_module
 
 
 class BuildLayer(object):
@@ -33,9 +30,10 @@ class BuildLayer(object):
 
     def __init__(self, layerfile):
         """init"""
-        self.layername = layerfile + ".LayerCase"
+        self.layerfile = layerfile
+        self.layer_module = load_case_module(self.layerfile)
 
     def get_layer(self):
         """get_layer"""
-        layer = eval(self.layername)()
+        layer = getattr(self.layer_module, "LayerCase")()
         return layer
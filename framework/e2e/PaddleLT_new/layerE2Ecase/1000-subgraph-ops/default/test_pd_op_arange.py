@@ -1,1008 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-            paddle.static.InputSpec(shape=[], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_92e3d542e45c79808e3e51765f0815bb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.int64)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_53261b325682a62cc6f065b1894033f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([20.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0c5d4aa2e73e82a1c8c8e4c9c3569e7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([96.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fddc8e4f61d1364e67c5404528289e34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([48.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1e58eb8c2b6cd0ea724cef544967e59f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([24.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9cf1c9a4d7e36eff494e4892c7dc4521(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_664c18e859c270321a397a08ea531eb9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4400835ad7a54bb365b7465f677d5de7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_90c148b4789220d5d5782a677869389d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([80.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fba4d63d3f9e588b68fb9f4db5a0648c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([40.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_53261b325682a62cc6f065b1894033f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([20.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_90c148b4789220d5d5782a677869389d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([80.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c8d1732596fabef173e2f5302787c08d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([14.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_14e554f91b2b51be492c1da1e23f7026(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([28.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cfc20fa3486576525ffb87835bccf1b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([56.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_53261b325682a62cc6f065b1894033f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([20.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f909b93da201133270c8be1cec7a2f0a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle.arange(input_0, input_1, input_2, dtype=paddle.float32)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2502d8bccbfcac0307f4ce34dc13a3e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f909b93da201133270c8be1cec7a2f0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([24.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3524c9bff6a836f50d798efc806005e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([68.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_937630ad62c3c29a1ef811fd0797adfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([34.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3e56695e9e9a4dfa6078724a40714502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([17.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dfa50655dc3639225cbd3de2a69fc13f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(16, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dfa50655dc3639225cbd3de2a69fc13f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(16, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_397e8971fa90e9ef3900082a23bf2bd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(8, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_397e8971fa90e9ef3900082a23bf2bd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(8, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4bae8404a9309158eb45abcb26aac7e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([152.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f660704994add1463dd7a3ef52e87f75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([100.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_19fe9d1a77f14b6acf42597a87897905(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([76.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1012d0b8c12a4573a283e08489ff660a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([50.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd595fca7853bdf2b014db8228852be2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([38.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b3e4b319ace0deb40e101fe621ed7a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([25.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1dd1d5726996fb84c4da25947fb26fbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([19.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fe54d766fac9494caf39dac89f5ffee9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([13.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c2eafb7befd9a2ad8736d445efc376de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([10.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3f31c854d08c430caba2084fe92e0bac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([7.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_451fe16d7aaf28645686c2539757d0ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([72.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3e2fd9aafb2f6372ca808b09067d1eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([36.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2ad5dcf3585109e0aed13a7467f930e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_92e3d542e45c79808e3e51765f0815bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([18.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3fbc1e6a8c29fe35264e89d4ea82b11d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(32, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_693fe48fdd1efe31992989e7942799ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(64, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_47ce023c27c90bebd395c45e0a347f86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1204107b08f75d2ff849140bb1cab0a
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-            paddle.to_tensor(128, dtype='int64').reshape([]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
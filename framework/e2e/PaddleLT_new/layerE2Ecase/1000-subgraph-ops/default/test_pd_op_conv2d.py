@@ -1,21334 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_874c28b98261a9c0f801e3b3e0eabd72(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[480, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_56c3f9ea30239b7eab3268ecc4c68d8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_874c28b98261a9c0f801e3b3e0eabd72
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_991e34b8310259732008e5c876cda386(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 576, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_20616e2cfbe564cb147a9832b4c49626(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_991e34b8310259732008e5c876cda386
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 576, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_66858f5e20b2167d3d10be3056eb5638(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 192, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192, 4, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0920273e0f5e48e97b3603cbe5181ebf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66858f5e20b2167d3d10be3056eb5638
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e2f1216bd347bf9ca5c8993ef8df6252(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 576, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8b54322b87c120bcda1cc99764c83844(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f1216bd347bf9ca5c8993ef8df6252
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d8d771701605dec05616a437f38260ad(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[576, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bcac768eba677d908182f848ef5debef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8d771701605dec05616a437f38260ad
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([576, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_410a52202b5ba5fa7dced71c15250686(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ce507eb7b315cd5a817be5b1913dafe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_410a52202b5ba5fa7dced71c15250686
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[40, 160, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b8b1cddd745ef6bfa4e84ce578b5d0d6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 768, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6258573d85c201afea4629cc5e77acad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8b1cddd745ef6bfa4e84ce578b5d0d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2c2a70445b46a81c66e59924a0a702e0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 192, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192, 4, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e10d915095dd2645d101116efd7ba98a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2c2a70445b46a81c66e59924a0a702e0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 258, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 258, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5a22334b60e7874b89727257b4032f11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[28, 672, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fc66b4f7529432b40dc9f750444cbb3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b2c498629d181a4471930129f3255347(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 28, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[672, 28, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_83061f94ad1769521e56e833ea788ad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b9c899e12f38d34ca2fc4db71ea3568b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 10, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a43eb6d422ceb17eba98af8e762fe9a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_633b8e35b9181ff5650df6ed7032e968(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a43eb6d422ceb17eba98af8e762fe9a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_35f3fabf92b69b12f1fc251b069dbf66(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b8e4cdd49b5fd8724cf2bc6dafed8757(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35f3fabf92b69b12f1fc251b069dbf66
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 40, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_673f1177c8eae462cd9e374fa9fa0ff5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[258, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9230ed987ca2a8e087a501ff937c48d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_673f1177c8eae462cd9e374fa9fa0ff5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 23, 23], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3d20201b5d860366e678abe674f2720b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[258, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ea21caddaf20c4c057149ca1e896759b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d20201b5d860366e678abe674f2720b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 46, 46], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_98b1aa86c6103308e46bdb019c4a8b72(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[258, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6d71c4f48cdd110dee35f639accb1b52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98b1aa86c6103308e46bdb019c4a8b72
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 92], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_811de970d9924f22625e06e64d42b0b3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6e8f1658a650fd419c5eb7aa2f8a01e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[4, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fd691a839ad98625a0d1e8aac0c32ef8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0e854755d267f86bd24cf41627606719(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_293b1fbc25e3737ec5b240a5e9cb56ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5461d676af213b8e40c035cf46e4d657(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_293b1fbc25e3737ec5b240a5e9cb56ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 64, 32, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4b8d9a2db9f4f5f377b83b302740fbe0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 240, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_64b8bbdb1efe13d2af6ed57750038fcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b8d9a2db9f4f5f377b83b302740fbe0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 84, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 240, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_22f4bc02785f523b704e706c4357d11b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[168, 672, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 168, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[672, 168, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_649005d597a57af8944224dbb06307a3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[30, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f3751f883aae941e8848b9fe16cb3302(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 30, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[120, 30, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9da6213b9f9b590fe5bac9d7a1b4508e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[8.2501859664917]], [[6.932194232940674]], [[7.612552165985107]], [[7.256061553955078]], [[7.942919731140137]], [[7.891726016998291]], [[8.28133487701416]], [[7.749438762664795]], [[7.674022674560547]], [[8.22433090209961]], [[7.68172550201416]], [[7.750961780548096]], [[7.011548042297363]], [[7.908207893371582]], [[7.478104591369629]], [[7.471679210662842]], [[7.2602996826171875]], [[8.059569358825684]], [[7.967419624328613]], [[6.88662052154541]], [[7.30298376083374]], [[7.154520034790039]], [[7.9740118980407715]], [[7.091414928436279]], [[6.766086101531982]], [[7.102862358093262]], [[7.430992603302002]], [[8.102372169494629]], [[7.599595546722412]], [[7.570135116577148]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_1d371b3e21c50c8b443aba88bf1e4114(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3c6d148a1e7d67ddfcb620da0816be3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d371b3e21c50c8b443aba88bf1e4114
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e57c4db7c599db6ceb28cc9fc8fc9126(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5d662963f16e0b3f126e1d4a2924788f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e57c4db7c599db6ceb28cc9fc8fc9126
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6a0f4fbca14945ca7764e9414f2a78c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_39211c452436b11f4be59256f7fd8eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a0f4fbca14945ca7764e9414f2a78c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_261f53ce33bee7b701de01f444eb9e65(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 19, None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 19, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7ce818e1a8bb01dd0643231a4bad1103(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_261f53ce33bee7b701de01f444eb9e65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 19, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.13327710330486298]], [[0.0076531642116606236]], [[0.20092031359672546]], [[0.24684381484985352]], [[0.041313689202070236]], [[0.3444598615169525]], [[0.34842321276664734]], [[0.29722991585731506]], [[0.401922345161438]], [[0.08659573644399643]], [[0.45648860931396484]], [[0.37542295455932617]], [[0.35212069749832153]], [[0.4854077696800232]], [[0.004670596681535244]], [[0.2588486075401306]], [[0.11519550532102585]], [[0.3378724157810211]], [[0.25991663336753845]]]], dtype='float32').reshape([1, 19, 1, 1]),
-        ]
-
-
-class PrimitiveOp_b1978266051110285842b5bf39d06401(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[720, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ec6a56759c789c41eeee7d48118c26b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[36, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15e4a385bf9670e0f19366bb1fcf714c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_879dd6736e60bb68502c38573f81944d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_822e1d679552f416de584e930e8f125d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e2883c81fdb2ddfe0c27262d1e36b65e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_000c24da0bd0a76acb236e8775cc9ba7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_395bc36d5d6033ab80e2e14d1f699247(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7ecbe8e63c2817cd59d45865ba87ec95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4882fa4772752e2e3c79d4cba89849c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6e47d97b55cdf867e0ddf9c72183300b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_02a997db6d976f2bc3d7edc92f326ab5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f267e4a91b4a64c44093febc76371e28(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 768, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2e55d5b2542f18799bdc610a8d3761c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f267e4a91b4a64c44093febc76371e28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_93cfd70947d89c6203cb4b377e3bbc42(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0120c2fbd969ae6e0b81afbd40fc03d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93cfd70947d89c6203cb4b377e3bbc42
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 256, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e8c9f5d655a06d267b0e93f14c5eec7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f267e4a91b4a64c44093febc76371e28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b1fee704af3bdf1a88126201407824a0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[960, 960, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bca71e7c6b9f8dfc164028550c851670(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1fee704af3bdf1a88126201407824a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_772604b6517c7febe3ad6a1fdfe43834(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 576, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5dc51aad9fbb030346b54ec67196c77d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_772604b6517c7febe3ad6a1fdfe43834
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 576, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f7543a75994cf3b6cec122e46b3dcd2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_673f1177c8eae462cd9e374fa9fa0ff5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 21, 21], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd3862145b861ab334467b99a150b13f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d20201b5d860366e678abe674f2720b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 42, 42], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3e44fee61d7bd95f40151f48b76f4b74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98b1aa86c6103308e46bdb019c4a8b72
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 84, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_903e7e2c7ace0bd2c4cfa9900f9dbd64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_673f1177c8eae462cd9e374fa9fa0ff5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5240cf17db923429c32c5238817e7b2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d20201b5d860366e678abe674f2720b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da7ed4d6e3ba9701de99ea47ea2e091d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98b1aa86c6103308e46bdb019c4a8b72
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_afec739cc797000106328d6cf26d5e47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[72, 72, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fc1a17ce6ba56bd6ef02f37527425593(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afec739cc797000106328d6cf26d5e47
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a41a5ab6540b6af50ed4f63d3b8abaca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[18, 8, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6bb44bcd37a2bc60eade89f52275ffba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a41a5ab6540b6af50ed4f63d3b8abaca
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_77f2d86011a1152af78617aec7926798(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.4382147789001465]], [[7.172217845916748]], [[7.839988708496094]], [[7.093533515930176]], [[7.588199615478516]], [[7.334031105041504]], [[7.226020336151123]], [[7.878104209899902]], [[7.134644031524658]], [[6.876903057098389]], [[8.207573890686035]], [[7.061928749084473]], [[7.545718193054199]], [[7.4662556648254395]], [[7.726208209991455]], [[7.755766868591309]], [[8.107254981994629]], [[8.222565650939941]], [[8.075759887695312]], [[6.480790138244629]], [[7.446372032165527]], [[7.7072224617004395]], [[7.286617279052734]], [[7.6667022705078125]], [[8.105085372924805]], [[8.341302871704102]], [[7.371513843536377]], [[7.748709678649902]], [[7.58203649520874]], [[8.013923645019531]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_abc7d1692a1336f0c016ef17832e51e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_51487d6cb97c8d4d0835a50311507f01(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b15ff904a64617c1722d46b78bd92e11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_59352157030777dd6ceb1d0b4ae1f837(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[112, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c32dbd605011871ad884997492fa7e92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 6, 6], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8c112b745c7b3dd4bc34a2ece5c0f2f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[5, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_50363e3a478eba81a1c516e06549ae6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c112b745c7b3dd4bc34a2ece5c0f2f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.037720054388046265]], [[0.15741494297981262]], [[0.2734352648258209]], [[0.21679821610450745]], [[0.40028369426727295]], [[0.029039310291409492]], [[0.34532681107521057]], [[0.09196615219116211]], [[0.0037758611142635345]], [[0.3240366280078888]], [[0.40875130891799927]], [[0.31617316603660583]], [[0.3694436550140381]], [[0.49093782901763916]], [[0.3176663815975189]], [[0.03579851984977722]], [[0.07391463965177536]], [[0.3240877091884613]], [[0.19690623879432678]], [[0.289758563041687]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([5, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e51a13c28be2f221b729b5364cc20473(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 5, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 5, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0cbb88f79489294b20a89f41da49a3dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e51a13c28be2f221b729b5364cc20473
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.1729425191879272]], [[1.050920844078064]], [[1.8103842735290527]], [[1.0185503959655762]], [[1.7034114599227905]]]], dtype='float32').reshape([1, 5, 1, 1]),
-            paddle.uniform([20, 5, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_509a1e7f8b8ad375ed1bf06e6ffa3a2d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f9bbb828c176ec56c626707bc50b9a68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_509a1e7f8b8ad375ed1bf06e6ffa3a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a6575ac1f771657d11790643355020e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 10, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[40, 10, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_04e5d5a8d70020f7e1c7892d0b864028(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a6575ac1f771657d11790643355020e9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.3636417388916016]], [[2.8115501403808594]], [[2.6660690307617188]], [[2.9447200298309326]], [[2.8664729595184326]], [[2.8791861534118652]], [[2.772390842437744]], [[3.2748148441314697]], [[2.3994789123535156]], [[3.3518660068511963]]]], dtype='float32').reshape([1, 10, 1, 1]),
-            paddle.uniform([40, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 960, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9b132e0e45b8363f2416de02491eae7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7a3586965c08f6767ebc721983fb6a91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[960, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75eb979a7bee2bd230100ad6a1be5cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3586965c08f6767ebc721983fb6a91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b165b87d8f4004fb505714a6319e46d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 24, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c57c97d7137d754c073f7875cd7539ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.104528427124023]], [[6.961180686950684]], [[6.71400785446167]], [[6.830350875854492]], [[7.2423248291015625]], [[7.559572696685791]], [[6.134675979614258]], [[7.428889274597168]], [[7.322786331176758]], [[6.550795555114746]], [[7.239031791687012]], [[7.2071533203125]], [[7.188485145568848]], [[6.755732536315918]], [[6.640803337097168]], [[7.492865562438965]], [[6.020525932312012]], [[7.016757011413574]], [[6.92329740524292]], [[7.183115482330322]], [[6.945228576660156]], [[7.333922386169434]], [[7.1487274169921875]], [[7.88762903213501]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[112, 160, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_93cd5a59f7edf68f936cd0155027038a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_12bbd2e655babbce2073262f529cee3c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 384, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 384, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9ea97ba0c778f975675adf35ea9542fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12bbd2e655babbce2073262f529cee3c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_79bb98fe5b1270d578b4d3ddca4a4bc5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bd9244d513759e303e3f80c73c05c3ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79bb98fe5b1270d578b4d3ddca4a4bc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([128, 128, 16, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4780eed66b51bd5311c8b1d4847f18a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9d323292a1969cdfebe5937407919f95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ef045e2998456dd0701c2c85bddd55f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_66756c6b2aac6b666202970b00e5ef12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_597460f113cdb9645c5d7a580b43dc47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 10, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 10, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_737c112022fe835cae66dbd2ca595bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_997afa2cb137a67ebc741714b2d0148d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0e8c057b8c6712427c0a3eeab2046b9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a2e9b8d34c302154cee58ca90f529760(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8730e097634a595714c6af4df9dcbf26(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 2048, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c39903709e1aa1e0472e3a247893830f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_28a9e41356405b6f7a5e2767c7bb2b43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bc77e5592019fed7e8ba4dd030024fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd85ac45a87d2ae01ec2d9a7bf1de264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ca56ce9095708f2c75869515954ac6e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_431ecee80e785d2ad5531714cac6aece(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c69db5a24a7cecea42331f252a11ba61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fda18936de6c2ab9ecd6acf8e08be0aa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 384, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e32f1c3b29d6a17d17168f8ad1d8df1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fda18936de6c2ab9ecd6acf8e08be0aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f767245719515f2a3a572194ca184b25(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[112, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5bdd8ef170bb9b1cf55b0e977bb50125(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc66b4f7529432b40dc9f750444cbb3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83061f94ad1769521e56e833ea788ad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[18, 72, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 18, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[72, 18, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ff2041585deffcbee8bfab36447dfd47(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5.484678745269775]], [[5.074028968811035]], [[5.828806400299072]], [[5.4740519523620605]], [[5.159370422363281]], [[6.245060920715332]], [[5.169663429260254]], [[5.357104301452637]], [[5.23924446105957]], [[5.223175048828125]], [[4.8893303871154785]], [[5.327600002288818]], [[5.111997127532959]], [[5.783746719360352]], [[6.086709976196289]], [[5.005163669586182]], [[5.18336296081543]], [[4.819846153259277]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b132e0e45b8363f2416de02491eae7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75eb979a7bee2bd230100ad6a1be5cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3586965c08f6767ebc721983fb6a91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f71022b12b25739db11b015cdd783780(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_66756c6b2aac6b666202970b00e5ef12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_737c112022fe835cae66dbd2ca595bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c167735f2b55e36c77d7dcb30f3ade3d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1152, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 1152, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_43071e7da4edd4e5ec2378e20c87c9b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c167735f2b55e36c77d7dcb30f3ade3d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_76546a0ed7d007a9ce46cb1807144df1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1152, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_48d25fb1287a91ded6f9bc6985a5b2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76546a0ed7d007a9ce46cb1807144df1
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1152, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3019fc336a19945f1d881af0b0710eb6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ba03b310f71bf25d14d6882375a7eee5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 184, 280], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0ccac40df7bb8519f4205797e8a0d0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d1bd8575d4cad4f3d2fd047eac170254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a5fedff54cff19820e2aac07226b638(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_489f852926328d0ef3bddc9ae8dd7b1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 184, 280], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a865e12c0daed378aa03ef0a86d4438d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_abc7d1692a1336f0c016ef17832e51e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_94946ac5d9f2061163b66983f901530a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_1df552bfd732ade67a3af1cec9d809fa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[76, 384, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ab90a11dad359e2bc84eec8ade3c4086(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1df552bfd732ade67a3af1cec9d809fa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([76, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_74f9d9b21ce88c8e8fe6bd1e5284ab2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6.983786582946777]], [[6.683963775634766]], [[6.350196838378906]], [[6.979458332061768]], [[6.205477714538574]], [[6.530839443206787]], [[6.541595935821533]], [[7.03007173538208]], [[6.504271984100342]], [[6.730112552642822]], [[6.467111110687256]], [[6.760300159454346]], [[6.718202114105225]], [[6.631244659423828]], [[6.2626752853393555]], [[6.156786918640137]], [[6.056285858154297]], [[6.5396809577941895]], [[6.595881462097168]], [[5.874543190002441]], [[6.579184055328369]], [[7.077872276306152]], [[6.161011219024658]], [[6.219567775726318]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e582e9bc79a4354f3ce0aae34ef1533d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0f12733aaddb68ef7e85605300de6fb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83fed16d291e9f337736700af7d82b59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dc369be7202e7f25c6b64a35a950bf6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e10ef08155193ba91db247e21259bb11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_448a2f6ee5aeb6dc17345d170fb8a1a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[4, 16, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c13ab3079ac66da11fe5da07a64153b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_448a2f6ee5aeb6dc17345d170fb8a1a7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.03482901304960251]], [[0.18538063764572144]], [[0.4325038492679596]], [[0.30522826313972473]], [[0.19145438075065613]], [[0.02684219554066658]], [[0.32013678550720215]], [[0.19158591330051422]], [[0.1768256574869156]], [[0.3816632330417633]], [[0.38803359866142273]], [[0.03649169206619263]], [[0.264602392911911]], [[0.3368885815143585]], [[0.4990680515766144]], [[0.0010921547655016184]]]], dtype='float32').reshape([1, 16, 1, 1]),
-            paddle.uniform([4, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c5a25e996af489cec0661804efa05c38(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 4, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d795896974173081efc4bd1e9f42b1d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c5a25e996af489cec0661804efa05c38
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.10427987575531]], [[1.3791073560714722]], [[1.2158668041229248]], [[1.2521073818206787]]]], dtype='float32').reshape([1, 4, 1, 1]),
-            paddle.uniform([16, 4, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_84b48686dd222c45e116c8e5c0860379(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[78, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7bc1dda0927cdf2f7f0bf41b3abdb1d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_84b48686dd222c45e116c8e5c0860379
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([78, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d9688e12983b5886296427c765cf86d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[78, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d29691487e515a1a11a5aa8f47e68562(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9688e12983b5886296427c765cf86d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([78, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bfd7c668de6add1b08b1647deddc9b74(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[78, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1d7920ee50890ee9bc83daea58da7b91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bfd7c668de6add1b08b1647deddc9b74
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([78, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_98f00834c08ce48a82fa9acbccafa75b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 44, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[11, 44, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c3ecba46574edf1d225fa9b9432104cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98f00834c08ce48a82fa9acbccafa75b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 44, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9f1061d727ada5b5908a819fa5e44575(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 11, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[44, 11, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9c1e17b9fb4ee0d4fc4c18e8289a6e95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f1061d727ada5b5908a819fa5e44575
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.8037075996398926]], [[3.653050184249878]], [[3.189301013946533]], [[3.479839324951172]], [[4.231141090393066]], [[2.9321372509002686]], [[2.8760643005371094]], [[3.063652992248535]], [[3.2276203632354736]], [[3.4634451866149902]], [[3.33797287940979]]]], dtype='float32').reshape([1, 11, 1, 1]),
-            paddle.uniform([44, 11, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_30010c1913aeb40b0050d0a29e981d65(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_005621aef7a3f06713c0bb830763c02e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_30010c1913aeb40b0050d0a29e981d65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2919c8acfe33519b67be6561272cda6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3e1424838fa7bdc3b4c8d283c27bf6fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c02c3f6029728566a9c3c9efa68a89cc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[196, 16, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3ee55135e521d452aa9ec505d856a0ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c02c3f6029728566a9c3c9efa68a89cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([196, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b132e0e45b8363f2416de02491eae7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75eb979a7bee2bd230100ad6a1be5cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3586965c08f6767ebc721983fb6a91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e0402296782ed73d40af710949159c20(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1000, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_38e39fb3fd0904d5485450851dbd99b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0402296782ed73d40af710949159c20
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[120, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[480, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a9fa19f6f0866528ba34e792b05a8e68(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 288, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a3a4618009682390186328ba3b8626e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9fa19f6f0866528ba34e792b05a8e68
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 288, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c8f2e7f569f3b158184706e35f6ac611(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 96, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0cf5783deaa540d7893c09044e614888(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c8f2e7f569f3b158184706e35f6ac611
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b5655d26892b558ed55172c90ede832a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.796370506286621]], [[7.425544261932373]], [[8.034993171691895]], [[7.881669521331787]], [[8.470291137695312]], [[8.410958290100098]], [[7.47309684753418]], [[8.655950546264648]], [[7.781922340393066]], [[7.3980937004089355]], [[8.336796760559082]], [[8.181797981262207]], [[8.256478309631348]], [[8.476247787475586]], [[7.3903303146362305]], [[9.282735824584961]], [[7.355771064758301]], [[7.882828712463379]], [[8.036581039428711]], [[7.611663818359375]], [[8.27880573272705]], [[7.5327606201171875]], [[8.172910690307617]], [[7.68001651763916]], [[7.941064357757568]], [[7.587181091308594]], [[7.815543174743652]], [[8.150639533996582]], [[7.904240131378174]], [[8.302390098571777]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ccf33e6cd22a9b25eabe33efdb46a7f9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [8, 8], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[43, 96, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 96, 8, 8], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f63f89821de26c758dd46c5c9228e606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccf33e6cd22a9b25eabe33efdb46a7f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc861a4b6b6d78dad9483f8e5feee323(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9ececbebbe8534f85d13689947cccea1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[34, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bb2004edf11c8b794f56bd048b494d12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ececbebbe8534f85d13689947cccea1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([34, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a99f70e0935d0ca2b6799e033cb8fb45(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 270, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 270, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5b3e7d70ee5531a0d2471d05c08f888c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a99f70e0935d0ca2b6799e033cb8fb45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 270, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 270, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa452a493997ddcab22fc3f1140804ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3978904b24740f1d14c01042123cd21e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7b144d83079c5103a292862364766c5e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[15, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_00e701e11f3fbd8d431462126c72b3f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b144d83079c5103a292862364766c5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_abddda5d36ae6eb4880038fb90337cc0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_73f1e568062e1e87fca39b57308c9d81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2bfd4b965836d313d573fc887c2aed4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_0ae3e570c54f95dc8c803fe4afaf58f4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cad2dacac46a386f6c6717876536aa29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ae3e570c54f95dc8c803fe4afaf58f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_62286ff9b8c69751c32c35dfdc2032ce(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 16, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_08d53abe525b5170ea3388f9aca09097(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62286ff9b8c69751c32c35dfdc2032ce
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.587721347808838]], [[4.3246612548828125]], [[4.479421138763428]], [[4.402522087097168]], [[4.6713032722473145]], [[4.385179042816162]], [[4.756476402282715]], [[3.9912707805633545]], [[4.334266662597656]], [[4.4837470054626465]], [[4.380829811096191]], [[5.2111053466796875]], [[4.420821189880371]], [[4.444425106048584]], [[4.850891590118408]], [[4.529412746429443]]]], dtype='float32').reshape([1, 16, 1, 1]),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_aa357ef2017d6d1858f00a75a92f6e6a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_69dd926f6c546de5de58120f60254b16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa357ef2017d6d1858f00a75a92f6e6a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bfb75d2e0a34ce01314b80b39b23a665(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[76, 768, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e4ade40f6bef57d0f93d7ce1c6d2aa9c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bfb75d2e0a34ce01314b80b39b23a665
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([76, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ea546cbe61c4d86e28da92d6a7241625(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 240, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4794c8ef4d860f7e46e5292e81a76fa3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea546cbe61c4d86e28da92d6a7241625
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 240, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 192, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_596a4ef2aeaec6bde71a78123d68a7f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_15330765d53807f6b1c71a1fe6e333de(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 17, None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 17, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ecf6f934a3bdf6527ba9f5ddab564063(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.3231879472732544]], [[0.04991677403450012]], [[0.2776494324207306]], [[0.49472689628601074]], [[0.007190635893493891]], [[0.241347998380661]], [[0.07446780800819397]], [[0.4469527304172516]], [[0.22014999389648438]], [[0.3308055102825165]], [[0.1293763369321823]], [[0.32726284861564636]], [[0.4960756003856659]], [[0.15591175854206085]], [[0.26663801074028015]], [[0.45408523082733154]], [[0.3901550769805908]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_942e5aae65cc8938c198a4c92a070efa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_23d227ff9ba35f47bc9aee5f9f2e3289(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2d833feb444c54b59a5e459d7be920eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b61f2f4dad335bc8a75b44a3e001d6cd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 768, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_69f0bf04178fcc2aac9bce746a98bdc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b61f2f4dad335bc8a75b44a3e001d6cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3fefd00a59005f5db8a4b821fc825b67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c8f2e7f569f3b158184706e35f6ac611
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5fdc7240f7aee846eceffbf2be155c70(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d5c4b08d5ef5e9080ea99f462c7bd17e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fdc7240f7aee846eceffbf2be155c70
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d5c4b08d5ef5e9080ea99f462c7bd17e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fdc7240f7aee846eceffbf2be155c70
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 40, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_23a2ddba04d4001035e42690a4d8dbaa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_02bf013a07984d2a522011c4107fb764(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4a686bb6686ab3f5aea3a7ee6fde2984(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d222fdd3298eb2f2c6c4eb5a774d32d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_79bb98fe5b1270d578b4d3ddca4a4bc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 128, 16, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_20053d53fc6eaff30752be50bb03cf7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.15899789333343506]], [[0.1279740184545517]], [[0.4714583158493042]], [[0.013788492418825626]], [[0.3605746924877167]], [[0.021225279197096825]], [[0.4222475588321686]], [[0.3078031837940216]], [[0.12270784378051758]], [[0.436213880777359]], [[0.20060449838638306]], [[0.0653734877705574]], [[0.10927435755729675]], [[0.3027559220790863]], [[0.4468083679676056]], [[0.10805145651102066]], [[0.17075158655643463]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_a41cc079bf64b6b1d8dd981ab9d76fd1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_480188eb2a3a0c8d0e28b9efd351f31d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7e16f572eee281e1a8a1a48baf102c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e25c834609b089ea67d6ae435c8bc321(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_23cc153e7005222814c123a5fcf00395(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a4490077aeaeca03a7a864217c99941d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e3e5c935a0d31216f3cb716853a7008f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a4490077aeaeca03a7a864217c99941d
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 64, 16, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c61cf870e3bf0071fe5a1d3bd1b43498(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b7acf70546ab41b091e5ef35ae1aa5bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c61cf870e3bf0071fe5a1d3bd1b43498
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 10, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_659fd0b2ad50a723004e23481866a55e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_88dd544716d0e811af1e89d8abca9369(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_659fd0b2ad50a723004e23481866a55e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 20, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_53bc9470e19efa0070af1c52133b864d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_883abac584ab91617af7dbc8c16f4e47(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_53bc9470e19efa0070af1c52133b864d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2f5c9935e95b505bb25cbaa3944d06e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cc88c1c9e86af8522cedec40b3a837b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ea6028350653a293ef257b9125b6f2d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e059c59204380e621540f555ad0814b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93cfd70947d89c6203cb4b377e3bbc42
-    def get_inputs(self):
-        return [
-            paddle.uniform([3, 256, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc66b4f7529432b40dc9f750444cbb3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83061f94ad1769521e56e833ea788ad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4780eed66b51bd5311c8b1d4847f18a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_44b260ff430943c31cec9c584e593cfe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3e954b91cfc8e9f907e7b37844c0bb06(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_39a978e0b0a2d92ea2abc854b9725745(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3e954b91cfc8e9f907e7b37844c0bb06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_946bc92564835d934783134cf032df4f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_facbf155137ef2404833cad4ce27a8ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_946bc92564835d934783134cf032df4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_74b3d7a1b5ccb6fa76591f83f366e458(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 32, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_03ce694d189e2a955d13193fc5157185(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_74b3d7a1b5ccb6fa76591f83f366e458
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 32, 64, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2b74a19688ae6f6c919503d39fa5c925(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.965019702911377]], [[7.700647830963135]], [[8.405227661132812]], [[7.43557071685791]], [[7.802799701690674]], [[7.760162830352783]], [[7.512366771697998]], [[7.2944231033325195]], [[8.090426445007324]], [[7.602020263671875]], [[7.561552047729492]], [[6.983290672302246]], [[8.4525146484375]], [[7.89238977432251]], [[8.067671775817871]], [[7.534737586975098]], [[7.731925964355469]], [[7.776444435119629]], [[7.235656261444092]], [[7.494112968444824]], [[8.015143394470215]], [[8.311062812805176]], [[7.456423282623291]], [[7.688058853149414]], [[7.6000518798828125]], [[7.871383190155029]], [[7.536570072174072]], [[7.285067558288574]], [[6.742663383483887]], [[7.58042049407959]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_01ab77eb71d6d1e6647c75273ed80028(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b144d83079c5103a292862364766c5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f23ab9bf1f49e1d1e7c7acf6068c824a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 320, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c76e3a6a886d436de5bfe09b4e3f7ca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f23ab9bf1f49e1d1e7c7acf6068c824a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a3166a926a3f1b8d29f7eb031d55e8f7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75d1d4909bc56bfcbd2f936aafccf30f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3166a926a3f1b8d29f7eb031d55e8f7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_1b8c55b4c23f35b4f84a082e29bcbbe2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 100, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[25, 100, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75e2e42505e389a404c1b2313f51ed1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b8c55b4c23f35b4f84a082e29bcbbe2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_dbdd9578d5f71ce59bc106ece4ce20a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 25, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[100, 25, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0c7ddc5a2163ca65e3d0c476ecbc9ae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbdd9578d5f71ce59bc106ece4ce20a6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.269874572753906]], [[6.50400447845459]], [[7.275503635406494]], [[7.267482757568359]], [[6.673055648803711]], [[6.645165920257568]], [[6.792430400848389]], [[7.175436019897461]], [[6.256261348724365]], [[5.848960876464844]], [[5.810983180999756]], [[6.566005229949951]], [[6.111290454864502]], [[7.201818466186523]], [[6.263810157775879]], [[6.334699630737305]], [[6.466543197631836]], [[6.602529525756836]], [[6.388439178466797]], [[5.946466445922852]], [[7.072900772094727]], [[6.712144374847412]], [[6.521991729736328]], [[6.767359733581543]], [[7.125980377197266]]]], dtype='float32').reshape([1, 25, 1, 1]),
-            paddle.uniform([100, 25, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6516f918c20bfc9f3572d630a54a527c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 128, 4, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_146c89f07538d0bae80820282c01cd30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6516f918c20bfc9f3572d630a54a527c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c0bfc7aa193a3c990619b102261a765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dade49e25e26fde73e913fa7550549da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b144d83079c5103a292862364766c5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f63f89821de26c758dd46c5c9228e606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccf33e6cd22a9b25eabe33efdb46a7f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_03b572b13dd15516633c8dc1d7a56912(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 51, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[19, 51, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_afb0d0f48bcb66cb2a825050d533750d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03b572b13dd15516633c8dc1d7a56912
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 51, 256, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 51, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_450fafe42ba9887f209de6564357d403(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_293b1fbc25e3737ec5b240a5e9cb56ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 64, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e45fe5c6dceadf97a94c0b399a2d9173(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 2048, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_36e8a2be0075f037f71307438b1ec586(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 1024, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e702a3e43ff7428489f54c38d4777297(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 512, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6629a359b210f75a13968bf7fc5627f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [4, 4], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 256, 9, 9], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c774481bff8021ef19842c57609547aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0672f1dc5d0ae87b3fc376ce71014f7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ff4dd525d17035ceb7b31c6f85c6c25d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b6efd4c551a5e47138720d4e855d73c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4c376a775037cde911d064101e2b5c99(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_551a1a203ff614fa6549f91b7bd04dfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2d68713926d926b7dfd8efd3d7daeec4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d2033288c348dad58011009c9d87420e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [4, 4], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64, 9, 9], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_da40c95a442c73772c50b613fd495e81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd2f20e6d96f868f997be0d936636f49(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b21226d73959772bf235bfb6d00d2200(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4ba0e4cd5a741ae9587081e88c869f95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 64, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b132e0e45b8363f2416de02491eae7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75eb979a7bee2bd230100ad6a1be5cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3586965c08f6767ebc721983fb6a91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 384, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b4dc79aabdc2f7ab0a2855437294a8ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e8380088f300855fcfa29d08fc919b71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.49344930052757263]], [[0.3431015610694885]], [[0.17646424472332]], [[0.4508698284626007]], [[0.4939868748188019]], [[0.23359593749046326]], [[0.1769866943359375]], [[0.44417694211006165]], [[0.10587800294160843]], [[0.16636717319488525]], [[0.372622549533844]], [[0.21326027810573578]], [[0.09613523632287979]], [[0.489317387342453]], [[0.07733223587274551]], [[0.03279281407594681]], [[0.2340717911720276]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_f5c80d3b03d91813f807190a557257d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ffd54f8add22590ac313c31f27ad973f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a43eb6d422ceb17eba98af8e762fe9a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5d8aa825280fe17cb6ba431b646c8e05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35f3fabf92b69b12f1fc251b069dbf66
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 76, 136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_683f0f05f7e2f01f31c215f6c9d31646(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_04927c8061e72140bcbb26682cef0167(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_751df1a1132897de22ad8e5cd64ea248(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b6a0c9bdb49eb29017240b26bcb1f927(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d438228d0b3f8df15a8b51327a839522(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6a0c9bdb49eb29017240b26bcb1f927
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2454023993a2231506eb051e0b211b64(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8d94a0abfd0d5f605f51cb7c17bc6970(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2454023993a2231506eb051e0b211b64
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_941893defd2b7842d1848f9de13ec512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_387031f4b60b641507339d72bbde2946(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a574ef2810e2510a4fc69656f746380d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c02c3f6029728566a9c3c9efa68a89cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([196, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[60, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1fb5685bd358c3c29a615f5de08793f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 60, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 60, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4f94b27aed234746769d819ffe29dbeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d72de3c78aca683e676efc29be2cae6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_cd5724848d12a2235dc893ad105b7291(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d0fc3caf3a2fa6bfabc2be2e01d9d2f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5724848d12a2235dc893ad105b7291
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7ee8ccf8d5755d8476675e2e650cbcd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5.160754203796387]], [[5.997652530670166]], [[5.622430324554443]], [[6.166098117828369]], [[4.808307647705078]], [[5.185327053070068]], [[5.284343719482422]], [[6.009469509124756]], [[5.161757946014404]], [[5.336788177490234]], [[5.176393985748291]], [[5.559955596923828]], [[5.87173318862915]], [[4.927751541137695]], [[5.911347389221191]], [[5.122724533081055]], [[5.748874187469482]], [[5.282630443572998]], [[5.053696632385254]], [[4.8179192543029785]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa1417e27f49c9fedd2c640fae6847ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dffd40b7cb284a2849670581abcaeb6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a4490077aeaeca03a7a864217c99941d
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 64, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c76e3a6a886d436de5bfe09b4e3f7ca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f23ab9bf1f49e1d1e7c7acf6068c824a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75d1d4909bc56bfcbd2f936aafccf30f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3166a926a3f1b8d29f7eb031d55e8f7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_0ebad4b794241d8c4ce4069c159e7be0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[27, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b3eb3b0bb1302b368a97ea9792201579(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ebad4b794241d8c4ce4069c159e7be0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_98f0237fa09649bdaa5b9ce55be53239(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.10308819264173508]], [[0.07955647259950638]], [[0.027185657992959023]], [[0.13565252721309662]], [[0.02282579056918621]], [[0.024113312363624573]], [[0.21108078956604004]], [[0.3940810561180115]], [[0.42013677954673767]], [[0.2871836721897125]], [[0.003993629012256861]], [[0.2533699870109558]], [[0.17363405227661133]], [[0.10497879981994629]], [[0.006723104044795036]], [[0.21087531745433807]], [[0.4699722230434418]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_253c3415a3abe5bae70f17206e626071(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [16, 16], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 3, 16, 16], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_62f29f85d30387b7d6986b33531fdbb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_253c3415a3abe5bae70f17206e626071
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 3, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6ad537635ef674f37ad453b8e4e7a28c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c61cf870e3bf0071fe5a1d3bd1b43498
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 19, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f04647a9c64d519554fb61201a868bc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_659fd0b2ad50a723004e23481866a55e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fbabe3b437c730e36f8069fcd9d2dd2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_53bc9470e19efa0070af1c52133b864d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 76, 136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_daa25e5af0d9cdf1f6f37b5ce9a1a416(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 3, 4, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3162b73011db3f8192a7b5f705bea10f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_daa25e5af0d9cdf1f6f37b5ce9a1a416
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 800, 1216], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_71b394b66fcd4bf4a07ecf533751acaa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.61201810836792]], [[4.536763668060303]], [[4.598280429840088]], [[4.286109924316406]], [[4.312885761260986]], [[3.928863286972046]], [[5.247699737548828]], [[4.219944953918457]], [[4.198246955871582]], [[3.463104724884033]], [[5.034609317779541]], [[4.0184102058410645]], [[4.341063022613525]], [[4.320268154144287]], [[4.415691375732422]], [[4.435419082641602]], [[4.092111587524414]], [[4.157284259796143]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c19365451c35a5ffcf247efa93235574(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 176], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_85e8056cadad7b8f669dd8bc33aa220e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3c02e0e2cda69fcc7961c6cbe5076773(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d6cfbbaddb0d1011878676a0ddbd6759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ac9d937244f8876757a1239962592b54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 176], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_98097672a6537d133d7c00567cf647ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_355ae80b0d7977ef0fe2512a164ed179(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_182fcb8f877af9330895fda1ca8800a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_73b3cc4bda1ec2887481d98fb40a02cc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[4, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6cacbb94328b55f80ad3035774c3ab6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73b3cc4bda1ec2887481d98fb40a02cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_1ba1f38248eaf6624e589b6c9dbc13c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 4, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8e8f29725bf369b50de814fa5803a875(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ba1f38248eaf6624e589b6c9dbc13c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 4, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 4, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_789792ae08569e72dc7a90a68be0a175(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ebad4b794241d8c4ce4069c159e7be0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_59ff0cd814d496a46a93ab37dd18e819(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[576, 576, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_155939f39891d04201c7d427d827f947(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59ff0cd814d496a46a93ab37dd18e819
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([576, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ae7510e575cbf41e2b244a62348f8d87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae7510e575cbf41e2b244a62348f8d87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_061ab133b8905c0454e23f8eeed55e09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6258573d85c201afea4629cc5e77acad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8b1cddd745ef6bfa4e84ce578b5d0d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8b54322b87c120bcda1cc99764c83844(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f1216bd347bf9ca5c8993ef8df6252
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bcac768eba677d908182f848ef5debef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d8d771701605dec05616a437f38260ad
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([576, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8a346aa1441e2003d80ef2d8a3612ccc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f660ee82d2ef483ae4fa09d1a025971b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a346aa1441e2003d80ef2d8a3612ccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_efb6fbd98e205bbce7b4b680582478ca(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[480, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_76893a9f07dcef4c73ee9e033e4d8430(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb6fbd98e205bbce7b4b680582478ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 20, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159440d837b6bee92e2fa03255465b87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 4, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7dc1baa18e9fe83832847a56ab2611d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa357ef2017d6d1858f00a75a92f6e6a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_97bf810464cf9c95cc156a98ccb4e57d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[19, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e74a3ac20e1005614535a29dcf9c54ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97bf810464cf9c95cc156a98ccb4e57d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c303061c52bb6d8567d7b87e1ff89104(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3070ccaf89619708ac2e7f46fa4da103(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [8, 8], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 96, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 96, 8, 8], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0fcc6be989fd32c61acf5098f97f00b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3070ccaf89619708ac2e7f46fa4da103
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_155939f39891d04201c7d427d827f947(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59ff0cd814d496a46a93ab37dd18e819
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([576, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b26fb3acaba89ea7d630a3c638cb85fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_86c32f2dbb57402c3862475eb79b9c6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f267e4a91b4a64c44093febc76371e28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b406f43b316a78a38b27049c4386b591(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_82cc090f828a44c4df071f64fdcc4c04(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 8, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_01b0ee44f61b857d1457d415e052150e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82cc090f828a44c4df071f64fdcc4c04
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_01b0ee44f61b857d1457d415e052150e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82cc090f828a44c4df071f64fdcc4c04
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb6f426917f7857ffb0591cd09c9b212(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f63b8ad6923014897208e66948199bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65ddd5547ee76f816fc023c51b301f49(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ae840f6fd9ba08298a0e40a41a06fc01(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[12, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_80c7b37617d539e1646018326e9c87e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ae840f6fd9ba08298a0e40a41a06fc01
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_80c7b37617d539e1646018326e9c87e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ae840f6fd9ba08298a0e40a41a06fc01
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4ba0482c61514fa4ee91d14bb81158a8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 3, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4fc0049f9f37d373a5748e88a307b5a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ba0482c61514fa4ee91d14bb81158a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3, 224, 224], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5e763037a51d651d257898b9d06a0d0f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1ac06c232ea9a1fe5aab80d61311cd67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e763037a51d651d257898b9d06a0d0f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bd285a54b789af28514707c00cc7b7c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 16, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_376f6cac6ae9264fdd1a34cb8adaf3a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 16, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_94cd8c90d30d1d0503a79f9e8448e15f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2f8778e2826e2a172fd70c45d3cf7656(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_29b0412fc4411b2ba61a0dbb436d8d92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f8778e2826e2a172fd70c45d3cf7656
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_376f6cac6ae9264fdd1a34cb8adaf3a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_94cd8c90d30d1d0503a79f9e8448e15f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_36523538a77376ff367c11944646e4d6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bd7fe26e0b946f4f0c7b6451adc67c9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_36523538a77376ff367c11944646e4d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_48ac6d80a48c9baa087bfde7925c316c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7ce1c1d67136181ff289a39607ae5867(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 32, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f21381a0d6111d61609881999507a94a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_202c8852203ccabcc14bd160f24594d9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d9898a3e682aa7506455bf500356ed55(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_202c8852203ccabcc14bd160f24594d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f8ac11b58e399d92a65479d797dbeb4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c556657b03158c44cf835c36e9b63c44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_dd561fa2c98b28f3353a22f3b96d1029(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e2db3ad4ee411fb3f5733bc864eb35d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd561fa2c98b28f3353a22f3b96d1029
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_868dd701f92a580addf90948c8d783ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 48, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_49791aa6a23c0398c9da5ae0eba5c667(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_811fed8f57bff702d24d72809a2e3782(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_778e5ff9c929085fee3baeead75ca587(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811fed8f57bff702d24d72809a2e3782
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_868dd701f92a580addf90948c8d783ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_49791aa6a23c0398c9da5ae0eba5c667(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_62a91881d2c296fc8162e151a5964ec7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_916d26895b5cbea8da2ad501342fe5f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62a91881d2c296fc8162e151a5964ec7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bab3427594f721182ec809dcc3e8450f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c07e42931753d3f02f5a9a9c79581489(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a1666c5625485e96d2eed10b9b528b23(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f12019a6df67eecfc7db840388a04d27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_37c0b904fac81068fe6fda64da6f3695(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3275435c57aaf14f51769c7bf1481eac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3b4bd5f744da3bb0d8c68377b67b163a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4a4fb45108efabcaf0e77647df367cb2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a9102e04865c6eff81dff4840ce0a076(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1000, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aecfc9ffdbf02849d4d5933d96a42549(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9102e04865c6eff81dff4840ce0a076
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6ca1106c0c20a2e5f455c758667e3c7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fb5685bd358c3c29a615f5de08793f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4f94b27aed234746769d819ffe29dbeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_82b1c1b9fe5e619b2eb8ea3bf80e378c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.714488983154297]], [[4.443142890930176]], [[5.085370063781738]], [[4.209088325500488]], [[5.368871688842773]], [[4.3549628257751465]], [[5.382656574249268]], [[4.757989406585693]], [[4.818227291107178]], [[4.851780891418457]], [[4.6191253662109375]], [[4.718576431274414]], [[4.519834995269775]], [[4.6472086906433105]], [[5.415843963623047]], [[4.603140354156494]], [[5.2356276512146]], [[5.021620750427246]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e1c6901261227aa876a52d891cf1a6f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6.526523113250732]], [[6.043794631958008]], [[6.90977144241333]], [[6.102715492248535]], [[6.4980316162109375]], [[5.7348856925964355]], [[6.001577854156494]], [[6.258039474487305]], [[6.239075660705566]], [[5.31162691116333]], [[6.18557071685791]], [[6.083158016204834]], [[6.540745258331299]], [[5.996211528778076]], [[5.726161956787109]], [[6.026066780090332]], [[5.7318115234375]], [[5.774482250213623]], [[5.944167137145996]], [[6.283750534057617]], [[5.458617687225342]], [[6.294531345367432]], [[6.537069320678711]], [[6.027162551879883]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7d071309c7cf3d233365110bce84fb69(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 960, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_337af84351e2fd5f970d735dddd09f8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d071309c7cf3d233365110bce84fb69
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 21, 21], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 960, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_87b8f5bcaa48392282ace3a03caed29a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25fe1950bab8f1e4ec71aae9791927ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2ef4f69fa47e6dd93241ca0bef7faec2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_06f27e98ebafe97858375c75688f7e1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5505a486c4fd1ad14f7307c0d8ba228a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6cad5f36a5d1ba621f0b90641ea9a83f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c1f5f44f0cec4ed56aeb8e3b03920ebe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_adeda6ead2186c8e849e71bbca283422(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 11, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5ed8f550786dba40d9653ff2606a11c8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[150, 192, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_71fe089979f27301925fc90ffdcecaf2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5ed8f550786dba40d9653ff2606a11c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([150, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_216abce904b92882d98a1e14aa92193b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.739062309265137]], [[4.688821792602539]], [[4.776612281799316]], [[4.059608459472656]], [[5.166944980621338]], [[4.729506015777588]], [[4.730851650238037]], [[4.666179656982422]], [[4.102670192718506]], [[4.641115188598633]], [[4.6286540031433105]], [[4.33927583694458]], [[5.287729740142822]], [[4.956509590148926]], [[4.618988037109375]], [[4.08074426651001]], [[4.852072715759277]], [[4.769102096557617]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce507eb7b315cd5a817be5b1913dafe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_410a52202b5ba5fa7dced71c15250686
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_26c882baf4aa6c3a3f09789b0d3e11d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_59258bf939f158821072e42e3c995f66(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_658a324ef7bb1daff7bd5e41cd31e5f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59258bf939f158821072e42e3c995f66
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_658a324ef7bb1daff7bd5e41cd31e5f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59258bf939f158821072e42e3c995f66
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_26d594b0941411234a3f2b0fa903f7c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b20152466c561ee4f3c7af0eae766c32(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 192, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1b1f7f5d873a47e588be68063c6420c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b20152466c561ee4f3c7af0eae766c32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2722cf4d638bd5c84a8d34709d206778(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_34e6e20c98bb2921227ba7c748b84629(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2722cf4d638bd5c84a8d34709d206778
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_32a90f830833b5808830e0d31fa6f7d7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [3, 3], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 3, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ea3415365d8aa67e3a6ad9b06ba6d20a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_32a90f830833b5808830e0d31fa6f7d7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e163b821b218ca73d8bb067108d44afd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dc81561204c1d5bba3b5cf5ed6f73948(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba5e3eed8f1232a897ec2bd487f49463(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_95a50e03048f831a30e620e34401d844(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1568, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5d4689f9028489fbd68ea8bbabc9eceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95a50e03048f831a30e620e34401d844
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1568, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc872f047b5776afaeceb17377afc2fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_673f1177c8eae462cd9e374fa9fa0ff5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3fbe59f3b048ab72eb30f3e9eadfefe3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3d20201b5d860366e678abe674f2720b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289abf84763e78a48ffbbbd051ee21d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98b1aa86c6103308e46bdb019c4a8b72
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([258, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[6, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_03135b238c987a7435a9ae9bf6dc95e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 6, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 6, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bc765449d0a7ff7c622aa36960c4c437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b92c3d756e1df91017a6f912574bb8a4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[40, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_04bf640922cc1f740338e06d2d73b894(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b92c3d756e1df91017a6f912574bb8a4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_04bf640922cc1f740338e06d2d73b894(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b92c3d756e1df91017a6f912574bb8a4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 120, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_12aa0b5d2b1a02f25d03baae2d780146(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.917412757873535]], [[4.43644380569458]], [[4.775966644287109]], [[3.7165615558624268]], [[4.397369861602783]], [[4.7223920822143555]], [[4.5663065910339355]], [[4.643307209014893]], [[4.453743934631348]], [[4.898346900939941]], [[4.856120586395264]], [[4.6476263999938965]], [[5.165657043457031]], [[4.913374423980713]], [[4.844727516174316]], [[4.288026332855225]], [[4.44254732131958]], [[3.718435287475586]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9ebd665834d99fbf52cdcca2abccf3ed(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[120, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9b4cabbafef73d5cb9c0f026b4db96e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ebd665834d99fbf52cdcca2abccf3ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b1f7f5d873a47e588be68063c6420c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b20152466c561ee4f3c7af0eae766c32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_34e6e20c98bb2921227ba7c748b84629(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2722cf4d638bd5c84a8d34709d206778
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_03ab70957421f74782c050b914b079a5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [2, 2], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 3, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3f31c1c29bf07d2c51f96cf9fc013d67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab70957421f74782c050b914b079a5
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 3, 384, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b56fdd9ba3974810bec53cf3ba82392e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8141a6a699275202c28c9285899de22b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_66756c6b2aac6b666202970b00e5ef12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_737c112022fe835cae66dbd2ca595bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6e3a9558d2eadc6d2dedf0fda8ed7b79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4560ca4525c20ae367958ed06926cda4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c044cb24d41ac5e2f72735afbdc3cf8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_866d0f908e067d9c078c7721bf5518e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c97b09441a42700654f2a5daab992ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c1f31d6f2b755f42f39df7ef7699611(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ba0482c61514fa4ee91d14bb81158a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 3, 224, 224], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_160731aa29e2ca739f1bc8aa0b0571ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e763037a51d651d257898b9d06a0d0f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 96, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_894f22b6c79baaf55427089d4948e2a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_90583d513a9b39c4599cd8f6082be0e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_51bb024a7c58802d4e28e06bc7cca447(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f8778e2826e2a172fd70c45d3cf7656
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_894f22b6c79baaf55427089d4948e2a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_90583d513a9b39c4599cd8f6082be0e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_269771047b659412b9a1e18544a4afe9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_36523538a77376ff367c11944646e4d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e6b526866400ea9ce8c88655696a5ba3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bc84bd8edfd8b2270ed3aa9d7a794b58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ebf12e34d97170cbf211c72d090eb637(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_202c8852203ccabcc14bd160f24594d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_259c5b5fd5e03a542812c59d2b7bcc7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ce9835d2e3eacc4040c8a2fd930b2b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1aec82fb802831741d05f00d99313c63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd561fa2c98b28f3353a22f3b96d1029
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43723d8a24207209887fba620c8e151b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_53554abd8612221fecd2ce8c01210324(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ed9088194258fcf089471f26093b56e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811fed8f57bff702d24d72809a2e3782
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43723d8a24207209887fba620c8e151b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_53554abd8612221fecd2ce8c01210324(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4cbe39f60617253597475cbbb340364a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62a91881d2c296fc8162e151a5964ec7
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5fb17f31281c9d896e38f43d73f18290(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_76fdc87612da2e7371b54e029c625e8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa813335c8a56d1727c3f691a727763d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5fe6a2aed08ed99f3c38156a1a3f4ecf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_80be8969b67543dcfcc34f180c8d65c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ff9c832a45c443c352d31605ab63cc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9102e04865c6eff81dff4840ce0a076
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_0d3565e6b177772c1610491ce3939d07(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 192, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_afde5c18071d8cecc422f116c5b07b7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d3565e6b177772c1610491ce3939d07
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_86c32f2dbb57402c3862475eb79b9c6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f267e4a91b4a64c44093febc76371e28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4e37cfec893a281fa982911772172e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c659fea58380b59760b1f635b97d2eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7e392614e0cfc172fa2234c763f5c0d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ececbebbe8534f85d13689947cccea1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 160, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([34, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a705c2ae0eb22abfecb4b59eacac9e27(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[11, 384, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 384, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e5232be28914d2e8d2d4615fdaa578bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a705c2ae0eb22abfecb4b59eacac9e27
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a808845731e052e47a8b8ef0e16e14f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d44934b65dea2b31b4c9d053c309a6f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39a978e0b0a2d92ea2abc854b9725745(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3e954b91cfc8e9f907e7b37844c0bb06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_facbf155137ef2404833cad4ce27a8ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_946bc92564835d934783134cf032df4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a35843383a542ca6ed5d9ae114db9530(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9053c968977dc74f124006ada05b357c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a35843383a542ca6ed5d9ae114db9530
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e3b93680125e9be62e38fafdc89784ab(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4340ba88b907cea4ee342de5f306d7cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e3b93680125e9be62e38fafdc89784ab
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_454b3d25b64ad33f3d0c6fcf59ffab2f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[84, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c7b1c67e47db71dcb7629b5a3f2e300d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_454b3d25b64ad33f3d0c6fcf59ffab2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_31d0869ddd55e4257fd1d629fb3c2e02(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 1024, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8cbcf49fad97a17238a728340cb539d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31d0869ddd55e4257fd1d629fb3c2e02
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1024, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b3b583596d1695986acfcc2b131732f9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[126, 1024, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a562d246cf23b0c036fa0624d1d1de7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b3b583596d1695986acfcc2b131732f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([126, 1024, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_729bcfc79f6698208eaf5bbdebd96514(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8f5373dde52669cedaaeaa4687ae6ba8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_729bcfc79f6698208eaf5bbdebd96514
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e2d19613f749987122582126feb88cad(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[126, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_08b423a41977b2bd8680afff65c34288(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2d19613f749987122582126feb88cad
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([126, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a963a2784a93076bcdae4ace3b290e31(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_70d625e864384ae875470e13e262437f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a963a2784a93076bcdae4ace3b290e31
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_030c1e80ce9a16bab4f30b2d3fba3f35(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[126, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5614d1844cf541277d9af6cfc84a7f7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_030c1e80ce9a16bab4f30b2d3fba3f35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([126, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7ccc3d64534f1c53ca366ae1069a39f2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[16, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_616b034177728d256527a1931a73983f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ccc3d64534f1c53ca366ae1069a39f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_193ebbbe8fee0b927d611a8f51239d64(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[84, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_093a346d42e91aebd9541fab05640e2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_193ebbbe8fee0b927d611a8f51239d64
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_92787b0b72004f9e7ec9d1c52a8b2f06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ccc3d64534f1c53ca366ae1069a39f2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_481cd011699883c88bdc95abd4ab6a37(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_193ebbbe8fee0b927d611a8f51239d64
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f660ee82d2ef483ae4fa09d1a025971b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a346aa1441e2003d80ef2d8a3612ccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_76893a9f07dcef4c73ee9e033e4d8430(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb6fbd98e205bbce7b4b680582478ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 20, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b82b93126ae12171ec4e0049fbbc609(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e0e34d1254ece397202b03b627b18b33(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[19, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6504b27b98aad100fe32f582a6115969(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0e34d1254ece397202b03b627b18b33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c254eecc8bcf9fa5be7b77c08e35a2b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0e34d1254ece397202b03b627b18b33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2a93335d2828efbf25bd53d8387b0212(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa357ef2017d6d1858f00a75a92f6e6a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_24a0834025a83b53244df3892d19eb45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_edde788a911daf40bdcbf22f6a75003c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c167735f2b55e36c77d7dcb30f3ade3d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cef17f16aed7a7f8a26cc1a42bf7e6cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76546a0ed7d007a9ce46cb1807144df1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1152, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bdc839b316325680ff45e746d08fbe57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.4613591432571411]], [[0.12249109148979187]], [[0.10945823043584824]], [[0.011136097833514214]], [[0.3550030291080475]], [[0.17773422598838806]], [[0.22164998948574066]], [[0.04716044291853905]], [[0.3015330135822296]], [[0.024030441418290138]], [[0.1507667899131775]], [[0.3349452018737793]], [[0.22082705795764923]], [[0.3408581018447876]], [[0.005938991904258728]], [[0.42881447076797485]], [[0.3247759938240051]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_900b3510563f5aa613378992561c0eb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da5df937455b55318fb8dd1af30aae15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1c7e3af653d4d1979a0976a20f8f0237(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_761e5a473fa962a2513bc7821baa2533(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[8, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75bcf0469e50b03707e30efc31c2a32e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_761e5a473fa962a2513bc7821baa2533
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b5feb994062ccee80ae9930492e78081(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 8, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6318d7b4b7061bc709bd00719c77950e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5feb994062ccee80ae9930492e78081
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 8, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_0a00b404c1253518de08ceae318bad6c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[17, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_75cfe65d0cb6eeb1585dc5fd9268cdfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a00b404c1253518de08ceae318bad6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 256, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([17, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14dafd0635c8394196a16a4abb3d65ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6258573d85c201afea4629cc5e77acad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8b1cddd745ef6bfa4e84ce578b5d0d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0f878e1115df22d437f82c361671a0de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ff860d0ce2a4dd5f213b36e7a551dc80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_35fc1f876158868b5e4c05b14c5ab6df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_190ea0c2474976650f87c266bc5ca923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_de5ca77257694deb55fb3b0aa6b24f23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a8704d5fefa0a2ce7b21f9391c00d88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ecaf5974aa46db2bc940569107327a52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ab658fabb9b0af354a558e91d61d7063(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 48, 512, 512], dtype='float32'),
-            paddle.static.InputSpec(shape=[19, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4b2002157e5ccae6e58513f91541207e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ab658fabb9b0af354a558e91d61d7063
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f147ed80d3890875e2112833442dffba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e1923a6ebfa39da36d4764def59f4fec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a346aa1441e2003d80ef2d8a3612ccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6b6cb857af6a7e55b7e8024ec8fe9a40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb6fbd98e205bbce7b4b680582478ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 20, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8ea3483694613e836d65c721f5acbbc9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 3, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be6cf5a4ffa7b3d8619ed0050fb78f12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8ea3483694613e836d65c721f5acbbc9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 300, 300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 3, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b21fee2ea27b74c76eee5faa615b69aa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_76f6ad88f08b92a378b3eb156e58d6b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b21fee2ea27b74c76eee5faa615b69aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 300, 300], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_35212ce88817e57d6aa8838eca2f192c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e7e3a9d815156131c0d66bec17cd17e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35212ce88817e57d6aa8838eca2f192c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 150, 150], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3bf23cf48d5c9dc62a650ab1cac5abc3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6e2331123f9f7ca870090167a19d2a5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bf23cf48d5c9dc62a650ab1cac5abc3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 150, 150], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a34734697a15a9d05a828b0c66caacd6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d05ede35ebd97518ab85c3785407555e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a34734697a15a9d05a828b0c66caacd6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 75, 75], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6086e11506eca754672e96fffbcbb59e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 75, 75], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6086e11506eca754672e96fffbcbb59e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 75, 75], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8926025ee49db71ab3392eba88280f77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a43eb6d422ceb17eba98af8e762fe9a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_172bc9fc3e7a865b206987e12d2ef1ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_172bc9fc3e7a865b206987e12d2ef1ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f32900757fddfdaba92c9b3f2e74709(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f32900757fddfdaba92c9b3f2e74709(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f32900757fddfdaba92c9b3f2e74709(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9379489a9f4d9e002b3dd19ebf408e84(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [6, 6], 'EXPLICIT', [6, 6], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1024, 512, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d0b1d15e9d4d4c5e6e52d8563308eed9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9379489a9f4d9e002b3dd19ebf408e84
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_73657e7669187269c9ac998b176c323b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1024, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_acf5dc8089c40e11d38557bb4373078b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73657e7669187269c9ac998b176c323b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3a1a3027a5176aa572180715e8acb055(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_09e616fafa147178a83701b875aa8ebe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 256, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_07ddbf1ec06389bcdafb3b9e2c7ecd07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_09e616fafa147178a83701b875aa8ebe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7471699d4e06486eaf159971f0ec4e98(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d7dbc4f2fb0a36dd7631fdf60d7f3864(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7471699d4e06486eaf159971f0ec4e98
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_00485e29852405a4772ea302a0e8cc21(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_521a905fb87ba87fee896469a81dd78d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00485e29852405a4772ea302a0e8cc21
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ea5eaa026088ddcd0b9cab9296387c3c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7a2e551139d5e710e655b87b1eea8844(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea5eaa026088ddcd0b9cab9296387c3c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bdfe3dc7dc23deb0626cdddddf968635(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_80fb219e7e972454cfc5497dbba1fa6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdfe3dc7dc23deb0626cdddddf968635
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 5, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_071ce23bdc68f76f97cd0b6020cf5ab5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ea5eaa026088ddcd0b9cab9296387c3c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ea5df64e871ca0168e1cdad2f9231fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdfe3dc7dc23deb0626cdddddf968635
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 3, 3], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cc86418f162083a1967f3055282cc919(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa357ef2017d6d1858f00a75a92f6e6a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ab1f2904c79c583419d7f5f8c6557d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_88a579b30925ba47f7bb4f7f2a3ebf13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b572c021efcdfa7479d5b3bc5731661(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2d5d226b8e32696506fd5a7d42763b06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa357ef2017d6d1858f00a75a92f6e6a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_15bc780f1a9427f76f79c119d76e8213(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[392, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_04a1fdd3f3a0ce0a5f0b03a20c0152e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15bc780f1a9427f76f79c119d76e8213
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([392, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b13aaf9819040667e1f6f38cfbe6dbd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8894b962be7a9d95b9d0363a670d3f64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a99f70e0935d0ca2b6799e033cb8fb45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 270, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 270, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c90ac3d536b30e1cde7a67f8fddcb4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_06f27e98ebafe97858375c75688f7e1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5505a486c4fd1ad14f7307c0d8ba228a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6cad5f36a5d1ba621f0b90641ea9a83f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3123d01a6204f87c00409a7d1395a9ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 11, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_461608ff6869e1314a98466661f24c49(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 96, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7c66425e1dadb3031e77d741a60fef28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_461608ff6869e1314a98466661f24c49
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 96, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_496ae1fd4b18a87108d56e0dafbe0f0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.4881144165992737]], [[0.3354964256286621]], [[0.2737503945827484]], [[0.4202028512954712]], [[0.33306270837783813]], [[0.3567906618118286]], [[0.04899383708834648]], [[0.4501943290233612]], [[0.05747019127011299]], [[0.2938452959060669]], [[0.35720404982566833]], [[0.451032429933548]], [[0.16755808889865875]], [[0.3990401327610016]], [[0.05044800788164139]], [[0.2440059334039688]], [[0.07258781790733337]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_47b949791d32c5e029ac1d58fb3ee868(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b16c29429e684b0ed6f0ea5a60beba95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3d1a67bb90df0d3ba07f1c5ea64a782a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4789883e0a43709439812868e6bb908(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1adc8137126303fbb8432076b792dfcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43ea2a9136cf65a53223748aae7981ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3641fe7797593c156814f4a175b348a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_08349a7d882ccff3010093f6dd64e606(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fda8078d930016f842a444b3aeab19e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe2d82aecd40d6cef65df1f7e2e873a1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_73ddca396e13db8fbae45cf76ebf2444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bd82ce55f19338ed43d64e6e2bb1b612(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6ceecfa4ea27f7a8352d681718b849e5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3143c2716bce60c7eb208146ca5ddb32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce2ba631b6830d9ea873f793292be7c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae4c0122e038b4307bf36e540f470376(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3d11fb2807e3a6322ac0a0a83af93036(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1797a3dfefc87dfd4a329c7fdde84c1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2033288c348dad58011009c9d87420e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 9, 9], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_87d3176705d82fd6fe9eafea01c7d980(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[784, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1ec1637b15c2ea5ef900590d21780759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87d3176705d82fd6fe9eafea01c7d980
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([784, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_351ec9ec2fcf9d43169eebe325a75930(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[150, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_388e585d317c69b00e9a43c16580d974(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_351ec9ec2fcf9d43169eebe325a75930
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([150, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5c9f78e9784980eb2a5802d83da4b80e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[288, 288, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1b9a7bef26d42f58a5a09749b65af37d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c9f78e9784980eb2a5802d83da4b80e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([288, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce507eb7b315cd5a817be5b1913dafe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_410a52202b5ba5fa7dced71c15250686
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b56fdd9ba3974810bec53cf3ba82392e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_38982cf41a448e1975046c61dfaca88c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c809f709818b225353075ee350fa3662(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f70a7a3c02b74f6e0aa75f7e013a7636(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0feda2c207be35d4b9d772922f1eca
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 15, 27], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_beaff835dc3fb4f6c5ac30a0e6e0c5a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a43eb6d422ceb17eba98af8e762fe9a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 30, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fb5858f2f3b59842d06db9957ea1804e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35f3fabf92b69b12f1fc251b069dbf66
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 108], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d4a6cf17f69abda5b6919b6e3e950f45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.799499034881592]], [[5.0738348960876465]], [[5.145184516906738]], [[5.271538257598877]], [[4.93988037109375]], [[4.938347339630127]], [[5.326796531677246]], [[4.89114236831665]], [[4.54721736907959]], [[4.589522361755371]], [[5.180274486541748]], [[5.083128452301025]], [[4.926649570465088]], [[5.409045696258545]], [[6.189463138580322]], [[5.0238542556762695]], [[5.464358806610107]], [[4.966123104095459]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fb5685bd358c3c29a615f5de08793f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4f94b27aed234746769d819ffe29dbeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9aff983d5270ec823dd578c3c2da8da4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 13, 19], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_725646bcbfa4d2ff06b6b4dc26792fd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9aff983d5270ec823dd578c3c2da8da4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_419c4f7a89e408e13f4285f31091434d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, 13, 19], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_718b4d88cda9cd26091f9d8a16ba2f32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_419c4f7a89e408e13f4285f31091434d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b356282c83a819090f47a759ff775b10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_69a12ff6f866d4be455f0041b428a4f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a92a67ccc590128d4f0ef0efa00d0988(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9a1d8ed0803bc9408eddda658298a2fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa452a493997ddcab22fc3f1140804ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 160, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f5eeeec71e7429f30d7c5451a3bc58d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 46, 46], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_35a02a04285bbae15e84ee566d958a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af1424b21dc0075ba4529c9794c8b2ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4e8c78d762c3730b07a67fa7bfe7d99b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_84ad23a9a3ed7bd9e79981138bbeda52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d47b1a194e1871acd288257be617b97b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5cee6ee4e970c6fd0ad5439bdf524b83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_367baa7dd172d944c099ce4c984f8be1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_97b9fdd35b2e2de745e5f13de29de066(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cad2dacac46a386f6c6717876536aa29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ae3e570c54f95dc8c803fe4afaf58f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f80395d680b8d906f10cda85f2ed8f30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62286ff9b8c69751c32c35dfdc2032ce
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.9688429832458496]], [[3.5228958129882812]], [[3.7565701007843018]], [[4.503530979156494]], [[3.484788179397583]], [[4.319233417510986]], [[3.879481077194214]], [[3.844485282897949]], [[3.4439430236816406]], [[3.1996936798095703]], [[3.290323495864868]], [[3.4732635021209717]], [[3.963658571243286]], [[3.808210849761963]], [[3.797853946685791]], [[3.9760208129882812]]]], dtype='float32').reshape([1, 16, 1, 1]),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0930362a3e8a03e2557c0099e08d4821(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fda18936de6c2ab9ecd6acf8e08be0aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_dc137e0e353ae0ae9715e9ced6bab7f5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[19, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_db14256df86945438fdb75e68f37e0ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc137e0e353ae0ae9715e9ced6bab7f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_db14256df86945438fdb75e68f37e0ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc137e0e353ae0ae9715e9ced6bab7f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_db14256df86945438fdb75e68f37e0ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc137e0e353ae0ae9715e9ced6bab7f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_db14256df86945438fdb75e68f37e0ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc137e0e353ae0ae9715e9ced6bab7f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a808845731e052e47a8b8ef0e16e14f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d44934b65dea2b31b4c9d053c309a6f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_77f3086f6b7eb9cb48010c64f53f0303(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_77f3086f6b7eb9cb48010c64f53f0303(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d7b9a7371f0a99f1a81f0e8dd040f1b4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d7aaba3845787f71f616a5613bfdcca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7b9a7371f0a99f1a81f0e8dd040f1b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e85cea7190ee24f93588e90f1ab1d287(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1ec1637b15c2ea5ef900590d21780759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87d3176705d82fd6fe9eafea01c7d980
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([784, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5e04a85691e0bb716bfb02bb8dc0163a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.237562656402588]], [[4.161190986633301]], [[4.370422840118408]], [[4.269828796386719]], [[4.532843589782715]], [[5.2616119384765625]], [[3.850778818130493]], [[4.414309024810791]], [[4.0816192626953125]], [[4.864469051361084]], [[4.644322872161865]], [[4.237806797027588]], [[4.480039596557617]], [[5.079169750213623]], [[4.436254978179932]], [[3.582730293273926]], [[4.425473690032959]], [[4.0732526779174805]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4e37cfec893a281fa982911772172e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c659fea58380b59760b1f635b97d2eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce507eb7b315cd5a817be5b1913dafe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_410a52202b5ba5fa7dced71c15250686
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_757f0e25326c1d32e9a5fb5568e643be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_448a2f6ee5aeb6dc17345d170fb8a1a7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.49179309606552124]], [[0.3946881592273712]], [[0.44777026772499084]], [[0.2703292965888977]], [[0.3565317988395691]], [[0.40710023045539856]], [[0.09421836584806442]], [[0.11102090030908585]], [[0.20094189047813416]], [[0.4083808958530426]], [[0.4095096290111542]], [[0.10337064415216446]], [[0.28764957189559937]], [[0.3688129484653473]], [[0.4044314920902252]], [[0.1252901554107666]]]], dtype='float32').reshape([1, 16, 1, 1]),
-            paddle.uniform([4, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_79c386d535a387093e93e4c9b0f90314(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c5a25e996af489cec0661804efa05c38
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.538755178451538]], [[1.2810152769088745]], [[1.3235585689544678]], [[1.3732095956802368]]]], dtype='float32').reshape([1, 4, 1, 1]),
-            paddle.uniform([16, 4, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f678ab4e0df3fa51b2956141bb89c99b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 6, 6], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d9365dfa35369397b7254a0a51b50d76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_daa25e5af0d9cdf1f6f37b5ce9a1a416
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 3, 224, 224], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f16f614ed84f3fc31cc87e721ebbd60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ba0482c61514fa4ee91d14bb81158a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3, 224, 224], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7fc45f2e302ed0ac11902b3bbe920d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e763037a51d651d257898b9d06a0d0f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cdbc65bd1b51b70f5afe3551e94d21ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_20108ba8bf50fc10374abe143bebc401(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4539a6f63771ab660aa6464a07994b07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f8778e2826e2a172fd70c45d3cf7656
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cdbc65bd1b51b70f5afe3551e94d21ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_20108ba8bf50fc10374abe143bebc401(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e08a341ddaf82b67d4d666625a9cdbba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_36523538a77376ff367c11944646e4d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c186c01a8d21cc02e937bd420d5877a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5f5dcedb55b7462d5847a46c47e9bac7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_557a4b826144aa7df191d3a92512b68a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_202c8852203ccabcc14bd160f24594d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ebba4a68206327e9fcbb6c1070902ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bcf2fc703ad7b23eb90281e40d14eba1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd3217e1f95bae1c570db5dc3cd59da9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd561fa2c98b28f3353a22f3b96d1029
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3f5db7e5ade7d7db3d7a5659015b2567(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_59234cca93d7b1a40e0eb4f1c5b96d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_67111770534819b8a3f442f133ffe74a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811fed8f57bff702d24d72809a2e3782
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3f5db7e5ade7d7db3d7a5659015b2567(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_59234cca93d7b1a40e0eb4f1c5b96d33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14c97803b119e78c27ecd931c8fdebd8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62a91881d2c296fc8162e151a5964ec7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bedde7a0ee86bc0ea098053ea09e6e68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ad637bc1dc4dac0f1bb5465be4ec313(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6cf15aa7236c97eca4845005f505f797(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cfa3c6bd3f61f879ec4276a8a3b42c0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f919829fef931a9275f3369caf1a6b63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dfa02efa8e321926587ed23bf6b2d909(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9102e04865c6eff81dff4840ce0a076
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fb5685bd358c3c29a615f5de08793f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4f94b27aed234746769d819ffe29dbeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d438228d0b3f8df15a8b51327a839522(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6a0c9bdb49eb29017240b26bcb1f927
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8d94a0abfd0d5f605f51cb7c17bc6970(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2454023993a2231506eb051e0b211b64
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ccbf99621b72d03585199e81e5bcdc57(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, 4, 80], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d1e23edb19df4c24c779954839b88250(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccbf99621b72d03585199e81e5bcdc57
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 4, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5a47e97ae053e63daafda810a4f79a6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4eb11051bd5ad4957d1b96b8d3ed3805(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_eb2ccb7ce90e35d9f61f143d5688d785(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d14aaccd719f5e2441493cc8dfeeb62a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c9b4c9671c0dc5b7e86666448cfd4c9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c44e230c3ddd8ffeb56a53adebdbaa5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_72bbeab5c0222868c73b791f66666b8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 60, 100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8835ec5ffcbb889aec728b4067ae6626(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d5ecd9513fc18b5d621efe3b1626a262(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_03432212b853a10ba1fe024de6a55ccd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 960, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c6c35a2937920d9abe15d787eb0623a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03432212b853a10ba1fe024de6a55ccd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 960, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_436666001f0c9385e9ff5be2a0a382e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2750d44518d71cf994999c3094634db8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_15c680891a1e9c46d4a096b969a54b3b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 400, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[100, 400, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aa4a9575da779e1ef092cb8b61cfe1f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15c680891a1e9c46d4a096b969a54b3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 400, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4ecafe60e26a3ecb1f0082fb898a56db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 100, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[400, 100, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3ec025daa7f5987c1182f57352e0d7b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ecafe60e26a3ecb1f0082fb898a56db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([400, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_04816a5e3eebe03ff2cd2c0d9db7ea83(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 160, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e647ea9597e82713dd1217ec81356dc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04816a5e3eebe03ff2cd2c0d9db7ea83
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8b7d79529ee9b0613d7dc5dc14047153(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c6aec7bb32cc88e2d913c5219c068aae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b7d79529ee9b0613d7dc5dc14047153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 200, 304], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6177b18e43b5f11b6c73fa5634f0d57c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 192, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9f7d081f3733be5ce3b76d5b6241bbd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6177b18e43b5f11b6c73fa5634f0d57c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2769eda7694e6a20809a099b2b3cf605(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_27b200a1b20200e6534a8981be07175a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2769eda7694e6a20809a099b2b3cf605
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_07658853a7554177748f6776b7bb96bb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 768, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_784a37fed3bbc4ceda5a2085727dbc86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07658853a7554177748f6776b7bb96bb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f30445f26e4238f02b29c967e1fc5bc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 200, 304], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_28a9e41356405b6f7a5e2767c7bb2b43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bc77e5592019fed7e8ba4dd030024fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd85ac45a87d2ae01ec2d9a7bf1de264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_10a2a8985a594655ccf9fd0c7373be56(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_902390f7421a46cd4beabef92eb54744(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_10a2a8985a594655ccf9fd0c7373be56
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 136, 208], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ab0bb574b84dae9ff410c4c59f4eafdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 68, 104], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c8cf2cecc15f15b2bcb6654b4dc857a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1024, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 1024, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_875682e57540abe6e2ed60490fcc87ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c8cf2cecc15f15b2bcb6654b4dc857a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 34, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3a1fa9ee803473b4f0d6a6fd21764afb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 2048, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aaf17cf3b8eb5c184af7e9e3dce4e287(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3a1fa9ee803473b4f0d6a6fd21764afb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 17, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_898f06b145361eca9428e589a2a87d88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b21fee2ea27b74c76eee5faa615b69aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 136, 208], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4ecff9c40d6e145866b88b74dbcad6d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b21fee2ea27b74c76eee5faa615b69aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 68, 104], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e3db7c935db483f82721565da65aebc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b21fee2ea27b74c76eee5faa615b69aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 34, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ee8d7f99807d1d2b14a869ee539a2b46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b21fee2ea27b74c76eee5faa615b69aa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 17, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_471fe169bdd0136e8eb11c5205cde8df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c8f2e7f569f3b158184706e35f6ac611
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dd8e3a09bb67d733eadc858df36a09c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d744207598210f5a6ad56089daeb592a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f71aa19308a083cd41fa833b46bfcd80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_424d6b6cafaeb0ae600e320238198ede(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 144, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a0796e8547be79c9522276d400dc061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_424d6b6cafaeb0ae600e320238198ede
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 144, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fb5685bd358c3c29a615f5de08793f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4f94b27aed234746769d819ffe29dbeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_91ef7c07585f1ae05badb5b540fccbb9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_74b3d7a1b5ccb6fa76591f83f366e458
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 32, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f38560bf195e1024a5348438d47bdffd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, 8, 25], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_623ea8f753ecd2b7b04ccb34397db472(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f38560bf195e1024a5348438d47bdffd
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 8, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0920273e0f5e48e97b3603cbe5181ebf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_66858f5e20b2167d3d10be3056eb5638
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ceb2d0ab6991a3b6a465bec9673dfc03(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[960, 960, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_daa6d9c7ee5b3928b86b599676ad86aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceb2d0ab6991a3b6a465bec9673dfc03
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b1f7f5d873a47e588be68063c6420c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b20152466c561ee4f3c7af0eae766c32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_34e6e20c98bb2921227ba7c748b84629(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2722cf4d638bd5c84a8d34709d206778
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c97b09441a42700654f2a5daab992ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0fc3caf3a2fa6bfabc2be2e01d9d2f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5724848d12a2235dc893ad105b7291
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da60100b0c09a449b8da9fed4333a25c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5.344324588775635]], [[6.016274929046631]], [[5.492908954620361]], [[5.4838337898254395]], [[4.395646572113037]], [[5.8052239418029785]], [[5.291003227233887]], [[6.2108001708984375]], [[5.438310146331787]], [[5.886660099029541]], [[5.573000431060791]], [[5.147133827209473]], [[4.929800987243652]], [[5.740851879119873]], [[4.916862964630127]], [[5.023261547088623]], [[6.229000091552734]], [[5.509725570678711]], [[6.279243469238281]], [[5.547002792358398]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_345945537b45a5a6392784d7f34a3df4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 336, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[84, 336, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6fc8111385b081db8203c579f98aa39e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_345945537b45a5a6392784d7f34a3df4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4b09aab980ba002d272f5be28096ef10(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 84, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[336, 84, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ac3b22bcdc11a67011e2ce8792b85b83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b09aab980ba002d272f5be28096ef10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 84, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ee278a8a657477f48f5c282a90ceb5a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[76, 192, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1988577d3eb903e356ab06027d313fa1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ee278a8a657477f48f5c282a90ceb5a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([76, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aae66edd4abc0dd55328abb4861300bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c61cf870e3bf0071fe5a1d3bd1b43498
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 15, 27], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_22142fc835f09c4924efaf8a407a249c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_659fd0b2ad50a723004e23481866a55e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 30, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d10f91fcff6b8210c4316329c1730203(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_53bc9470e19efa0070af1c52133b864d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 60, 108], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f8b681a0bc77af171b34f760c5618e3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_761e5a473fa962a2513bc7821baa2533
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4ab6a4aae273f82b440b2b2889fc4a93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5feb994062ccee80ae9930492e78081
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 8, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4061cb89c64c9cf4d9391358eb3fdcf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_04a1fdd3f3a0ce0a5f0b03a20c0152e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15bc780f1a9427f76f79c119d76e8213
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([392, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_03135b238c987a7435a9ae9bf6dc95e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bc765449d0a7ff7c622aa36960c4c437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b427d4511028c8cfbdd1c7b13c90c42e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[12, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_07b69f7b9d80ac22cf34465c0eb3f786(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b427d4511028c8cfbdd1c7b13c90c42e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8c1376968b850cff10d1b3398586b998(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[48, 12, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_95eb9c45080d3c078b10ff11581256e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c1376968b850cff10d1b3398586b998
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.2725584506988525]], [[3.2557055950164795]], [[2.9809985160827637]], [[2.556856632232666]], [[3.158665657043457]], [[3.6061155796051025]], [[2.929327964782715]], [[3.100254774093628]], [[2.723113775253296]], [[3.6244781017303467]], [[3.3199663162231445]], [[3.4506938457489014]]]], dtype='float32').reshape([1, 12, 1, 1]),
-            paddle.uniform([48, 12, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0fc3caf3a2fa6bfabc2be2e01d9d2f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5724848d12a2235dc893ad105b7291
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_084c987ae9a2d24ecd759316ea45bdab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.360434532165527]], [[4.717469215393066]], [[5.156486988067627]], [[4.6816864013671875]], [[4.958114147186279]], [[5.020376682281494]], [[4.247951030731201]], [[4.619385242462158]], [[5.13287353515625]], [[5.086236476898193]], [[5.179443359375]], [[5.324009895324707]], [[4.841670036315918]], [[4.750148773193359]], [[4.925405979156494]], [[4.23504638671875]], [[5.2949042320251465]], [[5.163760185241699]], [[4.736735820770264]], [[5.142109394073486]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c3ecba46574edf1d225fa9b9432104cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98f00834c08ce48a82fa9acbccafa75b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 44, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f8c7bc86e40660fe6da49f8629638b92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9f1061d727ada5b5908a819fa5e44575
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.0480129718780518]], [[3.237431526184082]], [[3.176517963409424]], [[3.314018726348877]], [[3.729637384414673]], [[3.15503191947937]], [[3.065131425857544]], [[3.4773731231689453]], [[3.3519415855407715]], [[3.2542996406555176]], [[3.8472933769226074]]]], dtype='float32').reshape([1, 11, 1, 1]),
-            paddle.uniform([44, 11, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0ccac40df7bb8519f4205797e8a0d0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d1bd8575d4cad4f3d2fd047eac170254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a5fedff54cff19820e2aac07226b638(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7cb7be90d4b00120fcbdcd834662eb8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a8704d5fefa0a2ce7b21f9391c00d88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_02d2e15b71b6bd4fa26a2e48d9a9b826(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0402296782ed73d40af710949159c20
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa4a9575da779e1ef092cb8b61cfe1f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15c680891a1e9c46d4a096b969a54b3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 400, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ec025daa7f5987c1182f57352e0d7b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ecafe60e26a3ecb1f0082fb898a56db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([400, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_417bd5290612ebb9bafc8f2418f7ca26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_32a90f830833b5808830e0d31fa6f7d7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9ed4ede63c424556f1be3da4458564ce(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [8, 8], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[32, 32, 8, 8], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_23999da3b48471c4b6fdcce583705131(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ed4ede63c424556f1be3da4458564ce
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4fe4ecf69530ed15dad1f710b0c94b1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b654220240b86117de24f87c8ff2037e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_01f3105d16c68cea8faae1b1faa68184(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_940e7fc9017f4d26d9dbe456e2aa77c5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, 8, 80], dtype='float32'),
-            paddle.static.InputSpec(shape=[128, 64, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7d5f513c2a319e910b3b195e1912f4d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_940e7fc9017f4d26d9dbe456e2aa77c5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 64, 8, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8825290148649dbf50194155730e1ef3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c223fffa60a94b777d06ac9706ec669b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8825290148649dbf50194155730e1ef3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_84e8273af563f67e571da55f4c6b8758(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 56, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[14, 56, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d8b0060b2a2099106896a4d47a256391(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_84e8273af563f67e571da55f4c6b8758
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([14, 56, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2f6728d3e26495fa2e177465cf46aa4f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 14, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[56, 14, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f6dbf2fb19ea93eee42dc36c95308c61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f6728d3e26495fa2e177465cf46aa4f
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.146519184112549]], [[4.502309799194336]], [[3.6644434928894043]], [[4.5797810554504395]], [[3.6583144664764404]], [[4.3430938720703125]], [[4.793707847595215]], [[3.8511109352111816]], [[4.1959757804870605]], [[4.701586723327637]], [[4.507343292236328]], [[4.357084274291992]], [[4.3168044090271]], [[4.285999774932861]]]], dtype='float32').reshape([1, 14, 1, 1]),
-            paddle.uniform([56, 14, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_13b3d9f904ccf4e14e3339ab3f21ea3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b144d83079c5103a292862364766c5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7403dc413afafbe3fce59c436fbdadea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 200, 304], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bfdfcce48ec2422f20167e17c5d128fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9edc9bf6bcda25ee978a3cea83fd11c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bfdfcce48ec2422f20167e17c5d128fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3007184bc6655cfabe2951dfbd86c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c3901d9978d9847c536691ce58234b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f30445f26e4238f02b29c967e1fc5bc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 200, 304], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_28a9e41356405b6f7a5e2767c7bb2b43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bc77e5592019fed7e8ba4dd030024fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd85ac45a87d2ae01ec2d9a7bf1de264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce3ac3bb9ad07481d6bdcacce16edb52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_772604b6517c7febe3ad6a1fdfe43834
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 576, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b8ad1d6f63b1069a8da09bd1a6dc2997(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[768, 384, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15be8228940bc7aa75437e91a81fcde1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8ad1d6f63b1069a8da09bd1a6dc2997
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 384, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2474811d7c445c1512145fd1542e837e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8b04b38b070b83ea2a643c7a933d9ab6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f267e4a91b4a64c44093febc76371e28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 23, 23], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_45a53bb0945970a5506e5ce1e62d087d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 288, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dbb75abe956fd41f758c2dd68fafedf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_45a53bb0945970a5506e5ce1e62d087d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 288, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7678d054238ae74cc7872cf5345bd147(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 160, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_33cd54a50ab0e4e80148ba935b085f17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7678d054238ae74cc7872cf5345bd147
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 160, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 160, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_820b87d01a348e98ce557730122baa4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1cdf81c140c8bb2b0e186fc245e76dda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_820b87d01a348e98ce557730122baa4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_73a2617629e728978d737303b44ce12d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7a297d99ef2bf72640376afb4f3fa3dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73a2617629e728978d737303b44ce12d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e756a04335ac075e960aa34d3aec7128(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 96, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5766d6fde33605e1f3f02b4311dd33ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e756a04335ac075e960aa34d3aec7128
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b75d7b26171f8f963b32ace7f27598b9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 144, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b64a7902c486ccb2a2d619e20ab9498f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b75d7b26171f8f963b32ace7f27598b9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 144, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9edc9bf6bcda25ee978a3cea83fd11c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bfdfcce48ec2422f20167e17c5d128fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3007184bc6655cfabe2951dfbd86c15d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c3901d9978d9847c536691ce58234b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_28a9e41356405b6f7a5e2767c7bb2b43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bc77e5592019fed7e8ba4dd030024fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd85ac45a87d2ae01ec2d9a7bf1de264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_431ecee80e785d2ad5531714cac6aece(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c69db5a24a7cecea42331f252a11ba61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0fcc6be989fd32c61acf5098f97f00b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3070ccaf89619708ac2e7f46fa4da103
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_56c3f9ea30239b7eab3268ecc4c68d8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_874c28b98261a9c0f801e3b3e0eabd72
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9053c968977dc74f124006ada05b357c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a35843383a542ca6ed5d9ae114db9530
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3d1be0411495146b4406754839744d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3d1be0411495146b4406754839744d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_98ef727ccbcbe48f3ef5dbe598ed30b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8ec9a88c4d74a02fb0f8f0c5d2fcec3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0fc3caf3a2fa6bfabc2be2e01d9d2f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5724848d12a2235dc893ad105b7291
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_490cb7afc7118ee6a295a017852b95e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5.50460147857666]], [[5.1588544845581055]], [[4.956395626068115]], [[5.047804832458496]], [[4.929196834564209]], [[5.238279819488525]], [[5.020495414733887]], [[4.726332664489746]], [[5.017806529998779]], [[4.798006534576416]], [[4.913485050201416]], [[5.579802989959717]], [[5.168251991271973]], [[4.592852592468262]], [[5.174535274505615]], [[4.714313507080078]], [[5.22613525390625]], [[5.080910682678223]], [[5.832324504852295]], [[5.216494083404541]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8583796cabe20337d1baf1f673ab4e90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0a00b404c1253518de08ceae318bad6c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 320, 320], dtype='float32', min=0, max=0.5),
-            paddle.uniform([17, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_319489e9d33ef298bc2e706e23c2fbb5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 600, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[100, 600, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_195519b1fa17d3161de339b52f270ad4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_319489e9d33ef298bc2e706e23c2fbb5
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 600, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_195519b1fa17d3161de339b52f270ad4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_319489e9d33ef298bc2e706e23c2fbb5
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 600, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 600, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c643a4fbb7eb37d9f56a08f360533d4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f7ed57d3dab29d0381593ead8876a2db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 768, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0ea32fe8ccc54b0024b4f9877351e22f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f7ed57d3dab29d0381593ead8876a2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_03135b238c987a7435a9ae9bf6dc95e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bc765449d0a7ff7c622aa36960c4c437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bef1c335cfde0b60334a1189b94565ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93cfd70947d89c6203cb4b377e3bbc42
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 256, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2d999964d019ed8d87e09554e88f5f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_005621aef7a3f06713c0bb830763c02e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_30010c1913aeb40b0050d0a29e981d65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_0da631f8329f791046bab56333763125(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3c34981776f22ceba23d53bbd7ecce8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0da631f8329f791046bab56333763125
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 480, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_de232989fd60ddfad16c939adf12f801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a2c680a0199b7c22b1cb1795179f8996(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_45c46806c264ade3588381ed8ac57cd8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 56, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 56, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bdf77dc4c1026c0bd1cad4f9a11579fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_45c46806c264ade3588381ed8ac57cd8
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 56, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 56, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_de232989fd60ddfad16c939adf12f801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a2c680a0199b7c22b1cb1795179f8996(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_745ed90dd79a1cdd12afd7934015d2d3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 24, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_89ed69fd14fb77ed3927e865ea0b9c5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_745ed90dd79a1cdd12afd7934015d2d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_de232989fd60ddfad16c939adf12f801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a2c680a0199b7c22b1cb1795179f8996(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_dbc15d34bfd67d58e691ac5bdaea0e06(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 16, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0ee7f3d22f15cfbe9daa34982a23c339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbc15d34bfd67d58e691ac5bdaea0e06
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 16, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_de232989fd60ddfad16c939adf12f801(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a2c680a0199b7c22b1cb1795179f8996(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 96, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6abf9ecaab60b4f962bdd9c91cdb01ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c47be947e510e7d1ad718230de507921(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[6, 24, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_25f0933e906c0729ccd57b8b891a943f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 6, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[24, 6, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1b4bf417ec88bece29190864b4b7e031(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[30745.705078125]], [[34771.90234375]], [[32326.46875]], [[39612.7421875]], [[33253.55859375]], [[37774.37890625]]], [[[30227.296875]], [[34185.22265625]], [[31785.390625]], [[38951.9296875]], [[32694.080078125]], [[37143.96875]]]], dtype='float32').reshape([2, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_db3ad5bd8603cc07cf8ea0b623359d63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25f0933e906c0729ccd57b8b891a943f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c8386eb70bbee1940e172d86565d546e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[41665.37890625]], [[41014.6328125]], [[37568.69140625]], [[26821.515625]], [[51724.7265625]], [[37817.19921875]]], [[[39541.67578125]], [[38922.7421875]], [[35652.1953125]], [[25452.8046875]], [[49086.55078125]], [[35889.1953125]]]], dtype='float32').reshape([2, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4046455595667fd719c745260eaefc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25f0933e906c0729ccd57b8b891a943f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a367941dd90531496692fe79ed838fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[47993.96875]], [[39397.859375]], [[46803.36328125]], [[42151.0]], [[44205.08984375]], [[36601.5859375]]], [[[45183.42578125]], [[37086.10546875]], [[44062.8359375]], [[39685.71484375]], [[41613.8203125]], [[34457.80859375]]]], dtype='float32').reshape([2, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7d5b752ab2b360017d9688ddbe534a6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25f0933e906c0729ccd57b8b891a943f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9cc1ba548438b7c413e24dd48a99ff12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[43644.1328125]], [[40460.4765625]], [[45850.01953125]], [[35621.6015625]], [[49567.62890625]], [[36778.08984375]]], [[[41154.578125]], [[38153.87890625]], [[43236.32421875]], [[33592.04296875]], [[46741.33203125]], [[34682.9609375]]]], dtype='float32').reshape([2, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_edde788a911daf40bdcbf22f6a75003c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c167735f2b55e36c77d7dcb30f3ade3d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cef17f16aed7a7f8a26cc1a42bf7e6cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76546a0ed7d007a9ce46cb1807144df1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1152, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_364b995ea09ce98d6f83e04f8c59f410(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [8, 8], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64, 8, 8], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_99ccf2c972b6b97a40144d2c7372681a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_364b995ea09ce98d6f83e04f8c59f410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c381216fc50983782084dd922e975b61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a1daf6691673f2c47b124b95b37d3352(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e1fee9d8ee8cea43aa47b53235b9ac0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af782654f96ae9be69090ad9762ea362(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dbdd063e524eb6b9c0f927f3a41f6f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_68b784775b0689badd7cd9d4ae83bcc9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f5de34c77e2d449d094614a704330854(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b0c789f3cdb56ec40c5ea032887468f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c7526930ad9cf1f413fd1f3fea7b4086(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_919f77b09c8f3dfe4304c85f0eb53c9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c5e7d956d953917567116c9b787fbf4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4e37cfec893a281fa982911772172e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c659fea58380b59760b1f635b97d2eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2267195038afa90cc474f6fdf6bcbc0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 15, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_910ae6832764866605ef2fb936e57152(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.36114394664764404]], [[0.4628693759441376]], [[0.24537760019302368]], [[0.06434471160173416]], [[0.4284261465072632]], [[0.2548513412475586]], [[0.4215666353702545]], [[0.2557278871536255]], [[0.012496702373027802]], [[0.4143214821815491]], [[0.36240410804748535]], [[0.131462961435318]], [[0.022050298750400543]], [[0.43332189321517944]], [[0.07134498655796051]], [[0.20765992999076843]], [[0.13471439480781555]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_319c255bef480dd564522826ec044a5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ebad4b794241d8c4ce4069c159e7be0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b1f7f5d873a47e588be68063c6420c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b20152466c561ee4f3c7af0eae766c32
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_34e6e20c98bb2921227ba7c748b84629(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2722cf4d638bd5c84a8d34709d206778
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cba7f48a294db7a1206f9d6146be602c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.755821704864502]], [[7.880363464355469]], [[8.339659690856934]], [[7.805987358093262]], [[7.146974563598633]], [[8.294384002685547]], [[8.496078491210938]], [[7.194164752960205]], [[7.577611923217773]], [[7.625204086303711]], [[8.2835693359375]], [[7.507097244262695]], [[7.1416826248168945]], [[8.226408004760742]], [[7.594336032867432]], [[8.34246826171875]], [[7.181814670562744]], [[7.2811689376831055]], [[7.641758441925049]], [[7.8403754234313965]], [[7.695457935333252]], [[7.748929023742676]], [[8.201318740844727]], [[8.233880996704102]], [[7.515065670013428]], [[8.358352661132812]], [[7.475659370422363]], [[7.770592212677002]], [[7.491364479064941]], [[8.304985046386719]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_be99cee30c4900018e33a413c4e7d398(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f21ba7d85d5a88c4b59c31ebdd4369a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[8.361176490783691]], [[8.62569522857666]], [[8.281803131103516]], [[8.14925765991211]], [[9.747525215148926]], [[7.804799556732178]], [[7.639775276184082]], [[8.602377891540527]], [[8.241849899291992]], [[8.349543571472168]], [[8.499847412109375]], [[8.088918685913086]], [[8.78412914276123]], [[7.870724201202393]], [[8.253105163574219]], [[8.090829849243164]], [[8.1477632522583]], [[7.753784656524658]], [[7.984825134277344]], [[7.965210914611816]], [[7.891635417938232]], [[8.431418418884277]], [[8.55389404296875]], [[8.33993911743164]], [[7.819582462310791]], [[8.01829719543457]], [[7.994621276855469]], [[8.532654762268066]], [[7.958878993988037]], [[7.8289055824279785]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_47a6fb9c944ac42a6c2e0e828f6c7e19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c13b66a16a6b01a5176761eadf356704(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_58d7d2d2e20defef3c96a4299b36c0c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_817118082f1a6caca5eb2c8b17a13794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[8.390397071838379]], [[7.276669502258301]], [[7.771251678466797]], [[8.005627632141113]], [[7.994493007659912]], [[8.68720531463623]], [[7.260528564453125]], [[7.991909027099609]], [[8.193622589111328]], [[8.123809814453125]], [[8.019279479980469]], [[7.6585588455200195]], [[8.132247924804688]], [[8.207873344421387]], [[8.074149131774902]], [[7.689914703369141]], [[7.0693559646606445]], [[7.276266098022461]], [[8.51368236541748]], [[8.271031379699707]], [[8.027261734008789]], [[8.839969635009766]], [[7.512433052062988]], [[7.383810520172119]], [[8.968289375305176]], [[7.611448764801025]], [[7.461771011352539]], [[8.392141342163086]], [[7.972481727600098]], [[8.172481536865234]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_db932a6d4a4189cd363ac2d95ca83f19(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 200, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[50, 200, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b259722376ae7b8a8a05d4958819416(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db932a6d4a4189cd363ac2d95ca83f19
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([50, 200, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_16ccc5af4816183206b7b1c93828d8b2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 50, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[200, 50, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_309402e73e24f043f1562c51c5d08d7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16ccc5af4816183206b7b1c93828d8b2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 50, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([200, 50, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a2d3651b742a385a727355a70d88218f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, 4, 25], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 128, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ec9ae5b4ad5a8a97ecbd76170e9fb479(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2d3651b742a385a727355a70d88218f
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 4, 25], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_59b444c72b501ab083d0eaedaf2167e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b7d79529ee9b0613d7dc5dc14047153
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 136, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8d862d1571320305e8c79204f2647f2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6177b18e43b5f11b6c73fa5634f0d57c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 68, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d1c6ad7d59bd923a5d3691be8ff61bbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2769eda7694e6a20809a099b2b3cf605
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 34, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ea6a1ea301f0baa94c41749354b9d368(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07658853a7554177748f6776b7bb96bb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 17, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_eee4e416e227a7d76c1be96958bfb90c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 136, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ee6683cea6cd59436d640c21df60bfa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 68, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5319b9de7bc642ef51e9619ea236589f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 34, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e4e51550199e06a3d1cb55a51e508730(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 17, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3d9a0563a53ec8cd9d217111614aae48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_daa25e5af0d9cdf1f6f37b5ce9a1a416
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 544, 640], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fb5685bd358c3c29a615f5de08793f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f904e8b6f9d63a6b154bb7088b7f6ccf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4f94b27aed234746769d819ffe29dbeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68b531bf97ea8622fee7d8ac6d193e81
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f31d4306b7a5a51df9f710314a9a1566(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95a50e03048f831a30e620e34401d844
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1568, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e74a3ac20e1005614535a29dcf9c54ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97bf810464cf9c95cc156a98ccb4e57d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e74a3ac20e1005614535a29dcf9c54ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97bf810464cf9c95cc156a98ccb4e57d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e74a3ac20e1005614535a29dcf9c54ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97bf810464cf9c95cc156a98ccb4e57d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bdc91ffe5334ce2a74c86884cee70ee4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[19, 2048, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_13b93d6d5bf6d9e4746e9c9752f4e5dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bdc91ffe5334ce2a74c86884cee70ee4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c06f0cf51f5551e06ba577edcb2091d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.850942134857178]], [[7.1077446937561035]], [[8.908502578735352]], [[8.179852485656738]], [[7.862389087677002]], [[6.818843364715576]], [[8.714977264404297]], [[7.29398775100708]], [[8.29191780090332]], [[8.17094612121582]], [[7.267852306365967]], [[7.6252641677856445]], [[6.961155891418457]], [[8.020214080810547]], [[7.234701156616211]], [[7.874801158905029]], [[7.739259719848633]], [[7.467905044555664]], [[6.924632549285889]], [[6.256964683532715]], [[8.247825622558594]], [[7.695131301879883]], [[7.3227972984313965]], [[7.623007774353027]], [[7.893981456756592]], [[7.224710941314697]], [[7.658906936645508]], [[7.460687637329102]], [[7.8282365798950195]], [[7.303142547607422]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b85ac6af33e218622b6ee1caf27a022(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9fa19f6f0866528ba34e792b05a8e68
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 288, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_07b69f7b9d80ac22cf34465c0eb3f786(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b427d4511028c8cfbdd1c7b13c90c42e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_accc66d74b0704715cdb70fb45e3a930(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c1376968b850cff10d1b3398586b998
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.453547716140747]], [[3.4846243858337402]], [[3.3897500038146973]], [[2.738614320755005]], [[3.100677490234375]], [[2.778423309326172]], [[3.3358168601989746]], [[3.2455596923828125]], [[3.148667573928833]], [[2.7828540802001953]], [[3.045139789581299]], [[3.4436392784118652]]]], dtype='float32').reshape([1, 12, 1, 1]),
-            paddle.uniform([48, 12, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d7636b3e6185a2c20a32459f0ebbdc62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6516f918c20bfc9f3572d630a54a527c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 128, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e0141d1853612213c4022c5b0221071e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_07b69f7b9d80ac22cf34465c0eb3f786(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b427d4511028c8cfbdd1c7b13c90c42e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d7eac538938066c518cb8955d6c68194(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c1376968b850cff10d1b3398586b998
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.455537796020508]], [[3.563206672668457]], [[3.335113763809204]], [[3.471310615539551]], [[3.515381336212158]], [[4.090732097625732]], [[3.5625362396240234]], [[3.7744622230529785]], [[4.15206241607666]], [[3.493366003036499]], [[3.432220935821533]], [[3.702237367630005]]]], dtype='float32').reshape([1, 12, 1, 1]),
-            paddle.uniform([48, 12, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc66b4f7529432b40dc9f750444cbb3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83061f94ad1769521e56e833ea788ad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_66756c6b2aac6b666202970b00e5ef12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_737c112022fe835cae66dbd2ca595bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2e7422d96559940f4541125b484f51c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[192, 192, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f17e30b2d36faeaa49a545b0fb3beb3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e7422d96559940f4541125b484f51c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da85eaa457a066f199dde577a6d68324(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 76, 116], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3f59891cc7796fdcc3d1487035178e11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 76, 116], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75e2e42505e389a404c1b2313f51ed1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b8c55b4c23f35b4f84a082e29bcbbe2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_48c359e6fffcbde67e9f430bba0e9f41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbdd9578d5f71ce59bc106ece4ce20a6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6.52806282043457]], [[6.5563201904296875]], [[5.7667951583862305]], [[5.988282680511475]], [[6.923935890197754]], [[6.8993048667907715]], [[6.979061603546143]], [[6.7552900314331055]], [[6.4361066818237305]], [[6.215381145477295]], [[6.004200458526611]], [[6.617111682891846]], [[5.9194464683532715]], [[5.7771525382995605]], [[6.030032157897949]], [[6.446322917938232]], [[6.711417198181152]], [[5.484778881072998]], [[6.323309421539307]], [[5.941737651824951]], [[7.155978679656982]], [[6.26820707321167]], [[5.581942081451416]], [[6.67197322845459]], [[6.15772008895874]]]], dtype='float32').reshape([1, 25, 1, 1]),
-            paddle.uniform([100, 25, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d031383097a5ad84966e38c5f4bcde76(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 320, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[320, 320, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_341ff97202ccb75df51d2fb60baccc37(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d031383097a5ad84966e38c5f4bcde76
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a2dff873ab150b37d6ef7bf2951a6a2f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[240, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e49ca20d42beaeac8abed74ae48c39fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2dff873ab150b37d6ef7bf2951a6a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_228d2343846c19598fac068569a691c3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[72, 288, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2eb0e32b67d7a2d43f5d11ba538c7236(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228d2343846c19598fac068569a691c3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_320665df12f7278dde4c800c15181a09(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[288, 72, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2a2d5be35e4ccdb6ecb0c8e175825d7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_320665df12f7278dde4c800c15181a09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([288, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0301c86094302ee71d1b318ea47592c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c8f2e7f569f3b158184706e35f6ac611
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_db561eeb38c48f01019b5523017fba58(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3840, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1000, 3840, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_011aadef7112765f99bc646001100cf7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db561eeb38c48f01019b5523017fba58
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 3840, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 3840, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b55142932447a69551c7206aed7ca08f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 36, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[12, 36, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bc4a067bb5cec8e5b5fc7b74c98ac27e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b55142932447a69551c7206aed7ca08f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bc4a067bb5cec8e5b5fc7b74c98ac27e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b55142932447a69551c7206aed7ca08f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6258573d85c201afea4629cc5e77acad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8b1cddd745ef6bfa4e84ce578b5d0d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8519f5fb02ef430c4ee772219956845e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.43629923462867737]], [[0.11064451932907104]], [[0.43154653906822205]], [[0.28809216618537903]], [[0.37702566385269165]], [[0.4144807755947113]], [[0.2638528048992157]], [[0.2510688602924347]], [[0.4685892164707184]], [[0.34461432695388794]], [[0.36695948243141174]], [[0.4090786278247833]], [[0.10187554359436035]], [[0.14927004277706146]], [[0.19927124679088593]], [[0.3383640944957733]], [[0.46207013726234436]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_67f3216501dfa4d72b3054ccdf05bcdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_67f3216501dfa4d72b3054ccdf05bcdd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a71081cccaa20a6bcfca47db49f786c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7b9a7371f0a99f1a81f0e8dd040f1b4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e4799b8fd7a5174f98b814515d9d79a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[21, 512, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_09201207b65b4955515878bfdcdb25f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e4799b8fd7a5174f98b814515d9d79a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([21, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_09201207b65b4955515878bfdcdb25f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e4799b8fd7a5174f98b814515d9d79a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([21, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_09201207b65b4955515878bfdcdb25f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e4799b8fd7a5174f98b814515d9d79a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([21, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_756f208dc31c414b4abeadf38881b8c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[21, 2048, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_245fba729687d9910ff885dbc958c41f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_756f208dc31c414b4abeadf38881b8c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([21, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b9a7bef26d42f58a5a09749b65af37d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c9f78e9784980eb2a5802d83da4b80e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([288, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_42a2599a81a18b577bc61b893560cad5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_42a2599a81a18b577bc61b893560cad5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_de28f294d489d8eb5726e32304902a95(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3cf5891ac55586206989f2404869017e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f17e30b2d36faeaa49a545b0fb3beb3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2e7422d96559940f4541125b484f51c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_941893defd2b7842d1848f9de13ec512(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0e30526de688428a4de9c243a148e246(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a8aef923827bad1c57c00e359afab656(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_35a02a04285bbae15e84ee566d958a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af1424b21dc0075ba4529c9794c8b2ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4e8c78d762c3730b07a67fa7bfe7d99b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_84ad23a9a3ed7bd9e79981138bbeda52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d47b1a194e1871acd288257be617b97b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5cee6ee4e970c6fd0ad5439bdf524b83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_52ae312c3e3905bee5b9349bc8f46ffc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[256, 2048, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_90854fa28a122ae1718a90e29deb33af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52ae312c3e3905bee5b9349bc8f46ffc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_97b9fdd35b2e2de745e5f13de29de066(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce507eb7b315cd5a817be5b1913dafe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_410a52202b5ba5fa7dced71c15250686
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_939c1cda6acfecf8ea46294f08a14b93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.046767234802246]], [[3.9678945541381836]], [[3.9724271297454834]], [[3.7310245037078857]], [[4.122970104217529]], [[3.9868345260620117]], [[4.107200622558594]], [[3.1835169792175293]], [[3.867957592010498]], [[3.762589454650879]], [[3.7537245750427246]], [[4.140583515167236]], [[4.303735256195068]], [[3.3093631267547607]], [[3.8385987281799316]], [[4.042405605316162]], [[3.860562562942505]], [[3.762036085128784]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b0ded1fe4ffee9a20a5216f4d2deb261(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab70957421f74782c050b914b079a5
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 3, 384, 384], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e9543cfb8e7e4382bb4d951ada8ce193(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6258573d85c201afea4629cc5e77acad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8b1cddd745ef6bfa4e84ce578b5d0d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f93d2ce5f927e084433fbd1cbc646cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_eb21f3b04b8cf67985ac89359fd44f6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b8ad1d6f63b1069a8da09bd1a6dc2997
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([768, 384, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dd8e3a09bb67d733eadc858df36a09c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d744207598210f5a6ad56089daeb592a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8abb8ce1c3f24d6d5f4fffd4b39e1d10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2d8726ee45756337ff24c10eef9421c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2d8726ee45756337ff24c10eef9421c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1a89e142f1d90eb98c3063e6167473dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a4c05a2304714074be94eedfd725a756(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[5, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4224f37cda0519c2c7324182eb0f1290(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a4c05a2304714074be94eedfd725a756
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.17710421979427338]], [[0.23343057930469513]], [[0.4228264391422272]], [[0.334635853767395]], [[0.025353197008371353]], [[0.12078011780977249]], [[0.46506550908088684]], [[0.30560529232025146]], [[0.01630464382469654]], [[0.2638155221939087]], [[0.4051567614078522]], [[0.29221311211586]], [[0.35016942024230957]], [[0.43995195627212524]], [[0.12275894731283188]], [[0.41265085339546204]], [[0.2698426842689514]], [[0.49685007333755493]], [[0.3026220500469208]], [[0.4406026303768158]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([5, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a0f410683d2e450c6b94bdbbddc31c91(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 5, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b3104e90ea0340e11c24ccb6858fe6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0f410683d2e450c6b94bdbbddc31c91
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.9371395111083984]], [[1.4174214601516724]], [[1.887669324874878]], [[1.8854116201400757]], [[1.499645471572876]]]], dtype='float32').reshape([1, 5, 1, 1]),
-            paddle.uniform([20, 5, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_80d581ecc3665b35918018bfe1ce21f6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 40, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f1d160774db01757d3440cbe3e9834ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_80d581ecc3665b35918018bfe1ce21f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8a7ef76099d6dbd26e854379470fa872(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 10, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[40, 10, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2c478c55a18de8c815b8b1577d0327cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a7ef76099d6dbd26e854379470fa872
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.7392921447753906]], [[2.9906959533691406]], [[2.7547178268432617]], [[2.436603307723999]], [[2.85025691986084]], [[2.8835673332214355]], [[3.025055408477783]], [[3.5736823081970215]], [[3.1143643856048584]], [[2.387617826461792]]]], dtype='float32').reshape([1, 10, 1, 1]),
-            paddle.uniform([40, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ff61d6e944c4ae940124a3c9bb902954(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 80, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[20, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_eb91d0d38c31981d42b2e712b810625b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff61d6e944c4ae940124a3c9bb902954
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_306062214825f78a614fb4d895002ad7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[80, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_aafbd35442647d4e77e11d44fe62c16a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_306062214825f78a614fb4d895002ad7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.622462272644043]], [[4.285831451416016]], [[5.210995197296143]], [[5.135226249694824]], [[5.38084602355957]], [[5.084770202636719]], [[5.020240306854248]], [[5.3524603843688965]], [[4.7265143394470215]], [[4.737364292144775]], [[5.210896968841553]], [[5.022562026977539]], [[5.217765808105469]], [[5.202975273132324]], [[5.090252876281738]], [[4.33493709564209]], [[4.5512590408325195]], [[5.169355392456055]], [[4.935278415679932]], [[5.615900039672852]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_cc0f4f5b5b7eb3121858367c00d9eb49(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 160, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[40, 160, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_490d232eea4a84ecbcb637c11362cc4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc0f4f5b5b7eb3121858367c00d9eb49
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_15c794ac270f61678eef4726b5bdfaba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 40, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[160, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c5758ef70e3823dc07005eaf59e51194(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15c794ac270f61678eef4726b5bdfaba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6b259722376ae7b8a8a05d4958819416(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db932a6d4a4189cd363ac2d95ca83f19
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([50, 200, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_309402e73e24f043f1562c51c5d08d7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16ccc5af4816183206b7b1c93828d8b2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 50, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([200, 50, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c76e3a6a886d436de5bfe09b4e3f7ca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f23ab9bf1f49e1d1e7c7acf6068c824a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75d1d4909bc56bfcbd2f936aafccf30f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3166a926a3f1b8d29f7eb031d55e8f7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b73155ec0107a81e42424db4ddb9a6c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_50ad135989799cd1b221ac865283fb47(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5ca25f28244bb9845ea057e613489034(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[384, 192, 2, 2], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_241020465fbd67f11410b0b17d8b5d7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5ca25f28244bb9845ea057e613489034
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 192, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_480e1323cc875a66f9215b53f2be3d5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73b3cc4bda1ec2887481d98fb40a02cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_93d6a7fcaa9a7dc267a5661ae716b187(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ba1f38248eaf6624e589b6c9dbc13c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 4, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 4, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_69a12ff6f866d4be455f0041b428a4f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a92a67ccc590128d4f0ef0efa00d0988(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9a1d8ed0803bc9408eddda658298a2fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_10e2a8cac66e5b870e849762b379d136(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f031c7bd7e5a99baea6c6a974f18635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b146571a87eaf0b8ef0562471a7fd807(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_50de4f945c5e950805101dd6f146db17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bd2bf00ad96dc28882d1f253a18e04aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c4b83f687e7836e521822c0d46beb66d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a808845731e052e47a8b8ef0e16e14f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d44934b65dea2b31b4c9d053c309a6f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_171d21f5d7e0baf6239f70a09ea72a13(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.04759259149432182]], [[0.029596738517284393]], [[0.3747383654117584]], [[0.2968893051147461]], [[0.3075331449508667]], [[0.009637904353439808]], [[0.1293448507785797]], [[0.4980875253677368]], [[0.4085457921028137]], [[0.01410758402198553]], [[0.4826800525188446]], [[0.024641498923301697]], [[0.0678630843758583]], [[0.30855223536491394]], [[0.4473814368247986]], [[0.015568612143397331]], [[0.019181452691555023]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a998dc49b41e24e1abeae8f2af0c2700(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6.1521124839782715]], [[5.625865936279297]], [[5.864670276641846]], [[5.375845909118652]], [[5.545053482055664]], [[6.240843296051025]], [[6.610225677490234]], [[6.288477420806885]], [[6.546566009521484]], [[5.868307590484619]], [[6.066805362701416]], [[5.875492572784424]], [[6.262943744659424]], [[6.564895153045654]], [[6.611114501953125]], [[6.125620365142822]], [[6.230747222900391]], [[5.691925525665283]], [[6.614777565002441]], [[5.801585674285889]], [[6.089720726013184]], [[6.300598621368408]], [[6.104410171508789]], [[5.252442836761475]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_cf7cf7ef5f02d81fae8b4e02cb5ebf74(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 60, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[180, 60, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_43b8644e21baf7b9ed91147aa19cb254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf7cf7ef5f02d81fae8b4e02cb5ebf74
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([180, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43b8644e21baf7b9ed91147aa19cb254(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cf7cf7ef5f02d81fae8b4e02cb5ebf74
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([180, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa78ad794ecc22baa32ee386d6b4ba15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15bc780f1a9427f76f79c119d76e8213
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([392, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f9bbb828c176ec56c626707bc50b9a68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_509a1e7f8b8ad375ed1bf06e6ffa3a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a0f1a8ef8433b2e2bb34313fd9e730cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a6575ac1f771657d11790643355020e9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.0770156383514404]], [[2.4979441165924072]], [[2.7093822956085205]], [[3.304619073867798]], [[2.5789761543273926]], [[2.927932024002075]], [[3.462181806564331]], [[3.108491897583008]], [[3.1799871921539307]], [[2.8289175033569336]]]], dtype='float32').reshape([1, 10, 1, 1]),
-            paddle.uniform([40, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4e3c988aff5fb00b804c5015ee709941(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 200, 304], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0e8c057b8c6712427c0a3eeab2046b9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a2e9b8d34c302154cee58ca90f529760(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c39903709e1aa1e0472e3a247893830f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f30445f26e4238f02b29c967e1fc5bc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 200, 304], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_28a9e41356405b6f7a5e2767c7bb2b43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bc77e5592019fed7e8ba4dd030024fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd85ac45a87d2ae01ec2d9a7bf1de264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7b36e548c39799d08fdadb6a0ec8236c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_424d6b6cafaeb0ae600e320238198ede
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 144, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_41462336509b4476349d8203213a76d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b8533ab31cffba554e458df44a73b5c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b144d83079c5103a292862364766c5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fb72a14061f4fe439dedcf67db0642a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_50c7c517c07de1ac19652d12e8862697(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a7a33f309249e00d05ccd1e124d4070e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_27227e7ec64be62e9effb2c2ea1283be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93cfd70947d89c6203cb4b377e3bbc42
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_01311966e866a25374835b07e41d7b96(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 50, 76], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_43cb602998fe727c34414e6813e2bc2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_01311966e866a25374835b07e41d7b96
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_59e53b152c335a9c52af41e7fcc4e870(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, 50, 76], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ba4d68e16f523ab0251cc292b9d8cfed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59e53b152c335a9c52af41e7fcc4e870
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e333b18b9934f151fcebebd8dc23f3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a279a911479aa6cbb204bbb8d45a7f6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_882e4cd8e0761ffef4ea70062cf70f05(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[3, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f6545af52f5a3f5a32bf44e152b7f360(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_882e4cd8e0761ffef4ea70062cf70f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 120, 200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_066787bbfd83a9d784b162cd8624b970(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87d3176705d82fd6fe9eafea01c7d980
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([784, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b0bbff887e76026b388cf89f086b4c7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[150, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2bc3bf49069e884832e94c7bf2444755(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b0bbff887e76026b388cf89f086b4c7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([150, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f37ffb41ef2fa6df0681751598cb4fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7658e5ac02c5ae156e73add89413d7fe
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_798a77ca682feba55a7ff1a56147fc26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d47d0bec6fde22eb8671558fd0673f82
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.898528099060059]], [[4.3500776290893555]], [[4.663306713104248]], [[5.012048244476318]], [[4.6429877281188965]], [[4.761097431182861]], [[4.561538219451904]], [[4.581537246704102]], [[4.645849227905273]], [[4.879332065582275]], [[4.542566776275635]], [[4.34019136428833]], [[4.2488274574279785]], [[4.670181751251221]], [[4.850446701049805]], [[4.748117923736572]], [[4.857550621032715]], [[4.844789505004883]]]], dtype='float32').reshape([1, 18, 1, 1]),
-            paddle.uniform([72, 18, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b9a7bef26d42f58a5a09749b65af37d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5c9f78e9784980eb2a5802d83da4b80e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([288, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_768ab23f14f77ac2d7709af73e398b91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 92, 92], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5d4689f9028489fbd68ea8bbabc9eceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95a50e03048f831a30e620e34401d844
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 128, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1568, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fe015a3dff51e0aa902b4641b9478086(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[21, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b128d535cdbb5fa8123310beed8f2ff3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe015a3dff51e0aa902b4641b9478086
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([21, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_491b1c3b9b3007b2cf53af43c9dc8567(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d031383097a5ad84966e38c5f4bcde76
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 32, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 320, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_56859c722217b9113cfd15325e0e8ec1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_371d2a92e279944ea6e1652c3712cdd9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ff860d0ce2a4dd5f213b36e7a551dc80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_35fc1f876158868b5e4c05b14c5ab6df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_190ea0c2474976650f87c266bc5ca923(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9a3de1ba4cb78cec0fd3bfabe802c8fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ce14b0969f07f6efca539796cae8f3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 96, 144], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c1a014c2de8e20fed4d91d64d664f2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 48, 72], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39221b91663322e9806a03b4aa1513dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 24, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_99cd11934b1a80d93a7a7c0a7ada341e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[96, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be7f82c0c96e002c243f977c58bc1bd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_99cd11934b1a80d93a7a7c0a7ada341e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_31d366f1e24c212d14d1bea36e7be31d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_67f880d2396c7becd16afa7bca75b1c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 258, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 258, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c6c5b6cb8b89a86509bf9ef2224dfa1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_04816a5e3eebe03ff2cd2c0d9db7ea83
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 32, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 160, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_cc8a755b75ce5e6c4a97a9fd554b8f15(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[120, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d6f782e4e7cc2e27ae113958a9bfbb98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc8a755b75ce5e6c4a97a9fd554b8f15
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d6f782e4e7cc2e27ae113958a9bfbb98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc8a755b75ce5e6c4a97a9fd554b8f15
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 20, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2f740493e44d63d0ad557d6d2cb60546(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d3565e6b177772c1610491ce3939d07
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e49ca20d42beaeac8abed74ae48c39fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2dff873ab150b37d6ef7bf2951a6a2f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_98c80d1c1dc98f1f4102d82815bba167(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[8.006047248840332]], [[8.260330200195312]], [[8.33996868133545]], [[7.44035005569458]], [[8.144697189331055]], [[8.882316589355469]], [[8.634410858154297]], [[8.990757942199707]], [[8.681737899780273]], [[9.278529167175293]], [[8.945840835571289]], [[8.340535163879395]], [[6.972236633300781]], [[8.692747116088867]], [[8.620205879211426]], [[7.893377780914307]], [[8.426971435546875]], [[8.7012357711792]], [[7.593849182128906]], [[9.233607292175293]], [[8.024942398071289]], [[8.995513916015625]], [[7.869999408721924]], [[8.258696556091309]], [[8.599509239196777]], [[8.74778938293457]], [[8.43944263458252]], [[8.748218536376953]], [[8.269468307495117]], [[7.775562763214111]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c3d8e11af2636a54b4787027747f196d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c112b745c7b3dd4bc34a2ece5c0f2f1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.4026601016521454]], [[0.32869285345077515]], [[0.0824538841843605]], [[0.11625923216342926]], [[0.21515676379203796]], [[0.30586665868759155]], [[0.44261813163757324]], [[0.24327495694160461]], [[0.3494437038898468]], [[0.41594868898391724]], [[0.23270539939403534]], [[0.10056428611278534]], [[0.28019458055496216]], [[0.2921260595321655]], [[0.23512694239616394]], [[0.4842880070209503]], [[0.3466060757637024]], [[0.1004253700375557]], [[0.09953092038631439]], [[0.34487438201904297]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([5, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6e49e972e15d3b849fbf8d93c11f3edd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e51a13c28be2f221b729b5364cc20473
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[1.9321253299713135]], [[2.0031938552856445]], [[1.3401333093643188]], [[1.0307426452636719]], [[1.41884183883667]]]], dtype='float32').reshape([1, 5, 1, 1]),
-            paddle.uniform([20, 5, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f9bbb828c176ec56c626707bc50b9a68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_509a1e7f8b8ad375ed1bf06e6ffa3a2d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e4058bc88ca1ef9e284da5ca0f57b92e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a6575ac1f771657d11790643355020e9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[2.6567420959472656]], [[2.480134963989258]], [[2.38443660736084]], [[2.644028902053833]], [[2.791123151779175]], [[3.084017753601074]], [[2.594184637069702]], [[2.4360194206237793]], [[2.3499386310577393]], [[2.3491780757904053]]]], dtype='float32').reshape([1, 10, 1, 1]),
-            paddle.uniform([40, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0fc3caf3a2fa6bfabc2be2e01d9d2f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5724848d12a2235dc893ad105b7291
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7905a9cabc80be441f65b67ea6d3f7db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.286731719970703]], [[5.207098007202148]], [[4.644401550292969]], [[5.0255866050720215]], [[4.486727237701416]], [[5.048819541931152]], [[4.073911666870117]], [[4.679478168487549]], [[5.2470550537109375]], [[4.851083278656006]], [[4.808639049530029]], [[5.182626724243164]], [[4.63551664352417]], [[4.853925704956055]], [[5.237611293792725]], [[5.667901039123535]], [[4.88744592666626]], [[5.126287937164307]], [[5.666903495788574]], [[4.0555925369262695]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4b2a4f4ca2cecf89c0d53f31d60601d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f767245719515f2a3a572194ca184b25
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_480e1323cc875a66f9215b53f2be3d5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73b3cc4bda1ec2887481d98fb40a02cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_93d6a7fcaa9a7dc267a5661ae716b187(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ba1f38248eaf6624e589b6c9dbc13c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 4, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 4, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a808845731e052e47a8b8ef0e16e14f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e2f553f38f5fb37f083b0faa9390e7fc
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([28, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d44934b65dea2b31b4c9d053c309a6f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b2c498629d181a4471930129f3255347
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 28, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 28, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce507eb7b315cd5a817be5b1913dafe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_410a52202b5ba5fa7dced71c15250686
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_03135b238c987a7435a9ae9bf6dc95e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bc765449d0a7ff7c622aa36960c4c437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cad2dacac46a386f6c6717876536aa29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ae3e570c54f95dc8c803fe4afaf58f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f2eb435a82eb09ee08e198d4d128adc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62286ff9b8c69751c32c35dfdc2032ce
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[4.067719459533691]], [[4.401407241821289]], [[4.741244316101074]], [[4.198362350463867]], [[4.390926837921143]], [[4.270419597625732]], [[4.106833457946777]], [[4.359747886657715]], [[4.1219682693481445]], [[4.265357494354248]], [[4.703689098358154]], [[4.149801254272461]], [[4.623326301574707]], [[3.8048813343048096]], [[4.348316192626953]], [[4.211686611175537]]]], dtype='float32').reshape([1, 16, 1, 1]),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39a978e0b0a2d92ea2abc854b9725745(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3e954b91cfc8e9f907e7b37844c0bb06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_facbf155137ef2404833cad4ce27a8ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_946bc92564835d934783134cf032df4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2f456cb64ac249ab4892cf26b46d844e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ea97ba0c778f975675adf35ea9542fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12bbd2e655babbce2073262f529cee3c
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa78ad794ecc22baa32ee386d6b4ba15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15bc780f1a9427f76f79c119d76e8213
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([392, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_92b13ab51ee0a39f3a292ec869ec03aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9d2693b059147caa2cd973b67e994cbb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[36, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5340cd8f2ee2104738b046ff72def2dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d2693b059147caa2cd973b67e994cbb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_78c4a2b5dd07c698324c0c850042fb36(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 36, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 36, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_89b4f5c8689524a3233e8cce89ab2dd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78c4a2b5dd07c698324c0c850042fb36
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 36, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e28d0964f10022ac12acf17151dc2809(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ad7bcd292cf6b657bf54e114207d4c71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fb35f792480fddaa6842dadf8d909406(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e602bfe427b25af1f4634aa30ca7c2bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b37d018f9b290bd5a2acc3ad6fbae0e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1011fe220b05d55eee9f8192a5042ef8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b3e8c3c05055251f44e0fc25c378d66c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_87ed99b758d20b1478a35c526aabdd4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_90c9ae74f921f9a9a8a9bac6294bd957(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4353c4b803e01332854448c8c406379f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f5de34c77e2d449d094614a704330854(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b0c789f3cdb56ec40c5ea032887468f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b53ec7777c59fa9c973ef5b1cf20d71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c7526930ad9cf1f413fd1f3fea7b4086(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bac8f2ebcad210a8364f12aea1bc207e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([720, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_919f77b09c8f3dfe4304c85f0eb53c9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dca1002439ddd96a5ba9e1233cd90708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7264350fe574f3f85e6b4486cc4dae32(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[36, 12, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e7553dbf2f050e3039c921da2dfdb46b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7264350fe574f3f85e6b4486cc4dae32
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 12, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e7553dbf2f050e3039c921da2dfdb46b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7264350fe574f3f85e6b4486cc4dae32
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 12, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 12, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6fc8111385b081db8203c579f98aa39e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_345945537b45a5a6392784d7f34a3df4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([84, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ac3b22bcdc11a67011e2ce8792b85b83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b09aab980ba002d272f5be28096ef10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 84, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([336, 84, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9053c968977dc74f124006ada05b357c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a35843383a542ca6ed5d9ae114db9530
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1cdf81c140c8bb2b0e186fc245e76dda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_820b87d01a348e98ce557730122baa4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7a297d99ef2bf72640376afb4f3fa3dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73a2617629e728978d737303b44ce12d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_c3dde3d71b5a874ab8a934b421cd180f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 180, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[60, 180, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3cd98bd185eb9af6ac829bf31c1fab96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dde3d71b5a874ab8a934b421cd180f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 180, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3cd98bd185eb9af6ac829bf31c1fab96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3dde3d71b5a874ab8a934b421cd180f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 180, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([60, 180, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d8b0060b2a2099106896a4d47a256391(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_84e8273af563f67e571da55f4c6b8758
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([14, 56, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_456545b35e9cef83691990674e64e2ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f6728d3e26495fa2e177465cf46aa4f
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.594022512435913]], [[3.0237579345703125]], [[3.9599907398223877]], [[3.5962255001068115]], [[3.341888189315796]], [[3.5093657970428467]], [[3.4329586029052734]], [[3.4953789710998535]], [[3.3291006088256836]], [[4.385458469390869]], [[3.8612802028656006]], [[3.2962377071380615]], [[3.4300596714019775]], [[3.4416568279266357]]]], dtype='float32').reshape([1, 14, 1, 1]),
-            paddle.uniform([56, 14, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_155939f39891d04201c7d427d827f947(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59ff0cd814d496a46a93ab37dd18e819
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([576, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_1eaf98eefe7ac42a2bb2530d2af1660e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[91, 480, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7cbb7a12da58a68b9778faf26d966ccd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1eaf98eefe7ac42a2bb2530d2af1660e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([91, 480, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b49953da67f45be165bc8bb768b0bfcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 144, 216], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f0a370f2872d2764adb3f144d3e9a561(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 72, 108], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f4db0176f1237228ce04dfd537d3ef31(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 36, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6c48d84f823630ece8fa95561ba401ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 18, 27], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0e4b9ff01b0015546799c7cc866f18ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 144, 216], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_912faa897629f83311a54fa1a70c5905(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 72, 108], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_334585c01ba339d951e4cd51468255d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 36, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4308bcb9e481e2f64bb531560ccf29d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 18, 27], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e10d915095dd2645d101116efd7ba98a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2c2a70445b46a81c66e59924a0a702e0
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7929da7c12e39482da6560f5b90cc99e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_87b8f5bcaa48392282ace3a03caed29a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25fe1950bab8f1e4ec71aae9791927ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2ef4f69fa47e6dd93241ca0bef7faec2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c90ac3d536b30e1cde7a67f8fddcb4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 176, 264], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_06f27e98ebafe97858375c75688f7e1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5505a486c4fd1ad14f7307c0d8ba228a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6cad5f36a5d1ba621f0b90641ea9a83f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_90a139499b663f2878194c1db845ac9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 168, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5a6c928745ca1e4ddd70ec52cc6a8080(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 84, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9aad5b03b1e60d3059e2eddcd30b72af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 42, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_855dbdfac49b2fa0ff4e6ec4b62fb140(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 21, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_69e40b9cea1ba9b32f5918ab969c4e57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 168, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3c3210236790a3c35986ff38608ec27c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 84, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3124b1aaf4425b976e7990a381d312b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 42, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ca273deac849ef20cdbc644f3505fff6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 21, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d0fc3caf3a2fa6bfabc2be2e01d9d2f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd5724848d12a2235dc893ad105b7291
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_64a1c96719b89fa13c9fe423c251e78c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f42d2cfb701e087ca2490bccf2d0b6e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5.7662224769592285]], [[5.121534824371338]], [[4.892688751220703]], [[5.425559997558594]], [[5.572066783905029]], [[5.944691181182861]], [[6.39108943939209]], [[5.49835205078125]], [[5.610344409942627]], [[6.0812859535217285]], [[5.372618198394775]], [[6.230724811553955]], [[5.5229573249816895]], [[4.913982391357422]], [[5.887957572937012]], [[5.302123069763184]], [[5.387816905975342]], [[5.579483985900879]], [[6.140265464782715]], [[4.865345001220703]]]], dtype='float32').reshape([1, 20, 1, 1]),
-            paddle.uniform([80, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_547b3a8d487403d0bc9440b8548140b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_547b3a8d487403d0bc9440b8548140b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b5df79d57d02dfec9866e26d1c8ff0d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 384, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa0c8cc5ade9f0757dd5f088fc182fc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3019fc336a19945f1d881af0b0710eb6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 200, 272], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed2248d10e6c83d2fa83ef5a7b42047e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 100, 136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d39c3d033c44283d2b4d6e054d60b713(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 50, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_498c7bdf13301dc2345af4632c8f0ae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 25, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_56d29c2712ba9517830063deca087437(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 200, 272], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a187cf19df10ad6393967d37aaf3e46f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 100, 136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_57b972ab96ab47287d2517f03913a985(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 50, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2a9fe000d4078221728778fcbb52d6ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 25, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3db5490d6f0eb830c5126c023645eca8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5ca25f28244bb9845ea057e613489034
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 192, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ec07ff2d5377b51a80b4a5efddf36270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9bc590efe0fe2607ecab520233ea5e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 192, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e5232be28914d2e8d2d4615fdaa578bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a705c2ae0eb22abfecb4b59eacac9e27
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 384, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([384, 384, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6392cdba6829d8ad7e27ae91df89cf42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_59726218df94ded55013e473075679d6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_99fed0eb54de5adfe3778e92f26b44f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5aca66b67927e4e90edd8bd10b9f07f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9889035b0be7940be2888d3eb964ad7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_73747c66a0e3c3aee58cfea2012be80f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5ab2b0d42283d52445a94156853a9333(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_499f0ecdf61b552ecec8f75ff11c2b29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc717eac1b30fe0227160093531b1cbb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_461608ff6869e1314a98466661f24c49
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 96, 2, 2], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e1923a6ebfa39da36d4764def59f4fec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8a346aa1441e2003d80ef2d8a3612ccc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([20, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6b6cb857af6a7e55b7e8024ec8fe9a40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb6fbd98e205bbce7b4b680582478ca
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 20, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c76e3a6a886d436de5bfe09b4e3f7ca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f23ab9bf1f49e1d1e7c7acf6068c824a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75d1d4909bc56bfcbd2f936aafccf30f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3166a926a3f1b8d29f7eb031d55e8f7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f892bce0cb544c2b2546883c75ffead0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_02542b11c00a57345c8ea01c92119d5c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[576, 576, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4de5aa48b6eb0b0f62f25fc3b5c1751d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02542b11c00a57345c8ea01c92119d5c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([576, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3dccc645c4dea38d2618fc91bff8e7e3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[68, 480, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_243d119851910e3728ab8a79d54529de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3dccc645c4dea38d2618fc91bff8e7e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 42, 42], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 480, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1a3fd310b55c7fc7260d2887432f2550(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_159dbbb04d57326d7f17c959b3a00ea6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_649005d597a57af8944224dbb06307a3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([30, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ef1dfea394214f84e79406ea0d5d3c2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3751f883aae941e8848b9fe16cb3302
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.583075046539307]], [[8.193709373474121]], [[7.204549789428711]], [[8.163895606994629]], [[7.642520904541016]], [[7.732715606689453]], [[7.417176246643066]], [[7.169443607330322]], [[7.470338344573975]], [[7.886391639709473]], [[7.617181301116943]], [[7.129844665527344]], [[8.19444751739502]], [[7.656916618347168]], [[7.290440559387207]], [[7.6368536949157715]], [[7.412344932556152]], [[7.855836868286133]], [[7.848021030426025]], [[8.159557342529297]], [[7.353343486785889]], [[7.523690223693848]], [[8.088516235351562]], [[8.147160530090332]], [[7.752000331878662]], [[7.7076849937438965]], [[7.139747619628906]], [[8.289602279663086]], [[7.066431045532227]], [[7.022487640380859]]]], dtype='float32').reshape([1, 30, 1, 1]),
-            paddle.uniform([120, 30, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b132e0e45b8363f2416de02491eae7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75eb979a7bee2bd230100ad6a1be5cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3586965c08f6767ebc721983fb6a91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a9dcee2f54641da3e641bb2334704da5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5051d1c648ae3af20bbaf38d11c3df67
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f414a537e72b0ed72e2f27aed2844d86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f267e4a91b4a64c44093febc76371e28
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 768, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5340cd8f2ee2104738b046ff72def2dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d2693b059147caa2cd973b67e994cbb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_89b4f5c8689524a3233e8cce89ab2dd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78c4a2b5dd07c698324c0c850042fb36
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 36, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_77c8977c87fd7221b6d34aea24a15d8e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [4, 4], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 64, 4, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_456b476f47926a77150f4d06522670d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77c8977c87fd7221b6d34aea24a15d8e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 64, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ab734c7c533ebd7c6f32945ecf68005d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_77c8977c87fd7221b6d34aea24a15d8e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 32, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc1a17ce6ba56bd6ef02f37527425593(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afec739cc797000106328d6cf26d5e47
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_daa6d9c7ee5b3928b86b599676ad86aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ceb2d0ab6991a3b6a465bec9673dfc03
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed6c4213adb8a712e55deea856ac8dc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97bf810464cf9c95cc156a98ccb4e57d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-            paddle.uniform([19, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_abb8f8f12a9c60fb8fb6ec89112ebef1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ba0482c61514fa4ee91d14bb81158a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 3, 224, 224], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bee1360e9513662b9de6c8af0e77aa26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5e763037a51d651d257898b9d06a0d0f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 96, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_53fdeb0a1ba385fa16125ea88d641cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f9e03587bfeb0db7a12e707adfee0be0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_20c3abeba2f274c65e0beeb5fc101549(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f8778e2826e2a172fd70c45d3cf7656
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_53fdeb0a1ba385fa16125ea88d641cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd285a54b789af28514707c00cc7b7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f9e03587bfeb0db7a12e707adfee0be0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2439d0c84f54967c90c74409cb6d55b
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 16, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_371fa48f4900b620813b179aba127658(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_36523538a77376ff367c11944646e4d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a997d925d0b42d7bd57286f24b6387ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8cff83ff97f429f82f46c4dd048d7d2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 54, 54], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d9963c3b4105c384d925252e81ae0d25(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_202c8852203ccabcc14bd160f24594d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6ef7cab77b3cb8c4d5fb392b2c146340(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ba5746270320e71b07912cb5ad02c9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e4b28fc6ee8365466064fe2db7a3e49d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7ce1c1d67136181ff289a39607ae5867
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c8847cd25bc41532bf0ef884296680e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd561fa2c98b28f3353a22f3b96d1029
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 256, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e545bfd830dee5be7d6f1138ccf3181e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_61a135592ea4a5a83e276604e3390b2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_563e21b81b96ce3fc6f1c92576a95635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811fed8f57bff702d24d72809a2e3782
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e545bfd830dee5be7d6f1138ccf3181e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bae7dee415d8f5ee19ec943814ddc350
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_61a135592ea4a5a83e276604e3390b2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76af2d1f27dd1525e61057f8622f3a71
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 48, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 48, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7286f647add222cb1dfb820632d94728(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62a91881d2c296fc8162e151a5964ec7
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e51d568e0ecc246f0bdac5ef0e23ea0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8b3d2bbecf671a3fd39a6414c9e6bd37(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_592632c519d56512a418a3bfb756d7a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37c0b904fac81068fe6fda64da6f3695
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c4c5af960a2810c45a1fe7341b12e1be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bab3427594f721182ec809dcc3e8450f
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c5601aaa8c6fefad49daac9f70a2ec9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1666c5625485e96d2eed10b9b528b23
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 64, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c6990d8dc9ccf164dd0ea798aabe008c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a9102e04865c6eff81dff4840ce0a076
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 512, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8dbabe4986e5f8ed5a20ba75c51a26a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc5cc618fd2590c5f52692ac3a14d626
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([192, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_482d422b3f48713218c335953cfd76ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [2, 2], [1, 1], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[512, 320, 3, 3], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_14a16831c77d4cdf7de96dafae49039e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_482d422b3f48713218c335953cfd76ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 320, 16, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 320, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_1143bdb97069aeae899fa6ca1091a8cc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[480, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8b438f00916139e676e4fdbdeaff17a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1143bdb97069aeae899fa6ca1091a8cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_095a26c88c6fe92d164aa0f32c021a14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ed4ede63c424556f1be3da4458564ce
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 32, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b4cabbafef73d5cb9c0f026b4db96e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ebd665834d99fbf52cdcca2abccf3ed
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a51cc5e2d995a077dbcbed6e6a0f2e20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a41a5ab6540b6af50ed4f63d3b8abaca
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([18, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_88535bb1c9f529f24b5fa1a911bc05ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_482d422b3f48713218c335953cfd76ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 320, 8, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([512, 320, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7c8d8101f88a219c2cc5bac2fd38ac3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7c8d8101f88a219c2cc5bac2fd38ac3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e6c269b6b70f81e4a19b976e94bce13
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ee370a69c94eca2f1bc47991b8ee41eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5d0f92a5fbae6f7f1c6045184077bca5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ebad4b794241d8c4ce4069c159e7be0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 30, 50], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 128, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6b259722376ae7b8a8a05d4958819416(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db932a6d4a4189cd363ac2d95ca83f19
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([50, 200, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_309402e73e24f043f1562c51c5d08d7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16ccc5af4816183206b7b1c93828d8b2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 50, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([200, 50, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb8fcaa8732f7e48e7a85a33e4a0d76b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 80, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0a357129f743b3a5e8c5134efc475151(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 40, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d20f48592bfabc1c7b8fa7e67e8a4901(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fe31a4ef53ed600bc5cc26a20999eaa4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 80, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c7b3151f36795c8fefb9482de4837aa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 40, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b501a4442701301fcbc125b877fc5cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ff716af518a78adc6a6e76173530161e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3fe4902781d3e80504aa86a5ee292d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cdca1a632c8dc71044374dac3e744b9c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15330765d53807f6b1c71a1fe6e333de
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 17, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.23747996985912323]], [[0.1630447506904602]], [[0.0028940076008439064]], [[0.2152070850133896]], [[0.18946489691734314]], [[0.20506542921066284]], [[0.18682995438575745]], [[0.0914703756570816]], [[0.20739726722240448]], [[0.3708796501159668]], [[0.3002738654613495]], [[0.4498026371002197]], [[0.030341600999236107]], [[0.07943764328956604]], [[0.3069377541542053]], [[0.05187969282269478]], [[0.2775059938430786]]]], dtype='float32').reshape([1, 17, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_aa4a9575da779e1ef092cb8b61cfe1f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15c680891a1e9c46d4a096b969a54b3b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 400, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ec025daa7f5987c1182f57352e0d7b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ecafe60e26a3ecb1f0082fb898a56db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([400, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f8b681a0bc77af171b34f760c5618e3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_761e5a473fa962a2513bc7821baa2533
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4ab6a4aae273f82b440b2b2889fc4a93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5feb994062ccee80ae9930492e78081
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 8, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b2dc657a1311b2dd6842315249b28bde(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5.8344502449035645]], [[5.308574676513672]], [[5.197693347930908]], [[5.810678958892822]], [[6.115532875061035]], [[6.332800388336182]], [[6.011363983154297]], [[6.428175926208496]], [[5.293699741363525]], [[6.867156982421875]], [[6.036801338195801]], [[6.028261184692383]], [[5.883553504943848]], [[6.4830851554870605]], [[5.543907165527344]], [[6.666767120361328]], [[6.437577247619629]], [[5.476907730102539]], [[5.848413944244385]], [[5.90508508682251]], [[5.937018871307373]], [[5.70152473449707]], [[5.871396541595459]], [[6.425298690795898]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f31d4306b7a5a51df9f710314a9a1566(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95a50e03048f831a30e620e34401d844
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 128, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1568, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75e2e42505e389a404c1b2313f51ed1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b8c55b4c23f35b4f84a082e29bcbbe2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([25, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32dbe99faf3442ffda7d4819d7e1a724(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbdd9578d5f71ce59bc106ece4ce20a6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6.3510565757751465]], [[6.3323073387146]], [[6.168614387512207]], [[6.464269161224365]], [[6.101673126220703]], [[5.865241527557373]], [[6.3766398429870605]], [[6.4013566970825195]], [[5.243803977966309]], [[6.055446147918701]], [[6.2069878578186035]], [[6.7337493896484375]], [[6.769177436828613]], [[6.396623134613037]], [[5.389490127563477]], [[6.747425079345703]], [[6.138436317443848]], [[6.221158981323242]], [[6.170349597930908]], [[6.110472679138184]], [[5.7079877853393555]], [[7.01296854019165]], [[6.37586784362793]], [[6.595516204833984]], [[7.369556427001953]]]], dtype='float32').reshape([1, 25, 1, 1]),
-            paddle.uniform([100, 25, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6cacbb94328b55f80ad3035774c3ab6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_73b3cc4bda1ec2887481d98fb40a02cc
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8e8f29725bf369b50de814fa5803a875(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ba1f38248eaf6624e589b6c9dbc13c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 4, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 4, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_07b69f7b9d80ac22cf34465c0eb3f786(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b427d4511028c8cfbdd1c7b13c90c42e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([12, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_31f43828ea515d267ad8c57bc3dd8727(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8c1376968b850cff10d1b3398586b998
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[3.368758201599121]], [[3.5837509632110596]], [[3.370384931564331]], [[3.6329598426818848]], [[3.639111280441284]], [[3.4895529747009277]], [[3.313647747039795]], [[3.074462652206421]], [[3.1436984539031982]], [[3.319467782974243]], [[2.9891510009765625]], [[3.0360426902770996]]]], dtype='float32').reshape([1, 12, 1, 1]),
-            paddle.uniform([48, 12, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8e6b1cd823ba40cd6b9e1fcc5b8aea2b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[288, 288, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d4df47bf23188215a0a57036164f6aec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8e6b1cd823ba40cd6b9e1fcc5b8aea2b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([288, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75bcf0469e50b03707e30efc31c2a32e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_761e5a473fa962a2513bc7821baa2533
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6318d7b4b7061bc709bd00719c77950e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b5feb994062ccee80ae9930492e78081
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 8, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 8, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c76e3a6a886d436de5bfe09b4e3f7ca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f23ab9bf1f49e1d1e7c7acf6068c824a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75d1d4909bc56bfcbd2f936aafccf30f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3166a926a3f1b8d29f7eb031d55e8f7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([320, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_79c6e487620eb42f55099cd7925fe3bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_997afa2cb137a67ebc741714b2d0148d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 76, 116], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6e3691174f133a8a2ca42bb72101cb14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d09d4bcad1f9837761705e9b7b9d6eb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1024, 38, 58], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 1024, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f3c54050ce5fda12d16e76c1675273a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8730e097634a595714c6af4df9dcbf26
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 19, 29], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b9445c09059cd09c7485206d65cd85ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 76, 116], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65620a29cb39380b739385ed06731049(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 58], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f4e5eb5169b529f7c491c95818571843(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1978266051110285842b5bf39d06401
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 29], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a0802c86b7df5079c89a2308bd136b54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 29], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bd2bf00ad96dc28882d1f253a18e04aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ca56ce9095708f2c75869515954ac6e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_09201207b65b4955515878bfdcdb25f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e4799b8fd7a5174f98b814515d9d79a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([21, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f76ef86541932613b4f29452b70f2f53(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 25, 38], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dfe24e744935597670facf12ebdc7594(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f76ef86541932613b4f29452b70f2f53
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_62937576626954618fcd3430166c46d0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, 25, 38], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0211d3bd98da37d8d5432376efa930ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62937576626954618fcd3430166c46d0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39a978e0b0a2d92ea2abc854b9725745(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3e954b91cfc8e9f907e7b37844c0bb06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([32, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_facbf155137ef2404833cad4ce27a8ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_946bc92564835d934783134cf032df4f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 32, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([128, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b041fb3a1ddcda90dbb5ba5adb0354de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 58], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e32eb4186a8667aa32c16d910a8fede3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 38, 58], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9879b5bbf97c6a2d4a88f2fad0bd5191(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56f151d310ff6c8c974ffce8bccf6fd2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([112, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dd8e3a09bb67d733eadc858df36a09c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d744207598210f5a6ad56089daeb592a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ab42f9f43e38018fedfdb5011b96e8f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7678d054238ae74cc7872cf5345bd147
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 160, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 160, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8d00569baee95ffe2817dd064ace71d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_99238897a2359f0bf27c16043be5c5e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_718f3c440c4db401e907be74577cae0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d06e13ee427c97bac56d7b95975c7c3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fa1325d69fc7efd8e24aefc4a281c45
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed14e19d03a10b932c32fa9bd125061e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b1c2308131d1addc59dc7f03a2c7ea1d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([160, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_443227d0aef77b697c7e7322e656fdac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_303fb3fd5a9194782ac44b5f71b3ca48
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([120, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_83d29c4d0aa8f170fe5ede302222421c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cfb9febd5b6d5ca2a4417b9d14ac008
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([480, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ab1f2904c79c583419d7f5f8c6557d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e5d1f54a066c73f6b5b761bbf5920feb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dd8e3a09bb67d733eadc858df36a09c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6e3888dc007310e5ed2371aa2606d89b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d744207598210f5a6ad56089daeb592a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_597460f113cdb9645c5d7a580b43dc47
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 10, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 10, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb471f6eeeb533a3150c672f403f3652(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_43c72f2ec5748aa9b619b689813c8d93
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6a9d942f856b7eab0bd11b91fd0f9952(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 7, 10], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_db5eb9e58e00b9ca00f0892c95225561(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a9d942f856b7eab0bd11b91fd0f9952
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2a719065ab55cc3b21a3611c604fb9c0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, 7, 10], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ec5167b53013df7214f230f7fe90bf69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2a719065ab55cc3b21a3611c604fb9c0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fc2daa335c1418cc65e6c4a2f6363708(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[144, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_278d3d1b1b0935932b7fef7e4d8f36e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc2daa335c1418cc65e6c4a2f6363708
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_01933cc83d738cb91a4a04986550e4aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0da631f8329f791046bab56333763125
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3720a09b280016bd72ba4e5638bf66d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[655.4158325195312]], [[748.7725219726562]], [[692.6093139648438]], [[675.9588012695312]], [[723.8267211914062]], [[691.8809204101562]], [[685.0557250976562]], [[656.61474609375]], [[651.1011962890625]], [[638.8635864257812]], [[645.2039794921875]], [[633.7434692382812]], [[738.085205078125]], [[690.8182983398438]], [[751.1514892578125]], [[687.8397216796875]], [[720.921875]], [[710.91748046875]], [[700.0542602539062]], [[689.18408203125]], [[779.5396728515625]], [[715.0927124023438]], [[676.9441528320312]], [[659.2435913085938]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b16d0edddcd4a1f7a9f22fe33d711366(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_45c46806c264ade3588381ed8ac57cd8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 56, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_38aab490fe83964ec2e0cddc259a4243(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[89.75337219238281]], [[83.88530731201172]], [[85.36779022216797]], [[101.26313781738281]], [[93.88082122802734]], [[93.06602478027344]], [[90.46851348876953]], [[95.70880889892578]], [[91.65472412109375]], [[89.20690155029297]], [[86.20255279541016]], [[88.42669677734375]], [[91.45832061767578]], [[92.54753875732422]], [[84.1095199584961]], [[84.91959381103516]], [[87.48403930664062]], [[82.42300415039062]], [[95.25798797607422]], [[83.24836730957031]], [[89.63948822021484]], [[87.21763610839844]], [[91.71382141113281]], [[87.82693481445312]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e1fe22e76e0d5bf4215bbe50237ef1c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_745ed90dd79a1cdd12afd7934015d2d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_70737e24def109a67ec156f20c788191(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[42.18286895751953]], [[37.83257293701172]], [[40.49087142944336]], [[43.330360412597656]], [[44.14835739135742]], [[40.272438049316406]], [[44.13959884643555]], [[36.287113189697266]], [[37.874507904052734]], [[39.063697814941406]], [[38.932186126708984]], [[41.010169982910156]], [[38.879032135009766]], [[38.83740997314453]], [[41.46599578857422]], [[41.778499603271484]], [[41.137664794921875]], [[44.069366455078125]], [[41.292484283447266]], [[44.26629638671875]], [[44.70181655883789]], [[43.096923828125]], [[39.14973831176758]], [[40.833160400390625]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d3fe320ed68540223ba9eff4c510b0a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dbc15d34bfd67d58e691ac5bdaea0e06
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 16, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ceeec993a6e02677dbc33da2172353a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[22.444965362548828]], [[22.91837501525879]], [[23.13045883178711]], [[22.496843338012695]], [[22.286651611328125]], [[23.69428062438965]], [[25.22113609313965]], [[22.483142852783203]], [[22.866270065307617]], [[19.72197151184082]], [[20.52303123474121]], [[23.253934860229492]], [[23.307491302490234]], [[23.008604049682617]], [[21.508983612060547]], [[20.23398780822754]], [[23.137319564819336]], [[21.744840621948242]], [[19.086095809936523]], [[21.751005172729492]], [[22.209606170654297]], [[20.772302627563477]], [[21.15880584716797]], [[24.43274688720703]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f8c940a0d0fdf69717b180f9c40a1ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f317347967ccc3b049b95916d141fda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[5694.77099609375]], [[5865.689453125]], [[5578.80419921875]], [[5560.3662109375]], [[5239.8662109375]], [[5435.01416015625]], [[5432.3701171875]], [[5690.66650390625]], [[5636.439453125]], [[5711.98095703125]], [[5660.19580078125]], [[5742.43701171875]], [[5373.93603515625]], [[5678.763671875]], [[5373.89453125]], [[5825.58544921875]], [[5862.39013671875]], [[5691.59423828125]], [[5623.8251953125]], [[5951.29150390625]], [[5816.40869140625]], [[5695.05078125]], [[5631.4990234375]], [[5801.54541015625]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_48a997c73afcedd06cbce8afc5c648a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[32464.681640625]], [[37679.4140625]], [[27940.255859375]], [[39437.74609375]], [[37338.4765625]], [[39932.78125]]]], dtype='float32').reshape([1, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5789d9a4a5ad46269b9d8016225b269e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_61f72628dc9671e9c859a9a0178c5934(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6218.27197265625]], [[6437.78564453125]], [[6332.91552734375]], [[6261.58154296875]], [[6418.03564453125]], [[6256.5869140625]], [[6230.2939453125]], [[6367.98095703125]], [[6201.81103515625]], [[5964.33447265625]], [[6298.47216796875]], [[6396.22607421875]], [[5855.2470703125]], [[6592.94482421875]], [[6501.23486328125]], [[6488.33203125]], [[6045.45458984375]], [[6073.13525390625]], [[6150.5751953125]], [[6052.462890625]], [[6179.64306640625]], [[6098.640625]], [[6250.4130859375]], [[5864.505859375]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dac343c0f9ba6bf0709fe6087e10c04e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[37346.5078125]], [[42651.91015625]], [[38734.8125]], [[41321.63671875]], [[34292.33203125]], [[35547.7578125]]]], dtype='float32').reshape([1, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e724881b4ff9bf4aa6fb5eaa96d97f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d326d6ad2fa2f7b9f6f3fd2fb6832bc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[6683.55908203125]], [[6657.83837890625]], [[6472.80224609375]], [[6740.22119140625]], [[6545.1875]], [[6604.4248046875]], [[6505.4482421875]], [[6677.6435546875]], [[6504.5107421875]], [[6393.4384765625]], [[6477.0771484375]], [[6671.4833984375]], [[6506.78369140625]], [[6801.1533203125]], [[6453.5126953125]], [[6521.541015625]], [[6185.03369140625]], [[6878.1337890625]], [[6613.7802734375]], [[6684.76904296875]], [[6635.47900390625]], [[6960.24169921875]], [[6081.99755859375]], [[6516.23486328125]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_37d9726390a136b4553542098aeacc06(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[39694.03515625]], [[40349.96484375]], [[39755.27734375]], [[37882.40625]], [[39102.8046875]], [[48837.41015625]]]], dtype='float32').reshape([1, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_670cf78b2d8de25bb3ec3c3afb805310(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff70a8f7e52ccd73fd4a8ccfd34cca50
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_98f820ceb114a52505d705c2ca919c65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c47be947e510e7d1ad718230de507921
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7082.8291015625]], [[6984.06201171875]], [[6856.89794921875]], [[6916.03369140625]], [[7069.72705078125]], [[6894.19873046875]], [[6734.99853515625]], [[6929.75390625]], [[6560.697265625]], [[6603.26953125]], [[7321.50927734375]], [[6925.974609375]], [[6824.7685546875]], [[6849.10986328125]], [[6781.5146484375]], [[6995.35498046875]], [[6612.943359375]], [[6981.5185546875]], [[6858.69287109375]], [[7126.6884765625]], [[6962.685546875]], [[7017.62939453125]], [[6498.345703125]], [[6643.197265625]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([6, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a8e0d6fdb0134c3cedc05e2bbfa5b061(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ddf9129eabb9678548cfa1c6cf264f2c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[36175.0078125]], [[42373.3203125]], [[39840.25390625]], [[34214.703125]], [[48471.6875]], [[34461.23046875]]]], dtype='float32').reshape([1, 6, 1, 1]),
-            paddle.uniform([24, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d3c92a46f4cfdee404d5369e10cc9ccc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d0b920c7167c443a16ede63ec3db4b8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([27, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ec6116d8a996cb896136a573176ead78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 11, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c9f022468671866d66b7b135d232b9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 11, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_105b476bc8d03d70800e3987ac053137(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 11, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b132e0e45b8363f2416de02491eae7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_47a99af1c677287f67f8fffb8da88eb7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([240, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_75eb979a7bee2bd230100ad6a1be5cca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7a3586965c08f6767ebc721983fb6a91
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([960, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1d733676a56deff3bdcd48b934473522(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c8f2e7f569f3b158184706e35f6ac611
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 96, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2eb0e32b67d7a2d43f5d11ba538c7236(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228d2343846c19598fac068569a691c3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2a2d5be35e4ccdb6ecb0c8e175825d7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_320665df12f7278dde4c800c15181a09
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([288, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4e37cfec893a281fa982911772172e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4027e4b4e482bb60db1b79b1b2e4402d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([6, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c659fea58380b59760b1f635b97d2eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fbb7f0261e3b54d882f3d0685662cc82
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 6, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([144, 6, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5fea4c0a69ebb78fe81568297d5bf496(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ce7553546746c24877c767922a73a060(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5238061cd5b1cbb9334d7f3f2004dd9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c50ad5bf1382f43d3144f08c68c55fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f36ac70fbf0df3fd54a5591426cd48a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b239111222a737c3d47522782fe28914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b165b87d8f4004fb505714a6319e46d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([24, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b0ae2675ee1901949f9e78d9c63d104d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7bd1b78f3daf96ffcafe00c5ded77654
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[7.552052021026611]], [[6.885455131530762]], [[7.7262959480285645]], [[6.937347888946533]], [[6.907149314880371]], [[7.159947395324707]], [[6.235235691070557]], [[6.965958118438721]], [[6.20238733291626]], [[6.355335712432861]], [[7.046883583068848]], [[6.232797622680664]], [[6.774624347686768]], [[6.22779655456543]], [[7.0101118087768555]], [[6.264059066772461]], [[6.324331283569336]], [[7.0207390785217285]], [[7.54101037979126]], [[5.516294002532959]], [[7.428412437438965]], [[7.558745384216309]], [[6.78711462020874]], [[6.509342670440674]]]], dtype='float32').reshape([1, 24, 1, 1]),
-            paddle.uniform([96, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_162548e5dcddd9d5710a5b710f5ab04f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_364b995ea09ce98d6f83e04f8c59f410
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 512], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 64, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_695c58763f3d77f8db830d829799e9c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_daa25e5af0d9cdf1f6f37b5ce9a1a416
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 3, 224, 224], dtype='float32', min=0, max=0.5),
-            paddle.uniform([96, 3, 4, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5532f0cbdb34de2eb6f5eae5c327c36a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 100, 152], dtype='float32'),
-            paddle.static.InputSpec(shape=[64, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_294326069cf3c0a3e9309479a18f6324(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5532f0cbdb34de2eb6f5eae5c327c36a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 20, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_78e275386e74788a600818b0872551f7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.conv2d(input_0, input_1, [1, 1], [0, 0], 'EXPLICIT', [1, 1], 1, 'NCHW')
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 64, 100, 152], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1eeba05c164aaabdc3ce7c6acf522d17(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e275386e74788a600818b0872551f7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_93351688cd38a0787fb1c86159da1d2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 29], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3e03dc7c08efa28a1831b30d59b46690(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 19, 29], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43071e7da4edd4e5ec2378e20c87c9b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c167735f2b55e36c77d7dcb30f3ade3d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([48, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_48d25fb1287a91ded6f9bc6985a5b2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_76546a0ed7d007a9ce46cb1807144df1
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 48, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1152, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fc1a17ce6ba56bd6ef02f37527425593(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_afec739cc797000106328d6cf26d5e47
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([72, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_066787bbfd83a9d784b162cd8624b970(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87d3176705d82fd6fe9eafea01c7d980
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 64, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([784, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_34c432dd0a6702602d8fefd33cce09c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_882e4cd8e0761ffef4ea70062cf70f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 192, 288], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a81173039b6595aab99801b6ae7caaa9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22f4bc02785f523b704e706c4357d11b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([168, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_709ad9d252d5c139382211ed3d392311(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fc32db42bf3f4ad20f1b43d926118a40
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 168, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([672, 168, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cb6f426917f7857ffb0591cd09c9b212(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_811de970d9924f22625e06e64d42b0b3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([80, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f7d044f0075e06503501437266e3fb9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5823737c3f13c8ceaac7edd0ed834a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([68, 256, 3, 3], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_754454ec285d86bd1edf8f0205dedff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db561eeb38c48f01019b5523017fba58
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 3840, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1000, 3840, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
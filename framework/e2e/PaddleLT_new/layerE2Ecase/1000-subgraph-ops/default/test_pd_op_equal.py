@@ -1,414 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.equal(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fb6eb4ef94c0db59616b2704d0ff34cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[86970], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_ccf1b7f91eb5ed1c6a2ed8ffff4c16e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[242991], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_38c60070d3d6d94373ce20436f78abb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[220968], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_6e3f472f8cfbe8c621cce49cdc81d51f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[153450], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_c0635438cc0ebbbb90bc5cc03a75e058(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_12afb8d18d6255e3e612b2af11ab2645(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_a1ff67d40723a30917a10ccb386bbfa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185691], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_09fbf374bc2218658329a6eb0aaed131(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_a66d23b1b9f796ab3b20e7f5e723b347(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_01d0c1acf955c0bfe676e8cf85c61dd2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_341103405472f10ed2cb7eacf287df0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-class PrimitiveOp_e04bc632d2c5b61edfb33b80a3e3af45(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.equal(input_0, input_1)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_595e481c00053831dde87b1de03326ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e04bc632d2c5b61edfb33b80a3e3af45
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-            paddle.to_tensor(1025, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_e37e016d4866796f1bfbde2fea702005(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[113061], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_b721e1bbfb2ccf40863cea1da298aa7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[205923], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_e715f2e7abc98e97eeb55478da7eba76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[123783], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_ee70c5d0ebbc94b18c016a76f8e144fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[171888], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_a9756cad8f7ff65ec9aa13fe8a904960(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[217413], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_9c6388a0b0f23d1e97c20134835f255c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor(0, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_600544d553509b6369c285f4908e4adb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor(-1, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_2b303f06282ea68d17e9d5e753627084(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a45dc126167a71df6f3866f5c2f46c5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185658], dtype='int32'),
-            paddle.to_tensor(1, dtype='int32').reshape([]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
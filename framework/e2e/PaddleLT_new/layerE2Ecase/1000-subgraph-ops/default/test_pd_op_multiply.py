@@ -1,10291 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2774c7541978089979a8bf75d9bb915d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_15e9618881bbcf2704b6c3e42456f235(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b21e10151f5f42299c2f2e8d65245bf4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 21504, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b21e10151f5f42299c2f2e8d65245bf4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 21504, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_273f5fa5e1a60bc6bab9fc18b1756fdd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 576, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9f8595731d0f004149e22ff848f5ed98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_273f5fa5e1a60bc6bab9fc18b1756fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_45ed6e2ea6597cb8a974ca3264305339(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 72, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7285593bc04cb6b369b69c524e983c8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_45ed6e2ea6597cb8a974ca3264305339
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_38bb39d657dc5d7e436622670defaaf4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 92, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_61bf352a65feab513291922baf1f3d7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_38bb39d657dc5d7e436622670defaaf4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 92, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_365076adc3d102e71c719de9ef08dd8f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 48, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 48, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_63e40356286180d9f9b4c652500eb132(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 152, 152], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 160, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 160, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9bc44b61fc9876453d735eabd3109e21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_379f999eb4bce558d918c04cb94da334(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ca4fbcc3549c220f4375987b359b70a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]]], dtype='float32').reshape([11, 1, 1, 1]),
-        ]
-
-
-class PrimitiveOp_fad09e57f2687163480f6dd7e30c1b7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 768, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2d4a3a85ce228a85013cca5c194dfddb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fad09e57f2687163480f6dd7e30c1b7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f222e4c5dee0ef477fb91950adcd45f5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 960, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e0daf7ae547bfbfe5390f925ada64f6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f222e4c5dee0ef477fb91950adcd45f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_8570defc04449c14d5bee6ebca4fed58(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 672, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f22e76f2ea13917fef17230001a8e1f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_aed5bda16e8cfde36cccb444f43454e4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 480, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d6b3be2b89331fbd84aec78dc35d6e2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aed5bda16e8cfde36cccb444f43454e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8256110661c5365bde62ac806223bfb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15f517679f0c875bf295719e365109a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 20, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.13066428899765015], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_adad8a01dc9927f8bd2cc2a7665e748b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7e07043bdf5d883ed57fefd3ffd6b75c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_59945b092cb4d746030eeb6abfa865f5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 336, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e7c5f13910a637aec8d4b04f848f10ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0aaf2290134d34f1cb502ed2c21714d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_3605aca3e677045f208df2206e91238b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_01421f7dff29dbb58036232da4159fa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-class PrimitiveOp_4b25df3b1fffbc0b25118bd310e55451(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[4, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ea7443ad0a3406521223e57c0b0c7622(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b25df3b1fffbc0b25118bd310e55451
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.3512340486049652]], [[0.20144441723823547]], [[0.4534510374069214]], [[0.4873906075954437]]], dtype='float32').reshape([4, 1, 1]),
-        ]
-
-
-class PrimitiveOp_3b88e84456df8cb584439449ae567680(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6ca5f84180fed38620928baf4f302fca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b88e84456df8cb584439449ae567680
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_13ed9f40856a970d54ffe24723e19107(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 72, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2de1d525819d23857f870af61b6c9e01(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 104, 104], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_476e6620e1438088f38ad912418c2905(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6cc05e8ee866ced8824fa896b7b68d7d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([1024, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1024, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_bc7f49a71d68be5f48093de4be1538c8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 2, 1, 9, 112, 112], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 2, 16, 9, 112, 112], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ef795d85fc8ac051a96cd676c3c3f52b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bc7f49a71d68be5f48093de4be1538c8
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 1, 9, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 2, 16, 9, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_94964cae99f5e12c43a76654feaef906(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_098e20b479f6105be5ba15e7d4535fb0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.301143616437912], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_0b73d20cebb10645d031e52e745d0cf6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 20, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_36264228af254775d622a497be0d87ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b73d20cebb10645d031e52e745d0cf6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.8897103071212769]], [[0.8558052182197571]], [[0.8812646865844727]], [[0.8647167086601257]], [[0.919826090335846]], [[0.8695605397224426]], [[0.7983281016349792]], [[0.8446924090385437]], [[0.8743979334831238]], [[0.7994021773338318]], [[0.9012270569801331]], [[0.8914714455604553]], [[0.8910974860191345]], [[0.9107499122619629]], [[0.9030941724777222]], [[0.9546953439712524]], [[0.8936544060707092]], [[0.9288642406463623]], [[0.8397343754768372]], [[0.7359887361526489]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-class PrimitiveOp_9984ef09cd593fb4560d8d5176e4c7bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 40, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6770c548d1849d859d5eec9a24f05381(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9984ef09cd593fb4560d8d5176e4c7bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 384, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_59bc67bb8c4068adc28e7888053442dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a765bc0a04d60f18d97a972284ed0241(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 960, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6ddcdaf878e3026f546c21ed5819f0b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_eeacd4c721523530e52c46b66de64a38(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 96, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9ab6bcb6cca4fa418422559d1ec92366(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_72e4c9ecb974002ee15b0800eb6246ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_72e4c9ecb974002ee15b0800eb6246ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_98420ee273a186f34c945b66bbab6eef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_96036e91f1a57826dd918e02fcdcbdae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98420ee273a186f34c945b66bbab6eef
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.23627743124961853]]], dtype='float32').reshape([1, 1, 1]),
-        ]
-
-
-class PrimitiveOp_85baf4be5ec839e5a123fc61e087f547(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2100, 20], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_971db95433b2eb3c3823acc861468ed3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85baf4be5ec839e5a123fc61e087f547
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2100, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7d964fc1789c70051adcdad189e529ec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.11622358858585358], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c94e0eeae3a50f039ec474da3d8e43a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([4096, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4096, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_39be55716b940d949c945071172b4740(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9d35808d05c7e718499cbd4315f63d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f35fb909862ead27f3bdb6714839bc40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 60, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ed32ec80b79f706aa05e171d48d76a58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35fb909862ead27f3bdb6714839bc40
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 80], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_28119637b5e500ed0719d28e2a79da29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4a7839bc29fa408f2645a06ed8d01664(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_70c553538f080589ff9e98db3bff902f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c011a20f722f6fc4bbbbad775677bd7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_88a18fec0ab3d35435862b899ebaa447(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a3e4323a567951a3d707091b7981614b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1152, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1152, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fe08d16f366db21b0fa73f21bb7dac1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e4323a567951a3d707091b7981614b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 192, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3f291d38a1bfa6c02b08749a03694f46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ed18e33ab9f3afd2191f1914a2b7136c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43b3bb766f0fe3e3d72d9373a8e2b643(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([150, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([150, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 68, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a2d60970c57064b0236025a75b8bd5f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 50, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.05012466385960579], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_77a23f49cc975ba1ce24c8b8287d5231(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f0a28c1598c7bd0e66ecc7f7542934b9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_40ca935aa07f787a0709f3b9b31f66a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([145, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c425c3d49b25cb863b2948c5dafb2fce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_712c48e1aa15c7d43e4095fefc8a38ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 28, 40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.18255819380283356], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c854e9b7faf7ee1767f48ca3ec4c53fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_93f34d002b99b46d05d1eb89caaa868d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 16, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 16, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8d0bf36aaa0c3b27fda2cc22c1e52275(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93f34d002b99b46d05d1eb89caaa868d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.7501780986785889]], [[0.9918511509895325]], [[0.6383017301559448]], [[0.9637100696563721]], [[0.6404445171356201]], [[0.8570069670677185]], [[0.867103099822998]], [[0.7134389877319336]], [[0.8779413104057312]], [[0.8721026182174683]], [[0.7576207518577576]], [[0.7073616981506348]], [[0.7422252893447876]], [[0.8758162260055542]], [[0.7369071245193481]], [[0.8388648629188538]]]], dtype='float32').reshape([1, 16, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_0beff2f0d141cfff69baa908fd64f15c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_248307a896aa76b5b3c9b8b9872b5590(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([145, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a69e43a060f8a1b0a2aac3060ad88535(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 44, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 44, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_659e644eb938f291314ef6e160410f10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a69e43a060f8a1b0a2aac3060ad88535
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 44, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7a67ea2ca29d795eebf27ef76bd63d15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e0f0b7cc3586001c9b2aa41c037f9740(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3584b29c8105e93a5545b62e73abf277(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0f0b7cc3586001c9b2aa41c037f9740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[-0.03580167889595032, 0.032364264130592346]], [[-0.2486335188150406, 0.031014174222946167]], [[0.0708705335855484, 0.2186449021100998]], [[0.3210778832435608, -6.23464584350586e-05]], [[0.07536324858665466, -0.22674953937530518]], [[-0.129308819770813, -0.28110766410827637]]]], dtype='float32').reshape([1, 6, 1, 2]),
-        ]
-
-
-class TestPrimitiveOp_05dc71692542f8694ba82700b50d2de4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0f0b7cc3586001c9b2aa41c037f9740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[-0.2941361665725708, 0.20316524803638458]], [[0.04726943373680115, 0.04939296841621399]], [[-0.03572338819503784, 0.05265358090400696]], [[-0.024472994729876518, -0.37459635734558105]], [[0.15027132630348206, -0.09043115377426147]], [[0.011610478162765503, -0.25386616587638855]]]], dtype='float32').reshape([1, 6, 1, 2]),
-        ]
-
-
-class TestPrimitiveOp_81c31eda1386614ed73dbce86ab530b7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0f0b7cc3586001c9b2aa41c037f9740
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[-0.03580167889595032, 0.032364264130592346]], [[-0.2486335188150406, 0.031014174222946167]], [[0.0708705335855484, 0.2186449021100998]], [[0.3210778832435608, -6.23464584350586e-05]], [[0.07536324858665466, -0.22674953937530518]], [[-0.129308819770813, -0.28110766410827637]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[-0.03580167889595032, 0.032364264130592346]], [[-0.2486335188150406, 0.031014174222946167]], [[0.0708705335855484, 0.2186449021100998]], [[0.3210778832435608, -6.23464584350586e-05]], [[0.07536324858665466, -0.22674953937530518]], [[-0.129308819770813, -0.28110766410827637]]]], dtype='float32').reshape([1, 6, 1, 2]),
-        ]
-
-
-class TestPrimitiveOp_c9500c14d3f720cd70e021da88c173e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e0f0b7cc3586001c9b2aa41c037f9740
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[-0.2941361665725708, 0.20316524803638458]], [[0.04726943373680115, 0.04939296841621399]], [[-0.03572338819503784, 0.05265358090400696]], [[-0.024472994729876518, -0.37459635734558105]], [[0.15027132630348206, -0.09043115377426147]], [[0.011610478162765503, -0.25386616587638855]]]], dtype='float32').reshape([1, 6, 1, 2]),
-            paddle.to_tensor([[[[-0.2941361665725708, 0.20316524803638458]], [[0.04726943373680115, 0.04939296841621399]], [[-0.03572338819503784, 0.05265358090400696]], [[-0.024472994729876518, -0.37459635734558105]], [[0.15027132630348206, -0.09043115377426147]], [[0.011610478162765503, -0.25386616587638855]]]], dtype='float32').reshape([1, 6, 1, 2]),
-        ]
-
-
-class TestPrimitiveOp_e45895579fde9d09e4cdec749c094e65(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98420ee273a186f34c945b66bbab6eef
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.00011241174797760323], [0.01573030650615692], [0.012142246589064598], [0.03310023993253708], [0.013642589561641216], [0.02962482161819935]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([[[0.005460692569613457], [0.04573238268494606], [0.07607401907444], [0.020931769162416458], [0.25405409932136536], [0.0021392370108515024]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-class TestPrimitiveOp_0729b9bef9c03907daae19d8de575edd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98420ee273a186f34c945b66bbab6eef
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.04568320885300636], [0.0003195523750036955], [0.000257603038335219], [0.052901167422533035], [0.005394658073782921], [0.016412531957030296]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([[[0.005460692569613457], [0.04573238268494606], [0.07607401907444], [0.020931769162416458], [0.25405409932136536], [0.0021392370108515024]]], dtype='float32').reshape([1, 6, 1]),
-        ]
-
-
-class PrimitiveOp_24220e97cfb882d7db6688d0b0dceb7a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 384, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5cb26ca917c992fc761401e0c3ff2c82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_24220e97cfb882d7db6688d0b0dceb7a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d9977247759bc092dedb9973d521f77e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 4, 1, 49, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 4, 16, 49, 56, 56], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3ab87ce6092bcd301f05a261e1b353aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d9977247759bc092dedb9973d521f77e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 1, 49, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 4, 16, 49, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_06b196423ce79bcad89057ff84d5c7c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4b75c3c39962f68793e377df24762be4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([40, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_991aa3649a8d89ca46c1ce9d0743997d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5419101c4f71e06d7120314964b7b1b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_069cfdf0c9713bfac471b083069991e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7c987637f3a77cd7027758e096b15014(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e5de0e4ce8fa8364a392f3166e466ad4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 81], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 81], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0ef8bef711f8b10ab2b61274af46cfac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5de0e4ce8fa8364a392f3166e466ad4
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 81], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3800, 81], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d7352dd94434211fb041a08a13babfb1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_914346d5194d95e3a0ac2c6b4e58d2b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.9313265085220337, 2.357778549194336, 2.267331838607788, 2.2795844078063965, 2.010868787765503, 1.9143667221069336, 2.312474489212036, 2.0880370140075684, 2.092761516571045, 2.171534299850464, 1.8332440853118896, 1.8002440929412842, 1.8413166999816895, 2.037410020828247, 2.1291356086730957, 2.0480966567993164], dtype='float32').reshape([16]),
-            paddle.to_tensor([0.8341897130012512, 0.8580669164657593, 0.9918850660324097, 0.8849743604660034, 0.7500244379043579, 0.7648125886917114, 0.5207740068435669, 0.5953684449195862, 0.7336146831512451, 0.8628090023994446, 0.7108194828033447, 0.6675501465797424, 0.6337616443634033, 0.6086683869361877, 0.8675577640533447, 0.6049840450286865], dtype='float32').reshape([16]),
-        ]
-
-
-class TestPrimitiveOp_938889858036cb8985781d222d34fd7b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.9542105197906494, 2.2515485286712646, 1.8974164724349976, 2.0332117080688477, 2.065920114517212, 2.193167209625244, 2.1452512741088867, 2.082914113998413, 1.97029709815979, 1.9159406423568726, 2.2288293838500977, 1.9541637897491455, 2.0449936389923096, 2.0640869140625, 2.122668743133545, 1.8684662580490112], dtype='float32').reshape([16]),
-            paddle.to_tensor([0.16581030189990997, 0.14193306863307953, 0.008114946074783802, 0.11502566188573837, 0.2499755322933197, 0.23518739640712738, 0.4792259931564331, 0.4046315550804138, 0.2663853168487549, 0.13719098269939423, 0.2891804873943329, 0.33244985342025757, 0.3662383258342743, 0.39133161306381226, 0.13244225084781647, 0.39501598477363586], dtype='float32').reshape([16]),
-        ]
-
-
-class TestPrimitiveOp_28180f6f6c2fedeafdfec3d79ecada19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.48378023505210876, 0.5856752395629883, 0.5660825371742249, 0.5628113150596619, 0.5061575770378113, 0.4949842691421509, 0.5580841898918152, 0.5214910507202148, 0.5150346755981445, 0.5341172814369202, 0.4869098961353302, 0.46285367012023926, 0.4789777398109436, 0.5119624137878418, 0.5320698022842407, 0.4942849576473236], dtype='float32').reshape([16]),
-            paddle.to_tensor([0.29492616653442383, 0.015218395739793777, 0.09603925049304962, 0.4136781692504883, 0.29454126954078674, 0.0370655357837677, 0.11418686807155609, 0.19159305095672607, 0.06644794344902039, 0.4809371531009674, 0.05165327340364456, 0.05351187661290169, 0.46389690041542053, 0.15890836715698242, 0.2184208631515503, 0.06789974868297577], dtype='float32').reshape([16]),
-        ]
-
-
-class PrimitiveOp_dba7f635df5585d7dd15cf6f26aa306e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 240, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7f6839d00f935d52405dd6bff2074ffa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dba7f635df5585d7dd15cf6f26aa306e
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([145, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_692912c75e74d6cdb6f4b24b69c499b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 80, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.11176148802042007], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_33e669bf74ae8c6199fad52a6cd08283(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 64, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 64, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4b241792bb25fe583a4802659145add7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33e669bf74ae8c6199fad52a6cd08283
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_79f717952faab472c73d70804a493506(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 14, 20], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17367160320281982], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e6b115870dac2bd4a5c9de7ce7b479b1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 300, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2d7891fef456267c92112cadeb674248(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e6b115870dac2bd4a5c9de7ce7b479b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.4048970639705658, 0.3832208216190338, 0.42839768528938293, 0.13404519855976105]]], dtype='float32').reshape([1, 1, 4]),
-        ]
-
-
-class PrimitiveOp_19c2ac00d767b97e264e68b3acd0e778(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 768, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4796ed25722efdf68443f1d9695ceac5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_19c2ac00d767b97e264e68b3acd0e778
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5641dc3ffde63ac476404cf6870bb20e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 22, 33], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.3504430651664734], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_031df0598afc821cdcc6e58ed648ddb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 23, 35], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.12507274746894836], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_df02bedba7371c6223c8c008b2bb55bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 46, 70], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.00483984500169754], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba2a59bb137edb21273af43257adc078(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dcfc564428cf84e56fbc415031654c70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_86a54ec7416ee4fcd7a5c436627ddd16(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[3, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cd49ad6b130373821cfff1ba263234d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86a54ec7416ee4fcd7a5c436627ddd16
-    def get_inputs(self):
-        return [
-            paddle.uniform([3, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.4878624677658081]], [[0.05223489925265312]], [[0.008530229330062866]]], dtype='float32').reshape([3, 1, 1]),
-        ]
-
-
-class PrimitiveOp_6eb4a6e9a3ff24c70e63d79aecc77097(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[768], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 768], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_44da7c5b1df417b4f46a65213634a9a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6eb4a6e9a3ff24c70e63d79aecc77097
-    def get_inputs(self):
-        return [
-            paddle.uniform([768], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 577, 768], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b927250f1ed493ebd521e2f1cd143a6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([150], dtype='float32', min=0, max=0.5),
-            paddle.uniform([150], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_db8ac11661fe8ba5fbddcd902fc85009(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35fb909862ead27f3bdb6714839bc40
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f22e76f2ea13917fef17230001a8e1f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_310e7cc7187ce8d5882e51d16eed9251(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 100, 152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.19945332407951355], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_495d91e33a635b19edea897af6cd1867(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 128, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7c2dd8865c749aece8a06806458645bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_495d91e33a635b19edea897af6cd1867
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b83079c8e510360c3f05b8bea7211ff4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_046bf242e687e1d6da8d5dea3eaa45d1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6cf52968ff726dfa7ab970ab9887cee8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 320, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 320, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ff6c0b867464b3e360c597f7a4122a85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cf52968ff726dfa7ab970ab9887cee8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bd97aa78fd5322c7b85710e4b6f0eb2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a1ca419767c56c49909af1ef11eb453c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 872, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a9314b938952134be5cecdd63415564b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1ca419767c56c49909af1ef11eb453c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 872, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2f3bc8fd07c5dacb5e606a94f7719f18(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 100, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 100, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_314d180723704f74ed92488886ff4183(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f3bc8fd07c5dacb5e606a94f7719f18
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_52a959cf135117882a736b88e937bf24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_efb9086f821a20072586613485e9cf86(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dacd7bdb15c489ed69b32195cee6185a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dacd7bdb15c489ed69b32195cee6185a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dacd7bdb15c489ed69b32195cee6185a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dacd7bdb15c489ed69b32195cee6185a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dacd7bdb15c489ed69b32195cee6185a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d5a1e8321ba740de2183935fd70009a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d5a1e8321ba740de2183935fd70009a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dacd7bdb15c489ed69b32195cee6185a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fe14a1ada2bb144a12326ab62490cc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_76b951e395f2098559d73555f1a27efb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]]], dtype='float32').reshape([11, 1, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_50a1686a30d651381be1d0043d62aa43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 6, 9], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.40978288650512695], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5e62cb016eb141b2b79cb445be02b533(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_691fafab64d3fa33d0c13d528a8a6f2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 40, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]]], dtype='float32').reshape([11, 1, 1, 1]),
-        ]
-
-
-class PrimitiveOp_de41dd47297a46f2044aa6bf6d6b5a35(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 256, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bbcd99e7a0f19a67a3034a0962b80b51(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_de41dd47297a46f2044aa6bf6d6b5a35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_30aebb5a7f1a998d73fe2c1e78d52a75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.014413835480809212], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f3da1e67cebce87064c8d2b0a9e3fef2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 4, 1, 49, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 4, 16, 49, 56, 56], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_de23b4cd222e5c7f85458629b4e37119(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3da1e67cebce87064c8d2b0a9e3fef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 4, 1, 49, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 4, 16, 49, 56, 56], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b018881c7b0a50025013fbfa32434287(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_81532de63423082f34c4e132cb97f22e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([171, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c7a18c346cd091828fece527d0a42ec6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3fc6489618b07c3077d4bbc369be5dba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 24, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6558a47673440af5766878b002e3a19c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1206e5b0a8c8146e25b7be8c0133603b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6558a47673440af5766878b002e3a19c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7e648d405f232958c2e8a605a38f98a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 11, 11], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bb5334aa97663b65be2fbd12fcab3eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cf52968ff726dfa7ab970ab9887cee8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af869ff0a49f274c4820852bdd8e359b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 96, 96], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_173b4141e6caed499d3669b0df217ade(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4d60aaf967df7afd00148d2c6a03a623(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_75ab1ce1ca742268bc1923ad626c28f4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_81bdaba4544131da9393093343b5ceec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75ab1ce1ca742268bc1923ad626c28f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_992d9697ed7b694bf4a3fc5f3bfc8bb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.02123597264289856], [0.0], [0.0]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.0], [0.020342353731393814]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-class TestPrimitiveOp_a166c03df1f2f1ce9ce6fa34c8ab9336(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.153676837682724], [-0.451524943113327], [-0.05051368474960327], [0.16077575087547302], [-0.06059856712818146], [-0.37212833762168884], [0.0784212052822113], [-0.07564777135848999], [0.13375301659107208]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[-0.43609243631362915], [-0.08434078842401505], [-0.04727376997470856], [0.4467587471008301], [0.07252585887908936], [-0.3461950421333313], [-0.02600729465484619], [0.21967345476150513], [0.055268917232751846]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-class TestPrimitiveOp_101174652bac92c7a6e8335497063663(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.06871581077575684], [0.017661601305007935], [-0.09969797730445862], [-0.24965323507785797], [0.06549587845802307], [-0.03732961416244507], [0.07591791450977325], [0.022864848375320435], [-0.03110349178314209]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[-0.08596774935722351], [-0.1876102089881897], [0.15513403713703156], [-0.35840296745300293], [-0.09005039930343628], [0.10423088073730469], [0.0014954209327697754], [-0.35533180832862854], [0.29093411564826965]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-class TestPrimitiveOp_eb581c219b48b4f4fe690e3c8c66c822(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.06871581077575684], [0.017661601305007935], [0.25429418683052063], [0.16077575087547302], [0.25483518838882446], [0.006061911582946777], [0.133103147149086], [0.05847308039665222], [0.20373472571372986]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([[-0.08596774935722351], [-0.07365637272596359], [0.15932123363018036], [0.4467587471008301], [0.08745938539505005], [0.10423088073730469], [0.08094674348831177], [0.21967345476150513], [0.3258606791496277]], dtype='float32').reshape([9, 1]),
-        ]
-
-
-class TestPrimitiveOp_5eef900d2786624d1fc326e79093a971(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c96a3c6c52cec6689d26fdc752bb6a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dba7f635df5585d7dd15cf6f26aa306e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2d25e44fcd5823b98187b408f9d56b8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21824, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 21824, 15], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fe743c2606a69acd1286ac7b4b988e8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a8db7d79ba603928916a4aab0dfca6a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_273f5fa5e1a60bc6bab9fc18b1756fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bc0a5d71f0cb68455aff9f269d6ea506(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.20062156021595], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bc0a5d71f0cb68455aff9f269d6ea506(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.20062156021595], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7fe80bf45124ca8664ea8278252b5644(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a8f0a74aba79956fd7249534ee6f6a74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fe80bf45124ca8664ea8278252b5644
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 8, 8], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e729ce4a58e1fb04f064fdd49605571c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_25f496183a3a4d0b32d401f709e8bda3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e729ce4a58e1fb04f064fdd49605571c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.4963630139827728], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_957fba86d9207bcce9276ec0f803dfb9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fad09e57f2687163480f6dd7e30c1b7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9db9c0bedcb79d1b3e7b957f664d4e3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_273f5fa5e1a60bc6bab9fc18b1756fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2fc77f67d6cf0dc520abb3c5d7d1a0a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d396a802a23c89fa3bd4b1a7e830f118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d396a802a23c89fa3bd4b1a7e830f118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d396a802a23c89fa3bd4b1a7e830f118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d396a802a23c89fa3bd4b1a7e830f118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d396a802a23c89fa3bd4b1a7e830f118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0346912d78f4586eb9076ccc0699deaf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0346912d78f4586eb9076ccc0699deaf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d396a802a23c89fa3bd4b1a7e830f118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2ae11320503813de712beff0767170a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_933ea103ec7225dd1e46ab506d5626c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_273f5fa5e1a60bc6bab9fc18b1756fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c363809de22c61b93144f162a2acac3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c07474e27d158ce947768c05ff5320e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c07474e27d158ce947768c05ff5320e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c07474e27d158ce947768c05ff5320e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fe1c253e39d4306f9595928e91e744cf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_03a186c4e005be8ddb8af100f93591ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.22053302824497223], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ec9bfc40b8420156251b1946c26a8198(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9b2f8d98762f1c3a2cf490994053eea8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7d6ace31f971fd90e501e4112037e132(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_373d8a0ec1c910abd02992266543699b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32d5f3eafc0cb9283e7e2c05b339c2f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e30ed52cb5ae3242d681ad560a32d658(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6a2c2b69682293c75df0cb693e3cd442(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e30ed52cb5ae3242d681ad560a32d658
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_61c8b51cb4ec38acb1b96553571d8877(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ccbde913955e28ec5f8831477dc3555(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5de0e4ce8fa8364a392f3166e466ad4
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200, 81], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15200, 81], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6b2f8e9b3c562537f4a502427e327a01(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 160, 160], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e30c9929f70d7657a2c5aff0a3dc5a0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_38ca9bd1c920c14943ba277d29c86fbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f73057aa9c0d63506c682d60495bfb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 10, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.35366085171699524], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_36e122a8b324ef1f39afe76c04516af1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15200, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2ccfe3873dc0eb37636c2a4ceb244a35(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.9290266633033752], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.027632426470518112], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d26b98267bd4ddb475d287766d32cea4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.8689955472946167], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.334881991147995], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_391ea07d377bd44a525315beafa2d798(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 32, 1, 49, 7, 7], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 32, 16, 49, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_790f78bb904d1b4385831401401b9ae3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_391ea07d377bd44a525315beafa2d798
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 1, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 32, 16, 49, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_077b080259d38ef4229744f4eb9ffabd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 144, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_700f00bcfbbb1f4307af62e00093f8c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_318112fbb3a78cef01b64ba6ced6256d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([64, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cbd38b8ca90f7c41e51c4ec40edf9af5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d8062088484c8a20e453b9da3d59d47c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 168, 168], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_79acfb528c3c78f029a791d8e7343f35(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_db95b78c01a0cd6760b50ec1358a26e7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 36, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b88a37be84085cefdbda1eb7ea7a6e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db95b78c01a0cd6760b50ec1358a26e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9bdc11669c3d4d73147de414ae83123a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.498783141374588], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_88a18fec0ab3d35435862b899ebaa447(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bca1ed73625889afb98c1bb8bbad53c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 12, 18], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.1789509356021881], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3a45f0286abd0a8d30448cb98eae1a98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_81bdaba4544131da9393093343b5ceec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75ab1ce1ca742268bc1923ad626c28f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae3d6dc9230440962a951bcc6cf55409(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6e45eaebc956fdf8d427bedc5cdaef6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_be96aea9c868e55a81fafa0df8f428cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([-0.3436264991760254, -0.026239752769470215, 0.0256974995136261, -0.48480790853500366, 0.0, -0.05702018737792969], dtype='float32').reshape([6]),
-            paddle.to_tensor([-0.27330726385116577, -0.2945631742477417, -0.10658591985702515, -0.2021600604057312, -0.10806180536746979, -0.09570963680744171], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_244fd1d7e6b77a31e2c6ed5dcd69a67e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.09391561895608902, 0.007729264907538891, -0.00273899151943624, 0.09800879657268524, -0.0, 0.005457381252199411], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.0, 0.0, 1.0, 0.0, 0.0, 0.0], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_e558718de30107fa1c370ad9bbfb3c0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 0.0, -0.00273899151943624, 0.0, -0.0, 0.0], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.0, 0.0, 0.0, 0.0, 0.0, 0.0], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_1ef4b3707c2c6c2f96088d4fd1829667(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.008161276578903198, 0.0, 0.1359562873840332, 0.0, 0.0, 0.09199276566505432], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.0, 0.0, 0.0, 0.0, 0.10956054925918579, 0.06975878775119781], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_588110ea8cd6819a1da718387dab5c83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([-0.03985670953989029, 0.3563137352466583, 0.0256974995136261, -0.07077597081661224, 0.2433735728263855, 0.24213233590126038], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.10679596662521362, -0.2945631742477417, 0.04922857880592346, -0.2021600604057312, -0.10806180536746979, -0.09570963680744171], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_c18f60ff9b698be80046e3a7862409de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.32777875661849976, 0.19396711885929108, 0.03677868843078613, 0.2845810651779175, 0.025402367115020752, 0.22408275306224823], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.32777875661849976, 0.19396711885929108, 0.03677868843078613, 0.2845810651779175, 0.025402367115020752, 0.22408275306224823], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_ae2608c14f52a3c6cc58a3362aa87d0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.19039610028266907, 0.037546172738075256, -0.22206011414527893, -0.21200229227542877, 0.027823418378829956, 0.06056720018386841], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.19039610028266907, 0.037546172738075256, -0.22206011414527893, -0.21200229227542877, 0.027823418378829956, 0.06056720018386841], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_4ac4d5193d40e432fd4af206481decd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3119310736656189, 0.38255348801612854, 0.1359562873840332, 0.4140319228172302, 0.2433735728263855, 0.3911452889442444], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.3119310736656189, 0.38255348801612854, 0.1359562873840332, 0.4140319228172302, 0.2433735728263855, 0.3911452889442444], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_1f7fa53ed18cb560e92f62ebc8add828(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3801032304763794, 0.0, 0.1558144986629486, 0.0, 0.10956054925918579, 0.06975878775119781], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.3801032304763794, 0.0, 0.1558144986629486, 0.0, 0.10956054925918579, 0.06975878775119781], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_be7b5a3ec52490649dd7ef1c0408c60d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([-0.13263669610023499, -0.4464241564273834, 0.45530542731285095, -0.1938367486000061, -0.11905823647975922, -0.8577317595481873], dtype='float32').reshape([6]),
-            paddle.to_tensor([-0.32726770639419556, -1.1015067100524902, 1.1234203577041626, -0.4782726764678955, -0.29376423358917236, -2.1163668632507324], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_09ae2ffbfdb2d803392cf22ff820aadb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.041601866483688354, 0.32964152097702026, 0.3384053111076355, 0.08484144508838654, 0.0337931364774704, 0.6447948813438416], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.043407708406448364, 0.4917392134666443, 0.5114994049072266, 0.0927068218588829, 0.03497505187988281, 1.8152750730514526], dtype='float32').reshape([6]),
-        ]
-
-
-class TestPrimitiveOp_ca39728c53ea119b05babd7a5eabc1df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aed5bda16e8cfde36cccb444f43454e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ab9aa7a7fba56756f211670a4d29dad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_495d91e33a635b19edea897af6cd1867
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_57eecf821a68fe7ca9cb91228e491a4a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e490514da90a9dd3fab20aa90e59ec0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e490514da90a9dd3fab20aa90e59ec0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e490514da90a9dd3fab20aa90e59ec0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e490514da90a9dd3fab20aa90e59ec0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e490514da90a9dd3fab20aa90e59ec0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e3bcb09167c8850d149a09c6f1b7f106(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e3bcb09167c8850d149a09c6f1b7f106(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e490514da90a9dd3fab20aa90e59ec0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2fc77f67d6cf0dc520abb3c5d7d1a0a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_68c48677c7bbaf3489b1be408a6d1c47(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c5731bf660ecd11e044f32436b14163a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68c48677c7bbaf3489b1be408a6d1c47
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8fdca225a0558864bff16f123528a0fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68c48677c7bbaf3489b1be408a6d1c47
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_504ec092db58f4046f7ca852afc2bc7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1fe14a1ada2bb144a12326ab62490cc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200], dtype='float32', min=0, max=0.5),
-            paddle.uniform([15200], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_019a428061f24ae4abcedf66d37b7dd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e4323a567951a3d707091b7981614b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d8e6a112cd2cd8cc73cf9ec2a91dd8b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_52bdaa6ea0894b91cc6e0c261eef44a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 92, 140], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.3365625739097595], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_91aa37acc2c39060693c7c183cd1c99d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 32, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_29011776bb501c2a7449822400f1dc74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91aa37acc2c39060693c7c183cd1c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1d2e1ee0b892f8c5e529fbb3f74d1d49(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8da80925aa2163f3ebf62d9bbdff67ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75ab1ce1ca742268bc1923ad626c28f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1adf363743d54762fc72832310dd3db9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fad09e57f2687163480f6dd7e30c1b7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_801689fb2d7b4652adc7dd2a018767a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dba7f635df5585d7dd15cf6f26aa306e
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([171, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_13b0442a6b79f982d641b8d61db49d9e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([171, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e899c64cf254931f2d3bdac698e40af6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e148209ad3a18dfd71f439ef3cb4cd1f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 512, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1b1fa3c6df75f3d903bedbb466b7f050(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e148209ad3a18dfd71f439ef3cb4cd1f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 38, 38], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fd2966c8536acb6d9946196707b68c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b68e2697af6ffea106ab6da29a75fdb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.2090020775794983], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_64b3661e08a9412b02da4daf9ca243b1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 8, 1, 49, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 8, 16, 49, 28, 28], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_36f01420ed2327f7cf7f3850d440b720(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64b3661e08a9412b02da4daf9ca243b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 1, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 8, 16, 49, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_baecdc4f1e372f39d1070576abf1fc6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2.155299663543701, 2.127903461456299, 2.092061996459961, 2.2456891536712646, 2.0062496662139893, 2.1588125228881836, 2.184248685836792, 2.2017717361450195, 1.9601012468338013, 2.0094528198242188, 1.8388959169387817, 2.111158847808838, 1.9217698574066162, 2.2436141967773438, 2.0422940254211426, 1.9107041358947754, 2.0932178497314453, 2.2492575645446777, 2.282749652862549, 1.9342312812805176, 2.0746495723724365, 2.0994317531585693, 1.8970482349395752, 2.2481303215026855], dtype='float32').reshape([24]),
-            paddle.to_tensor([0.5023728609085083, 0.506704568862915, 0.6151540279388428, 0.6396647691726685, 0.8156242370605469, 0.9069505929946899, 0.967793345451355, 0.9233776330947876, 0.5636694431304932, 0.8777757287025452, 0.7497011423110962, 0.979551374912262, 0.7818257212638855, 0.6523077487945557, 0.833903968334198, 0.9146982431411743, 0.9137731790542603, 0.5271173715591431, 0.9546530246734619, 0.6569538116455078, 0.7714357376098633, 0.5338518619537354, 0.5759052634239197, 0.740065336227417], dtype='float32').reshape([24]),
-        ]
-
-
-class TestPrimitiveOp_0c7c64d68a884eb7086cb2447eb606a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2.2614030838012695, 2.3531107902526855, 2.061070680618286, 1.9574167728424072, 1.9233795404434204, 2.215851306915283, 1.8629826307296753, 2.046051263809204, 2.1637990474700928, 2.271042823791504, 2.219791889190674, 1.9951488971710205, 2.2989611625671387, 2.2857558727264404, 2.335562229156494, 1.8782644271850586, 2.309227466583252, 1.9977295398712158, 2.082630157470703, 2.233391284942627, 2.110212802886963, 2.144787073135376, 2.0895724296569824, 2.010680913925171], dtype='float32').reshape([24]),
-            paddle.to_tensor([0.4976271390914917, 0.49329546093940735, 0.38484594225883484, 0.36033523082733154, 0.18437574803829193, 0.09304941445589066, 0.032206643372774124, 0.0766223669052124, 0.43633055686950684, 0.12222424894571304, 0.2502988576889038, 0.020448602735996246, 0.2181742787361145, 0.34769222140312195, 0.1660960465669632, 0.08530177175998688, 0.08622681349515915, 0.47288262844085693, 0.04534696042537689, 0.3430462181568146, 0.22856423258781433, 0.46614816784858704, 0.4240947365760803, 0.259934663772583], dtype='float32').reshape([24]),
-        ]
-
-
-class TestPrimitiveOp_dff82708574a89ee86ac44c78b2fdde0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5520249009132385, 0.5597493648529053, 0.5200337767601013, 0.5354536175727844, 0.49774259328842163, 0.5410299897193909, 0.5434754490852356, 0.5474600195884705, 0.512245237827301, 0.5103563666343689, 0.48355844616889954, 0.5271966457366943, 0.501015841960907, 0.5645666122436523, 0.5227512121200562, 0.47698426246643066, 0.5279608964920044, 0.5325785875320435, 0.5684186816215515, 0.5092142820358276, 0.5206944942474365, 0.5301435589790344, 0.4946742057800293, 0.5466022491455078], dtype='float32').reshape([24]),
-            paddle.to_tensor([0.13146184384822845, 0.3453679084777832, 0.36368468403816223, 0.44398126006126404, 0.45706695318222046, 0.4047502875328064, 0.43159645795822144, 0.09742504358291626, 0.31323546171188354, 0.18723386526107788, 0.23575150966644287, 0.008799650706350803, 0.14068754017353058, 0.46657177805900574, 0.04315873607993126, 0.317475825548172, 0.4341680407524109, 0.16204066574573517, 0.3985646367073059, 0.23267440497875214, 0.22201983630657196, 0.015112691558897495, 0.4839669167995453, 0.057680461555719376], dtype='float32').reshape([24]),
-        ]
-
-
-class TestPrimitiveOp_ac87c780d6f6cd248f9a89cadba48259(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35fb909862ead27f3bdb6714839bc40
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([171, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0aaf2290134d34f1cb502ed2c21714d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_3605aca3e677045f208df2206e91238b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_01421f7dff29dbb58036232da4159fa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a3c7a027b4b4f54f78609f64a7f9adc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c700c32d13ac44b6a0488c6b78025c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25d7666f48a400da6a24e925b3fc30b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25d7666f48a400da6a24e925b3fc30b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25d7666f48a400da6a24e925b3fc30b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25d7666f48a400da6a24e925b3fc30b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25d7666f48a400da6a24e925b3fc30b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1157f587ea2bf59bd85891d48bc6b279(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1157f587ea2bf59bd85891d48bc6b279(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25d7666f48a400da6a24e925b3fc30b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9794fdf6fb3d3d5ff6d5c5f8cd521f6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9794fdf6fb3d3d5ff6d5c5f8cd521f6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8326646824189315858496ccd167df2d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98420ee273a186f34c945b66bbab6eef
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 3549], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.2447127103805542], [0.2457219362258911]]], dtype='float32').reshape([1, 2, 1]),
-        ]
-
-
-class PrimitiveOp_f3fc74df3abfedf16441aca8fc495610(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3549, 80], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3f02a31307015cc4469b39c22ac51fa5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f3fc74df3abfedf16441aca8fc495610
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3549, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fe6f4f2695ad16c7c77e69861404b436(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 16, 1, 49, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 16, 16, 49, 14, 14], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f806701357b7f72ee71db5f39236ad4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe6f4f2695ad16c7c77e69861404b436
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 1, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 16, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_aade34522bd8e886a16859e50a64fe65(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 288, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a9e9a7621f4f62d33e50ee77c026846f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aade34522bd8e886a16859e50a64fe65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_da79dd60741bbd1567e79af19c32f84c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_20d3f909c693bc3384a78029f743e264(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 136, 136], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_331c766b1e46eba68efe7224ea68276a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25055b0954dbb92ce33c2b7b5fe8843c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dba7f635df5585d7dd15cf6f26aa306e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5a416a54e1407015eaf85d32632bb913(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.4157809615135193], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6feb0d50ecf7b32d85ee0a4319cbf055(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_50a5afcc62a7782a74facdf157325275(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_91610a1e3fab246adcc33c7b29c9edf6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.866011142730713, 1.9389455318450928, 2.0601091384887695, 2.358898401260376], dtype='float32').reshape([4]),
-            paddle.to_tensor([0.9497616291046143, 0.8234353065490723, 0.5128353238105774, 0.7427608966827393], dtype='float32').reshape([4]),
-        ]
-
-
-class TestPrimitiveOp_bb808594d410a873ec097065ccd9ec1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2.287076711654663, 2.1407384872436523, 2.079587459564209, 2.1326074600219727], dtype='float32').reshape([4]),
-            paddle.to_tensor([0.05023837462067604, 0.17656466364860535, 0.4871646761894226, 0.25723910331726074], dtype='float32').reshape([4]),
-        ]
-
-
-class TestPrimitiveOp_52709dcfef192ee6cbc3237b6ef7f6ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.47179120779037476, 0.49364376068115234, 0.5173995494842529, 0.5751718878746033], dtype='float32').reshape([4]),
-            paddle.to_tensor([0.21723027527332306, 0.45019516348838806, 0.01997283659875393, 0.028484124690294266], dtype='float32').reshape([4]),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7bdfc8d95d5881032d537aaa3b422cec(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4f7be09b684bb609a33e2c4e00303220(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b582d948627475bfb33bff57a0c8e698(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14f267a57c56fba4b10b4b448d8d5622(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33e669bf74ae8c6199fad52a6cd08283
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e5ac41b03c5c8d6f2781dd1dfd095e53(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([2204, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2204, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6e45eaebc956fdf8d427bedc5cdaef6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3321cbfbdd1af6ad1050273abae0e404(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db95b78c01a0cd6760b50ec1358a26e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9a423e03901bccbf4130859edcc903a2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c939211096abf5d00857ac2cd4984fe5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a423e03901bccbf4130859edcc903a2
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4596213400363922], dtype='float32').reshape([1]),
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_44362afcd75a7f769066dbffc9843e79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.028612107038497925]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-class TestPrimitiveOp_aba2fdfba75067feb1923acdd5bc9888(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.189552441239357]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.18256038427352905]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-class TestPrimitiveOp_58f19dcacfdbad33cea1eccf775b05ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.07901003956794739]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.028612107038497925]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-class TestPrimitiveOp_98b4bbd47f5a3dc6c33cda5c123a5d11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.3194582462310791]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([[0.18256038427352905]], dtype='float32').reshape([1, 1]),
-        ]
-
-
-class TestPrimitiveOp_f806701357b7f72ee71db5f39236ad4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fe6f4f2695ad16c7c77e69861404b436
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 1, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 16, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2680b4e58d7fc952ab87e6394029001c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.06804439425468445], [0.02055343985557556], [0.04278743267059326]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-class TestPrimitiveOp_74208c5647c92274edabf0e8ae3a3338(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.21635276079177856], [-0.19235265254974365], [-0.22706788778305054], [0.21540191769599915], [0.296457439661026], [-0.07150772213935852]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.019107341766357422], [-0.2054910957813263], [0.08177486807107925], [0.06804439425468445], [0.15704363584518433], [0.1863020956516266]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-class TestPrimitiveOp_4c351f392eae51bf5dd7ffaa3bc162a0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.07328501343727112], [-0.063353031873703], [0.2526455521583557], [-0.09737130254507065], [-0.01586967706680298], [0.4435715675354004]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[-0.20553243160247803], [0.2713114619255066], [-0.14125452935695648], [0.17876625061035156], [0.02055343985557556], [0.04278743267059326]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-class TestPrimitiveOp_e3db6244765465ff7bd989766d6aa09e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.07328501343727112], [-0.063353031873703], [0.2526455521583557], [0.3751889765262604], [0.296457439661026], [0.4435715675354004]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([[0.27651363611221313], [0.2713114619255066], [0.0981573611497879], [0.17876625061035156], [0.15704363584518433], [0.1863020956516266]], dtype='float32').reshape([6, 1]),
-        ]
-
-
-class TestPrimitiveOp_5d9e5165720e32370b69422269702b39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_eef93fb848df67dc44565fa01d2b6aa5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bce3971251283f2cba69aad209b8914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d79c954f6db73c3c92e1207fa1f33e96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 24, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]]], dtype='float32').reshape([11, 1, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_756fa99dd4e4e82173538c8d3fa132ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 104, 104], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_90f505cfd6b30c97be35a2942924bb29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 184], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_24dbdfce73c6b40c61f7a5924293082e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_93f34d002b99b46d05d1eb89caaa868d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 16, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.690815269947052]], [[0.6871036291122437]], [[0.754462480545044]], [[0.864290714263916]], [[0.754234790802002]], [[0.721239447593689]], [[0.8178617358207703]], [[0.7077670693397522]], [[0.887250542640686]], [[0.8750168085098267]], [[1.0]], [[0.8262085318565369]], [[0.8936378359794617]], [[0.7582119703292847]], [[0.8348007798194885]], [[0.8091009259223938]]]], dtype='float32').reshape([1, 16, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_be0f2c6e49f62d20309b1243f37e023f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1abc54e376fb5052102022a91b98959e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_958b4118d1b39a976a5d1e7cad4591a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_de41dd47297a46f2044aa6bf6d6b5a35
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7ad7eaf9eea797e6652fe035dae0d9ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35fb909862ead27f3bdb6714839bc40
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([145, 60, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2bf5b18a8843a869fcfffff666b69221(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 10, 15], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.37437477707862854], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_868bbc1015b501a18caf5be2a7bcc4de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5de0e4ce8fa8364a392f3166e466ad4
-    def get_inputs(self):
-        return [
-            paddle.uniform([70, 81], dtype='float32', min=0, max=0.5),
-            paddle.uniform([70, 81], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_21ef7f363354580c538accf3d7c28886(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 672, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f3b25627e85604508691e1d41becd5e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21ef7f363354580c538accf3d7c28886
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b5514196fe16e168c00cdf88b5d013cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b5514196fe16e168c00cdf88b5d013cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_15e9618881bbcf2704b6c3e42456f235
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b8b65106f8d42acc64e482710718a38e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_98420ee273a186f34c945b66bbab6eef
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.24599924683570862]]], dtype='float32').reshape([1, 1, 1]),
-        ]
-
-
-class PrimitiveOp_74b91555817feac39979146252c7a32a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4116, 20], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c5d6aa179994866dd6fcabb89f232db6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_74b91555817feac39979146252c7a32a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 4116, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e227a7d95b9c12a590ba1b5a044acc0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([551, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([551, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3b4ab9361655d2fe5948b0646c1c24a9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 400, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 400, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_21ab6f4e75e2c5b1b28e5e50df2110db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b4ab9361655d2fe5948b0646c1c24a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 400, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_944e83c51e8d121647a84e6e92a6768b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1b8001c62c0bd69cf5de364d5b27a34
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_81d71b176c2019416a00fda3ed0a8582(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_62c18f93eea105ac2098b9e57dd70260(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1f0050d3cbc1aef0b73f7bc36c6e49a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_63092bdd0f95c10e3dca7fabd98297bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_251492e55a3314ec015f4d42e8052794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e4ea38b9433fe5130b2855adf0c9df93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e71cb2b5086e992dc023c4ab13add7b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([247, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([247, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_eac66fad68674381fa58147cf3206717(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f7b5aa0775d0163db95da8cd81dd59d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6558a47673440af5766878b002e3a19c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_697f5999308dfb7f1532283236f37c92(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 336, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 336, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1b924fdec3cc23ba72b287ad7b40d688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_697f5999308dfb7f1532283236f37c92
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_66af5a2abeb2ad3f0e348b66e7a7326d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 104, 104], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a8ad0cdc472c07c09f80ce9a67cb05c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([950, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([950, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_13efc424bbb13915b3fece9609885532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91aa37acc2c39060693c7c183cd1c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_36f01420ed2327f7cf7f3850d440b720(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64b3661e08a9412b02da4daf9ca243b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 1, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 8, 16, 49, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14a4f43aee5569af215eff3d34af6794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_73872a41564e7527a5641dec82098953(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_289da9e370b87b8230fefc86aef88388(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a9696e30909f6bb43629b7b84126fa0a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6558a47673440af5766878b002e3a19c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_16d68d6cd9a76b72250d12c789069b0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a69e43a060f8a1b0a2aac3060ad88535
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 44, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 44, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_163bd5955706b238fc93fa07c1e35b26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_51587ad9decc41aae77ee442776d2b85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b4ab9361655d2fe5948b0646c1c24a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 400, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_02ae1ae4c053339435dd70834c9a8a34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 56, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.3768826723098755], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e565ee2acf9ee57916d7a11375fba47c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([950], dtype='float32', min=0, max=0.5),
-            paddle.uniform([950], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ba25f242d8af46e2756a95fffc150d0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 240, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c2bb25f28973667d3abb75ac6decf547(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ba25f242d8af46e2756a95fffc150d0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_29d6a6bc7bef6885014c49f2880fdd30(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 56, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 56, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_08a438cd6c2f77b77aab6ec6eff612da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29d6a6bc7bef6885014c49f2880fdd30
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 56, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ab7b1893b50be5a1f2a33e7b95ddccaa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([8816], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8816], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c586388c5eff2f9a22cafb0b7e109a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c586388c5eff2f9a22cafb0b7e109a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c586388c5eff2f9a22cafb0b7e109a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c586388c5eff2f9a22cafb0b7e109a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c586388c5eff2f9a22cafb0b7e109a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_993de4c7f5732968ebecbe5e09f1a6d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_993de4c7f5732968ebecbe5e09f1a6d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5c586388c5eff2f9a22cafb0b7e109a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_89038fee494c05b5c4b527f45ddf9fe3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0e3f2997cb6ed869ee3a51d96f14259c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6394371390342712], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.26848334074020386], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f2c06f6dc93d0a4b6707b37562d2a579(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.8305439352989197], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.3614746630191803], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6513b64d48780f8b8790c8b59b60122f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6811770796775818], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.18341492116451263], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e3721066bbd137c79f2a728ac244fb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.8999757170677185], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.10196869820356369], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5a6a1ce0112899301c3f7b2fe2a4e339(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.7320895791053772], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.2661309242248535], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_71caef4150d4f97a2867e1a6ef8005c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.8180530667304993], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.22389334440231323], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_490680584e30bc14c78dc0613f40b4cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.9556610584259033], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.1334448903799057], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_440f3fcdaf9f7ad0bdb418f1e2be8e39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.7333043813705444], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.2981969118118286], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9552f4434f013f495d17398ae6aedcb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_96103fdfa05cd6136dd0c5e46553a36b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.7640184760093689], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.4498392939567566], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_17b94d78918f3477084704ef69e1303a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([8816, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([8816, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d66501acc8efb60a1eb4900db994d46e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([16384, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([16384, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4480fb5fe8259dd5c165094e2ca2941d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 42, 42], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a4881148a414d4ac6275d85c3f510722(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bf76dc28b3c4d385770f6ada58fa4d15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.26666751503944397], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bf76dc28b3c4d385770f6ada58fa4d15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.26666751503944397], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2b8a78a3abc7c4452be179435e14f690(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fe80bf45124ca8664ea8278252b5644
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d470208e10a091a91a1e355bdb4145fd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e729ce4a58e1fb04f064fdd49605571c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0507081113755703], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9f4dff7c7c30b5d8315ce1477dd3562b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e9230c263ee9f4613278df33412e1506(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6558a47673440af5766878b002e3a19c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3bc36932627102a32460ba39e59279d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3bc36932627102a32460ba39e59279d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3bc36932627102a32460ba39e59279d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3bc36932627102a32460ba39e59279d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3bc36932627102a32460ba39e59279d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_38964bbad2a851fc936df66fb5ddef98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_38964bbad2a851fc936df66fb5ddef98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3bc36932627102a32460ba39e59279d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_700f00bcfbbb1f4307af62e00093f8c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_e63b527e1fd25c01c06029d1b7a69602(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[6, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_336dfc2c521e45bbe26fc5870bae00af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e63b527e1fd25c01c06029d1b7a69602
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.07471039891242981]], [[0.4338351786136627]], [[0.3128529489040375]], [[0.27451038360595703]], [[0.08683019876480103]], [[0.4641912877559662]]], dtype='float32').reshape([6, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_f345436a6de7eb6761742ce621005ea7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f427258c06df487c71e0355b0cbbe92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f427258c06df487c71e0355b0cbbe92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f427258c06df487c71e0355b0cbbe92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f427258c06df487c71e0355b0cbbe92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f427258c06df487c71e0355b0cbbe92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_390735d8586ba53eba488d3387d8458f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_390735d8586ba53eba488d3387d8458f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9f427258c06df487c71e0355b0cbbe92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e3bfb480cf9f60349cffdb11e4b40900(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_24220e97cfb882d7db6688d0b0dceb7a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4c0acd54ee1932d93183c0253341a79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7b38516e087e509e2fd8e3adcbacad0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14b7d19fc9c49dd52d4f2e924a6b5fd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1b695408f744c53c4e498b8eca10c146(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 96, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_3430aac1e87ac914d423761d92512b31(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 24, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 24, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ae2f2e513038cea3b709c5fa18bdc2a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd059d2c0aca693a6d0bd85fcfc31034(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 60, 60], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_999f7ce0c801a7e6299f55ff81a2d5f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4425f2e6a84dd371ea7dbee04852bb50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 24, 240, 240], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2, 24, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_019a428061f24ae4abcedf66d37b7dd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e4323a567951a3d707091b7981614b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_aa014bc9476b17053059c8fe747ed9d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0bce3971251283f2cba69aad209b8914(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_25baf12596500cb4f8f3340e362df1bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_39d6def76ee1fd3e178286b0e8b54484(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9ef45dcd3ae0df98a8bfad37f110b9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4d9c5585d219fa5fb0f1f420a01927a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_adcce674fc5ad8c69eb49dc1f9b65cb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_adcce674fc5ad8c69eb49dc1f9b65cb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_30bd704ec6afbca5111b0f3e9160a8f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 44, 66], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.09714151173830032], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f1d11cbb21763f46099e7ce511efb795(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8bf3088cc16f31c965831062ca57f3f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d1b97dc50da98911c4d5bcb820acad04(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 200, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 200, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b5d031fcd589b38e7b67e67a23583860(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1b97dc50da98911c4d5bcb820acad04
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 200, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_177590cd52bd62f378486762c1ef9945(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_d5b8478af74dca2c2504ea117ed35028(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 32, 1, 49, 7, 7], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 32, 16, 49, 7, 7], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e168a8b1f854d5d54e68326b2e603957(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5b8478af74dca2c2504ea117ed35028
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 1, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 32, 16, 49, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2ae11320503813de712beff0767170a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2ae11320503813de712beff0767170a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2ae11320503813de712beff0767170a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_34b1d61fa37d839c9c89ae37750ce176(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f39a18cee1d0206e4fbade16cab68461(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b1d61fa37d839c9c89ae37750ce176
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_442def56b1745511a29bb0ea1952b29c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_518dacedf00c3e090ba7a1241a03047b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_518dacedf00c3e090ba7a1241a03047b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_efbd66f2c137c72e92e9fc1ac1e52091(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.005014330148696899], [0.0], [0.2721625864505768], [0.0]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.0], [0.0], [0.1706799566745758], [0.0], [0.05108173191547394]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-class TestPrimitiveOp_e8fedeb7ec235cfefeb8157ff7eb2b7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.28496819734573364], [0.09288781881332397], [-0.0046816132962703705], [0.2721625864505768], [0.06783290207386017]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.3994688391685486], [0.1985095739364624], [0.24306778609752655], [-0.0793103277683258], [0.07907016575336456]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-class TestPrimitiveOp_9d39434cec1fb7fc839e72a15ca711be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.23078739643096924], [0.07283130288124084], [0.06773319840431213], [0.29101890325546265], [-0.1740378588438034]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[-0.2742784917354584], [-0.09100476652383804], [0.1706799566745758], [0.1614600419998169], [0.23824608325958252]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-class TestPrimitiveOp_35405a9876744819d6a6d02f5d2e3d36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.28496819734573364], [0.16070479154586792], [0.30940088629722595], [0.29101890325546265], [0.06783290207386017]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([[0.3994688391685486], [0.26762259006500244], [0.24306778609752655], [0.1614600419998169], [0.26623451709747314]], dtype='float32').reshape([5, 1]),
-        ]
-
-
-class TestPrimitiveOp_ecdc5a397894adb1604738d8e3fb4295(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1371c48d2f29cecf2a3113d306b4eadd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ad8c94a6920e604b78c14f6a52a6b8da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4a7839bc29fa408f2645a06ed8d01664(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9d35808d05c7e718499cbd4315f63d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_7421ac25178a09eef8ef7ed703227ee3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bab70f58b8b7ac4324068002c1bedc50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7421ac25178a09eef8ef7ed703227ee3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_01421f7dff29dbb58036232da4159fa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_3605aca3e677045f208df2206e91238b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_0aaf2290134d34f1cb502ed2c21714d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_879278357d980c22197d2a1a86b4e6d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_6fb1622b9c699d65e2ff5f2bca5df7e1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-            paddle.to_tensor(8, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_dbb96db8d551277f6a5d412b6befa1b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 76, 116], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.09792206436395645], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ab953a1ae6cf3c05223cc92e648000ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f3bc8fd07c5dacb5e606a94f7719f18
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a618b21f875fc9539d5be7c532f6ef83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cc18ce2544fc573153d3dcbdf639a096(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aade34522bd8e886a16859e50a64fe65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_333dc3c20dcc6619754caa85bd2f1f1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ca61d2b81a889ce6d72b8b2a55f104d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fad09e57f2687163480f6dd7e30c1b7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c334a25aca8f3e752fbf071144b7150a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a423e03901bccbf4130859edcc903a2
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3103976249694824], dtype='float32').reshape([1]),
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af56aeeb84822e85d1a96a3c285361c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af56aeeb84822e85d1a96a3c285361c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af56aeeb84822e85d1a96a3c285361c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5d24d3b3868593ff8ecc222e0f5db94b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34b1d61fa37d839c9c89ae37750ce176
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_6bd3d31341a6a3cd46e149d1cde4ba79(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1248, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d8c64e8e4dddcfa36307dbc91556240f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6bd3d31341a6a3cd46e149d1cde4ba79
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1248, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9bc9ec0e5728384e76d8239644f6a275(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aade34522bd8e886a16859e50a64fe65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 30, 30], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2036fe7f31e31fb163e97ab0171ba84d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.3978588283061981], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2036fe7f31e31fb163e97ab0171ba84d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.3978588283061981], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0fb5684e1768a44747951f83105ec7f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fe80bf45124ca8664ea8278252b5644
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 128, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ba3954cd17210b9c2efe49202b84988c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e729ce4a58e1fb04f064fdd49605571c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.03637641668319702], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5868663be13fae4fb58dbb4084b94ceb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14d5ba4a9c30007c5cf7cabdee3666f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aed5bda16e8cfde36cccb444f43454e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([171, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b4a2605b3435a2b4b649f4a5cfc03b38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_898a310661f073ae0d8c7e769d158b1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db95b78c01a0cd6760b50ec1358a26e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([145, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1a2300b5a1fcc84ed9f40a84a3e0ec96(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7421ac25178a09eef8ef7ed703227ee3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_13779ff44ee9cad88f3c31d55e04a9be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 5, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.40824392437934875], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9be9050b89f71bd2e085ada6cf708a04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 256, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c12767ec75bd00b55dc5ddbfa495b86d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_993590a34fad3b3a59be4ab2eecbaa9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fad09e57f2687163480f6dd7e30c1b7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 768, 23, 23], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 768, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32bcce841f3d091cd30b237ccf9dee3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32bcce841f3d091cd30b237ccf9dee3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32bcce841f3d091cd30b237ccf9dee3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32bcce841f3d091cd30b237ccf9dee3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32bcce841f3d091cd30b237ccf9dee3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_30feee44d6c4ae256a94dcd3829ade3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_30feee44d6c4ae256a94dcd3829ade3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_32bcce841f3d091cd30b237ccf9dee3a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_743ac389e85aff4b57e83bad028f33f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b594f9265530bab0ef8c4890f561f69e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65eb79134256a87c5f70828c6270439a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65eb79134256a87c5f70828c6270439a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65eb79134256a87c5f70828c6270439a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65eb79134256a87c5f70828c6270439a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65eb79134256a87c5f70828c6270439a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dee5a64490a94c60864cf78a7ec83cd9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dee5a64490a94c60864cf78a7ec83cd9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_65eb79134256a87c5f70828c6270439a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f165c88fe2b4c784742001093186e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f165c88fe2b4c784742001093186e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f165c88fe2b4c784742001093186e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f165c88fe2b4c784742001093186e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f165c88fe2b4c784742001093186e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e5fa9d14b275ec103ca38dc335fecedf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e5fa9d14b275ec103ca38dc335fecedf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6f165c88fe2b4c784742001093186e1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_89f3a02f6fbadedf3640a7ff5ee0e244(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.40220561623573303], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_89f3a02f6fbadedf3640a7ff5ee0e244(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.40220561623573303], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3ac8245bfd4c58bc609b7e89307a0a92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fe80bf45124ca8664ea8278252b5644
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_592198ca8578451e4c1b6c23b04634bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e729ce4a58e1fb04f064fdd49605571c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.42968687415122986], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_bd53eaf54790773621796d3b2a1819df(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 156, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_04615ccd1b6539e8756d079a46ef113b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bd53eaf54790773621796d3b2a1819df
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 156, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_06afa0ac8681719902f3e86d0feb1b9c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 20, 128, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 20, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a4cf5645a70ae34d97a0f66b8b235b89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06afa0ac8681719902f3e86d0feb1b9c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.97471684217453]], [[0.8564654588699341]], [[0.8460602760314941]], [[0.9568177461624146]], [[0.9348431825637817]], [[0.9123063087463379]], [[0.9359005689620972]], [[0.9533238410949707]], [[0.878296971321106]], [[0.9006496071815491]], [[0.9275569319725037]], [[0.902090847492218]], [[0.870993971824646]], [[0.9606375694274902]], [[0.8240513801574707]], [[0.9171385765075684]], [[0.948712170124054]], [[0.9595835208892822]], [[0.8964919447898865]], [[0.8868018388748169]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-class PrimitiveOp_08a35fac70f021394b01b6711933f04f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 40, 64, 128], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 40, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_20a228bd881e6abe9c2150c1edcb899f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_08a35fac70f021394b01b6711933f04f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_34967eb0bb98058b9f8a9a8cc0d2f7e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 80, 32, 64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 80, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b98eb3e500bcacfd0b31f99ca2396226(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34967eb0bb98058b9f8a9a8cc0d2f7e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_5ae2202f46a54d568740a3992dd4d5a6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 160, 16, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1, 160, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e90e446b4d6a7053fda61404189f3e64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5ae2202f46a54d568740a3992dd4d5a6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_054f5187721a79ef1c529b16e3902ac6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 92, 92], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_69a58e50ba723730f651fa8a74868a8b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.uniform([256, 5], dtype='float32', min=0, max=0.5),
-            paddle.uniform([256, 5], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8d51264be6beb2c37dedec2f3a743110(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bc3aa6ff9951515bc0a5860ffce3afb6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1b97dc50da98911c4d5bcb820acad04
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 44, 44], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 200, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1e7505f7bc157b6854dfd2cc4a6cc80b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c9a7e60a1129fd35e796c37d46fbd764(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]], [[[1.0]]]], dtype='float32').reshape([11, 1, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_8eabaa3269588cc668e7b36edf75b853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cf52968ff726dfa7ab970ab9887cee8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f2418ad7e7ede2ae716ce43afa2d876f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c81d0e668edfd727a7ba05a953e22eef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a423e03901bccbf4130859edcc903a2
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.16499599814414978], dtype='float32').reshape([1]),
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9513613484b790b436f9e8d705cb9da8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 40, 40], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7e80edc4e2a448be1178373c64e8d2f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_510ddc2ea4dbc588738205f3a468fdbc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 34, 34], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_21f330f1b74e5cd291a7e46e35522bc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fa2cc991001f630c23656cdb2bd1dcb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c43d32e698ed2ae35037971f3a1c58e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a1ca419767c56c49909af1ef11eb453c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 872, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a50aa2dd342514e148d910d7c7377100(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([247], dtype='float32', min=0, max=0.5),
-            paddle.uniform([247], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d212094f49c51f92ec8037edd298eeea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_fa34e62f4f2ceafc1c2d9505b9015908(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 8, 1, 49, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[10, 8, 16, 49, 28, 28], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8e459d2bd856669f2dea44957f175396(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa34e62f4f2ceafc1c2d9505b9015908
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 1, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 16, 49, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_68b1296fd7c36b8e58fefde3b48325d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aed5bda16e8cfde36cccb444f43454e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4da612ebf1274aa50522cdba5e320a0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9984ef09cd593fb4560d8d5176e4c7bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9a2473bad63f20d04b32490d59023673(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aed5bda16e8cfde36cccb444f43454e4
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([145, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_bcad53ffbb34309f11a873ca88eb218d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 40, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.12651798129081726], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_dc92fca6b0d576aa7e787ec52e99bc7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[2, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_55489a8f55df678e291a76248972dee4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dc92fca6b0d576aa7e787ec52e99bc7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[0.4199373722076416]], [[0.07790789008140564]]], dtype='float32').reshape([2, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_598ba36488adda70901bdfe72f2a4a6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 46, 46], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a110d518a795d074b2a61e32baffa205(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db95b78c01a0cd6760b50ec1358a26e7
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([171, 36, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ad4d8b2af8f1e48e6c666ef31b8c2059(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 16, 1, 49, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 16, 16, 49, 14, 14], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_70746e0deb8d731f2134be47100661ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ad4d8b2af8f1e48e6c666ef31b8c2059
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 1, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 16, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c27f247f5e9670c1ca8b2cb8a466695a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_00b5c3adf4c2df89caf66042439ff1b7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c72b5a65081e1bea3a6109e268864e27(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_00b5c3adf4c2df89caf66042439ff1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ff87fb7093bf46933af4ec67f2ddc0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_9fdee5cb855466bd8f8c60610748b510(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 120, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dc575bcb7876f61b7fe355891febd35b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9fdee5cb855466bd8f8c60610748b510
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5e7328134afc4778853ce549f039d523(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aade34522bd8e886a16859e50a64fe65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_790f78bb904d1b4385831401401b9ae3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_391ea07d377bd44a525315beafa2d798
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 1, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 32, 16, 49, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f5fa5348790b760007068d5db1f909bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_68c48677c7bbaf3489b1be408a6d1c47
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_f22813dda1edb780c1cd301b524997c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2.0777587890625, 2.0595974922180176, 2.1112780570983887, 2.196075201034546, 2.2804276943206787, 1.8491451740264893, 2.0108838081359863, 2.1082522869110107, 2.198577642440796, 1.8796778917312622, 1.9906038045883179, 1.93548583984375, 2.2058911323547363, 1.9823532104492188, 2.108671188354492, 2.2810447216033936, 2.186410427093506, 2.109078884124756, 2.115388870239258, 2.126674175262451], dtype='float32').reshape([20]),
-            paddle.to_tensor([0.8849408626556396, 0.7332608699798584, 0.839418888092041, 0.630196213722229, 0.5015142560005188, 0.5995699167251587, 0.6642241477966309, 0.9852955937385559, 0.5005736351013184, 0.7130999565124512, 0.83890700340271, 0.6258077621459961, 0.5007590055465698, 0.5058897137641907, 0.9361711144447327, 0.6254057884216309, 0.9962766170501709, 0.9213579297065735, 0.8500418066978455, 0.8563202619552612], dtype='float32').reshape([20]),
-        ]
-
-
-class TestPrimitiveOp_fb3a1811aa8f1c92da383f63a3f79aad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.8801006078720093, 2.027472972869873, 1.886061668395996, 2.1421492099761963, 1.9245673418045044, 2.1227405071258545, 2.3279428482055664, 2.049586296081543, 1.9850521087646484, 2.1254210472106934, 2.1525514125823975, 1.9545471668243408, 2.068394422531128, 2.1179118156433105, 2.2178049087524414, 1.945752739906311, 1.9815173149108887, 2.008840799331665, 1.9969098567962646, 2.2115871906280518], dtype='float32').reshape([20]),
-            paddle.to_tensor([0.11505911499261856, 0.2667391300201416, 0.1605810821056366, 0.3698037564754486, 0.4984857439994812, 0.4004300832748413, 0.33577585220336914, 0.014704381115734577, 0.49942636489868164, 0.28690001368522644, 0.16109298169612885, 0.3741922676563263, 0.4992409646511078, 0.4941102862358093, 0.06382890045642853, 0.37459418177604675, 0.0037233552429825068, 0.0786420926451683, 0.14995817840099335, 0.14367970824241638], dtype='float32').reshape([20]),
-        ]
-
-
-class TestPrimitiveOp_055fac8e5c0eece847b5092bb3ad3381(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5137540698051453, 0.5127571225166321, 0.5187781453132629, 0.5440332889556885, 0.5257591009140015, 0.48967522382736206, 0.529336154460907, 0.5268474221229553, 0.5229843854904175, 0.487545371055603, 0.5041730999946594, 0.4856546223163605, 0.5343117713928223, 0.5123335123062134, 0.5289092659950256, 0.5388615131378174, 0.5464118719100952, 0.5252990126609802, 0.5244054794311523, 0.5347185730934143], dtype='float32').reshape([20]),
-            paddle.to_tensor([0.4302529990673065, 0.26271751523017883, 0.1872635930776596, 0.4351722300052643, 0.49967101216316223, 0.43928518891334534, 0.152265265583992, 0.20933519303798676, 0.40284520387649536, 0.16727297008037567, 0.1960330605506897, 0.09058205783367157, 0.11826908588409424, 0.137680783867836, 0.06805641949176788, 0.4606708884239197, 0.3298879563808441, 0.07591143995523453, 0.09210511296987534, 0.22624193131923676], dtype='float32').reshape([20]),
-        ]
-
-
-class TestPrimitiveOp_4291408d086d3a5ec242c08ef8a6b92c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 10, 10], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f551af64b8ec582461adfc573a8438dd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 96, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fed3fe86ac708f648c6763ee11663a84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f551af64b8ec582461adfc573a8438dd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_20f61356260405197b9294080efaa687(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e2d6431001e8d4723cbbfd81bea9a0d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5de0e4ce8fa8364a392f3166e466ad4
-    def get_inputs(self):
-        return [
-            paddle.uniform([247, 81], dtype='float32', min=0, max=0.5),
-            paddle.uniform([247, 81], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_01576eed5c9e85151588310ae0502b74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_21ef7f363354580c538accf3d7c28886
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 16, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1d3ff13d07277be506a9df9eab09623b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 240, 84, 84], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0ac475292e86b18f7ebdf524b22e81c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_73e75d40f511c80fc229807c9e23bc2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b73d20cebb10645d031e52e745d0cf6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 20, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[0.9185773134231567]], [[0.9624173641204834]], [[0.900300145149231]], [[0.8811642527580261]], [[0.8945450782775879]], [[0.7463398575782776]], [[0.9229792952537537]], [[0.9166155457496643]], [[0.9479628801345825]], [[0.9073103070259094]], [[0.8728652596473694]], [[0.8338676691055298]], [[0.9507482647895813]], [[0.9041141271591187]], [[0.8558382391929626]], [[0.9211746454238892]], [[0.7993230819702148]], [[0.9135574698448181]], [[0.8518068194389343]], [[0.8172760605812073]]]], dtype='float32').reshape([1, 20, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_6770c548d1849d859d5eec9a24f05381(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9984ef09cd593fb4560d8d5176e4c7bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 40, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 40, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3ff48a8f92c5de664bedcf6c697b4042(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6558a47673440af5766878b002e3a19c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7e80edc4e2a448be1178373c64e8d2f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0aaf2290134d34f1cb502ed2c21714d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_3605aca3e677045f208df2206e91238b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_01421f7dff29dbb58036232da4159fa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_9ae0b7422085c51fa002b7dca3e1abb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_28119637b5e500ed0719d28e2a79da29(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3800, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_21f330f1b74e5cd291a7e46e35522bc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8a298ba96af8ed84bcda57da776c37aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 80, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_14a4f43aee5569af215eff3d34af6794(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 144, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_661479d087e40eca06b5846c5dea92c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33e669bf74ae8c6199fad52a6cd08283
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 64, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd3064444e6f091f93fc42ba2c0ad5e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_495d91e33a635b19edea897af6cd1867
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8e459d2bd856669f2dea44957f175396(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fa34e62f4f2ceafc1c2d9505b9015908
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 1, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([10, 8, 16, 49, 28, 28], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_80a2642d2c0aa3deb3160231c27c4d90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_04776d8469653b881efca104140ec295(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_697f5999308dfb7f1532283236f37c92
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 336, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 336, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0793232adcf60b5f2e3a32d449f3764a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_adb474579bc42725676d9c14277e32e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42e5cbf8636ab2328cb24d25e02d55a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 384, 12, 12], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 384, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_81f9f7874426f0ebee93c63b5e805fd3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_29d6a6bc7bef6885014c49f2880fdd30
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 56, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 56, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4bd8cc45fca1f63e0bb9af7d7638616b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e5de0e4ce8fa8364a392f3166e466ad4
-    def get_inputs(self):
-        return [
-            paddle.uniform([950, 81], dtype='float32', min=0, max=0.5),
-            paddle.uniform([950, 81], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e9fb7d6b38eb9a809f4fd0d37939beae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_273f5fa5e1a60bc6bab9fc18b1756fdd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_85d4fdc65d6cccd970dfacef6fd9a6ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0254327654838562]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[0.0], [0.0], [0.0], [0.0]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-class TestPrimitiveOp_95286c6e51b952d239920ea8a3e0ff83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.3651619553565979], [-0.15210482478141785], [0.07774680852890015], [0.23460687696933746]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[-0.19360090792179108], [-0.11845558136701584], [-0.15997755527496338], [-0.19479671120643616]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-class TestPrimitiveOp_5e6b5261306004de3d4e84937e4e6a60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.02948373556137085], [-0.09635786712169647], [-0.34582602977752686], [0.03597790002822876]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[-0.3337309956550598], [0.15437167882919312], [-0.27068042755126953], [0.046072348952293396]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-class TestPrimitiveOp_e4d82c27aee5fac20279799551a78243(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_476e6620e1438088f38ad912418c2905
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.028477609157562256], [-0.03242844343185425], [0.07774680852890015], [0.24515201151371002]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([[-0.19360090792179108], [0.2113741785287857], [-0.15884177386760712], [0.0705457478761673]], dtype='float32').reshape([4, 1]),
-        ]
-
-
-class TestPrimitiveOp_465fd319de580febedcfaa58e5db726f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6558a47673440af5766878b002e3a19c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 80, 36, 36], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 80, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_d6c318da2e143be2f423a053389bf091(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([70], dtype='float32', min=0, max=0.5),
-            paddle.uniform([70], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e899c64cf254931f2d3bdac698e40af6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 480, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a5264961f316270cb0f678ddb3f7910e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cf52968ff726dfa7ab970ab9887cee8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 15, 15], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_f4d17a49cb0e5ac4d61a570abd83fef8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 576, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_71bbd03bb1c114ab2fd685ecb62c5c50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f4d17a49cb0e5ac4d61a570abd83fef8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 576, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 576, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_dace524da911487b369022e70ee39f28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 76, 76], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_57fd8af3c27f180f6ae177784506a3a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_379f999eb4bce558d918c04cb94da334
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 40, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_518898b65acdb90280ac87bf188e9b86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 19, 19], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7f71b20c8ffbb59324709da928e840a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_9c2904ae21c3222442090643347f655b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd1cd1ce75710ccf2efba8c3a7002477(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd1cd1ce75710ccf2efba8c3a7002477(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd1cd1ce75710ccf2efba8c3a7002477(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd1cd1ce75710ccf2efba8c3a7002477(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd1cd1ce75710ccf2efba8c3a7002477(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e2457853fd241c0793b6b8d39d8acffd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e2457853fd241c0793b6b8d39d8acffd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_cd1cd1ce75710ccf2efba8c3a7002477(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7923904033b5954ecbb2109b2b33fbd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2c37b3f38039b15f986d269493c9ff8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 120, 120], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8c64a9b9541e14e07683ff5107e945b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 21, 21], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_baf4a53208cde2603284bca97cdd2a58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_eb2f257740f2307f49fe3ccaa89b851b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6c5233add8cdd8c5d32d11ce72b27a52
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 38, 38], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 192, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3b1a52ce74cadc18cd583c06438657b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3f65c315ee5b1f776a3c66ea436faaeb
-    def get_inputs(self):
-        return [
-            paddle.uniform([70, 80], dtype='float32', min=0, max=0.5),
-            paddle.uniform([70, 80], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_ac334a99cfefff7aa7dea18a98b0d7d3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 480, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_37f2397a5335f37c20ac4f141031b1ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac334a99cfefff7aa7dea18a98b0d7d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_61571c5a8cf454a51205b86c06ebcfe0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9a423e03901bccbf4130859edcc903a2
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.47561055421829224], dtype='float32').reshape([1]),
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_34fcd4a324a23be1923e3e2741ad7f92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a27c74de460ece435090f3e7f32c4d9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 256, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_2472b300c494153848ce36201cd5f902(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 2, 1, 9, 112, 112], dtype='float32'),
-            paddle.static.InputSpec(shape=[22, 2, 16, 9, 112, 112], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_97a04b1b0ffcbd3b20313f75067cc4b1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2472b300c494153848ce36201cd5f902
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2, 1, 9, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 2, 16, 9, 112, 112], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_94bd3178f42bd6b8f1420d4fd7024132(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.07709497958421707], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_94bd3178f42bd6b8f1420d4fd7024132(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b679c4cc71d59f2e43b2dfcd94557384
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.07709497958421707], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cbab3b741b6ad3ef14d5d0b1eefec635(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fe80bf45124ca8664ea8278252b5644
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_837c2260638cacb21f5781a239ebfd7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e729ce4a58e1fb04f064fdd49605571c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.09570518881082535], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4b09630682bc2ded1cecba6ee55d46b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1b97dc50da98911c4d5bcb820acad04
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 200, 18, 18], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 200, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_53145961f15bfbe89b37fb8a7b302759(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b4ab9361655d2fe5948b0646c1c24a9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 400, 9, 9], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 400, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2a43aade7b7656a8c4a6f887a32b645b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 68, 68], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6d409b9b7e56c506f1f394e82ed802f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([551], dtype='float32', min=0, max=0.5),
-            paddle.uniform([551], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_13efc424bbb13915b3fece9609885532(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91aa37acc2c39060693c7c183cd1c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fff741ae09b4d773d99ff30ec7672aa5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 24, 24], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_011b4e42f34d6960d873d5e7a8f5d293(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e168a8b1f854d5d54e68326b2e603957(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d5b8478af74dca2c2504ea117ed35028
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 1, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 32, 16, 49, 7, 7], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_43c98cd1347c40d5b42d87c5905da211(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2f3bc8fd07c5dacb5e606a94f7719f18
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 100, 26, 26], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 100, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fe743c2606a69acd1286ac7b4b988e8f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 96, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e735a95fb5465512540f88729564065a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_365076adc3d102e71c719de9ef08dd8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 48, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_da259e892bc889d4e17184e842d2110b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 288, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a754653742a1c5fcb9254959d6a8688c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_da259e892bc889d4e17184e842d2110b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7a8d59909ba35e735c5601d021027f1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800], dtype='float32', min=0, max=0.5),
-            paddle.uniform([3800], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_29011776bb501c2a7449822400f1dc74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91aa37acc2c39060693c7c183cd1c99d
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 32, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 32, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b83079c8e510360c3f05b8bea7211ff4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 22, 22], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_6c9a96fec48bf6f8427deec2fbcd2fed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 88, 88], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_b5642d80cfdb714deb56b91d1083bd8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cf52968ff726dfa7ab970ab9887cee8
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 320, 13, 13], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 320, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_af56aeeb84822e85d1a96a3c285361c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_084821d92360c14e4e4d0a29cf72c48f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 512, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_082b99fab11286358636c3b140538ffd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_495d91e33a635b19edea897af6cd1867
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 48, 48], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e507d3b877301a0a087aed5b94bd939f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 38, 58], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.4367183744907379], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81d71b176c2019416a00fda3ed0a8582(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4c74785e91eed091c5bd0bff16eeb031(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d7352dd94434211fb041a08a13babfb1
-    def get_inputs(self):
-        return [
-            paddle.uniform([2204], dtype='float32', min=0, max=0.5),
-            paddle.uniform([2204], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_30240e65e433ce849f1dbe21464b444a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 112, 160], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.048116203397512436], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2986fa98826ce45c274f2b4072a785c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4f7308ce4f71bc6b95b05f00e639e2fb
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 160, 52, 52], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 160, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_2e701afcaf09ae0df6cf016ab6f0207e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8ce5b019ecea14eeab1e8821734641b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8da80925aa2163f3ebf62d9bbdff67ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_75ab1ce1ca742268bc1923ad626c28f4
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 128, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_4e60d4ba30347fc0b54e0cf3a1d8fa3b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 13, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.004131810739636421], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b594f9265530bab0ef8c4890f561f69e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_39be55716b940d949c945071172b4740
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 240, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([11, 240, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_e115bb93acf510bf890857f92bffadc7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 256, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae180e04ef411d9166814961f037b343(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class PrimitiveOp_422abe390ccf1a2220e9bb8248ae4490(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 144, None, None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_08428af55bf5c44487723fcb2ef68853(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_422abe390ccf1a2220e9bb8248ae4490
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 144, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_803bef613a81dcd46357f96a80c49fe4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_a739ab0473dad64947d4332d09e47e98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_c24bc0d8c8572cd6f279f2c0b5e0f41c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_7120aabc6b58f0706380ae573accc28b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_1401c4b95a96c24befe11ab0c12cde46(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 23, 41], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]]]], dtype='float32').reshape([1, 24, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_d04f5569f0065af40469c8783f265e2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 46, 82], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]]]], dtype='float32').reshape([1, 24, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_7833e8cd1f935f7b7ab75504368d7749(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 92, 164], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]]]], dtype='float32').reshape([1, 24, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_77adb4d68db3b0f0093d2eb2726895d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3430aac1e87ac914d423761d92512b31
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 24, 184, 328], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[[[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]], [[1.0]]]], dtype='float32').reshape([1, 24, 1, 1]),
-        ]
-
-
-class TestPrimitiveOp_fd5f649e8d473e3e07e90bc54fc2ba92(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 11, 17], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.4458204507827759], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5724536a97510f97d98a3c7a75cbee98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a765bc0a04d60f18d97a972284ed0241
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 17, 17], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5aced072f9504fd7bf79505f4df8b214(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aade34522bd8e886a16859e50a64fe65
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 288, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 288, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ae3d6dc9230440962a951bcc6cf55409(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077b080259d38ef4229744f4eb9ffabd
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 144, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 144, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_ee1a0601aae95c4d16e75c9e17e64ebb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6ae2998311ba2fef68a6646e8cabf77a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4, 88, 132], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.39826616644859314], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_df1201702b34d1a5443f389b4689f96b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eeacd4c721523530e52c46b66de64a38
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_439624c1710c2a19a5af56d9cac6ef77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_439624c1710c2a19a5af56d9cac6ef77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_439624c1710c2a19a5af56d9cac6ef77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_439624c1710c2a19a5af56d9cac6ef77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_439624c1710c2a19a5af56d9cac6ef77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3c6f6211313cb8a9d6bcd5d55282d6ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_3c6f6211313cb8a9d6bcd5d55282d6ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a2c054a0fdfb6cb0cd90fc09624fb2db
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 4], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 4], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_439624c1710c2a19a5af56d9cac6ef77(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_efb9086f821a20072586613485e9cf86
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_0aaf2290134d34f1cb502ed2c21714d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-            paddle.to_tensor(32, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_3605aca3e677045f208df2206e91238b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-            paddle.to_tensor(64, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_01421f7dff29dbb58036232da4159fa2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e98a4f3b5e3959ecdeb00c7b75f915b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-            paddle.to_tensor(128, dtype='int32').reshape([]),
-        ]
-
-
-class TestPrimitiveOp_944852dfc7dbe5d9c7d9893a65add8d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 19, 29], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.3199149966239929], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c507c253fd44b7c5698c341543d99e9e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return input_0 * input_1
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, 624, 1, 1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be02362f58a3e010284f5233e90262f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c507c253fd44b7c5698c341543d99e9e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624, 20, 20], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 624, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_fe08d16f366db21b0fa73f21bb7dac1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a3e4323a567951a3d707091b7981614b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1152, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.uniform([43, 1152, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_8938de35115b378936e3fdccd0de463d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59945b092cb4d746030eeb6abfa865f5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_5e7c911d4e03e342f7799d9865d6170a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_13ed9f40856a970d54ffe24723e19107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 256, 256], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_70746e0deb8d731f2134be47100661ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ad4d8b2af8f1e48e6c666ef31b8c2059
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 1, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([22, 16, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_68bd62387bc532548466dbaadbf6a301(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8570defc04449c14d5bee6ebca4fed58
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-        ]
-
-
-class TestPrimitiveOp_256fba89a3e8032e9dc17dc7d48ece4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0cd5fa6582c6fa47ad19ded5110ad5e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 68, 7, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.22846846282482147], dtype='float32').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
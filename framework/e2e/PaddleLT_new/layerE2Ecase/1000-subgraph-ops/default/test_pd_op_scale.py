@@ -1,10208 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_5fb1fddda22e3f81cf03c8c25101635f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e17986ff5e1a02ced8fbc01da4a0cd04(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fb1fddda22e3f81cf03c8c25101635f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21504, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0b3352d3a5b96111d97b5e8fb0972540(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6cc781baf8c7d609b5f628c4356dd689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b3352d3a5b96111d97b5e8fb0972540
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9e2c74c9e7e915c9c0e8ab2eeca69787(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 198, 198], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0de510d31af841de52cb7fd7926f2f57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9e2c74c9e7e915c9c0e8ab2eeca69787
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 198, 198], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_56959cf90e818a62a6fb01ddddf0aa87(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.85, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3656b81c54eecb0125eb92d394d2cc52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_56959cf90e818a62a6fb01ddddf0aa87
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.14537160098552704]]], [[[0.7895930409431458]]], [[[0.8976643681526184]]], [[[0.9884347915649414]]], [[[0.724375307559967]]], [[[0.4383770823478699]]], [[[0.8006237149238586]]], [[[0.6282894015312195]]], [[[0.3811306953430176]]], [[[0.1904328167438507]]], [[[0.38898614048957825]]]], dtype='float32').reshape([11, 1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b64c3bd3bbc733d2c56a2b3f5cd26661(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 192, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.1764700412750244], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_1ec97bab89916775ffd60b3a1015e9d4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.875, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_887375add4673d70a056d558b3de3c60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ec97bab89916775ffd60b3a1015e9d4
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_48e27f2889f14b1cddf2732c5a76beb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.1428600549697876], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_13fefee5e5df16f7fbac313ee18cb816(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[1.1947546005249023]], [[1.2339849472045898]], [[1.630832552909851]], [[1.3503144979476929]], [[1.4345450401306152]], [[1.595362901687622]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1aa79d33105271754ad3ff75a51ad6b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[1.0987837314605713]], [[1.6176296472549438]], [[1.049620509147644]], [[1.3890669345855713]], [[1.2358343601226807]], [[1.3585190773010254]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-09, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e2f9a318b4df84ec2c93219af64e7d82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9af9938a4076cf462823909dc39afd33(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_23c3f07a62f43c3736ba117a5ad9b76a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9600213b2b5203ea1935105a0554dbf7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e30f76dbb2a05d5c1b945c25d54ac46f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a54916af9cbf09ee779de9b63118f78b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.3630925714969635]], [[0.26425275206565857]], [[0.301220566034317]], [[0.18989835679531097]], [[0.4035983681678772]], [[0.12422579526901245]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.10000000149011612], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_962e1bdef386af3df454376c9536b465(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.30489975214004517]], [[0.10537705570459366]], [[0.027480924502015114]], [[0.3134068250656128]], [[0.07270033657550812]], [[0.23179233074188232]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.10000000149011612], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7a8294266e48c2e4c70558fa33aa1f90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.3416723310947418]], [[0.21342092752456665]], [[0.4738646149635315]], [[0.0453365184366703]], [[0.12080196291208267]], [[0.1438743621110916]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.20000000298023224], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ba25e52f5ee9cad77e0b36ed31746a1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.007984833791851997]], [[0.009300637990236282]], [[0.30954933166503906]], [[0.34026792645454407]], [[0.47010329365730286]], [[0.32854390144348145]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.20000000298023224], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d3b937caf8329c221b280f7349e76763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([1024, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bc8d759f87da47ff32888a9f034110a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([1024, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e897d27951d2dca0e85ec5790a6e446b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -0.0555556, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f293295354cab5a1d106e54572e37e26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e897d27951d2dca0e85ec5790a6e446b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1024, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_867adfec7bf1f3263c962f4e72e6a16b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bfd9704bc62bff43da8d30fd736d853b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_d6160d3322b1c6bb28cb3cdb54d99274(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1fe708bd73d4b101b6638dc024895f02(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d6160d3322b1c6bb28cb3cdb54d99274
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[1]], dtype='int64').reshape([1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f35a775a0ee969edad718b5c6e6cdc72(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-09, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_eb4c0ab9b56bc68e42326b9afedd93a1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35a775a0ee969edad718b5c6e6cdc72
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.2414522022008896]]], dtype='float32').reshape([1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b1b395808f4b687d7268b31e89ac5981(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([4096, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_600eec5c6eb2092710151ce96926bbf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([4096, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f4eb28f8c298e3ad51be783c2ca9aa34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e897d27951d2dca0e85ec5790a6e446b
-    def get_inputs(self):
-        return [
-            paddle.uniform([4096, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_077abd1642f8ae2cd035b1f158165f4d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f0b9532fc5f60083ddafbea8380797de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077abd1642f8ae2cd035b1f158165f4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6eeec5e95591aec5cade1dd0cb822a84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077abd1642f8ae2cd035b1f158165f4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a56cf8864334847d664a770104d8eb8d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[48], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_315fc85e711e6cb1055e47b136811654(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a56cf8864334847d664a770104d8eb8d
-    def get_inputs(self):
-        return [
-            paddle.uniform([48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1340a7a747f69aee87a7b8bf061bd355(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a56cf8864334847d664a770104d8eb8d
-    def get_inputs(self):
-        return [
-            paddle.uniform([48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0cedebdb00063d3794413a6eafc373c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[24], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d92c791abc3d5c712e117ff573a0fb67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cedebdb00063d3794413a6eafc373c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0], dtype='float32').reshape([24]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8566c68ac1ab29b03cebc624d3c4cb0f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cedebdb00063d3794413a6eafc373c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0], dtype='float32').reshape([24]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c57063572a467078a3dba1f53f09c037(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12096, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0f50d8022ff78548f62eb858288990c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[96], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_83ddda25aadd6b491bcb000a27f9e8cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0f50d8022ff78548f62eb858288990c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6eeec5e95591aec5cade1dd0cb822a84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_077abd1642f8ae2cd035b1f158165f4d
-    def get_inputs(self):
-        return [
-            paddle.uniform([96], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_cfbbb74e96a9a3cd73df6e3db19f6071(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[48], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c28fe059bbf5f090e657d416897f3d0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cfbbb74e96a9a3cd73df6e3db19f6071
-    def get_inputs(self):
-        return [
-            paddle.uniform([48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1340a7a747f69aee87a7b8bf061bd355(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a56cf8864334847d664a770104d8eb8d
-    def get_inputs(self):
-        return [
-            paddle.uniform([48], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_49320ad40a0d29048d7502d846f4a69d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[24], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4b613ac899315e5f21be8112d25f831e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_49320ad40a0d29048d7502d846f4a69d
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0], dtype='float32').reshape([24]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e8bb63c00c2a8a6c7c25d22c576bddfb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cedebdb00063d3794413a6eafc373c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5, 19.5, 20.5, 21.5, 22.5, 23.5], dtype='float32').reshape([24]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d05b79bed41695c7b5d47461684d4e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0884743459f4915d82904c5015982b8f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ed7daf5c52586b646382609a0a3bd810(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b8261c8c6ca769da010cfa2db17721ee(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2e8f76faee089e0f282e89a36d57920c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26fdd96db2d35f2e0c886d370f91665b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_699166084feb39f20e7855e1829a3ad4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_261a0d8c68091762adc968a1284ff9ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1108.9075927734375, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9282bb0a2c293548f1ea6e704a14f305(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(117.26750183105469, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_39e80c9808cb8942bfdf1896e1704216(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.9935460090637207, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_90a9d192480b64079293c7f00caa0fa6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-09, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_63cdb39244691bb36ad589bb9c1a6868(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_90a9d192480b64079293c7f00caa0fa6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[6.138459980320476e-07], [0.0007193844066932797], [0.0009237094782292843], [0.0006928466027602553], [0.0034659558441489935], [6.337451486615464e-05]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5053032b9700b1c64652ec6d0d0c39f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_90a9d192480b64079293c7f00caa0fa6
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.0002494619693607092], [1.4613891835324466e-05], [1.9596898710005917e-05], [0.0011073150672018528], [0.0013705349992960691], [3.511029717628844e-05]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_406921816d9b8047f7a20b58c83cb1fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 21824], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-6.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4962ab207754ab8228ea8b9ce9e307f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.005460692569613457], [0.04573238268494606], [0.07607401907444], [0.020931769162416458], [0.25405409932136536], [0.0021392370108515024]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([0.08333329856395721], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e1ea305b3dc7019c9433823cb1c9a6fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.00045505751040764153], [0.003811030415818095], [0.006339498795568943], [0.0017443133983761072], [0.021171165630221367], [0.00017826967814471573]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([6.28318977355957], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3ae23dba71550094b092272227a37fcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35a775a0ee969edad718b5c6e6cdc72
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.002859212690964341], [0.02394542656838894], [0.03983227536082268], [0.010959852486848831], [0.1330224573612213], [0.0011201022425666451]]], dtype='float32').reshape([1, 6, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_401eb4b4f029154dd5cae15374049d6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f54dbe4b543b68af451ff90aae3c9977(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d6c4e66c1cf8b817caccf768d3a029d8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7d1ddc0752730cecf252203843ce3330(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.9125, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5cbabc747d63e51543ee4d1cf2ef613d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7d1ddc0752730cecf252203843ce3330
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8d629e4a64c31e5d1639e6975555c78(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0958900451660156], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_04ce4e62b5989f2e4feb6e797661a79f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b3352d3a5b96111d97b5e8fb0972540
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6b2435231cb0b72f5bf9fbe721fbabae(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1838b37d2467fe344ae29914aff0b72c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b2435231cb0b72f5bf9fbe721fbabae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([16]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_729b6252b5c79af06bae6dc084bbe7bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.935120940208435, 2.342700958251953, 2.2643301486968994, 2.2512452602386475, 2.024630308151245, 1.9799370765686035, 2.2323367595672607, 2.0859642028808594, 2.060138702392578, 2.1364691257476807, 1.9476395845413208, 1.851414680480957, 1.9159109592437744, 2.047849655151367, 2.128279209136963, 1.9771398305892944], dtype='float32').reshape([16]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7efbf941479ed11a660aae938fbc50f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1.564199447631836, dtype='float32').reshape([]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e7518ea9bb600c3b0d162fb95909efaf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e61ef3da4ad9bc37ec4fa86115bafb6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ce769e2d9ddc9dcca08295563e25e911(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_d2f5c701ebc4b7993ff4593c39bce75f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[300], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ff5f136c54017cba95692f4cb11afdfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2f5c701ebc4b7993ff4593c39bce75f
-    def get_inputs(self):
-        return [
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ff5f136c54017cba95692f4cb11afdfa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d2f5c701ebc4b7993ff4593c39bce75f
-    def get_inputs(self):
-        return [
-            paddle.uniform([300], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ed719d6509efa0049e18c1b5567f91e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e2f9a318b4df84ec2c93219af64e7d82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b490fb656ba4c746f2f1385973a74007(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_93757ca75bbd8aec72362eb50ab4460d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_aaf9eb01860bac2d07fefe1b5ccbb9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e190541fd3702c50394cadd50f3ade20(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a08231dd8f86775b3368a6d48fab80df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(32.654319763183594, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6b6147eb9e3d4540fa230991620e9845(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 12, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_dad529b6ef3865104188f816494f1348(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b6147eb9e3d4540fa230991620e9845
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 577, 577], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1e29c838c5790e072d13daaae567420d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([150], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2442936b9c953fd1f69ff4e93406132d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor([80.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d561cacbea2024cbf00637fc4cac2b45(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int32'),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be78ed9a480ce1763a6d3fd601c278c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_16abb8e7dedafb807d1765c213c91c98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9304f6466b4dbbfc74753ae7db50618a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c9345b8b02d6dd7df77c45cd51df2a1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_06f90143b8ab9d69120ff1073a9dc131(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 16384, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5e27661c69d9ccf9bb533a4ef4ff8a4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06f90143b8ab9d69120ff1073a9dc131
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_95864ebc6da496802f63c6f82174b6ba(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-10, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f362136650d8511f8dced7152ccf05ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f362136650d8511f8dced7152ccf05ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_bce202c470bbbf07a610c93dd97477d6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_31eaf792128a6edd12ed69756c641023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ccd6c6f6e10d7d19312517748d224539(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f8e2a562f80618756cdb4d2fb1f472cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1756, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_626de8f444c822bb894fb31988f051d3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_923a8e4b25d859c64025f7833d322db7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c37e5f94ff19255a10f7e7678e5f974e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1756, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c37e5f94ff19255a10f7e7678e5f974e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1756, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_740344bef65e797e3e21a0302b109d98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_294d4137d4a600513d2d3bf1244ea829(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_331edb1c9303e4e3870604a7267f19eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ec97bab89916775ffd60b3a1015e9d4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.7083258032798767]]], [[[0.9496928453445435]]], [[[0.9463376402854919]]], [[[0.9680418968200684]]], [[[0.17180411517620087]]], [[[0.6216364502906799]]], [[[0.2295222282409668]]], [[[0.9252181053161621]]], [[[0.7369711399078369]]], [[[0.8887742757797241]]], [[[0.3568985164165497]]]], dtype='float32').reshape([11, 1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fbb726a707dca0611ee336838469bb56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 112, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.1428600549697876], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8b9c3e62b05bfc6cd607c3af196c561e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.95, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a39a8761de3af129d16e66c7c07e7fd7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b9c3e62b05bfc6cd607c3af196c561e
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.8457365036010742]]], [[[0.867270290851593]]], [[[0.5704374313354492]]], [[[0.10677924752235413]]], [[[0.12649035453796387]]], [[[0.6223046183586121]]], [[[0.13621319830417633]]], [[[0.5117543339729309]]], [[[0.8699116706848145]]], [[[0.5217539072036743]]], [[[0.18710771203041077]]]], dtype='float32').reshape([11, 1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6bef5181b1df4219849534bfbf0eee38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 40, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0526299476623535], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b84d1d4d14461693f90bf3cb41c429e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0c52286567942f96debd9a3725775c52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int32'),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f91e7db5c0d209d2dc2134f2c8325681(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(179.86773681640625, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1b721edce117f4b944cc6ce73aa740cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.1214802265167236, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b7f77b803843c70f3ea3a911fb00834f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_18c5ff7fa6912d3d5cf38b57199f5d4f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c06a1af5d94843b480dd89fa203450c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fe00de0e146d53d5801d77118ad3234f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_de0604c4db8b7ee04ef6ac7ed236f55b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9d60d914d23aa26f64d03d6aa0d6ebe8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d145e8dfcdb17c1c20c3ba3dfc775868(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d60d914d23aa26f64d03d6aa0d6ebe8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f9d62c01b45d450a30c199efde0d6aca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d60d914d23aa26f64d03d6aa0d6ebe8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a5e682b4ee939ca23901b4ad22819a94(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_02ed9f3ba80e98d820b1cec76f4a0a87(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5e682b4ee939ca23901b4ad22819a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9930f4f202acd144cda1c40287701a9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5e682b4ee939ca23901b4ad22819a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_501c33c7d623297e4ad2d951c7dacf94(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[16], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ddf1ff94f97900bb515293428cf803c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_501c33c7d623297e4ad2d951c7dacf94
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0], dtype='float32').reshape([16]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fe6e68c45a2ff092290d10ebac8a663a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_501c33c7d623297e4ad2d951c7dacf94
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0], dtype='float32').reshape([16]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_deb73becced98f6c5759831c9f04d43c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5376, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_27d0a016da023d787152f0123accfcd8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[64], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4ae8a647da6ae930dcea153346509215(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_27d0a016da023d787152f0123accfcd8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f9d62c01b45d450a30c199efde0d6aca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d60d914d23aa26f64d03d6aa0d6ebe8
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_bcfab7f6120c6e92a0ab9645baffb419(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a3029350eb0e396db1f5593e46d7350b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcfab7f6120c6e92a0ab9645baffb419
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9930f4f202acd144cda1c40287701a9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5e682b4ee939ca23901b4ad22819a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_861b9f5093066d708bff81a9c78a39ae(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[16], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0e2e42f2673c1cf6a58724552bdbd660(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_861b9f5093066d708bff81a9c78a39ae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0], dtype='float32').reshape([16]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cbeca4ac23fff43507123b3c66a25ddf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_501c33c7d623297e4ad2d951c7dacf94
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5], dtype='float32').reshape([16]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e9266b2f5899c43f6355f6510dc9ba9c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor([80.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_abacdb10842bc3af6f4d5bd6ba572135(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int32'),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_05e0b9bb08c232513afa900f145688a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(216.4986114501953, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ec82346ad66327e8b1972e43129de6a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2.2957000732421875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_bad0cdc814f871416a345678b7bfe23b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.975, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6503101bdb381df31e52cfb729f5bc25(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bad0cdc814f871416a345678b7bfe23b
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_62242bc83acb197f32a9ac052c607e12(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 24, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0256400108337402], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e30f76dbb2a05d5c1b945c25d54ac46f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c96d146e7e14cd35b1f3c88a1a06d037(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_afe32a543886c60ee5313ae762a6504f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_783b94dcaff2575db6fc483d4b0b0045(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_af41558ba46e07d2fdfbb8e64e20699d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2efb0252f404ed2af5c0e13260ee0fdb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0025143f5b51814a8843d390d8dc3763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.01010000705719], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-10, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_26c52a63d8df7c0032506738d906947a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.0729246512055397], [0.034768473356962204], [-0.013078576885163784], [0.16130442917346954], [-0.010292893275618553], [0.12493808567523956], [-0.0019259940600022674], [-0.02474241331219673], [-0.0016566826961934566]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ea5297a0397620e8054553d968aa996a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.005907343700528145], [-0.0013008895330131054], [0.04051446169614792], [0.0718279704451561], [0.022287728264927864], [0.0006318383966572583], [0.010774265974760056], [0.012844983488321304], [0.06638913601636887]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_71e0ff489cff7c2d8a49defcd3685526(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[11.344745635986328], [-27.726694107055664], [-1.322812557220459], [1.245705008506775], [-1.461818814277649], [196.73736572265625], [-1.1787587404251099], [-2.926231622695923], [-1.024954080581665]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd99b933d945b5176dbe6413aa475d67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-10.344745635986328], [28.726694107055664], [2.322812557220459], [-0.2457050085067749], [2.4618186950683594], [-195.73736572265625], [2.1787586212158203], [3.926231622695923], [2.024954080581665]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_185c4bd51cbdb666f8dad51190c25b6b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b1cf5fc4d4db97834e906f00af2e687d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_185c4bd51cbdb666f8dad51190c25b6b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 640, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_45f84f1119bef1fe99d6a2e09dc1d55f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(11637.380859375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.09090910106897354], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e51ccab0b2aae478f630f50c1d21d52b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1057.94384765625, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_aea42d3dd1b75b3634bfed1d23c04505(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.013741692528128624], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd57074d5e47a4895c1df702424ef717(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[1.107850432395935]], [[1.2693606615066528]], [[1.4553009271621704]], [[1.019621729850769]], [[1.4108771085739136]], [[1.2713781595230103]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_07c86e38c11450d5e1eea351344c0c41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[1.0268770456314087]], [[1.3323951959609985]], [[1.332847237586975]], [[1.2609877586364746]], [[1.4324498176574707]], [[1.1542859077453613]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c6f26cc1e54d0586c662c29dcbc6e6c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([128.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5d5f9bd71fabbc72e3807e6e4c080102(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d796e582b20df45278478b4d31a1d023(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d5f9bd71fabbc72e3807e6e4c080102
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c6f26cc1e54d0586c662c29dcbc6e6c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8, 8], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([128.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6f5834c8c53ec44715795e36c02054b5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9e2c74c9e7e915c9c0e8ab2eeca69787
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 198, 198], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0ab361f35cef4bd26d67451732b9236e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0ab361f35cef4bd26d67451732b9236e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_75a36b87e2b87c0ee72584d79dfcdda6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b10aa094db21e77eb551eda9d6b71f9f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b3cc4ccac4116e9fc7a25dfe1347aee2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5551, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_80cadb55d8cbf5d2b1d4226a82634f7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e2f7105cc1ee7b12cb028326b52c286b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5551, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e2f7105cc1ee7b12cb028326b52c286b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5551, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a761e369aef83a6e069e91991e66dcdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_db5e0ebd14c954fb41dd58c9152aab40(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6d9109d3a8a42bea255990c030d9268a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db5e0ebd14c954fb41dd58c9152aab40
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 1000], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2bf7fc4525c2009bca9f02b1a44768b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_db5e0ebd14c954fb41dd58c9152aab40
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 1000], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_82c9db5f05b6b5957493ca53fa23194d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.8375, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e76b706b1c7f53c4d0fa1bd148dd3885(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c9db5f05b6b5957493ca53fa23194d
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d2d05e1023b1e57160df9e8cb7661b35(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 192, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.1940300464630127], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_971dc6fb19192b9f5d99e306afa2ca6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(125.73326873779297, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_39aa985b9f230460da9ef59f712f5765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.3826441764831543, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_09137a2422dbcc3eb5123a531ec92b37(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b2435231cb0b72f5bf9fbe721fbabae
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_91e82a42b0128509f7aa63d940d07b0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0fff3d6a1fc394c4a68f4a19dd041e6d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6.012561798095703, dtype='float32').reshape([]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_de113d8b2e1c1ae4aab1077d48da10d1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 192, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c93813d29f9a8e93f9bb10874b9b6c05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_de113d8b2e1c1ae4aab1077d48da10d1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_16e2c3f6ec434a69754b5507465f4090(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_01da33f5f1f65ded611dccad01ab2150(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.07361782342195511], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5d8082368b197d38ae875fdbd5f5190a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.14041727781295776], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5e7d9219e519777e34d2e81bc954fb9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5307173132896423], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ce96d9a0d68fc3060fc58e54e14e3552(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_770870f0c3eb202c2798f34d4778477d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_73903025a84bb1199ca5c2baf2812e9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e897d27951d2dca0e85ec5790a6e446b
-    def get_inputs(self):
-        return [
-            paddle.uniform([64, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d98eae762def6387f548db0c76a61b56(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(178.2649688720703, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_18058961a838e7730e62cbe82bc93e22(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(45.9840202331543, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5a145d1a0738c95ec3acc2366fecd6d2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cfe9c9da192980655b3bbc3958969276(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a145d1a0738c95ec3acc2366fecd6d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0025143f5b51814a8843d390d8dc3763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 64, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.01010000705719], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d1b311242b3772fa7c61d958d6189e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.8076322078704834, 0.7650506496429443, 0.3246075510978699, 0.6688218712806702, 0.4887043237686157, 0.8063077926635742], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_aa2cc1a57231486c402fdebd6f3daca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6515396237373352, 0.4568503201007843, 0.19003455340862274, 0.3337627947330475, 0.6107997298240662, 0.5642118453979492], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_69039dd8632fbd2adeb2045014d08017(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1520746648311615, 0.3771164119243622, 0.2510501742362976, 0.0996597558259964, 0.4378995895385742, 0.35814228653907776], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dca9310e18a7104c20218a58d551b8df(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.27074742317199707, 0.3817579746246338, 0.6341547966003418, 0.757767379283905, 0.5551528930664062, 0.4430774450302124], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a0c770b38c84ad14480ac00f4f1e66dc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-10, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_796eed2411b79c2fa0aa12ac9cab8bbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0c770b38c84ad14480ac00f4f1e66dc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([-0.004256535787135363, -0.10495690256357193, 0.001265051425434649, 0.014308074489235878, -0.026299387216567993, -0.016757093369960785], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be2652a735966efdb80e3e194abdb090(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0c770b38c84ad14480ac00f4f1e66dc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1436895877122879, 0.0390329584479332, 0.05066336691379547, 0.12593135237693787, 0.0014194229152053595, 0.05388146638870239], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a87b288ae217fe54c22d6ebd5da17765(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0c770b38c84ad14480ac00f4f1e66dc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.24177946150302887, 0.14634716510772705, 0.04276227205991745, 0.17142243683338165, 0.07123421132564545, 0.1578609198331833], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0ef3a60eaef10c868b2dcd9dcc635ccd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([-0.32726770639419556, -1.1015067100524902, 1.1234203577041626, -0.4782726764678955, -0.29376423358917236, -2.1163668632507324], dtype='float32').reshape([6]),
-            paddle.to_tensor([0.4052850008010864], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_737b031602b630b137ac0eec78de8030(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1e4cb933bff1d59cdab5bb981d3bd2f0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_737b031602b630b137ac0eec78de8030
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([-0.0, -0.0, -0.0, 0.0, 0.0, -0.0], dtype='float32').reshape([6]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_23caf146d057f958863799f3cf3f9d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a0c770b38c84ad14480ac00f4f1e66dc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.043407678604126, 1.491739273071289, 1.5114994049072266, 1.0927067995071411, 1.0349750518798828, 2.815275192260742], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_11b881627cb4d0d15fd71781ff0fe61f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.5961060523986816, 1.4288125038146973, 2.3578619956970215, 1.7424912452697754, 1.0211081504821777, 2.5118026733398438], dtype='float32').reshape([6]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d17ce130e49458e021f7b1cd9a2e4563(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(1.7763638496398926, dtype='float32').reshape([]),
-            paddle.to_tensor([10.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6cc781baf8c7d609b5f628c4356dd689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b3352d3a5b96111d97b5e8fb0972540
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 100, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4836a15f079e4e29f868d64759359877(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4836a15f079e4e29f868d64759359877(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2713e4567a915ae6f68883c489fec56c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7268d58e04e5b347b1b9ccc5623cfd8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d426328b945e3f3e0996f0c9bc1d434c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1769, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_126088b7497203185ff55090ac739b3f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8587ae20adda5efb17d114694560bae8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 2, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_24d92aa00ebd04b5ddaf443eb67d432c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8587ae20adda5efb17d114694560bae8
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1769, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_24d92aa00ebd04b5ddaf443eb67d432c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8587ae20adda5efb17d114694560bae8
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1769, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4d4dc2965698bbfff26e52d07448b60b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 256, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_64192781fbcaa98161663d6866606c40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d4dc2965698bbfff26e52d07448b60b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_09d7e73a12a83f037b40a3cc61ed53f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d4dc2965698bbfff26e52d07448b60b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 256, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_20c3f0b2ff1c6ab81d1f6e0a3e6c83a8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, 100, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e9cd492b29af7c6418613ddd9f387ba1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_20c3f0b2ff1c6ab81d1f6e0a3e6c83a8
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 100, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_601870bc7897ec307c0858093e81d4d0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 32, 100, 2], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_539137be84ed82dc399e18cf9b8d5d60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_601870bc7897ec307c0858093e81d4d0
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 100, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8eff2a85347b369b1c65e58aa0e03b64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.020559780299663544]], [[0.3155970573425293]], [[0.19930656254291534]], [[0.15176549553871155]], [[0.3551301062107086]], [[0.05046052113175392]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.10000000149011612], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bc3242465adcdf28c729276c718f46bd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.19929003715515137]], [[0.08641352504491806]], [[0.21354976296424866]], [[0.4191088378429413]], [[0.3011622428894043]], [[0.06974518299102783]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.10000000149011612], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_68b9bb36e54020345136d9bc7c018d48(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.19057197868824005]], [[0.3952142596244812]], [[0.3562823534011841]], [[0.35590291023254395]], [[0.31859326362609863]], [[0.06735644489526749]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.20000000298023224], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_753e3dab292a7605861039fe120823ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ac811c2a72ca0524f50c83bd6556b347
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.3585663437843323]], [[0.17645567655563354]], [[0.46808937191963196]], [[0.32756173610687256]], [[0.44194966554641724]], [[0.21164923906326294]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([0.20000000298023224], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_740344bef65e797e3e21a0302b109d98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([15200], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d54e923ecb8d59fd818e26058cf344fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c02551bab36df46b5f83aecebc4cd85b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.2229018658399582], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_617789a9e1303adc9e1c357ecf61b3c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.29154813289642334], dtype='float32').reshape([1]),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b88d5b90577f1e7f0ae0155e94883373(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.08758503198623657], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.05000000074505806], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ceed4979b7bffd85870a207cc3ec8e61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4da469a78e23afb577317277efe9d4a5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[80], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_91baf4d9417c6c3f4ebf28d60e947408(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4da469a78e23afb577317277efe9d4a5
-    def get_inputs(self):
-        return [
-            paddle.uniform([80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6fd85e2f6c491cde854054fa504c38c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4da469a78e23afb577317277efe9d4a5
-    def get_inputs(self):
-        return [
-            paddle.uniform([80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_55bdce66a71497878845c53c67a53385(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[40], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b9a6b620aa02183b1840db39e6748fdb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_55bdce66a71497878845c53c67a53385
-    def get_inputs(self):
-        return [
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_25c1d5b276d03f22431fa8dcff64dadf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_55bdce66a71497878845c53c67a53385
-    def get_inputs(self):
-        return [
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_dd1adeaa64b38c4276ec6e8e6855f9e1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[20], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e8301af09c3dfdf12a7c6433c29cf8ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd1adeaa64b38c4276ec6e8e6855f9e1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0], dtype='float32').reshape([20]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6272f45d7d8e3c9c5e52202061795fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd1adeaa64b38c4276ec6e8e6855f9e1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0], dtype='float32').reshape([20]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6143ef1df0d8b6277213569bdf601ae2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_06be4122bb08a6e0bd2606d613e178d2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[80], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4600f14674436750dcd617c3c163a429(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06be4122bb08a6e0bd2606d613e178d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6fd85e2f6c491cde854054fa504c38c9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4da469a78e23afb577317277efe9d4a5
-    def get_inputs(self):
-        return [
-            paddle.uniform([80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_65d2aa88cdd67118a0fdf9114743747c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[40], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d6a71a1eebafb839ec764cbd14de1ad6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_65d2aa88cdd67118a0fdf9114743747c
-    def get_inputs(self):
-        return [
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_25c1d5b276d03f22431fa8dcff64dadf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_55bdce66a71497878845c53c67a53385
-    def get_inputs(self):
-        return [
-            paddle.uniform([40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7be50029f9d563d7329e5f69ea219b57(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[20], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_20711143a1c28f279ec09c24f44f689e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7be50029f9d563d7329e5f69ea219b57
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0], dtype='float32').reshape([20]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4682705c4e12f2c7829926030fb34325(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dd1adeaa64b38c4276ec6e8e6855f9e1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5, 19.5], dtype='float32').reshape([20]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9c289c6bf98831e366a0f5abf1877d5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b2435231cb0b72f5bf9fbe721fbabae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([24]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_83ba6889ac30e50486caf8ce766d01ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2.208099603652954, 2.238997459411621, 2.0801351070404053, 2.1418144702911377, 1.9909703731536865, 2.1641199588775635, 2.1739017963409424, 2.189840078353882, 2.048980951309204, 2.0414254665374756, 1.9342337846755981, 2.1087865829467773, 2.004063367843628, 2.2582664489746094, 2.0910048484802246, 1.9079370498657227, 2.1118435859680176, 2.130314350128174, 2.273674726486206, 2.0368571281433105, 2.082777976989746, 2.1205742359161377, 1.9786968231201172, 2.1864089965820312], dtype='float32').reshape([24]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9212e7dd0e92dfbdcc5f9b9ef732bf2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.3647758960723877, dtype='float32').reshape([]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8ce9bd635c586339a56551f473bf8d28(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.22892695665359497], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_31bbae978276fea4acb68c61ca5a7aa1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1], dtype='float64'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b32bc8a582c0c9dd1984f4fedd12539d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_31bbae978276fea4acb68c61ca5a7aa1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.12435943841004746], dtype='float64').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2e8f76faee089e0f282e89a36d57920c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_20c21067792b528a1827526af1d242bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1110dfca8f3ada39b04df45d165eca89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c06a1af5d94843b480dd89fa203450c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cf8fcb20789d854f5543046dc3c9ad6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c4cf17956e7b4a9194e6081f5dff5529(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f2cae5498afac2c43b29964f308cc3ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f2cae5498afac2c43b29964f308cc3ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1d922c6e82ca7bc0b3a36e447f74c7f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_da22cf1f47243ed8538d9ed4983ecf0c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d2a2ed4eb2415b93866abd89934ad04a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1502, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_aa9859ae1f2b26a0a303c415aa2d45b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_69cf601e833e99f3a9a56707b32a8415(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1502, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_69cf601e833e99f3a9a56707b32a8415(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1502, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d81c32f7aa52db9280450cc5503ee38c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d6160d3322b1c6bb28cb3cdb54d99274
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[9]], dtype='int64').reshape([1, 1]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6c326dbf36abe12a277312c540d7ad8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35a775a0ee969edad718b5c6e6cdc72
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.24687178432941437], [0.2461656779050827]]], dtype='float32').reshape([1, 2, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e7518ea9bb600c3b0d162fb95909efaf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ab87a2cb4c2a7ac823f6ed9e3093b308(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cb21f42b89a8cedb8b0cd8fc6992ae5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_78320b05a98b71c6a03ce110c09e33f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b2435231cb0b72f5bf9fbe721fbabae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0], dtype='int64').reshape([4]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c898397bb1e12740d30f5249139b378c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1.887164831161499, 1.9745750427246094, 2.0695981979370117, 2.300687551498413], dtype='float32').reshape([4]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a0a68e5b1b9c4a7ee480691c238b1cb5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(0.35144057869911194, dtype='float32').reshape([]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_867adfec7bf1f3263c962f4e72e6a16b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e9fc4c8e1b73c8136c01199c77f6c61e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_68d4381413a9785d4a9b37690160c12e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7906555b088b448b2f92d4a87a85dd68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(143.6868896484375, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ba09dd7a90845aefedaecd2550657c24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.115994930267334, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_41f2b4bfb1517f5ccfdf5895adaa8472(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(177.46954345703125, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dad6a9bf3d1fee9849732ddb6b623863(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.6003942489624023, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_b63e01909a92a47391412fe2026d9342(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 19, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8b90850b78985fe9140cd0748c0cccff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b63e01909a92a47391412fe2026d9342
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 19, 512, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4e4922968922a1a6756c98fbf770d107(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 6, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_33f511ec78b9460e6f2e4d464a99cab1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e4922968922a1a6756c98fbf770d107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1025, 1025], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9a8a5b0cedf1b523bca719b55852aa54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(118.93710327148438, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_16aab66b3bfbce2830a3587af859b09c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(6.233312129974365, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a67be348fe5e5990961697a4d294defd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.03686540946364403]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fe7f7e2aa1c99d223fbbfd75e1515a6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.05832042172551155]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cc9ef357922ade6fd07e50a4db4d6fd9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.3678816258907318]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8af1e0b0768b0aa85b5a2b9e382d9b2f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[1.3678816556930542]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8b79d92ed0a83b6ec38f1eadea3b542(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.010928520932793617], [0.022338353097438812], [-0.05425577610731125], [-0.0027498090639710426], [0.046230580657720566], [0.005657250061631203]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_65b0244d49085e1e49094b1870cb24bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.02026430517435074], [-0.017188403755426407], [0.02479902096092701], [0.06707112491130829], [0.046556755900382996], [0.08263831585645676]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bcafa9129612da87fd462578970f6066(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-1.5392990112304688], [-2.2996177673339844], [-3.187819242477417], [-1.0409983396530151], [-0.0070059699937701225], [-0.9315420389175415]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6ad600e8c6f779c13a226a5791c97abe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[2.5392990112304688], [3.2996177673339844], [4.187819480895996], [2.0409984588623047], [1.0070059299468994], [1.9315420389175415]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b977d8952c16ddbd6158b69aae6974f2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bad0cdc814f871416a345678b7bfe23b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.47449377179145813]]], [[[0.285202294588089]]], [[[0.22183844447135925]]], [[[0.9436632394790649]]], [[[0.25344154238700867]]], [[[0.5762527585029602]]], [[[0.5416237711906433]]], [[[0.037196170538663864]]], [[[0.7850573658943176]]], [[[0.829213559627533]]], [[[0.4879533350467682]]]], dtype='float32').reshape([11, 1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_84a5bbb7c70e8a167a89b541c0fcfac9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 24, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0256400108337402], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_eb4253799ebf0e06bd17d9c6c3cc4e24(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f9b06314642ca37163bc865de1cb00de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_eb4253799ebf0e06bd17d9c6c3cc4e24
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0], dtype='float32').reshape([14]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_22d219f2e2f925ceeab15052197f93a3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_42cc2e3d5a213a00c04435ab1a42241c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_22d219f2e2f925ceeab15052197f93a3
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5], dtype='float32').reshape([14]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8781a49b754f4f6dc72561c7411d7b86(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -80, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_35fd2c7f013c9bae0fdf5341d35500c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8781a49b754f4f6dc72561c7411d7b86
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_35fd2c7f013c9bae0fdf5341d35500c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8781a49b754f4f6dc72561c7411d7b86
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f6ad56a52320f0d5d337853311377310(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 80, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c460d486f78aa1670978b8cfeef44ed8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f6ad56a52320f0d5d337853311377310
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c460d486f78aa1670978b8cfeef44ed8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f6ad56a52320f0d5d337853311377310
-    def get_inputs(self):
-        return [
-            paddle.uniform([14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6a431a288c5e02bca6e00dc99999b2bb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e8870d58c2da208a06f75dbe08f7a8be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6a431a288c5e02bca6e00dc99999b2bb
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0, 25.0, 26.0, 27.0], dtype='float32').reshape([28]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9df834a23d21b275d29b029f7e35ffc8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6f989e96e5da43c7c29b8d1a5f9a6671(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9df834a23d21b275d29b029f7e35ffc8
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5, 19.5, 20.5, 21.5, 22.5, 23.5, 24.5, 25.5, 26.5, 27.5], dtype='float32').reshape([28]),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4ec84098a9049f3d015d58dbc05364bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -40, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6b72878d2aba136664a8421b2a020c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ec84098a9049f3d015d58dbc05364bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6b72878d2aba136664a8421b2a020c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4ec84098a9049f3d015d58dbc05364bf
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_35b2ffe01b66d5a568669cc7743fd846(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 40, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_24e9e48ca1dd51fc6803657c442e42b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35b2ffe01b66d5a568669cc7743fd846
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_24e9e48ca1dd51fc6803657c442e42b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35b2ffe01b66d5a568669cc7743fd846
-    def get_inputs(self):
-        return [
-            paddle.uniform([28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7fb046410ef3da911fff37e026697f08(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9b41f6458ec266d3a4c0c4ff462a6893(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7fb046410ef3da911fff37e026697f08
-    def get_inputs(self):
-        return [
-            paddle.uniform([56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c2f06c1ce5ea54062fbe88bd372bc5ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_53dca9fae4ba139076d1e9fa3d113921(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c2f06c1ce5ea54062fbe88bd372bc5ef
-    def get_inputs(self):
-        return [
-            paddle.uniform([56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_2cf30a250438920dad73c05744325945(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -20, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_93d9d2a1cb6fd0349ee32a2581b7d75a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cf30a250438920dad73c05744325945
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_93d9d2a1cb6fd0349ee32a2581b7d75a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2cf30a250438920dad73c05744325945
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_44a84e4e0d9da031122c6b658bd046e3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 20, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7367164f3b920f2ba9779434c29f8609(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_44a84e4e0d9da031122c6b658bd046e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7367164f3b920f2ba9779434c29f8609(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_44a84e4e0d9da031122c6b658bd046e3
-    def get_inputs(self):
-        return [
-            paddle.uniform([56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_fd3b8b240747c1ba620654de03e03565(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b65cf46c219f98dabb80d0ef1a5e3995(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd3b8b240747c1ba620654de03e03565
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4, dtype='int32').reshape([]),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1dd55dbae13519ee09cac831657039c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd3b8b240747c1ba620654de03e03565
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(16, dtype='int32').reshape([]),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c2ed26e2ba00baa8920d63d9bec6ce85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd3b8b240747c1ba620654de03e03565
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c2ed26e2ba00baa8920d63d9bec6ce85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd3b8b240747c1ba620654de03e03565
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(13, dtype='int32').reshape([]),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2eacc2b9e00bbdc1b2370b036ff35226(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d6160d3322b1c6bb28cb3cdb54d99274
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[3]], dtype='int64').reshape([1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1406b05494ab8ef1f5e1611795df8570(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f35a775a0ee969edad718b5c6e6cdc72
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.24469703435897827]]], dtype='float32').reshape([1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5f8d070f71a65ad111798d37dd9aa7c9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 2048, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_629440ef52d0af9055747dadad79c854(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5f8d070f71a65ad111798d37dd9aa7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_239bb937b9af4dfd04295a5da65ed0c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4.0, dtype='float32').reshape([]),
-            paddle.to_tensor([0.0015625000232830644], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7884cd7a42c3622d8e8a43d1a0189d62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(7.0, dtype='float32').reshape([]),
-            paddle.to_tensor([0.0015625000232830644], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_61b397285958a88bcc1ae6227a1f6c5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a145d1a0738c95ec3acc2366fecd6d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ded342a463ec2e0dbb5ade68f90507f4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(193.93536376953125, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e2e7ef0870d056c42e208dec11d8717e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(3.0784122943878174, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_961f3390a1c87b8497a1ed54c7ef031e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_50d357549346f4f9831b551961a96c15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_961f3390a1c87b8497a1ed54c7ef031e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b7f77b803843c70f3ea3a911fb00834f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_84931cefb37a1084e7388e6ba4f471c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_11b19dd85a69e48df00f3bedced769d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_ccf84142974138841b80fa5a1f911d0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 3, 197, 197], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_83a3d3ef3b9ac5ff85530edbd006834a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccf84142974138841b80fa5a1f911d0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([54, 3, 197, 197], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d05b79bed41695c7b5d47461684d4e0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_511b0802a0e3bb7bfdd7d872984ebc00(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7062c55f276a99aea10d3e83efbc4d57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(167.85415649414062, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e4e3e7981dc9dcded746cc24a993c34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(70.8403091430664, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_aea8ae797393ab8e346cadca33845a8b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 65536, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f12cf06b527595cf3a3b7da088fe876b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aea8ae797393ab8e346cadca33845a8b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1806557559666c610f35cfce03005da5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([950], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_24d5d83f5d243d5eb9a7123ab337ffb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([8816], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_987b1323ba82e25445817eb9ec41bf2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_987b1323ba82e25445817eb9ec41bf2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_032ab90bf293536b4dd23e0caab0e5f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_de610b4ace4e30571dc4c1a5a21932ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6b37441a8e99f5285c1255d55005a0f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2080, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e337246613d8baf405ab435887eac2ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d86d087d46a9e838cf439649fa818bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2080, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d86d087d46a9e838cf439649fa818bd5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2080, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2071a1ca77091f7af57a22dfb29fb488(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_961f3390a1c87b8497a1ed54c7ef031e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ba0639a1b4699e4e71a040b5952451c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(134.99020385742188, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be57ae29dace36f760e97c7a737a59c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4.1094255447387695, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4b613ac899315e5f21be8112d25f831e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_49320ad40a0d29048d7502d846f4a69d
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0], dtype='float32').reshape([24]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bdbba4669cbe29d57ac7d72fbf869ae1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cedebdb00063d3794413a6eafc373c9
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5, 19.5, 20.5, 21.5, 22.5, 23.5], dtype='float32').reshape([24]),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4ad3e77d7580713070c39589cdc0d1a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4471670091152191], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5e6f32fa1d0f4ef9babfd87872df9bac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6188452243804932], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_809a13d7df9b968eb7dad8a816459793(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.18567442893981934], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_49cc9766a2e81e9f6820b38a007e4be5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4858950078487396], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0d5346b0439aa6bf58797b64f0e75467(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3839329481124878], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8f82b056521bb4f247d98eaa66d6a4ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5088709592819214], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f19528df5b4432a92a29b5e603b6ca6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.10538749396800995], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9bbe1b59f6e6abc449a92f468339f8a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.1971568465232849], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_67091aff97ed218d068ad319a5f21671(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3118523955345154], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ea8a5f01b0d99424bf3b09b4f81dc353(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5066840648651123], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03a7c00cd00ea6b83cfdeb2fc3b92cdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.20082803070545197], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cecb1ea57f31fb49ab3c49880ea7435b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.38398468494415283], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4d7cee1c46c1fe86ab3179a371d2590f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.04535200446844101], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_337850fd04d820b635af6b77beb061fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.17288008332252502], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_246614001d09c961b124d8bcf298e563(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3101944327354431], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_999a5cdcc17280ddeed7456bcac642ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5288635492324829], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7af8acc6668076e731acb02b62f3663a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_16e2c3f6ec434a69754b5507465f4090
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.2691633105278015], dtype='float32').reshape([1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ca621572f2174b15d594996c68a1fa08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.6128488779067993], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_418a2c8e43cc1291ac1b15836fff8140(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.26848334074020386], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d33c8e39dfcd4671aa064ae91f621e3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3614746630191803], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a7a8a596175489c04654167be4978e8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.18341492116451263], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fdca093e9d34e515d6c92692e8b70c6f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.8068056106567383], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_449996b1c13a28ef1a1e6fab04e4cf73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_780cdd7169cfb16985e95afdb0c95e74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8628feddcbefafdc9e8e39935c85df7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_28f3968edf2b35117064f979cfc33e24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([16384, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_10f8ba839be018a0ed94438a7fe72c3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([16384, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d99d1d5b1c3dfb5d302220f0d76f18a6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e897d27951d2dca0e85ec5790a6e446b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16384, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f0283859eb1a9d0954f93d6582ca3921(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2dc12426a4a69d0335e4ea1e059b4eb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d5f9bd71fabbc72e3807e6e4c080102
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f0283859eb1a9d0954f93d6582ca3921(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_60381ae66f78f0749166e4da3287e083(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_60381ae66f78f0749166e4da3287e083(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1a1ab61cd6c6a0356c4776edb9f84e41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6664906c323b123cf938e5e6a7c0d80d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f7e8b82fa073962b41713ff8cf48cd23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4585, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a458ee668adf7e0af826e4e920c2ddd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6c70c4b40f6024b5d0052c1486e4cfe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4585, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6c70c4b40f6024b5d0052c1486e4cfe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4585, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_04ce4e62b5989f2e4feb6e797661a79f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b3352d3a5b96111d97b5e8fb0972540
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 320, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_43b1fbfd59ff25b4c7a8bf35ba1e4836(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(101.84419250488281, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0adb7970382bf9a66eb09b1c9c5cf35e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(300.8228454589844, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6ee8005e8a5f9620a6709530ab88d3f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6ee8005e8a5f9620a6709530ab88d3f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b52c3a447e9e8bf93748a19f6d45dfcc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2725a60acd06917149c8ebd79bd72e2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3479213fe6de5d7974ff762dcd7b581b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1048, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_65567ed2867059b6b17887650c268950(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fa93580a7c3e17a2f25806490b3a912c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1048, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fa93580a7c3e17a2f25806490b3a912c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1048, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_07da1b56c4289e55404bebb46f57a9ec(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 1, 32768, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_084ebfc813bb86bd734c782e4714a5a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07da1b56c4289e55404bebb46f57a9ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1c0cda8bc7a6c1d91d93cc0f793a9319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 1, 960, 960], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-50.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_94074940be3a11df88ed07fe19fce89a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_06dc172288c86512107a8a1a8d896072(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_94074940be3a11df88ed07fe19fce89a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 1, 960, 960], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0ec41951c7d24f79869c5d7409093689(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(165.29530334472656, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9091a358f488a43ab188549fdf167117(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4.681039810180664, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8fa83128131317e11447c75e03480dcf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_185c4bd51cbdb666f8dad51190c25b6b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 200, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dc7d1cd873efe64dddaa7b4bbd876cdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_401eb4b4f029154dd5cae15374049d6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_57dfd4766d2225f7ea06b5ad57c15dac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d5b675b6940451f6028ef3d6a1cf8233(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.75], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_da4ff8f91e8d9166456472fa17a46b5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_42f21d71ff64b1d218657a0dddb2ef5f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 1e-08, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_048750d9b4d84e092dbf33e6662dfdae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42f21d71ff64b1d218657a0dddb2ef5f
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9dedb23c5b4ae45ebbf6c474fefc8171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f162b59be938a45816db2b4bca64bca9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_048750d9b4d84e092dbf33e6662dfdae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42f21d71ff64b1d218657a0dddb2ef5f
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9dedb23c5b4ae45ebbf6c474fefc8171(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c96d146e7e14cd35b1f3c88a1a06d037(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d206b9653466adecf735cf140da03f6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_238778ea1d225117b99048c1f78343f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e9221ed9eb8592f088df67e050d92a00(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[68], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b867780487642fd52b20f1a10429a105(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e9221ed9eb8592f088df67e050d92a00
-    def get_inputs(self):
-        return [
-            paddle.uniform([68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bf2b722c168d09ae34041790eacd2a72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e9221ed9eb8592f088df67e050d92a00
-    def get_inputs(self):
-        return [
-            paddle.uniform([68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7b395bf4de92806cef3841fa70edf552(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[34], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d302bc2bc3414872559023fd8c4908a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b395bf4de92806cef3841fa70edf552
-    def get_inputs(self):
-        return [
-            paddle.uniform([34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_781554fae082d67ffe651e8bbcaa1c94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b395bf4de92806cef3841fa70edf552
-    def get_inputs(self):
-        return [
-            paddle.uniform([34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0311368f5e8300e40600799b5c7bdf1c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[17], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_80fd32fa1dfcc168f53d00fef8c5a062(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0311368f5e8300e40600799b5c7bdf1c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0], dtype='float32').reshape([17]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_239e617c1b7e9e8e3320d2f19203a23a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0311368f5e8300e40600799b5c7bdf1c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0], dtype='float32').reshape([17]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5b82a6cdc7894b94faebbc71f54bcf6c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_33b5c6082ddd5dcd20b4f4184fd1a306(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[68], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6fb1e0bf6a77eae29c02e959fba6b838(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_33b5c6082ddd5dcd20b4f4184fd1a306
-    def get_inputs(self):
-        return [
-            paddle.uniform([68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bf2b722c168d09ae34041790eacd2a72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e9221ed9eb8592f088df67e050d92a00
-    def get_inputs(self):
-        return [
-            paddle.uniform([68], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7f54a117e3dfc66256bd7d727348cafd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[34], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c53755aabdef581a6e114a7f252eb9c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7f54a117e3dfc66256bd7d727348cafd
-    def get_inputs(self):
-        return [
-            paddle.uniform([34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_781554fae082d67ffe651e8bbcaa1c94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b395bf4de92806cef3841fa70edf552
-    def get_inputs(self):
-        return [
-            paddle.uniform([34], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e373054e34fcada833dbc73da8ced72d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[17], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_171f720e5133572e580b9d5599827c43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e373054e34fcada833dbc73da8ced72d
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0], dtype='float32').reshape([17]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_49494c93cc9e2c4da8eaf1b5bab44d70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0311368f5e8300e40600799b5c7bdf1c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5], dtype='float32').reshape([17]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a761e369aef83a6e069e91991e66dcdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a761e369aef83a6e069e91991e66dcdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a761e369aef83a6e069e91991e66dcdf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7682808d5e6343f426546d5b1653e757(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 2048, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_48af82642baeeb9a810bb4dab30f1ef4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7682808d5e6343f426546d5b1653e757
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bb4eced3f61118f9d8fa4e688be83046(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.75], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c09a98420873a6fd5a4418d786c696d3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fa98cefd4368de863014336ff220499d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42f21d71ff64b1d218657a0dddb2ef5f
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_29e1ea53efa83500df7211c196fdd1bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5688f9fd101075db7214cae53e06c706(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fa98cefd4368de863014336ff220499d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_42f21d71ff64b1d218657a0dddb2ef5f
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_29e1ea53efa83500df7211c196fdd1bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f9a5c725be91d3bd398a44ff08fd1d34(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.17713594436645508], [0.01181112602353096], [0.010422749444842339], [0.025402620434761047], [-0.03610027953982353]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_839ff7af72851c6d45bdc63b78b6cb63(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.11383591592311859], [0.0430082343518734], [0.07520538568496704], [0.046987924724817276], [0.018059460446238518]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f1ff1083b4c78737da1064076844c7cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.5560637712478638], [-0.725375235080719], [-0.8614094853401184], [-0.45937982201576233], [-2.9989676475524902]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_544892c974ae0186443d9c4a729cf731(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.44393622875213623], [1.7253751754760742], [1.8614094257354736], [1.45937979221344], [3.9989676475524902]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_066290e400a309599edf8c14cfc4a104(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 2, 8192, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3e050ad7a8443126ec3992858074fff5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_066290e400a309599edf8c14cfc4a104
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5141611d700ed69216f5b5f2e72f72ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0], dtype='float32').reshape([16]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f5cbda016974ee844142fb24ff82079b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5], dtype='float32').reshape([16]),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5141611d700ed69216f5b5f2e72f72ce(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0], dtype='float32').reshape([16]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f5cbda016974ee844142fb24ff82079b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5], dtype='float32').reshape([16]),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bc5f56dc0dda05b9a029a799112d0fb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], dtype='float32').reshape([8]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99287cfb36ac4da88774785208475b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5], dtype='float32').reshape([8]),
-            paddle.to_tensor([128.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bc5f56dc0dda05b9a029a799112d0fb3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0], dtype='float32').reshape([8]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99287cfb36ac4da88774785208475b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5], dtype='float32').reshape([8]),
-            paddle.to_tensor([128.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a37d1b7357ec9ea86999ee640ed05cf3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5f8d070f71a65ad111798d37dd9aa7c9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 2048, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_98d4a923f3851a1d3fd1a769bf8f0abd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d96451fa931d16b878746c7ee8f7e98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d96451fa931d16b878746c7ee8f7e98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d96451fa931d16b878746c7ee8f7e98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_88c27cfd227047ef169865567f91f8a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7682808d5e6343f426546d5b1653e757
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2048, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d843facdbe21cfbc0dd5d7f8aff0cfeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bbca83be97e4b19f2255d70ac362826b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d5f9bd71fabbc72e3807e6e4c080102
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d843facdbe21cfbc0dd5d7f8aff0cfeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 128, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_16abb8e7dedafb807d1765c213c91c98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4f123dd06b00a45164e972ee678e425d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_783b94dcaff2575db6fc483d4b0b0045(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6eae9e93b9cff084a224478ae527e4fb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1cf814b543620e69c96663c8ed99f745(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f442cbb8d09af876ab5d971a7ceca2c7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_83955a815db001e47a64588ac59a547e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.28384605050086975], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_beb38f1c575cf27278cdd4de739d7d44(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.16771577298641205], dtype='float32').reshape([1]),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_145d883b80616bae7945c7a79b579a10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.37778210639953613], dtype='float32').reshape([1]),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_efaf4d1759cd24c4aee9d7112d826bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b6147eb9e3d4540fa230991620e9845
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1025, 1025], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dc126e694af0c17c5a01a6a752f8bdbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2634f7d2d0f369a2470a3b7d05e1c581(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d09c1660cd2ad2a76fdc80dbc1d5524f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int32'),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_38cab747cbb26ffe957b9cfc2c05fd08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_38cab747cbb26ffe957b9cfc2c05fd08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2e1954d85fab64f697ed0a3bdd848e84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d22571079bb63d692dc443cb6d6b7e74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_33503302b4c76e262ffc5d0e841fffc4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2390, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6472dea666d0923af518b75116a7fb4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3ff4124a8a42987f3498e0310e26c0db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2390, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3ff4124a8a42987f3498e0310e26c0db(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2390, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_646b80dd8d4fb5cc49b184dbe713027a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_646b80dd8d4fb5cc49b184dbe713027a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c597d4bd76b962ff668fa1a296604384(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d8ef2822632853946ea97f19423fb4f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_caa4756eb49831cdad41a129be06707c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3090, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8764a14bc6fbf7576bce41675c17ec0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4976e9e05ef45cd7883353bedb0ec6ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3090, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4976e9e05ef45cd7883353bedb0ec6ed(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3090, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b72329d31aa8590bde6c86b8beac92de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b72329d31aa8590bde6c86b8beac92de(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e241f8c58c6dea68e4157dcfd8c7a72f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cbece7dd24cbabb2ec32240208330cb1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ae768b7a761cf19d6ac9a37faca69efc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3748, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8065e8c389bcf09f671c90ccc6d7fe54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_233e5f420c23f57333ae39dcc1776714(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3748, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_233e5f420c23f57333ae39dcc1776714(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3748, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26dac50cfdf7f51de15995599ccc9dc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_80dedf1aea8a4e982786ae05219b1f07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d5f9bd71fabbc72e3807e6e4c080102
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26dac50cfdf7f51de15995599ccc9dc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16, 16], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7394c593833e499967e8bb817ad53a5a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([256, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f14feaa466f7473d969bc71467f70e94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.uniform([256, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([9.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eb8b90f56d461f2a94724f0fb78fbe19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e897d27951d2dca0e85ec5790a6e446b
-    def get_inputs(self):
-        return [
-            paddle.uniform([256, 5], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5d487cf1b57f98d236eed82908f0fbbf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.925, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_deb17d9cf9ec846d3cf528317116be82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d487cf1b57f98d236eed82908f0fbbf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[[0.5110663771629333]]], [[[0.31888362765312195]]], [[[0.7183902263641357]]], [[[0.2893800735473633]]], [[[0.7030211091041565]]], [[[0.4529896676540375]]], [[[0.27740633487701416]]], [[[0.12306185066699982]]], [[[0.9304184913635254]]], [[[0.5781911611557007]]], [[[0.971562385559082]]]], dtype='float32').reshape([11, 1, 1, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4d7dbe82a2b84077755612259360f4c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 80, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0810799598693848], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_449996b1c13a28ef1a1e6fab04e4cf73(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d4ec0bb45ad0baf5f76c39400fc3d901(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b69b2a941125bd4fff9137864f4eef5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a145d1a0738c95ec3acc2366fecd6d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 1024, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5f70510f7450b4c570c1e54d7d4cd0c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5311636ee7d398a450debdea9c5cbfc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([247], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7e74d5b9bf59624692482eacb60dfbd4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[152], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3d77bf48475521352623e55921847244(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7e74d5b9bf59624692482eacb60dfbd4
-    def get_inputs(self):
-        return [
-            paddle.uniform([152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_faaae291c89467569f79fb9332868a59(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[152], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_63a4f84aa01c6336bf25a941982c6d08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_faaae291c89467569f79fb9332868a59
-    def get_inputs(self):
-        return [
-            paddle.uniform([152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_3b228569227788973e7076bc46119e26(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c90234efbbf024c357d560b9999dbd2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3b228569227788973e7076bc46119e26
-    def get_inputs(self):
-        return [
-            paddle.uniform([100], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5755eda1f828a71ac2bb3fa3a87ab770(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_85b70b091c477006d1ecf77aa485c07f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5755eda1f828a71ac2bb3fa3a87ab770
-    def get_inputs(self):
-        return [
-            paddle.uniform([100], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_1a9f6fa82df50ed4e89f4f8ed3c739a2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -32, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100, 152], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_472035a747dc0aa286c308c6ad5260c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a9f6fa82df50ed4e89f4f8ed3c739a2
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_472035a747dc0aa286c308c6ad5260c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1a9f6fa82df50ed4e89f4f8ed3c739a2
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_37921c57166772a90456c548046e0e4c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 32, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100, 152], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_de84c06dd03b184c8f956147b7345d3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37921c57166772a90456c548046e0e4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_de84c06dd03b184c8f956147b7345d3c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37921c57166772a90456c548046e0e4c
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 152], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_1b60c763cf6a1dcb445bf5b3ddba9d12(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[76], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bf4cd7f5288014b52f3ca0f47b7082b3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1b60c763cf6a1dcb445bf5b3ddba9d12
-    def get_inputs(self):
-        return [
-            paddle.uniform([76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_b6a4243a8813d897a44e3638e49a9fad(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[76], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_13b1c38022afbe81c155dafe889857bb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b6a4243a8813d897a44e3638e49a9fad
-    def get_inputs(self):
-        return [
-            paddle.uniform([76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_ee6d740198e369f6d89e538d31cc4dac(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e504945799d3c9a57e4e0d64dbf0601d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ee6d740198e369f6d89e538d31cc4dac
-    def get_inputs(self):
-        return [
-            paddle.uniform([50], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_fd919a2f39d9d308a1a49f82d5d128cd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_47d20b8c17fdcaa24b1fc7a7bdbdcdba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fd919a2f39d9d308a1a49f82d5d128cd
-    def get_inputs(self):
-        return [
-            paddle.uniform([50], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8cd57fc586e62e400c03a3908704d831(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -64, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50, 76], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f824fc370f36e0479117ac554f158d5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8cd57fc586e62e400c03a3908704d831
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f824fc370f36e0479117ac554f158d5c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8cd57fc586e62e400c03a3908704d831
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_cabe26f84410859dbaddf0eac846908e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 64, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[50, 76], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e1f5eaf2e3f4df34afd8bad07177f586(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cabe26f84410859dbaddf0eac846908e
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e1f5eaf2e3f4df34afd8bad07177f586(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cabe26f84410859dbaddf0eac846908e
-    def get_inputs(self):
-        return [
-            paddle.uniform([50, 76], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_2eaac3fb0476c20293980a536c185087(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[38], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4c0a48e0f9a5ba1d5f24ae43c5541223(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2eaac3fb0476c20293980a536c185087
-    def get_inputs(self):
-        return [
-            paddle.uniform([38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_ff07fc8d8a0a9e01b89def50cb63da97(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[38], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_775c09a20e32092ea363c8bad8a0ad08(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ff07fc8d8a0a9e01b89def50cb63da97
-    def get_inputs(self):
-        return [
-            paddle.uniform([38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f76b77f45738ca9ed91b978440476d48(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_eff9195c8cb8507ce1a25037a0aa742f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f76b77f45738ca9ed91b978440476d48
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0], dtype='float32').reshape([25]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_530f73bb2a01b2c53db35654631b1ebc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_7502e4ee916cf6e2ed836861acc7f35a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_530f73bb2a01b2c53db35654631b1ebc
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5, 19.5, 20.5, 21.5, 22.5, 23.5, 24.5], dtype='float32').reshape([25]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5743fb153583a117d383504af8e9af23(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -128, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25, 38], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_40f852d1052c56ef2fe88c569291795a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5743fb153583a117d383504af8e9af23
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_40f852d1052c56ef2fe88c569291795a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5743fb153583a117d383504af8e9af23
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c9b3bd8bf666a588ffb398384c3b379d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 128, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[25, 38], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_97e2b1c7675640902943c34129586a58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c9b3bd8bf666a588ffb398384c3b379d
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97e2b1c7675640902943c34129586a58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c9b3bd8bf666a588ffb398384c3b379d
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_85cd947ea62c1921e63a86db0ea7efb2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[19], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d7eabef8d485fa249a688046d1b7d8ba(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_85cd947ea62c1921e63a86db0ea7efb2
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0], dtype='float32').reshape([19]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_b30facf4c5afc2287577bec0afefed29(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[19], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e47ee3aa2343f9b9143d24ba01467e69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b30facf4c5afc2287577bec0afefed29
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5], dtype='float32').reshape([19]),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_dccd5293612feb652c792c547af6c471(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3b454d8c2b06a36cb78145cfc52e40d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_dccd5293612feb652c792c547af6c471
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0], dtype='float32').reshape([13]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c5bc633f1d9122996518e2c450bbffa1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_045439e8437fad5daa039824fd9d57e2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c5bc633f1d9122996518e2c450bbffa1
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5], dtype='float32').reshape([13]),
-            paddle.to_tensor([64.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8212f75369683688e39183e264047c0b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -256, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13, 19], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_26b12c9e3ba2cb55eacad0e95402c9a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8212f75369683688e39183e264047c0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26b12c9e3ba2cb55eacad0e95402c9a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8212f75369683688e39183e264047c0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c3836937c999df7482aa8e4d0675ecb9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 256, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[13, 19], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ce8c3ac4af42e6d451f4ecb6f049a3b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3836937c999df7482aa8e4d0675ecb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ce8c3ac4af42e6d451f4ecb6f049a3b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c3836937c999df7482aa8e4d0675ecb9
-    def get_inputs(self):
-        return [
-            paddle.uniform([13, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_926342d73fb71f40207de21ef2cde0bf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_497c6bda950bc99f455bfc0d819889a9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_926342d73fb71f40207de21ef2cde0bf
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0], dtype='float32').reshape([10]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_498f07b19c75a46fdf5d2b261bbd510f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1124a273d03c19c2ac7e9d2d184e4726(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_498f07b19c75a46fdf5d2b261bbd510f
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5], dtype='float32').reshape([10]),
-            paddle.to_tensor([128.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_97c344ff0d38ad7e4bd5cd96a431b4ef(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e69d13d8c5eee7c16b0b43bf78481320(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97c344ff0d38ad7e4bd5cd96a431b4ef
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0], dtype='float32').reshape([7]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_602b9f17491ca3bc76dc0f385aaa87db(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_abf3195fad34f0023f9f70236d50be98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_602b9f17491ca3bc76dc0f385aaa87db
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5], dtype='float32').reshape([7]),
-            paddle.to_tensor([128.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_3ce8abfe8f28e5405912abb2476b8f95(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, -512, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7, 10], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_af05aa9cd60d715b24778757b54dce82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ce8abfe8f28e5405912abb2476b8f95
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_af05aa9cd60d715b24778757b54dce82(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3ce8abfe8f28e5405912abb2476b8f95
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a5f3a8932b4f4ab853c6d119c81dff77(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 512, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[7, 10], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0218acb562ca31dbe9741bb1efebece3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5f3a8932b4f4ab853c6d119c81dff77
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0218acb562ca31dbe9741bb1efebece3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5f3a8932b4f4ab853c6d119c81dff77
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 10], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6cace5d5abfae5e10d7bb959e485d915(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 128, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_957392cba0ec1940cbaf467412bb652a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6cace5d5abfae5e10d7bb959e485d915
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_40e638a545923bbd854852fb93954c00(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4d4dc2965698bbfff26e52d07448b60b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a7092c3093f63acd441079bee597e041(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b2435231cb0b72f5bf9fbe721fbabae
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([20]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7a85161823970292fffa45dd96386d0b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2.055016279220581, 2.0510284900665283, 2.0751125812530518, 2.176133155822754, 2.103036403656006, 1.9587008953094482, 2.117344617843628, 2.1073896884918213, 2.09193754196167, 1.950181484222412, 2.0166923999786377, 1.942618489265442, 2.137247085571289, 2.0493340492248535, 2.1156370639801025, 2.1554460525512695, 2.185647487640381, 2.101196050643921, 2.0976219177246094, 2.1388742923736572], dtype='float32').reshape([20]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ecfc9cd698bd680a7ee37b4f2804b843(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2.6007845401763916, dtype='float32').reshape([]),
-            paddle.to_tensor([0.25], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_27e3cc44a370bfc6c5cd9ce623c689ce(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 5, 4096, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_df0bf7534f4a39a1f7d8b061ccaee5d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_27e3cc44a370bfc6c5cd9ce623c689ce
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4e5d757abcffe63788b0ef822bbf1c62(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_27e3cc44a370bfc6c5cd9ce623c689ce
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 5, 4096, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_078606ea46220b7a2ea0692e9320c040(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(371.2590637207031, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f6cc3ffd20a1566be5d122edeeefa29f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a145d1a0738c95ec3acc2366fecd6d2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8, 512, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_899e5ce75f63fc7b0f54198116dcecfd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.08053532242774963], [0.003142738714814186], [0.08117058873176575], [-0.04404306039214134]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f29bd288f21b690e958520de95934201(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1811779b2a5c416b22e37c688b06c8c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.005513290874660015], [-0.006854535546153784], [-0.012349440716207027], [0.01729443110525608]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4da17aab4a68ba51453b7124c548351d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1255f7a4bcebf297eee2ebc8e49a136
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[13.607486724853516], [-1.4584904909133911], [-7.57281494140625], [-3.546661615371704]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e1bf6424b12ee499b320f1299f80c73a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b4e3ffb4da18304ddf9f1e56baa2416
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-12.607486724853516], [2.4584903717041016], [8.57281494140625], [4.546661376953125]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([2.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_027d47ab7388419df1e35b3e27463a52(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([70], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_39b49a071e393ead1d05eda2820e96ad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(29.20802116394043, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_648d79f97cba0397cdf9583a0d8e4753(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8b9c3e62b05bfc6cd607c3af196c561e
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f902490c41039fc84df3624c2f0eb678(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 40, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0526299476623535], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e0764ffcc82e2fac590d5162f4a1bcb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e0764ffcc82e2fac590d5162f4a1bcb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ee2fb39690e7391b31b3fcb405844e93(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fb235ac877b752bf36cfc9b57b96fef5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1d7a239632f2bbe53052fed584fa1901(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2031, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7ea2c99ab9d33a38fe8171947b9d5931(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1fcb650f90ee32e0bc03ac9b5d5a944f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2031, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1fcb650f90ee32e0bc03ac9b5d5a944f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2031, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ec2905907300b200db91e8cb3918d621(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_06f90143b8ab9d69120ff1073a9dc131
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 16384, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_56a5f2db30fd4b0714a8deff75ca2a6e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_066290e400a309599edf8c14cfc4a104
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 8192, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0e4788abf81964905d04a1c809a07aff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_65e62d76aa6ab5bfd43e8e94ed365440(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_ccf84142974138841b80fa5a1f911d0b
-    def get_inputs(self):
-        return [
-            paddle.uniform([86, 3, 197, 197], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_00f12038eff5bacca8f01b1461e89088(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_07da1b56c4289e55404bebb46f57a9ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 32768, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd974b6e350999fcd9c1adec4a01251b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1e784cf8f1a282baffbfa44b5241b877(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5d5f9bd71fabbc72e3807e6e4c080102
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd974b6e350999fcd9c1adec4a01251b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a5979570d19df229baf6bb203b1dfcfa
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2, 32, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5b2beaaff5d49b678e4d0044967b0344(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9600213b2b5203ea1935105a0554dbf7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b8193bb6433511d16a561cf11d8367f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([551], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9967ca72578dd8ef3e14c36b7f9d35f1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[72], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1e42b9f37300328bc546260cad36311f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9967ca72578dd8ef3e14c36b7f9d35f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([72], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_13b972edb47b6d983dc2f354bf4fca05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9967ca72578dd8ef3e14c36b7f9d35f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([72], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6757a10f49dd3c5dedfad8c4ebb646bc(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[36], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_73ebf17bea752066c844306b0bf2d61f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6757a10f49dd3c5dedfad8c4ebb646bc
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b524bd9d1a6b8fbd43c50887393c3dc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6757a10f49dd3c5dedfad8c4ebb646bc
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5fba441d1e8e41bfd01c2535838fdf58(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[18], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_209f7ce44af0acb2c5b01e3c33e5bb1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fba441d1e8e41bfd01c2535838fdf58
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0], dtype='float32').reshape([18]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_58bbdf71533ebb929305aa568288edcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fba441d1e8e41bfd01c2535838fdf58
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0], dtype='float32').reshape([18]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e422b9fa52ba59149e6ae38ba5277ffe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b9908f0f4dbc186c67d7a4948572047
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6804, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_7777138a7c1729c3de2464c2da242473(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[72], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5d2f11747180d586348616f938df2b9d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7777138a7c1729c3de2464c2da242473
-    def get_inputs(self):
-        return [
-            paddle.uniform([72], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_13b972edb47b6d983dc2f354bf4fca05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9967ca72578dd8ef3e14c36b7f9d35f1
-    def get_inputs(self):
-        return [
-            paddle.uniform([72], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_64b358990ae4cc63a7581fb78595c31d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[36], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4bce05b28be8849111aadbe1a45b6c8e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_64b358990ae4cc63a7581fb78595c31d
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b524bd9d1a6b8fbd43c50887393c3dc1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6757a10f49dd3c5dedfad8c4ebb646bc
-    def get_inputs(self):
-        return [
-            paddle.uniform([36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_1d30cf08f36479f751b3b34565d68667(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0.5, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[18], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_bc764c5c16a091f84fe028f98b70c5b2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1d30cf08f36479f751b3b34565d68667
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0], dtype='float32').reshape([18]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_355a82ae40b18f1e6f9ebfbb89d31790(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5fba441d1e8e41bfd01c2535838fdf58
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5], dtype='float32').reshape([18]),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8484e45211c53e53a5cb57644f9f6562(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(134.06610107421875, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_14fb084bcc869b151529c0927a8afdeb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(4.164661407470703, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1cf814b543620e69c96663c8ed99f745(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_48a8a2869d47ae2d59b077d900ed3ac3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5f72d3a7c9eeed9fa2f58c2e1e63c270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9d5ad4d27e5434eb5bc012aa5880a256(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        return paddle._C_ops.scale(input_0, input_1, 0, True)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 8, None, 32], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_35e8ee17faf13989d562d6f47bb1bf89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d5ad4d27e5434eb5bc012aa5880a256
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 160, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5dead5fafb19f294ddc54ffa5e299325(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4e4922968922a1a6756c98fbf770d107
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6, 1174, 1174], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_77663c9ececcd0cf1207f3f9817844a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([3800], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d96451fa931d16b878746c7ee8f7e98(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_7b0be87a58810bed51f2f3b6995e9ef2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1ce50f6c2e2b76acad44c8afab79b274(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([2204], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ceed4979b7bffd85870a207cc3ec8e61(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03ab246f0ef50d2f39d167b82cfcc661
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 128, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.111109972000122], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_aaf9eb01860bac2d07fefe1b5ccbb9f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e05a45b5dabc87aec71a5d78abb25a5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e8be4fab207da0540c569eae7a0981f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a4634b5283312aa3b3fdb1d88e75831f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(37.07286071777344, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_24971a95fd7ed8e62effa7fc3ccbafd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b28c88138bdc7a3e8bb4216d76f6e4d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f30e0de8efeadfdbb5fce97927bae147(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f30e0de8efeadfdbb5fce97927bae147(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_95864ebc6da496802f63c6f82174b6ba
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ae4ee68a38fc001cbb7b86fde5f8982e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bce202c470bbbf07a610c93dd97477d6
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6890e4667ee7fa8c1e4b50a8fe238d0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52c1c16ac8d019b900f1c735a7d7334d
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b894804dcd8d0a1b5d8568cf3e44d722(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_86299bdcdf08bf954fc6518b813b5b7f
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4205, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f67349edb4df4bb4474c89aa9bf44f83(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_626de8f444c822bb894fb31988f051d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_92eab762bc201272c555272362aea530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4205, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_92eab762bc201272c555272362aea530(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_71bd1f02664b7f7df6bc8e3f5c3bb387
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4205, 4], dtype='int64'),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_02e6832d100596eadba4367a480c72cb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6b6147eb9e3d4540fa230991620e9845
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 12, 1174, 1174], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_93104c38c3091acd9b13b312e1300936(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aea8ae797393ab8e346cadca33845a8b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 65536, 1024], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.125], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bac8e1ea4605c244e39373fee1a17d75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(135.9326629638672, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dc434d705b898b9a6506a988d330713b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(5.320974826812744, dtype='float32').reshape([]),
-            paddle.to_tensor([0.00390625], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_97f9d1937249a96b510c38034ed3bb7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_52d4dd59305a9f8794d7b34f7542cc33(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([32.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b2342d6bed12006e2a9f4bb467835265(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ade2bcd145584cdcb79b6c9762a29444(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([16.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c436de5f23112c51a72421541a4cae6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4526b35f2d10614b12d93f6b96e2ec89
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_083b4d3efaf3cf209b1d805420a3eb94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e64fa8c8e1a2e2bcfa7741a33ad3ec
-    def get_inputs(self):
-        return [
-            paddle.uniform([128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([8.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_706ff3d631b9c5268eed10b41b3142ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9d5ad4d27e5434eb5bc012aa5880a256
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 50, 32], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.17677700519561768], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_24971a95fd7ed8e62effa7fc3ccbafd0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7d7822d1fed62091719529c0ea5eb7c
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ad1e091cd24dceeb0a3930800227a83f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0884743459f4915d82904c5015982b8f
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_295b1f166c8ce3f95b87de38ce76daa1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9af9938a4076cf462823909dc39afd33
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2.5], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7cfec599bedb52f4f0ed0968f8a68f74(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_699166084feb39f20e7855e1829a3ad4
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(34.48212814331055, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
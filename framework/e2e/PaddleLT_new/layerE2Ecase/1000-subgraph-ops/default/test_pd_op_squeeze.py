@@ -1,1952 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d02a1848d5ca02166fb3a8186b9d9a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_2c4f84237aa3858793791f13dde2abc6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5c67f99cc8f37dfbd4156740f7b6c9f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_d57f10246f1f7a849bb726b9624fd5f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_633638e839e08b5e060d31e75f814e8a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_acf4ea6d155f1545b7e3b40c52e5ad0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_37520fc006096a23477a87de152a3891(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_027f64f81ca35f7ab07039b2a26b4bb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1bc83da74d84597326f427feb320ab24(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c5824d76915ebc380ff92cceb95de2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3800, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_498503e4d8efbd7cb9f2fbbe289e3eb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[150, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9cb51858915566a4999721deb1781d1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9cb51858915566a4999721deb1781d1d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_23b3da102bdbbdaf34df470c8ad724be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[40, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c5824d76915ebc380ff92cceb95de2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3800, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_78e64cc05e12802c25314f6f69f64e77(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9c2083ba473eb1b41ef316ece34081da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[1.9313265085220337], [2.357778549194336], [2.267331838607788], [2.2795844078063965], [2.010868787765503], [1.9143667221069336], [2.312474489212036], [2.0880370140075684], [2.092761516571045], [2.171534299850464], [1.8332440853118896], [1.8002440929412842], [1.8413166999816895], [2.037410020828247], [2.1291356086730957], [2.0480966567993164]], dtype='float32').reshape([16, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b949476d6e6d0d9ca496be1abfe4e4c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[1.9542105197906494], [2.2515485286712646], [1.8974164724349976], [2.0332117080688477], [2.065920114517212], [2.193167209625244], [2.1452512741088867], [2.082914113998413], [1.97029709815979], [1.9159406423568726], [2.2288293838500977], [1.9541637897491455], [2.0449936389923096], [2.0640869140625], [2.122668743133545], [1.8684662580490112]], dtype='float32').reshape([16, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d9431c7c004d51e948195f7d2bd1f6f6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ed1fbe3b52affa7297d7ae3a8410fb86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_52928ec07d2cc026a64c4f5153865e10(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2aa3adb1c6034d785d8ef6c1f571f5c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 18, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2aa3adb1c6034d785d8ef6c1f571f5c1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 18, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_cc670791aad42956455fb17e210b46fd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, 1, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c9b3e9c932ee2c7ad4f1bba3fa615d1f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc670791aad42956455fb17e210b46fd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1, 66, 130], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_83a594b933525716fa07a8e82f414c80(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e9af9f5f0733004d106d41aa930fd0be(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0b51af733929daef62af5beec0619da4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2575c2042ae70551826738ac5548dd30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2575c2042ae70551826738ac5548dd30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ee283e2608d290a7d25b90762fed677f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9fa1ccba15916184681337eedec4f546(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_c4e5d3fbda82bf86b366d04197c019e1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b09608854256e15c38922d860dd00aaf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4e5d3fbda82bf86b366d04197c019e1
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_027f64f81ca35f7ab07039b2a26b4bb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d95d8d7a87c03218c7726d4607cb6abd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_868f3b9b99c9e311d9bcc28c3a686ae9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_868f3b9b99c9e311d9bcc28c3a686ae9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_19737372bda72f233ad75b88ee6f5d1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.uniform([36, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_19737372bda72f233ad75b88ee6f5d1a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.uniform([36, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0fd6a2f90079f8bb537963df203530f8(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000, 1, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fed3074f3fff1c8e43bf706adcfffaae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0fd6a2f90079f8bb537963df203530f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_acf4ea6d155f1545b7e3b40c52e5ad0d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ac1f9e6444044d7128b28e6e5a35fc1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[15200, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ac1f9e6444044d7128b28e6e5a35fc1b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[15200, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_724293786859a748a6fd0be84374c10b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_20da8dd4afc90e36966047941dbad075(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 1280, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_15245b7f948513c8299e4842c9a2653a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0fd6a2f90079f8bb537963df203530f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_42d8b35cdd0ec73bea41a1547d010966(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_96b688dac80f3eb269517e1be9a318f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_96b688dac80f3eb269517e1be9a318f8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8b3087c56495ddca1cf9875820e2e405(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e07abea0e097de8789693125a44aaf7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59279925799d0eb3ec062ec5138ce17f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9fa1ccba15916184681337eedec4f546(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_7deb92c219d5256ca6e40836c52bd266(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1536, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_23320bc25de9752e16c3a150e056619c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[2.155299663543701], [2.127903461456299], [2.092061996459961], [2.2456891536712646], [2.0062496662139893], [2.1588125228881836], [2.184248685836792], [2.2017717361450195], [1.9601012468338013], [2.0094528198242188], [1.8388959169387817], [2.111158847808838], [1.9217698574066162], [2.2436141967773438], [2.0422940254211426], [1.9107041358947754], [2.0932178497314453], [2.2492575645446777], [2.282749652862549], [1.9342312812805176], [2.0746495723724365], [2.0994317531585693], [1.8970482349395752], [2.2481303215026855]], dtype='float32').reshape([24, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_31ac6246cb168520026c25875b55e43a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[2.2614030838012695], [2.3531107902526855], [2.061070680618286], [1.9574167728424072], [1.9233795404434204], [2.215851306915283], [1.8629826307296753], [2.046051263809204], [2.1637990474700928], [2.271042823791504], [2.219791889190674], [1.9951488971710205], [2.2989611625671387], [2.2857558727264404], [2.335562229156494], [1.8782644271850586], [2.309227466583252], [1.9977295398712158], [2.082630157470703], [2.233391284942627], [2.110212802886963], [2.144787073135376], [2.0895724296569824], [2.010680913925171]], dtype='float32').reshape([24, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_455979436fac4295fe8497d472e13815(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1a948193bef33274ec134048afa9c1e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eafcb8cd514386bad3e5ce0258e10c84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eafcb8cd514386bad3e5ce0258e10c84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e0846c7684b916fabea4763a048271c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_8ccd739786607d58d4bbfbb290b28f41(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1536, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fa4e64362b359795bb9803a8c2c86ff2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[1.866011142730713], [1.9389455318450928], [2.0601091384887695], [2.358898401260376]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_de070d76ed2ba498ae9af239765e8b2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[2.287076711654663], [2.1407384872436523], [2.079587459564209], [2.1326074600219727]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d144f88c913872e9c8f582797434c04c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc670791aad42956455fb17e210b46fd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1, 70, 134], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0b9c265f01c2076027d7561665dfd333(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 512, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9ec9a0e702d74b0a40276413d1a07f3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b9c265f01c2076027d7561665dfd333
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1, 104, 101], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f4785530c233413400950a106e453b60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2204, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_13cf2fdba0205a3281445927f771d739(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_050e5a8a5bb54220ba1cec0de11baa3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc670791aad42956455fb17e210b46fd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1, 68, 132], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7ff158fbca0155900f880c84db235a10(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0fd6a2f90079f8bb537963df203530f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_218c4494abc250af898b1ae4e5b77be9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5f388df4e596c33c976dd63d2f2491e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 36, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5f388df4e596c33c976dd63d2f2491e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 36, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3c7212e8f28692281b1319c7eb381917(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[70, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_389afd1dd492dfab1c748acff234d57f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_fdf8546a93b9ee8b6b89e89c8aef28a3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[551, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8b3087c56495ddca1cf9875820e2e405(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_27938a289f06668af76155ecf1906743(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[247, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_82132ac87b82f0c0eaba83c397372c7e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2048, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a9cf09addaa04b38edc96411e2c77ab8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[950, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1773a8382c591396f7d33ddc183abce9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1773a8382c591396f7d33ddc183abce9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_12604e1ace86072f673bb4e46237df11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[8816, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_95eb5635f8755c474310334f771c60ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_95eb5635f8755c474310334f771c60ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_2526e2c7c591294574e694cd0c81443b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cec1809736ae1ee0f8d1c5d6c8dc429e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2526e2c7c591294574e694cd0c81443b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 96, 1, 40], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_cfd01d2a8f5138acb253ca55a683695d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e83951f4f1981c5172f98fadf024f984(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cfd01d2a8f5138acb253ca55a683695d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2434, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5548561f02ed944473c4d243fb2b87a0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, 1], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1a4ce437edea428217ab8102f998646d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5548561f02ed944473c4d243fb2b87a0
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2434, 1], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f1c5ca6746a5bd9f774671e23a537a88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f1c5ca6746a5bd9f774671e23a537a88(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b5e5294265420481fff475122bca85d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b535da8e145ffd1264a02410455b25f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c4e5d3fbda82bf86b366d04197c019e1
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0d925a93698fe72157fdcb2ba59a8b70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cc670791aad42956455fb17e210b46fd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6d85ba816bc80217011b940107155cc5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d83bcb75abe5beefe1fece92e65ccea5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d85ba816bc80217011b940107155cc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_d4e645242c4e6bc692930427e7c6959e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle._C_ops.squeeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1000, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_2580892d4979f933248b8355e1fef22b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4e645242c4e6bc692930427e7c6959e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_406c95b232e955b0bbb3183301eeed38(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_942d023cd1989f57888d1df5d426686d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_75086bffff941486531f4ce14035e23b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_bf1adc534e1be1bd7c1b09832589d465(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_775c307b775915eff8b5622d87c4d9c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 9, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_775c307b775915eff8b5622d87c4d9c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 9, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_99947f65aa501eb5cdb825c7cd43e0a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_99947f65aa501eb5cdb825c7cd43e0a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_58f9789325cce60558f8d6f472ce0eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 96, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_58f9789325cce60558f8d6f472ce0eda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 96, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2bd905a7b03c91fe1c285ee403f07483(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2bd905a7b03c91fe1c285ee403f07483(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1f8b10eeead8487dfe561587b97cc96c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1f8b10eeead8487dfe561587b97cc96c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51fc2bb09894eba54389375ad0e4ed6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 24, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51fc2bb09894eba54389375ad0e4ed6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 24, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_896782d129e68899c63275701e39010e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e23f11bac0890bbc9b94f2bef4ffbe15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 48, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e23f11bac0890bbc9b94f2bef4ffbe15(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_52928ec07d2cc026a64c4f5153865e10
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 48, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_539d888fd1bdf4e5dc3d7f40a38360d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b51af733929daef62af5beec0619da4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c945acbad4e64446053aa4f56ef50e57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_797720d57a98409f8e5fdffbd989bd1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e8f863b2cf17d20ceceb1bbf5346c014(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2526e2c7c591294574e694cd0c81443b
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 192, 1, 25], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c19943e165716a2469447c5372142c97(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_32cc71a90dc6092cc6d792f7e3fbd896(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_905977c473a535ef6c134004e5baf41a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[2.0777587890625], [2.0595974922180176], [2.1112780570983887], [2.196075201034546], [2.2804276943206787], [1.8491451740264893], [2.0108838081359863], [2.1082522869110107], [2.198577642440796], [1.8796778917312622], [1.9906038045883179], [1.93548583984375], [2.2058911323547363], [1.9823532104492188], [2.108671188354492], [2.2810447216033936], [2.186410427093506], [2.109078884124756], [2.115388870239258], [2.126674175262451]], dtype='float32').reshape([20, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_236995132518015b5285130b2474ff50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_78e64cc05e12802c25314f6f69f64e77
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[1.8801006078720093], [2.027472972869873], [1.886061668395996], [2.1421492099761963], [1.9245673418045044], [2.1227405071258545], [2.3279428482055664], [2.049586296081543], [1.9850521087646484], [2.1254210472106934], [2.1525514125823975], [1.9545471668243408], [2.068394422531128], [2.1179118156433105], [2.2178049087524414], [1.945752739906311], [1.9815173149108887], [2.008840799331665], [1.9969098567962646], [2.2115871906280518]], dtype='float32').reshape([20, 1]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_27938a289f06668af76155ecf1906743(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[247, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_389afd1dd492dfab1c748acff234d57f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c5824d76915ebc380ff92cceb95de2c3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3800, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a07de29f63fb404638e8b2af15991261(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cfd01d2a8f5138acb253ca55a683695d
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8732, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b3aa034ded9fb3c1160023fe8ac33fcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5548561f02ed944473c4d243fb2b87a0
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 8732, 1], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a9cf09addaa04b38edc96411e2c77ab8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[950, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bb60ca3b1787b9995dc8c9f18c5bab21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bb60ca3b1787b9995dc8c9f18c5bab21(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c30c0b6e6e174c30c7d3d79ed7c1a95d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0fd6a2f90079f8bb537963df203530f8
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_3c7212e8f28692281b1319c7eb381917(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b7eba55e49ee2bc13b46af6f9ba5c7e5
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[70, 1], dtype='int64'),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_73c2106d0d9c0fedac4676132c46f4d0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_37520fc006096a23477a87de152a3891
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f05861aaac5bbec50703a72538dcd58b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 1280, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a568572e82988630a817fd0a9ade46af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a568572e82988630a817fd0a9ade46af(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_12cce53d038409fdfee3ef122e72ac0a
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205, 4, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9c40abda62298d3a1e8ecdc00ba42935(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_18c7042b8f08478d0f7abcfc2d62d3d9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_24f8592bb0495f18280af549ab903369(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6d85ba816bc80217011b940107155cc5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 1, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d16392bce51af8c29b03fc7ed5c2563c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4e645242c4e6bc692930427e7c6959e
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 1000, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
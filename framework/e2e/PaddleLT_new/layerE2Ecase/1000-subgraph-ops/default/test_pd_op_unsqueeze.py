@@ -1,3337 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return True
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0, 1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_87f89434bb8835eeb00328e569c1fabe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_87f89434bb8835eeb00328e569c1fabe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([24, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_bcdfe623bbc80da97f4b4ae38712eb64(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 72], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f51b148853159d7ca2b8810bba75dbbf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcdfe623bbc80da97f4b4ae38712eb64
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_d91f6229cf39d0855ba6a0dda5a39b1e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 92], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_48e909c0eeb24d861c79821e8df111c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d91f6229cf39d0855ba6a0dda5a39b1e
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_f882ed8a82d554b89c5dec53919ce9e9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 960], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fe3c272fb3ee11575ab0fec8301b830f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f882ed8a82d554b89c5dec53919ce9e9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_9ba7e2138c8a4287d15c87767ebdf245(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 480], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ee20f5c97cefb26242f88530dd11b696(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ba7e2138c8a4287d15c87767ebdf245
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 336], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_33320f24f0a1635d74eab1b146258b2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_4603fed6fe8a43054c47a4534ed7bf64(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 80], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_484a42bb37efc5c8d50f40fab4830bd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4603fed6fe8a43054c47a4534ed7bf64
-    def get_inputs(self):
-        return [
-            paddle.uniform([4, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_87fe4a21c4e317bef4d094684b96b124(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1, 2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a604b4821cfe99ae6f69128095601805(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87fe4a21c4e317bef4d094684b96b124
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.3512340486049652, 0.20144441723823547, 0.4534510374069214, 0.4873906075954437], dtype='float32').reshape([4]),
-            paddle.to_tensor([1, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_a7b6ab04f76328231114fc3301452de9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 2, 9, 112, 112], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_07e6d04a48b25d3e141ed176424c4ba9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a7b6ab04f76328231114fc3301452de9
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 2, 9, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_6638a50c2f65c1ea22c8b73f2bc28555(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ca5b10a5234efe0dbb4c49f9b15bbc1e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6638a50c2f65c1ea22c8b73f2bc28555
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_3530ceeb65538eb17621f2b58fc8e150(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_82d411c5e350fd0d9aa27cd070a8de9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3530ceeb65538eb17621f2b58fc8e150
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 500], dtype='int64'),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_bf8f5a374559483270850abc19c8d90d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be5299f10f90f39db0e7dd26ea79421e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf8f5a374559483270850abc19c8d90d
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 500], dtype='int32'),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_846ab3609ad74f1e78c05edcd81e0318(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 60], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4b20d8c963bc8ffc21357d90806dc769(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_846ab3609ad74f1e78c05edcd81e0318
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='bool'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_81e7f3d90f54e158c62c8aff343baf6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8732], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e3913126375d4179e57ddf5463bff14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_755c16d2efd973cf40e3f0a07571052a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ad3e86e7608ee3a470feb1ccdfa52c67(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755c16d2efd973cf40e3f0a07571052a
-    def get_inputs(self):
-        return [
-            paddle.uniform([21, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_82d411c5e350fd0d9aa27cd070a8de9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3530ceeb65538eb17621f2b58fc8e150
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 500], dtype='int64'),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be5299f10f90f39db0e7dd26ea79421e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf8f5a374559483270850abc19c8d90d
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 500], dtype='int32'),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e3913126375d4179e57ddf5463bff14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_3262e4b2786f72fe30249ef8f22fcd9b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0250c3db18683c2e854e4d917b547534(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3262e4b2786f72fe30249ef8f22fcd9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 21824, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_03c6f267487ebd1bd5bed2860577d7fd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d19ad4d44f48cabc0b85809af6af92f9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_03c6f267487ebd1bd5bed2860577d7fd
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.49721720814704895, 0.058648962527513504], [0.17420677840709686, 0.2730419933795929], [0.12122957408428192, 0.16298291087150574], [0.02071063406765461, 0.09233691543340683], [0.296882688999176, 0.1320924460887909], [0.3168221116065979, 0.38519495725631714]]], dtype='float32').reshape([1, 6, 2]),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_d4e6578ceb2600eb4a49c9afd5ab5adb(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 4, 49, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_081f7450fce8978b7d6ac26e5f6da2aa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d4e6578ceb2600eb4a49c9afd5ab5adb
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 4, 49, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e3bad267721b810d4ea59d71b5500d16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([16]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_827917a30b698482a907a2ce3d1f828a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([16]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c32c9279ac3bff2e4cad9a2cc6a09a94(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 240], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c2f5ee7a8b8cb54ff7b3698c114b0e32(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c32c9279ac3bff2e4cad9a2cc6a09a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_3bf67855c57da80040c586ebfb500bd1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, 19], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_322a9ecf510d14d9fa3397eedb0b691f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3bf67855c57da80040c586ebfb500bd1
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 19], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_91395a1c1ce040995e32bc5c80de74f3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[300, 4], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_e13a2dc78ad02a080e9903ddc8521a4a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_91395a1c1ce040995e32bc5c80de74f3
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_f1491a6faf3586b355f6dd4f6b121002(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6dcf06e0d89324acbf2c0f04110e44ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1491a6faf3586b355f6dd4f6b121002
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4048970639705658, 0.3832208216190338, 0.42839768528938293, 0.13404519855976105]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([-2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_8d82a6c78f10eb16e64cd08fa528d436(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[300, 256], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0d5ec88a0850371337850a8da23dfb23(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8d82a6c78f10eb16e64cd08fa528d436
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_4533994f7909c01ef6ef8c05fd24420b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 36, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4533994f7909c01ef6ef8c05fd24420b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 36, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a2ab071d99006f60270d88a1a38ee62e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3262e4b2786f72fe30249ef8f22fcd9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_34d202c05671c8fef086b3d6fc52005a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a75ff30603cd74ec2ea16b0f4e24ae0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34d202c05671c8fef086b3d6fc52005a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ce83e641d696bf9698a273dfd0b8e1fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ce83e641d696bf9698a273dfd0b8e1fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([25, 38], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_f12fdb2cdfb28cd213ed06ee2cb23a29(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 512, 21], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ab6116a368ab2b9799f35ead309e24f5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f12fdb2cdfb28cd213ed06ee2cb23a29
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 21], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_80259009ba71504c1f4e417fea4bc729(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4603fed6fe8a43054c47a4534ed7bf64
-    def get_inputs(self):
-        return [
-            paddle.uniform([3, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e6d6dd8e0640e6973a68ae30a0134ef0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87fe4a21c4e317bef4d094684b96b124
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4878624677658081, 0.05223489925265312, 0.008530229330062866], dtype='float32').reshape([3]),
-            paddle.to_tensor([1, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_e1c07d27c7c82c4bb8fe28673fa7ad64(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_846ab3609ad74f1e78c05edcd81e0318
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_1ab9a42eb43a3a9598e743d905bff0f9(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 872], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b39d0d61c2746585b796455dbf22d09c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ab9a42eb43a3a9598e743d905bff0f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='int32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ea0dfffecc1d6914a3d29ffd62a65684(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_b198d699a7417f8e2f7a194c397c18ac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1756], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ed30fb4eca53e524037907406b876b72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4b2ceb30f022112d388b814d68b0db76(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 4], dtype='int64'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f99f2dc03bde3409691ec5005155254b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1756, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f99f2dc03bde3409691ec5005155254b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1756, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6309fb19a378e87abf6543515a13a012(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6309fb19a378e87abf6543515a13a012(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([20, 30], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_f057a54a8a3e37b7b8d753953bd9d47b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 4, 49, 56, 56], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_1c9b2a88ca981f8b55a6d29925c9d90c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f057a54a8a3e37b7b8d753953bd9d47b
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 4, 49, 56, 56], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4cce31d4379425f4a85c72cdc0cb06a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_f1a9773c9d4eb35f89ab1bfed8c1155a(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 768, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8c36da633f1c8a2b0bb36e1935118e8b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1a9773c9d4eb35f89ab1bfed8c1155a
-    def get_inputs(self):
-        return [
-            paddle.uniform([43, 768, 49], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_88083e48b3abbddd215602319940ab5b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c32c9279ac3bff2e4cad9a2cc6a09a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_85cefb633311670fd5b2380eb230c0e9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 11109], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_120cefb7d6c782b599f315fd117b890d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([5551], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a58522f2f032f1480252071cb25e23fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 11109], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_512bf0547d7da8c25161ea61146651e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5551, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_512bf0547d7da8c25161ea61146651e4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[5551, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_576a03aded3a441b322563d95af2264e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_576a03aded3a441b322563d95af2264e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[36], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_33320f24f0a1635d74eab1b146258b2b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_468324d038ef45fe9a7bd877c01e86c4(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 32, 49, 7, 7], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6c86fdbd166a3260d4db00be9b5c2a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_468324d038ef45fe9a7bd877c01e86c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_457cac9d4e34ee84783d609029cb75a8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755c16d2efd973cf40e3f0a07571052a
-    def get_inputs(self):
-        return [
-            paddle.uniform([19, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_c700508c2c4fc9c952da4d850effb4b1(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 36], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d3957af3cbe342b65fab2c21c311df2a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c700508c2c4fc9c952da4d850effb4b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_1e0893ec51556e81c28ff0e6f1c5c4f3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ba7e2138c8a4287d15c87767ebdf245
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ea0dfffecc1d6914a3d29ffd62a65684(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3549], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_873741117b8479841012dd281155ba84(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1769], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ed30fb4eca53e524037907406b876b72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3549], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0ada39313214bfcde46896f047731abe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1769, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0ada39313214bfcde46896f047731abe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1769, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b10d2f20837c26fd4a10883bdc6cce1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_b397bc8a7f77d8481443dad3bb51684f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c32c9279ac3bff2e4cad9a2cc6a09a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_4cce31d4379425f4a85c72cdc0cb06a2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_5aa99892aae5fa4f0a272098f5aca47f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[512], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_646fac0c6ce4134b408c64dbc20edb71(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5aa99892aae5fa4f0a272098f5aca47f
-    def get_inputs(self):
-        return [
-            paddle.uniform([512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_83a21327893a9c1b30cdc037e76c1c61(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 512], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8d71757a3c54aa1abd30020f47fe5a36(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_83a21327893a9c1b30cdc037e76c1c61
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_62e2ddaca06e957fc26220380782a687(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 512, 1], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_024be74abb2a46e4eebc0e3d0f7994bc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_62e2ddaca06e957fc26220380782a687
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([3], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_cd25b467ea7d9e3323ddaa4d4b9392c6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 8, 49, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_15eaea8e2948f5745ddff02796fb6fad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd25b467ea7d9e3323ddaa4d4b9392c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c76efbd51f9695a88cda12919f6709dd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([24]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_38f49c5f2c6fbb67af87ce898971bc01(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([24]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_88c34e78df5b8480a19fc2ba1f51f57a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_846ab3609ad74f1e78c05edcd81e0318
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_0fcbce5c247b2c758f7b9383049b946a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 3024], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_976c1b9e0be20924899ad9ccd22f6ad3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1502], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_05288875661149897688ef88e5116394(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 3024], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_91f454b6ef5fac851fc6e95f31193c5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1502, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_91f454b6ef5fac851fc6e95f31193c5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1502, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_495db7a8fea4d9f2a6ac7c14133d764b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6638a50c2f65c1ea22c8b73f2bc28555
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_25056672ab89efb55bd85f57acc72cea(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 16, 49, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5b612c2c11926d7b697930769c428459(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25056672ab89efb55bd85f57acc72cea
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4822c44ead9e71868f4611b943ad24b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c32c9279ac3bff2e4cad9a2cc6a09a94
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_55a692a275ea66a954f2541861070a11(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0], dtype='int64').reshape([4]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3b502c4eccc5693af5f64fe7d06ff133(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1], dtype='int64').reshape([4]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a2ab071d99006f60270d88a1a38ee62e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3262e4b2786f72fe30249ef8f22fcd9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a75ff30603cd74ec2ea16b0f4e24ae0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34d202c05671c8fef086b3d6fc52005a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_97dccfe0a3ac9d1a51c7189603875ee2(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, 512, 97, 97], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_0e4a8796bfc83983001945cc42ef4fab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_97dccfe0a3ac9d1a51c7189603875ee2
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 97, 97], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4a69e1a387c9f75d08187e9c3f20a701(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c700508c2c4fc9c952da4d850effb4b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_5b612c2c11926d7b697930769c428459(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_25056672ab89efb55bd85f57acc72cea
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a2ab071d99006f60270d88a1a38ee62e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3262e4b2786f72fe30249ef8f22fcd9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a75ff30603cd74ec2ea16b0f4e24ae0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34d202c05671c8fef086b3d6fc52005a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_574114f24f53d511d3901dec0643e8b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_846ab3609ad74f1e78c05edcd81e0318
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_c81fccbba4ed4738064edb64f982552b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c81fccbba4ed4738064edb64f982552b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_bf579441a213aad4d849c345b49d7902(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 672], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_26f5a4b3764cef1c15cbef09bcf63647(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf579441a213aad4d849c345b49d7902
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_eb1476b02567109002a4237b07671e70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_6638a50c2f65c1ea22c8b73f2bc28555
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b10d2f20837c26fd4a10883bdc6cce1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_d1ccc92dd7132dc4dbbf2dfa0c8e1bcf
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_15eaea8e2948f5745ddff02796fb6fad(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_cd25b467ea7d9e3323ddaa4d4b9392c6
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 8, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7eeb430ff287f69903a5af248f6e3b70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f0ee78a44c9b4df5a46c422acbea87a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([2080], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_30c5691d0aa246e99b527beac39fe3cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3e095f6aa5e898650910a60bb41cbe7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2080, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3e095f6aa5e898650910a60bb41cbe7a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2080, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c3a1be8904ebd1c878a4040a372f78dc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 9261], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d248dc766a4a9ba6d7361bb4d77f602d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([4585], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_acc5d083231fc52750cafd55306fbdcb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 9261], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be1b3bdcacdb2ffd4807434ed272fe2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4585, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be1b3bdcacdb2ffd4807434ed272fe2c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4585, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5c6838593e0191f85a5daefaba498ec9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4603fed6fe8a43054c47a4534ed7bf64
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_07d0ff6430ac4e57440847e8a25be6e6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87fe4a21c4e317bef4d094684b96b124
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.07471039891242981, 0.4338351786136627, 0.3128529489040375, 0.27451038360595703, 0.08683019876480103, 0.4641912877559662], dtype='float32').reshape([6]),
-            paddle.to_tensor([1, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9d48f1290beef2f0561d1d385c39d617(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2434], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b5e717559d6a7f3abc0e14431c4c3b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 2100], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_754df4dce2d93bdf1191620f3f53f742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([1048], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d417cc844769a2724688607517f75dbd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 2100], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3408213418aba00fd84f1142aa3e7041(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1048, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3408213418aba00fd84f1142aa3e7041(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1048, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0cd143f6b3eb98f617203d78924b8602(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [0]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f09760ab83ea9ffe1571bfc21415246e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cd143f6b3eb98f617203d78924b8602
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.42495518922805786, 0.2379216104745865, 0.12352313846349716, 0.09334713220596313], dtype='float32').reshape([4]),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_fb5dfafa48334c4e0da031d71a3a482d(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [1]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[1, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_cfbe28d152dd1aa474702c6c81f9e37c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5dfafa48334c4e0da031d71a3a482d
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.42495518922805786, 0.2379216104745865, 0.12352313846349716, 0.09334713220596313]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_35e179c8aaabf41b81853665dc8bf08e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[100, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_eebd34bfe58e2c4e133f855c5655e846(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_35e179c8aaabf41b81853665dc8bf08e
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd237dae64dc659cd6e2e52808b056f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_f1a9773c9d4eb35f89ab1bfed8c1155a
-    def get_inputs(self):
-        return [
-            paddle.uniform([11, 768, 49], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_024c4f0c07e3ee74425f812dbbddc555(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 32, 49, 7, 7], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_22a1e3568ec7e399fff742394f615dc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_024c4f0c07e3ee74425f812dbbddc555
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a2ab071d99006f60270d88a1a38ee62e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3262e4b2786f72fe30249ef8f22fcd9b
-    def get_inputs(self):
-        return [
-            paddle.uniform([512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a75ff30603cd74ec2ea16b0f4e24ae0e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_34d202c05671c8fef086b3d6fc52005a
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 512, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8f5f44c9bc76710f37be6d0b6de5ede5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0cd143f6b3eb98f617203d78924b8602
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4153171479701996, 0.3734067678451538, 0.3560805022716522, 0.21529623866081238], dtype='float32').reshape([4]),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9baab98cbbc3250b75401be5661619ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_fb5dfafa48334c4e0da031d71a3a482d
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4153171479701996, 0.3734067678451538, 0.3560805022716522, 0.21529623866081238]], dtype='float32').reshape([1, 4]),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9782f1f428d0b8702c30086fa5a1097f(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [-2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[300, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_f455922905a8e671a6f4c44352687876(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9782f1f428d0b8702c30086fa5a1097f
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_aa701398f27909a04f02c03458a946c5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 1248], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_d8102e8577525f6e85a6d528fb02667e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_aa701398f27909a04f02c03458a946c5
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_9d81dbdb1cccc0dd3cbcb1381c2ac202(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ba7e2138c8a4287d15c87767ebdf245
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_88f14c02425c81fc439dd899dcc2331d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c700508c2c4fc9c952da4d850effb4b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_62d577e8c2e7fcd793de3aa46b2fd226(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([15, 25], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_62d577e8c2e7fcd793de3aa46b2fd226(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a070fd391c7f9866f9e0dd923a3f58c7
-    def get_inputs(self):
-        return [
-            paddle.uniform([15, 25], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_20edb3f490a744ff4f5df631e2fa4427(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_20edb3f490a744ff4f5df631e2fa4427(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 18, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_563aacf9729392fafd24c8d538ba5af8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4725], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fe9d774e57720f1cc02378b02a7c06fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([2390], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1878b816d9d1630dd8d0b17e97a74290(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4725], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e7db2243b383191d2542585b98d35e81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2390, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e7db2243b383191d2542585b98d35e81(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2390, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4a7e0b6f667441f9c44737556a549f8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4a7e0b6f667441f9c44737556a549f8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 192, 32, 64], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cf70f6ff64ece93b49a3371c620c49ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 6069], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2fb5d075861a9a6abcb74012994d8d57(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([3090], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cd7bd35d6675ce19a51b2dcae619e8fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 6069], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f89b845e09d78f881b6c390f8dbc7742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3090, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f89b845e09d78f881b6c390f8dbc7742(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3090, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6588e564ab6c312f64cb6102a83b291e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 7581], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7063beabb4dbc6abba5c68e021e7af7c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([3748], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1181e0d1c8fd1e42a6c90a993e496eff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 7581], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_45bf9c11c6d10c35ca74fe38fad99763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3748, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_45bf9c11c6d10c35ca74fe38fad99763(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[3748, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81770c294df010c1b52f4dfe9c9b6102(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81770c294df010c1b52f4dfe9c9b6102(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 48, 128, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_59a326e9947890da7ed566af85d01aa6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 156], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c94dde54b1e99c76b815c0224ab16773(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_59a326e9947890da7ed566af85d01aa6
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_418ecd8dec9ea99ed8106f4d725b66e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_418ecd8dec9ea99ed8106f4d725b66e3(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_a8703bfcd1bfb9e06ec25a6fe39edcec
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 96, 64, 128], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b39d0d61c2746585b796455dbf22d09c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_1ab9a42eb43a3a9598e743d905bff0f9
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_02be19272751824395bc441ebe469662(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[10, 8, 49, 28, 28], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_963d3acc4bb614b6ce3c1c6f5e9e26c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02be19272751824395bc441ebe469662
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ae6d711e40a1f0afe186e03328ea07fe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ba7e2138c8a4287d15c87767ebdf245
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_ac2a36b81e9ce0df4572b87b12fd3c14(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9ba7e2138c8a4287d15c87767ebdf245
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_34ac43546a3a8fd75ae30433b29a9b89(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4603fed6fe8a43054c47a4534ed7bf64
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_a2481cce65d5e929f10ecf9dae1d4f1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_87fe4a21c4e317bef4d094684b96b124
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0.4199373722076416, 0.07790789008140564], dtype='float32').reshape([2]),
-            paddle.to_tensor([1, 2], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_edb66a5743db6ffe617c72eb2209468d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_c700508c2c4fc9c952da4d850effb4b1
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class PrimitiveOp_8fd71657c5a3295d87f9dce9a4cf9227(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 16, 49, 14, 14], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_017b6c17faf4571f776b930476e0c2d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8fd71657c5a3295d87f9dce9a4cf9227
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_220fc1e2536be603d379ceb0d009d5dd(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 120], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_03356ac3eacd778df1ad38bde324d7ef(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_220fc1e2536be603d379ceb0d009d5dd
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_6c86fdbd166a3260d4db00be9b5c2a43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_468324d038ef45fe9a7bd877c01e86c4
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6b86fb724ca7fc7693a819ce28d704a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], dtype='int64').reshape([20]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9db496b9f94d2056a13146b9f489b0a4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e516cf0b9d9e30654eeeaba30c49915c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype='int64').reshape([20]),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26f5a4b3764cef1c15cbef09bcf63647(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf579441a213aad4d849c345b49d7902
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_963d3acc4bb614b6ce3c1c6f5e9e26c5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_02be19272751824395bc441ebe469662
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 8, 49, 28, 28], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7eeb430ff287f69903a5af248f6e3b70(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 4116], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d3d945a68fa39a80f99f74e4741b7b4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([2031], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_30c5691d0aa246e99b527beac39fe3cc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 4116], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f087431c4645dddd95c6501b13af4061(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2031, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f087431c4645dddd95c6501b13af4061(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[2031, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_82d411c5e350fd0d9aa27cd070a8de9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_3530ceeb65538eb17621f2b58fc8e150
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 500], dtype='int64'),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_be5299f10f90f39db0e7dd26ea79421e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bf8f5a374559483270850abc19c8d90d
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 500], dtype='int32'),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_0ae8e870fdd50e7d2c89e99461e0648e(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[22, 2, 9, 112, 112], dtype='float32'),
-            paddle.static.InputSpec(shape=[1], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_ba9a8f4314cc1e56616a5ba163e6f5eb(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ae8e870fdd50e7d2c89e99461e0648e
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 2, 9, 112, 112], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_22a1e3568ec7e399fff742394f615dc2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_024c4f0c07e3ee74425f812dbbddc555
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 32, 49, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eb208ff1be9e1a6b7df746ed83356220(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_755c16d2efd973cf40e3f0a07571052a
-    def get_inputs(self):
-        return [
-            paddle.uniform([150, 256], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_291487150afaf119f3fd9f2d8e607e49(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_bcc5234dea9db689f8b157a1c8f97414
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[1, 8400], dtype='int32'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d1adf6985aca7918ff14d08f945efc68(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0d035c8ad2f1e179ca730c462a5c8f05
-    def get_inputs(self):
-        return [
-            paddle.uniform([4205], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26729a9091e07acff08d34299d40b4fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_2fe77989f9c3887fff615de2d76ebcd6
-    def get_inputs(self):
-        return [
-            paddle.cast(paddle.randint(low=0, high=2, shape=[1, 8400], dtype='int32'), 'bool'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_68021646842c37aa24588c0353df135c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4205, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_68021646842c37aa24588c0353df135c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4b2ceb30f022112d388b814d68b0db76
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[4205, 4], dtype='int64'),
-            paddle.to_tensor([-1], dtype='int64').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e9568155a4ba06c10d50416a53351796(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1):
-        input_1 = [2, 3]
-        return paddle.unsqueeze(input_0, input_1), None
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, 624], dtype='float32'),
-            paddle.static.InputSpec(shape=[2], dtype='int64'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3095e2fb1954ce711917bd87c61bcd05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e9568155a4ba06c10d50416a53351796
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 3], dtype='int64').reshape([2]),
-        ]
-
-
-class TestPrimitiveOp_017b6c17faf4571f776b930476e0c2d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_8fd71657c5a3295d87f9dce9a4cf9227
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 16, 49, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2], dtype='int64').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
@@ -1,2740 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return False
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.clip(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8bea5b959995c0c9c2855d6aefdb354f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 72], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3544dd1f18c55338d8ef99449246d37f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 92], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_590946ef6abbea1576e9be07df0462b6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 960], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8494eb2f85f01099d05df543eaaa6831(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.clip(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_898bb842489cbd4b872716004d4346c4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.48256734013557434]], [[0.4724912941455841]], [[0.3240368664264679]], [[0.30851316452026367]], [[0.01935223489999771]], [[0.4637943506240845]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([-10000000000.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([4.135169982910156], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.clip(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_df9a96bdafbe201ea527e74649d063d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_de8217bd3f77244cda0c3820acd74118(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_e597cdc7ee73453b4acb6ba7ac3f318c(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.clip(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_9c859bf6f5a15bce8beec2ddf694af76(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e597cdc7ee73453b4acb6ba7ac3f318c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(8732.0, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eaca3cdd186169d649efb2fb0dd5d87a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eaca3cdd186169d649efb2fb0dd5d87a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f73b809eaee125fa47bdc6cb50bb472d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_03267870f52151b4f60e660a0e5a086a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 23, 23, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6bbf4221fa8406337905e1db7bf0207b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_38dc6974fb3be331acf3240d5d76e7d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1db4d5a5acc9b892b237c6070e3b65ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1762, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1db4d5a5acc9b892b237c6070e3b65ca(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1762, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_80861692d62efa31ad5b280c46bb107e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_60e294a802ec895c6b13a8fbf2e49a40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fa9df8a5ed9d5a88e885ff1142c33f05(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.24106884002685547], [-0.299644410610199], [-0.36517778038978577], [-0.3376612961292267], [-0.04275056719779968], [-0.38072317838668823], [-0.04787394404411316], [-0.0072193443775177], [-0.38363292813301086]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4249d13fde98e74c9a825d1dc93f6521(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.33500275015830994], [-0.2355460226535797], [0.20793795585632324], [0.23501572012901306], [-0.2612786889076233], [-0.08832412958145142], [-0.2968669831752777], [-0.3520643711090088], [-0.2537158727645874]], dtype='float32').reshape([9, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a5a94a209bb02ffa9d9b7f9f2bbb2980(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3be3210d2e1fe2ed8d5b5d08c7958a66(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[[0.3604314625263214]], [[0.1886298954486847]], [[0.33323153853416443]], [[0.041337672621011734]], [[0.010262440890073776]], [[0.317024827003479]]], dtype='float32').reshape([6, 1, 1]),
-            paddle.to_tensor([-10000000000.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([4.135169982910156], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_13e67a88d5c696e94c4d4e085d482270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([5522, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_13e67a88d5c696e94c4d4e085d482270(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([5522, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a995bc0da61a79f0b9f17bb53c8cef91(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 11109, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_df9a96bdafbe201ea527e74649d063d5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8c7c61ff0087043832de9246f5345c2e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7c3a7b26dc03af085e61411f5be23af2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5f282b284dcd49ce179b1d72d88e4ba5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1760, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5f282b284dcd49ce179b1d72d88e4ba5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1760, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6edd588e9f9d4f2a01a296a15344cf5f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3549, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([-2.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_17aacaf8ebc513d8a43acae020cf0744(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_26dc710c935f3655fbd85dd42ee2bee5(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.clip(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_8d925bda9ef2bfe69f4fe7f99f0ce3ae(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_26dc710c935f3655fbd85dd42ee2bee5
-    def get_inputs(self):
-        return [
-            paddle.uniform([10, 32, 100, 2], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_153779b182749c87063ca10ec8c804fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_60e294a802ec895c6b13a8fbf2e49a40(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6f9f38b3edef197f52bff539b5602935(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e6c993527027668416e3338d8f8cb735(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 42, 42, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6321b9c22dd1a0a7582f8fbebfa2e067(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 21, 21, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_56d3a9d86b371f73795a49d309429bd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1522, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_56d3a9d86b371f73795a49d309429bd4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1522, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2b584b186d6fe582ad4bd9811a9d720c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3024, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_81596a9b3cfcf21630ce2afe3e943bcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 12, 12, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_29bbad1654052b0ce90a68672a2bcc07(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 240], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a99bbb24c2f0fa4776d18fa439749d54(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 11, 11, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ed36c548b005a9649b43145f94c37e09(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0364febe876e9088e68e68018b544a60(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.061174459755420685]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c68a32e8772dfe23921e19bf9fdb9056(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.24650467932224274]], dtype='float32').reshape([1, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59ffef60180810467d37d3f040380e19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.004442393779754639], [-0.29478719830513], [-0.08247548341751099], [-0.18305155634880066], [-0.12973004579544067], [-0.1364441215991974]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2bb30bb276baf61cd36d5076e1b269c2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.06521733105182648], [-0.20633187890052795], [-0.36336442828178406], [-0.3022501766681671], [-0.43793055415153503], [-0.3573991060256958]], dtype='float32').reshape([6, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4859c09e83492d9f029e51f87ce50f4c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 60], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_07a4b0a5d7c7231bd0332c8ad1de0841(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_17aacaf8ebc513d8a43acae020cf0744(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 336], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6ea48078a4a478542d40ab9834dd39(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 48, 48, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8daca51e7431eae3ec0fb05f8683334(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 24, 24, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b5cc941b14a6ebbdc6faf31a6f59d4d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([2074, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b5cc941b14a6ebbdc6faf31a6f59d4d9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([2074, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9db000d15f4c067ef3efb4af2f8ae9f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e4ec63d500885dc4d1be28b1aed2249d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([4734, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e4ec63d500885dc4d1be28b1aed2249d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([4734, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ef2fff1cddbf7c524225afc871efae16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 9261, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c876b510bd20ccf4a277450a83b3fb19(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_e597cdc7ee73453b4acb6ba7ac3f318c
-    def get_inputs(self):
-        return [
-            paddle.to_tensor(2434.0, dtype='float32').reshape([]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d314973f02c8df1749eb1b3834d361f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1074, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d314973f02c8df1749eb1b3834d361f7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1074, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_eb8c25d4c474edf481ff08b3a25d09bf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 2100, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_327171558e1bb64dbc6a50a18d604f26(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 46, 46, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_59a462b0ad958467ab8f6490fb021128(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 44, 44, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_10618d3398b3044149a8d8a817cf2b90(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.0690041035413742], [-0.22208070755004883], [-0.019657589495182037], [-0.44297075271606445], [-0.2709038257598877]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_90fb46bdfa221fd1fc85961b70549c4b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.2394963502883911], [-0.32325273752212524], [-0.07393494248390198], [-0.1380583941936493], [-0.45788586139678955]], dtype='float32').reshape([5, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ebf8698c1d69f471627fa4ac36bb7e79(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 1248], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_758a561d89d0883c081c7f968f5c59ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 38, 38, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_67b50d32e28e97e72ce5a597edee154b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_974c3379ae085f368f5b49628f28f00a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 92, 92, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_44ed9e99c77881ab0ed6a0674be0b563(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_58db83cc509c28ca4ad6dfaf7dc39b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([2332, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_58db83cc509c28ca4ad6dfaf7dc39b6b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([2332, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f6375728f8c0cf55509306b8f36e0f50(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4725, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_96c398e99b886511109ff158b7395cac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([3051, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_96c398e99b886511109ff158b7395cac(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([3051, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5b0556ee534928fecf69bffa38601c43(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 6069, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_039d81830d3fc8dd3f44d3ac223c867f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([3870, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_039d81830d3fc8dd3f44d3ac223c867f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([3870, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a4caf78002ee58bf9ebaf86133a98ff(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 7581, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e5ecec3c1f7f8e79486a1e7d122b4c30(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 156], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51d0f173aff7f2f5c6ae34a4d8de4fe2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 22, 22, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_38dc6974fb3be331acf3240d5d76e7d2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 872], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d444422024ab90a626d1637a9fe71ca7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([22, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d85802ba24cf729b86c3fade93d8f0fa(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([145, 480], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_07717cae658fc5415eaf798de2a19db2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([171, 36], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_922052f31472d0c356acd75d91b00f59(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 120], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_07a4b0a5d7c7231bd0332c8ad1de0841(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 672], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_034dfb7a04037e186836b15a2c00e9b0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[-0.44996094703674316], [-0.3418987989425659], [-0.05910114943981171], [-0.26658308506011963]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_ad8a89e907414fa79e9fa6104066e574(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.005715876817703247], [-0.21601969003677368], [-0.24322092533111572], [-0.05909551680088043]], dtype='float32').reshape([4, 1]),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_75bdb99634445650e5cebb8417539dcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([2111, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_75bdb99634445650e5cebb8417539dcd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([2111, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9db000d15f4c067ef3efb4af2f8ae9f1(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 4116, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d439532b6f28c279e88812c36a685afc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 19, 19, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_322b966d36a4684cdc7859ca26aa74ea(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 84, 84, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_56140a6050f25aa184e4bdd62745551c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([4141, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_56140a6050f25aa184e4bdd62745551c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([4141, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cf45a13ab89e93a01da17ddc45f73a72(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_82c1c1bf9aa0a325d7faaa49302bf1b7
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 8400, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([15.989999771118164], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1c05c2158bc66b2c15329056d22b7fc5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0ff9e4ce656b19bb464bf537855ac477
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 624], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([1.0], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0a6cc70c5c3660e7e5efbf5fa934bbb4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_4c61f08cb5064f3b8d3209b92dee0620
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 3, 76, 76, 1], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0.0], dtype='float32').reshape([1]),
-            paddle.to_tensor([3.402820018375656e+38], dtype='float32').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5372 +1,12 @@
+# 由pltools/e2e_spec.py生成, 子图定义见同名.json
 import os
-if os.getenv('FLAGS_cinn_new_group_scheduler') is None:
-    os.environ['FLAGS_cinn_new_group_scheduler'] = '1'
-if os.getenv('FLAGS_group_schedule_tiling_first') is None:
-    os.environ['FLAGS_group_schedule_tiling_first'] = '1'
-if os.getenv('FLAGS_prim_all') is None:
-    os.environ['FLAGS_prim_all'] = 'true'
-if os.getenv('FLAGS_prim_enable_dynamic') is None:
-    os.environ['FLAGS_prim_enable_dynamic'] = '1'
-if os.getenv('FLAGS_enable_pir_api') is None:
-    os.environ['FLAGS_enable_pir_api'] = '1'
-if os.getenv('FLAGS_cinn_bucket_compile') is None:
-    os.environ['FLAGS_cinn_bucket_compile'] = '1'
-
+import sys
 import unittest
-import numpy as np
-import paddle
-
-def GetEnvVarEnableJit():
-    enable_jit = os.getenv('PADDLE_DEBUG_ENABLE_JIT')
-    return enable_jit not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-def GetEnvVarEnableCinn():
-    enable_cinn = os.getenv('PADDLE_DEBUG_ENABLE_CINN')
-    if enable_cinn is None:
-        return False
-    return enable_cinn not in {
-        "0",
-        "False",
-        "false",
-        "OFF",
-    }
-
-
-def GetTolerance(dtype):
-    if dtype == np.float16:
-        return GetFloat16Tolerance()
-    if dtype == np.float32:
-        return GetFloat32Tolerance()
-    return 1e-6
-
-def GetFloat16Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT16_TOL'))
-    except:
-        return 1e-3
-
-def GetFloat32Tolerance():
-    try:
-        return float(os.getenv('PADDLE_DEBUG_FLOAT32_TOL'))
-    except:
-        return 1e-6
-
-def IsInteger(dtype):
-    return np.dtype(dtype).char in np.typecodes['AllInteger']
-
-def ApplyToStatic(net, use_cinn):
-    build_strategy = paddle.static.BuildStrategy()
-    build_strategy.build_cinn_pass = use_cinn
-    return paddle.jit.to_static(
-        net,
-        input_spec=net.get_input_spec(),
-        build_strategy=build_strategy,
-        full_graph=True,
-    )
-
-class InstanceTrait:
-
-    @classmethod
-    def instance(cls):
-        if cls.instance_ is None:
-            cls.instance_ = cls()
-        return cls.instance_
-
-    @classmethod
-    def static_instance_with_cinn(cls):
-        if cls.static_instance_with_cinn_ is None:
-            cls.static_instance_with_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=True
-            )
-        return cls.static_instance_with_cinn_
-
-    @classmethod
-    def static_instance_without_cinn(cls):
-        if cls.static_instance_without_cinn_ is None:
-            cls.static_instance_without_cinn_ = ApplyToStatic(
-                cls.instance(),
-                use_cinn=False
-            )
-        return cls.static_instance_without_cinn_
-
-
-class CinnTestBase:
-
-    def setUp(self):
-        paddle.seed(2024)
-        self.prepare_data()
-
-    def test_train(self):
-        dy_outs = self.train(use_cinn=False)
-        cinn_outs = self.train(use_cinn=GetEnvVarEnableCinn())
-
-        for cinn_out, dy_out in zip(cinn_outs, dy_outs):
-          if type(cinn_out) is list and type(dy_out) is list:
-            for x, y in zip(cinn_out, dy_out):
-              self.assert_all_close(x, y)
-          else:
-            self.assert_all_close(cinn_out, dy_out)
-
-    def train(self, use_cinn):
-        if GetEnvVarEnableJit():
-            net = self.prepare_static_net(use_cinn)
-        else:
-            net = self.prepare_net()
-        out = net(*self.inputs)
-        return out
-    
-    def prepare_data(self):
-        self.inputs = self.get_inputs()
-        for input in self.inputs:
-            input.stop_gradient = True
-
-    def prepare_net(self):
-        return self.get_test_class().instance()
-
-    def prepare_static_net(self, use_cinn):
-        if use_cinn:
-            return self.get_test_class().static_instance_with_cinn()
-        else:
-            return self.get_test_class().static_instance_without_cinn()
-
-    def assert_all_close(self, x, y):
-        if (hasattr(x, "numpy") and hasattr(y, "numpy")):
-            x_numpy = x.numpy()
-            y_numpy = y.numpy()
-            assert x_numpy.dtype == y_numpy.dtype
-            if IsInteger(x_numpy.dtype):
-                np.testing.assert_equal(x_numpy, y_numpy)
-            else:
-                tol = GetTolerance(x_numpy.dtype)
-                np.testing.assert_allclose(x_numpy, y_numpy, atol=tol, rtol=tol)
-        else:
-            assert x == y
-
-
-
-class PrimitiveOp_0b276116b8e53574370d174a27dc93d3(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None, None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_c2fb6b8a0ad3ff6105933f0096f20a86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[300, 1], dtype='int32'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2c281765ee6f257ca2b46651e6b3d5c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6], [7]], dtype='int32').reshape([8, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_da91b74e6eaa961088b610ce6da7f64f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1]], dtype='int32').reshape([2, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1ea2e6e6d6d6bf13f77ba1dc1325a66d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[100, 1], dtype='int32'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None], dtype='int64'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_be68e89fc71e873e4cb6ff8b0ea030cd(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([3], dtype='int32').reshape([1]),
-            paddle.randint(low=0, high=3, shape=[2100], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_228686245c205bc9933fdd0e091f009b(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='int64'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_fccdeb284b7ce3eec966088652662346(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4864453077316284, 0.1923384815454483, 0.3436434268951416, 0.39186203479766846]], dtype='float32').reshape([1, 4]),
-            paddle.randint(low=0, high=3, shape=[2100], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_da91b74e6eaa961088b610ce6da7f64f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1]], dtype='int32').reshape([2, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_6e923e11ea143c65affa0b5109eb9d16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([185691], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_3cd350690c0edad2e58186a5f9489125(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185691], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None, None], dtype='int64'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_a6ba098ad1859a66b46d7c6616e4a40a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([185691, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[1], [1], [5], [0], [9], [2], [4], [2]], dtype='int64').reshape([8, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a6ba098ad1859a66b46d7c6616e4a40a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([185691, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[1], [1], [5], [0], [9], [2], [4], [2]], dtype='int64').reshape([8, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_da91b74e6eaa961088b610ce6da7f64f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1]], dtype='int32').reshape([2, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2c281765ee6f257ca2b46651e6b3d5c0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6], [7]], dtype='int32').reshape([8, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bae91120eca5561ee78176f6d262b2c8(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([9, 5], dtype='int32').reshape([2]),
-            paddle.randint(low=0, high=3, shape=[2002], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_45c8fbc85a9ed44b1f794aa9801d4656(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([6, 0, 2, 8, 9, 6, 2, 5, 4, 0, 2, 4, 2, 2, 3, 5, 2, 4, 4, 1, 0], dtype='int32').reshape([21]),
-            paddle.randint(low=0, high=3, shape=[1021], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_25a2b215c7cbf034cf2b8a8507686521(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([242991], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c86adb1c0a8399f43d4e882559428b9a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[242991], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d5666402a5d7118457e757d252f4763b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([242991, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[8], [0], [6], [1], [5]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d5666402a5d7118457e757d252f4763b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([242991, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[8], [0], [6], [1], [5]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_434a90c6f3a583c05870780eeb270baf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6]], dtype='int32').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_895e73075cd1252db7d74b963c1bae9b(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([8, 5], dtype='int32').reshape([2]),
-            paddle.randint(low=0, high=3, shape=[1002], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_df75fa26601db648029d1ea8bd2dda42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([171888], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_67f388534317d6fe8c397f641bf490ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[171888], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8f906d414da755baf437a89e11feda69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([171888, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[6], [4], [1], [4], [1]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8f906d414da755baf437a89e11feda69(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([171888, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[6], [4], [1], [4], [1]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d001c3215b41f16ea8764f97a5dfbdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5]], dtype='int32').reshape([6, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_df75fa26601db648029d1ea8bd2dda42(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([171888], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_67f388534317d6fe8c397f641bf490ab(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[171888], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0850369cd66b76d058f700850b8d1603(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([171888, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[6], [4], [1], [4], [1], [3], [3]], dtype='int64').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0850369cd66b76d058f700850b8d1603(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([171888, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[6], [4], [1], [4], [1], [3], [3]], dtype='int64').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_02925ec5648ba984a3b75bccd2b7e095(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([3, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2]], dtype='int32').reshape([3, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d208667e839145120073b437ce740a49(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([217413], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e16f95ef95e6ed1a76501fd64702478f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[217413], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_415b56e270a3af6936d88d2ccc7c6efe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([217413, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[103, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_415b56e270a3af6936d88d2ccc7c6efe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([217413, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[103, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_da91b74e6eaa961088b610ce6da7f64f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([2, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1]], dtype='int32').reshape([2, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_565a79746ba144c682016ddae5529c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0]], dtype='int32').reshape([1, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9b8d6c583ddec481a57566cbcc4cba5d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_80bb7a4327e8f7961447f7e6966b362c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([6, 6], dtype='int32').reshape([2]),
-            paddle.randint(low=0, high=3, shape=[3549], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_51950ee76bbda83f99d0e8db52c160a5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.4985369145870209, 0.24180682003498077, 0.14517970383167267, 0.09398140758275986], [0.25021982192993164, 0.16600045561790466, 0.34498465061187744, 0.08536053448915482]], dtype='float32').reshape([2, 4]),
-            paddle.randint(low=0, high=3, shape=[3549], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8b88e68530b788f4c8667ab3dfcfa895(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 64, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6]], dtype='int32').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_565a79746ba144c682016ddae5529c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0]], dtype='int32').reshape([1, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_26071b4eebc43ad6cb58e188138421e7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([86970], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_f2c65eca6dc6bf557bd990ab01732098(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[86970], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d783951e804142c28677fe54a3f81c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([86970, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[9], [5], [1], [0], [0], [1]], dtype='int64').reshape([6, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d783951e804142c28677fe54a3f81c8c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([86970, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[9], [5], [1], [0], [0], [1]], dtype='int64').reshape([6, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_640c5aa93913eee506a9c0e779039958(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([205923], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d984e23b691efb21c774cbc98d44303a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[205923], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3187c107513c18b7c0018a769f1b854d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([205923, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[1], [0], [8], [4], [1]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3187c107513c18b7c0018a769f1b854d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([205923, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[1], [0], [8], [4], [1]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5ba6a3ea172973c9e13ca64cb580f8da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([153450], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a4be12becd5aa237ca6dd18586be7da2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[153450], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dd86f8ec034a103d0f4e6ebd8949e876(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([153450, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[8], [4], [4], [2], [3], [1], [7], [4], [8], [3]], dtype='int64').reshape([10, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_dd86f8ec034a103d0f4e6ebd8949e876(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([153450, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[8], [4], [4], [2], [3], [1], [7], [4], [8], [3]], dtype='int64').reshape([10, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a275f0892f5bbe06e45d30f0e3ac6d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([5, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4]], dtype='int32').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_728439d7d8f5a76038e7360144d7a0c6(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([3], dtype='int32').reshape([1]),
-            paddle.randint(low=0, high=3, shape=[4116], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1c80f61b0973573b6abd9fd467b372d4(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([[0.10158874839544296, 0.1664346307516098, 0.4401828646659851, 0.29688525199890137]], dtype='float32').reshape([1, 4]),
-            paddle.randint(low=0, high=3, shape=[4116], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_434a90c6f3a583c05870780eeb270baf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6]], dtype='int32').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_04e40ac899a220fecbda554d5b97b5d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([113061], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_8bcec94f3c88baac50418726a859749d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[113061], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b6583f5cf8e4b381a862d8da33aff19c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([113061, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[2], [6], [7], [8]], dtype='int64').reshape([4, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_b6583f5cf8e4b381a862d8da33aff19c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([113061, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[2], [6], [7], [8]], dtype='int64').reshape([4, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_434a90c6f3a583c05870780eeb270baf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6]], dtype='int32').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_565a79746ba144c682016ddae5529c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0]], dtype='int32').reshape([1, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_d96812bbaef3aefdd1ed6f7f6baa6165(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([123783], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a8974324b79ae75f647e1bf1115d6e75(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[123783], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_733d9531fc2ee4758e654586f4512bb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([123783, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[84, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_733d9531fc2ee4758e654586f4512bb7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([123783, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[84, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c2fb6b8a0ad3ff6105933f0096f20a86(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[300, 1], dtype='int32'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6e923e11ea143c65affa0b5109eb9d16(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([185691], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3cd350690c0edad2e58186a5f9489125(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185691], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bf4f4740208515b7e636c43f0822e688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([185691, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[1], [1], [5], [0], [9], [2], [4]], dtype='int64').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bf4f4740208515b7e636c43f0822e688(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([185691, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[1], [1], [5], [0], [9], [2], [4]], dtype='int64').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a275f0892f5bbe06e45d30f0e3ac6d3d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([5, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4]], dtype='int32').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5ba6a3ea172973c9e13ca64cb580f8da(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([153450], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_a4be12becd5aa237ca6dd18586be7da2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[153450], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6df1baba52e80077660ccc21bd3dcc4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([153450, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[8], [4], [4], [2], [3], [1]], dtype='int64').reshape([6, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6df1baba52e80077660ccc21bd3dcc4e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([153450, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[8], [4], [4], [2], [3], [1]], dtype='int64').reshape([6, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_cff782f519abc28cc7b01be4fc65bb85(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([49, 16], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[49], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class PrimitiveOp_539dd483bdb66f93ec0733b68c1034a7(InstanceTrait, paddle.nn.Layer):
-    
-    def __init__(self):
-        super().__init__()
-
-    def forward(self, input_0, input_1, input_2):
-        return paddle._C_ops.gather(input_0, input_1, input_2)
-
-    def get_input_spec(self):
-        return [
-            paddle.static.InputSpec(shape=[None, None], dtype='float32'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-            paddle.static.InputSpec(shape=[None], dtype='int32'),
-        ]
-        
-    instance_ = None
-    static_instance_with_cinn_ = None
-    static_instance_without_cinn_ = None
-
-
-class TestPrimitiveOp_5d9eeb412aa61a0f906e1f0bba4fa399(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_539dd483bdb66f93ec0733b68c1034a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 3], dtype='int32').reshape([2]),
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5d9eeb412aa61a0f906e1f0bba4fa399(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_539dd483bdb66f93ec0733b68c1034a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([5, 3], dtype='int32').reshape([2]),
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2043e000ae824e0bbf17de5cef108bbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_539dd483bdb66f93ec0733b68c1034a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 9], dtype='int32').reshape([2]),
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_2043e000ae824e0bbf17de5cef108bbe(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_539dd483bdb66f93ec0733b68c1034a7
-    def get_inputs(self):
-        return [
-            paddle.uniform([300, 80], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 9], dtype='int32').reshape([2]),
-            paddle.to_tensor([1], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3afc62a802a6195d4f4305bacdf29c7f(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0]], dtype='int32').reshape([1, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_565a79746ba144c682016ddae5529c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0]], dtype='int32').reshape([1, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_fb0bf144d94ad23ee6d2c917996eea5e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_9c515183356cf0e1d11f29cdc83853fe
-    def get_inputs(self):
-        return [
-            paddle.to_tensor([2, 2, 3, 5, 2, 4, 4, 1, 0, 6, 8, 6, 0, 6, 9, 3, 4, 9, 4, 0, 0, 7, 8, 6, 1, 9, 3], dtype='int32').reshape([27]),
-            paddle.randint(low=0, high=3, shape=[1027], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_bdecf6a0b54372cf4194e19b09b42529(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([8, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6], [7]], dtype='int32').reshape([8, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1ea2e6e6d6d6bf13f77ba1dc1325a66d(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([100, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[100, 1], dtype='int32'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_565a79746ba144c682016ddae5529c58(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([1, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0]], dtype='int32').reshape([1, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_72ba6676a550f204bbb258fb3a4ee85c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 4], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9e50e9eb905e3150ee552269b50946fc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([220968], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_58662e361d85c9055faf5e6765dbbb3e(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[220968], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_78c673384048c7a6ccb53b2975bcbdc0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([220968, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[6], [5], [2], [2], [8]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_78c673384048c7a6ccb53b2975bcbdc0(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([220968, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[6], [5], [2], [2], [8]], dtype='int64').reshape([5, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_0b44016d4cdc880cdc68f52203366fdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([196, 8], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[196], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_1babea2c91dc620468d452f06f8ca3a7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 2, 2, 1, 1, 1, 2, 1, 1, 2, 0, 2, 0, 0, 0, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_7da146462c84b539465a35f29492f325(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1, 1, 2, 2, 1, 0, 1, 1, 1, 1, 2, 1, 1, 2, 1], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_499e84d349b2a0591f9e06cf6e1b5f6a(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 1, 1, 1, 1, 2, 1, 0, 2, 0, 0, 0, 2, 2, 0, 1], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6cac7c3f79783da3400cd96020655ff2(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 0, 0, 2, 0, 0, 1, 0, 2, 2, 2, 1, 0, 0, 0, 0], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9cefe953057fc6c54dd75715f8380528(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 1, 1, 0, 0, 1, 2, 1, 1, 1, 0, 1, 0, 1, 2, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_9196b6bd031251e9e3b8bba89470c712(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1, 1, 2, 1, 1, 0, 1, 1, 2, 1, 2, 0, 1, 1, 1], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d6b3a9f1a6664be94b64891774d8319(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 0, 1, 0, 2, 2, 1, 2, 0, 0, 1, 2, 2, 2, 0, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_94b4935c133f6901476e866d3671dfaf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 1, 1, 1, 2, 1, 2, 2, 1, 0, 2, 2, 0, 0, 0, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_5b323cc4d6a30d84d59ac00f5da5a1d7(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 1, 0, 2, 1, 0, 0, 0, 1, 2, 1, 2, 2, 1, 0, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e8a2f34fe81a2917695419e72fd3ec94(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 1, 1, 2, 0, 0, 0, 2, 1, 1, 0, 2, 2, 2, 1, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_239650ec538bde37fbb6c4816af47db5(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 1, 0, 2, 2, 0, 1, 2, 1, 1, 2, 1, 0, 0, 2, 0], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_975958617cf5b69e65ed61eabf6a310c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 1, 1, 2, 2, 0, 2, 1, 1, 0, 1, 2, 1, 0, 0, 1], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4e42ebb8968ff507e737a83eee08afda(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 1, 0, 1, 2, 1, 2, 0, 0, 0, 1, 1, 2, 1, 2, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e9bceabc2b7aa657c2e01b56ae8a4380(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([1, 2, 0, 2, 0, 2, 1, 0, 0, 0, 1, 2, 0, 0, 2, 2], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_c602bf94950bb0daa59cede99393e266(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([2, 0, 0, 2, 2, 2, 2, 0, 0, 0, 1, 2, 0, 1, 1, 1], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_4c51aa4dd762865a22764b25a5210b1c(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_228686245c205bc9933fdd0e091f009b
-    def get_inputs(self):
-        return [
-            paddle.uniform([16, 12], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([0, 0, 0, 2, 2, 0, 1, 2, 1, 1, 1, 2, 2, 0, 2, 0], dtype='int64').reshape([16]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_6647dbbcedfd3c718b9c02b8f1915ff9(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_b84aa604bf9de54c604002fdb53f25a0
-    def get_inputs(self):
-        return [
-            paddle.uniform([185658], dtype='float32', min=0, max=0.5),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_538dc6d234116c2d88a70a49765e6401(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_57fea4b6a98b21e61c5c8c47efa08b18
-    def get_inputs(self):
-        return [
-            paddle.randint(low=0, high=3, shape=[185658], dtype='int32'),
-            paddle.randint(low=0, high=3, shape=[256, 1], dtype='int64'),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e50987087edab21c1bf70b678f4cb502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([185658, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[9], [1], [6], [9], [2], [8], [2]], dtype='int64').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_e50987087edab21c1bf70b678f4cb502(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_5a420bb9fb552bebcb43128ed9cb7ae6
-    def get_inputs(self):
-        return [
-            paddle.uniform([185658, 4], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[9], [1], [6], [9], [2], [8], [2]], dtype='int64').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_434a90c6f3a583c05870780eeb270baf(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([7, 256, 7, 7], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5], [6]], dtype='int32').reshape([7, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
-
-class TestPrimitiveOp_3d001c3215b41f16ea8764f97a5dfbdc(CinnTestBase, unittest.TestCase):
-    
-    def get_test_class(self):
-        return PrimitiveOp_0b276116b8e53574370d174a27dc93d3
-    def get_inputs(self):
-        return [
-            paddle.uniform([6, 256, 14, 14], dtype='float32', min=0, max=0.5),
-            paddle.to_tensor([[0], [1], [2], [3], [4], [5]], dtype='int32').reshape([6, 1]),
-            paddle.to_tensor([0], dtype='int32').reshape([1]),
-        ]
-
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from pltools.e2e_spec import load_spec_tests
 
+globals().update(load_spec_tests(__file__, __name__))
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()